@@ -0,0 +1,41 @@
+"""基准测试的公共配置
+
+运行方式（在 OlaMoMa 目录下）::
+
+    python -m pytest benchmarks
+
+结果默认以JSON保存在 .benchmarks/ 目录中，可用 --benchmark-compare 与之前的结果比较。
+"""
+import os
+import sys
+import tempfile
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ.setdefault("OLAMOMA_HOME", tempfile.mkdtemp(prefix="olamoma-bench-"))
+sys.path.insert(0, os.path.dirname(__file__))
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    # 默认保存JSON结果，便于比较不同版本之间的回归
+    if not config.pluginmanager.hasplugin("benchmark") or config.getoption("benchmark_json", None):
+        return
+    if not config.getoption("benchmark_disable", False) and not config.getoption("benchmark_save", None):
+        from pytest_benchmark.utils import get_tag
+
+        config.option.benchmark_autosave = config.option.benchmark_autosave or get_tag()
+
+
+@pytest.fixture(scope="session")
+def window():
+    """离屏的主窗口，不会触发真实的 ollama 调用"""
+    pytest.importorskip("PySide6")
+    from PySide6.QtWidgets import QApplication
+    from OlaMoMa.app import MainWindow
+
+    QApplication.instance() or QApplication([])
+    main_window = MainWindow()
+    yield main_window
+    main_window.close()
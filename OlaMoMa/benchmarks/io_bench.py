@@ -0,0 +1,312 @@
+"""导出、导入和哈希的端到端I/O基准测试
+
+在临时目录中生成合成的GGUF文件，启动模拟的Ollama服务器（OlaMoMa.fake_ollama）和假的 ollama 可执行文件，
+然后在独立的子进程中运行每种复制/哈希/导入策略，记录耗时、吞吐量、CPU时间和峰值内存。
+
+用法（在 OlaMoMa 目录下）::
+
+    python benchmarks/io_bench.py run --size 2G --output before.json
+    python benchmarks/io_bench.py run --size 2G --output after.json
+    python benchmarks/io_bench.py compare before.json after.json
+"""
+import argparse
+import hashlib
+import json
+import os
+import platform
+import shutil
+import struct
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+GGUF_MAGIC = b"GGUF"
+CHUNK = 1024 * 1024
+
+def parse_size(text):
+    """解析 512M / 2G 这样的大小参数"""
+    text = text.strip().upper()
+    units = {"K": 1024, "M": 1024 ** 2, "G": 1024 ** 3}
+    if text[-1] in units:
+        return int(float(text[:-1]) * units[text[-1]])
+    return int(text)
+
+
+def make_gguf(path, size, sparse=False, seed=b"olamoma"):
+    """生成合成的GGUF文件并返回其摘要；sparse 为 True 时只写文件头，其余部分为空洞"""
+    header = GGUF_MAGIC + struct.pack("<IQQ", 3, 0, 0)
+    digest = hashlib.sha256(header)
+    with open(path, "wb") as f:
+        f.write(header)
+        remaining = size - len(header)
+        if sparse:
+            f.truncate(size)
+            block = bytes(CHUNK)
+        else:
+            # 使用可重复的伪随机块，避免文件系统压缩或去重影响结果
+            block = hashlib.sha256(seed).digest() * (CHUNK // 32)
+        while remaining > 0:
+            chunk = block[:min(remaining, CHUNK)]
+            if not sparse:
+                f.write(chunk)
+            digest.update(chunk)
+            remaining -= len(chunk)
+    return "sha256:" + digest.hexdigest()
+
+
+def setup_environment(root, size, sparse):
+    """创建模拟的模型存储和假的 ollama 可执行文件，并安装一个待导出的模型"""
+    from OlaMoMa.fake_ollama import FakeOllama, blob_path, write_cli_shim
+
+    state = FakeOllama(os.path.join(root, "models"))
+    digest = make_gguf(os.path.join(root, "installed.gguf"), size, sparse)
+    os.replace(os.path.join(root, "installed.gguf"), blob_path(state.models_dir, digest))
+    state.add_model("bench:latest", size=size, digest=digest)
+
+    # 导入使用内容不同的文件，保证会真正上传
+    source = os.path.join(root, "source.gguf")
+    make_gguf(source, size, sparse, seed=b"olamoma-import")
+    env = {"root": root, "models_dir": state.models_dir, "ollama": write_cli_shim(os.path.join(root, "bin")),
+           "source": source, "size": size}
+    return state, env
+
+
+def drop_cache(path):
+    """尽量把文件移出页缓存，模拟冷读"""
+    if hasattr(os, "posix_fadvise"):
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+
+
+def make_manager(env):
+    """创建指向假 ollama 的 OllamaManager"""
+    from OlaMoMa.app import OllamaManager
+
+    manager = OllamaManager()
+    manager.ollama_path = env["ollama"]
+    return manager
+
+
+def strategy_export_manager(env):
+    make_manager(env).export_model("bench:latest", os.path.join(env["root"], "out", "bench.gguf"))
+    return env["size"]
+
+
+def strategy_copy_copyfileobj(env):
+    target = os.path.join(env["root"], "out", "copy.gguf")
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    with open(env["source"], "rb") as src, open(target, "wb") as dst:
+        shutil.copyfileobj(src, dst, CHUNK)
+    return env["size"]
+
+
+def strategy_copy_cache_neutral(env):
+    from OlaMoMa.fileio import copy_file
+
+    target = os.path.join(env["root"], "out", "neutral.gguf")
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    return copy_file(env["source"], target)
+
+
+def strategy_copy_file_range(env):
+    if not hasattr(os, "copy_file_range"):
+        raise RuntimeError("os.copy_file_range is not available")
+    target = os.path.join(env["root"], "out", "range.gguf")
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    with open(env["source"], "rb") as src, open(target, "wb") as dst:
+        remaining = env["size"]
+        while remaining > 0:
+            copied = os.copy_file_range(src.fileno(), dst.fileno(), min(remaining, 1 << 30))
+            if copied == 0:
+                break
+            remaining -= copied
+    return env["size"]
+
+
+def make_hash_strategy(buffer_size):
+    def strategy(env):
+        digest = hashlib.sha256()
+        with open(env["source"], "rb") as f:
+            for chunk in iter(lambda: f.read(buffer_size), b""):
+                digest.update(chunk)
+        return env["size"]
+    return strategy
+
+
+def strategy_hash_file_digest(env):
+    with open(env["source"], "rb") as f:
+        hashlib.file_digest(f, "sha256")
+    return env["size"]
+
+
+def strategy_hash_engine_files(env):
+    from OlaMoMa.hashing import HashEngine
+
+    # 同时计算待导入文件和已安装模型的blob，体现多文件任务的并行度
+    blobs = os.path.join(env["models_dir"], "blobs")
+    paths = [env["source"]] + [os.path.join(blobs, name) for name in os.listdir(blobs)]
+    HashEngine().hash_files(paths)
+    return sum(os.path.getsize(path) for path in paths)
+
+
+def strategy_hash_engine_tree(env):
+    from OlaMoMa.hashing import HashEngine
+
+    HashEngine().hash_tree(env["source"])
+    return env["size"]
+
+
+def strategy_import_manager(env):
+    make_manager(env).import_model(env["source"], "imported")
+    return env["size"]
+
+
+STRATEGIES = {
+    "export:OllamaManager.export_model": strategy_export_manager,
+    "copy:copyfileobj-1M": strategy_copy_copyfileobj,
+    "copy:copy_file_range": strategy_copy_file_range,
+    "copy:cache-neutral": strategy_copy_cache_neutral,
+    "hash:sha256-64K": make_hash_strategy(64 * 1024),
+    "hash:sha256-1M": make_hash_strategy(CHUNK),
+    "hash:sha256-8M": make_hash_strategy(8 * CHUNK),
+    "hash:hashlib.file_digest": strategy_hash_file_digest,
+    "hash:HashEngine.hash_files": strategy_hash_engine_files,
+    "hash:HashEngine.hash_tree": strategy_hash_engine_tree,
+    "import:OllamaManager.import_model": strategy_import_manager,
+}
+
+
+def run_worker(strategy, env):
+    """在子进程中执行单个策略，打印JSON格式的测量结果"""
+    os.environ["OLLAMA_MODELS"] = env["models_dir"]
+    os.environ["OLLAMA_HOST"] = env["host"]
+    start_cpu = time.process_time()
+    start = time.perf_counter()
+    moved = STRATEGIES[strategy](env)
+    wall = time.perf_counter() - start
+    result = {"strategy": strategy, "wall_s": wall, "bytes": moved,
+              "throughput_mb_s": moved / wall / 1e6 if wall else 0.0,
+              "cpu_s": time.process_time() - start_cpu}
+    if resource:
+        children = resource.getrusage(resource.RUSAGE_CHILDREN)
+        result["cpu_s"] += children.ru_utime + children.ru_stime
+        # Linux 上 ru_maxrss 单位为KB，macOS 上为字节
+        scale = 1 if sys.platform == "darwin" else 1024
+        peak = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, children.ru_maxrss)
+        result["peak_rss_mb"] = peak * scale / 1e6
+    print(json.dumps(result))
+
+
+def run_strategy(strategy, env, cold):
+    """启动子进程运行策略，保证峰值内存互不影响"""
+    if cold:
+        drop_cache(env["source"])
+    out_dir = os.path.join(env["root"], "out")
+    shutil.rmtree(out_dir, ignore_errors=True)
+    os.makedirs(out_dir)
+    proc = subprocess.run([sys.executable, os.path.abspath(__file__), "_worker", strategy, json.dumps(env)],
+                          capture_output=True, text=True)
+    if proc.returncode != 0:
+        return {"strategy": strategy, "error": proc.stderr.strip().splitlines()[-1] if proc.stderr else "failed"}
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def print_results(results):
+    """以表格形式输出结果"""
+    print(f"{'strategy':<38}{'wall s':>9}{'MB/s':>10}{'cpu s':>9}{'rss MB':>9}")
+    for r in results:
+        if "error" in r:
+            print(f"{r['strategy']:<38}  error: {r['error']}")
+            continue
+        print(f"{r['strategy']:<38}{r['wall_s']:>9.2f}{r['throughput_mb_s']:>10.1f}"
+              f"{r['cpu_s']:>9.2f}{r.get('peak_rss_mb', 0):>9.1f}")
+
+
+def command_run(args):
+    size = parse_size(args.size)
+    selected = [s for s in STRATEGIES if not args.only or any(s.startswith(p) for p in args.only)]
+    from OlaMoMa.fake_ollama import FakeOllamaServer, blob_path
+
+    with tempfile.TemporaryDirectory(prefix="olamoma-io-", dir=args.workdir) as root:
+        state, env = setup_environment(root, size, args.sparse)
+        results = []
+        with FakeOllamaServer(state) as server:
+            env["host"] = server.url
+            for strategy in selected:
+                runs = []
+                for _ in range(args.repeat):
+                    # 每次运行前删除上一次导入的模型和blob，保证导入会真正上传
+                    imported = state.get_model("imported")
+                    if imported:
+                        state.remove_model("imported")
+                        os.remove(blob_path(state.models_dir, imported["layers"][0]["digest"]))
+                    runs.append(run_strategy(strategy, env, args.cold))
+                ok = [r for r in runs if "error" not in r]
+                # 取最快的一次，减少噪声
+                results.append(min(ok, key=lambda r: r["wall_s"]) if ok else runs[-1])
+    report = {"size": size, "sparse": args.sparse, "cold": args.cold, "python": platform.python_version(),
+              "platform": platform.platform(), "timestamp": time.time(), "results": results}
+    print_results(results)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+
+def command_compare(args):
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = {r["strategy"]: r for r in json.load(f)["results"]}
+    with open(args.current, encoding="utf-8") as f:
+        current = json.load(f)["results"]
+    print(f"{'strategy':<38}{'MB/s before':>13}{'MB/s after':>12}{'change':>9}{'rss change':>12}")
+    for r in current:
+        old = baseline.get(r["strategy"])
+        if not old or "error" in old or "error" in r:
+            print(f"{r['strategy']:<38}  n/a")
+            continue
+        change = (r["throughput_mb_s"] / old["throughput_mb_s"] - 1) * 100 if old["throughput_mb_s"] else 0.0
+        rss = r.get("peak_rss_mb", 0) - old.get("peak_rss_mb", 0)
+        print(f"{r['strategy']:<38}{old['throughput_mb_s']:>13.1f}{r['throughput_mb_s']:>12.1f}"
+              f"{change:>+8.1f}%{rss:>+11.1f}M")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run = sub.add_parser("run", help="run the benchmark")
+    run.add_argument("--size", default="512M", help="GGUF file size, e.g. 512M or 4G")
+    run.add_argument("--sparse", action="store_true", help="use a sparse file instead of real data")
+    run.add_argument("--cold", action="store_true", help="drop the source from the page cache before each run")
+    run.add_argument("--repeat", type=int, default=1, help="runs per strategy, the fastest is reported")
+    run.add_argument("--only", nargs="*", help="strategy name prefixes, e.g. hash: export:")
+    run.add_argument("--workdir", help="directory for temporary files (choose the disk under test)")
+    run.add_argument("--output", help="write the report to this JSON file")
+    run.set_defaults(func=command_run)
+
+    compare = sub.add_parser("compare", help="compare two reports")
+    compare.add_argument("baseline")
+    compare.add_argument("current")
+    compare.set_defaults(func=command_compare)
+
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv and argv[0] == "_worker":
+        run_worker(argv[1], json.loads(argv[2]))
+        return
+    args = parser.parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""生成用于基准测试的合成数据"""
+import random
+
+SIZES = [10, 1000, 50000]
+
+FAMILIES = ["llama3.2", "qwen2.5", "mistral", "gemma2", "phi3", "deepseek-r1", "hf.co/user/model-gguf"]
+TAGS = ["latest", "3b", "7b-instruct-q4_K_M", "14b", "70b-q8_0"]
+UNITS = ["KB", "MB", "GB"]
+DATES = ["7 minutes ago", "2 hours ago", "3 weeks ago", "2024-05-01 12:30:00", "06/30/2024 08:15"]
+
+
+def make_models(count, seed=0):
+    """生成 count 个 ModelRecord，与 OllamaManager.parse_list_output 的结果相同"""
+    from OlaMoMa.records import ModelRecord
+
+    rng = random.Random(seed)
+    models = []
+    for i in range(count):
+        name = f"{rng.choice(FAMILIES)}-{i}"
+        tag = rng.choice(TAGS)
+        models.append(ModelRecord.create(
+            f"{name}:{tag}", f"{rng.getrandbits(48):012x}",
+            int(rng.uniform(1, 999) * 1000 ** rng.randint(1, 3)),
+            rng.randint(1600000000, 1750000000), "local"))
+    return models
+
+
+def make_size_texts(count, seed=0):
+    """生成 ollama list 中的大小文本"""
+    rng = random.Random(seed)
+    return [f"{rng.uniform(1, 999):.1f} {rng.choice(UNITS)}" for _ in range(count)]
+
+
+def make_date_texts(count, seed=0):
+    """生成 ollama list 中的修改时间文本"""
+    rng = random.Random(seed)
+    return [rng.choice(DATES) for _ in range(count)]
+
+
+def make_list_output(count, seed=0):
+    """生成与 ollama list 相同格式的文本输出"""
+    from OlaMoMa.api import format_size
+
+    lines = [f"{'NAME':<48}{'ID':<16}{'SIZE':<10}MODIFIED"]
+    for model, date in zip(make_models(count, seed), make_date_texts(count, seed)):
+        lines.append(f"{model.full_name:<48}{model.id:<16}{format_size(model.size):<10}{date}")
+    return '\n'.join(lines) + '\n'
+
+
+def make_manifest_tree(models_dir, count, seed=0):
+    """在 models_dir 下写入 count 个 manifest（不写入blob），返回模型名列表"""
+    import json
+    import os
+
+    from OlaMoMa.manifests import MODEL_MEDIA_TYPE, manifest_path
+
+    rng = random.Random(seed)
+    names = []
+    for model in make_models(count, seed):
+        path = manifest_path(models_dir, model.full_name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        layer = {'mediaType': MODEL_MEDIA_TYPE, 'digest': f"sha256:{rng.getrandbits(256):064x}",
+                 'size': rng.randint(10 ** 8, 5 * 10 ** 10)}
+        config = {'mediaType': "application/vnd.docker.container.image.v1+json",
+                  'digest': f"sha256:{rng.getrandbits(256):064x}", 'size': 500}
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'schemaVersion': 2, 'config': config, 'layers': [layer]}, f)
+        names.append(model.full_name)
+    return names
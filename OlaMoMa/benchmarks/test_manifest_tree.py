@@ -0,0 +1,28 @@
+"""遍历和解析 manifest 目录树的微基准测试"""
+import pytest
+
+from synthetic import SIZES, make_manifest_tree
+
+pytest.importorskip("pytest_benchmark")
+
+from OlaMoMa.manifests import iter_manifests, model_blobs  # noqa: E402
+
+from test_ui_hot_paths import run  # noqa: E402
+
+
+@pytest.fixture(scope="module", params=SIZES)
+def manifest_tree(request, tmp_path_factory):
+    models_dir = str(tmp_path_factory.mktemp(f"models-{request.param}"))
+    return request.param, models_dir, make_manifest_tree(models_dir, request.param)
+
+
+def test_iter_manifests(benchmark, manifest_tree):
+    size, models_dir, names = manifest_tree
+    found = run(benchmark, size, lambda: list(iter_manifests(models_dir)))
+    assert len(found) == len(set(names))
+
+
+def test_resolve_blobs(benchmark, manifest_tree):
+    size, models_dir, names = manifest_tree
+    blobs = run(benchmark, size, lambda: [model_blobs(models_dir, name) for name in names])
+    assert len(blobs) == len(names)
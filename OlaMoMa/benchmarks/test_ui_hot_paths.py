@@ -0,0 +1,77 @@
+"""列表解析、排序、过滤和表格填充的微基准测试"""
+import pytest
+
+from synthetic import SIZES, make_date_texts, make_list_output, make_models, make_size_texts
+
+pytest.importorskip("pytest_benchmark")
+
+from OlaMoMa.app import OllamaManager  # noqa: E402
+from OlaMoMa.records import parse_modified, parse_size  # noqa: E402
+
+
+def run(benchmark, size, func, setup=None):
+    """小规模数据自动校准轮数，大规模数据固定轮数以控制运行时间"""
+    if size >= 50000:
+        return benchmark.pedantic(func, setup=setup, rounds=3, iterations=1)
+    if setup is not None:
+        return benchmark.pedantic(func, setup=setup, rounds=20, iterations=1)
+    return benchmark(func)
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_parse_list_output(benchmark, size):
+    output = make_list_output(size)
+    models = run(benchmark, size, lambda: OllamaManager.parse_list_output(output))
+    assert len(models) == size
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_parse_size(benchmark, size):
+    sizes = make_size_texts(size)
+    run(benchmark, size, lambda: [parse_size(s) for s in sizes])
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_parse_date(benchmark, size):
+    dates = make_date_texts(size)
+    run(benchmark, size, lambda: [parse_modified(d) for d in dates])
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_sort_models(benchmark, window, size):
+    models = make_models(size)
+
+    def setup():
+        window.models_data = list(models)
+        window.sort_combo.blockSignals(True)
+        window.sort_combo.setCurrentIndex(2)  # Size (Largest First)
+        window.sort_combo.blockSignals(False)
+
+    run(benchmark, size, window.sort_models, setup)
+    assert window.model_table.rowCount() == size
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_filter_models(benchmark, window, size):
+    models = make_models(size)
+
+    def setup():
+        window.original_models_data = models
+        window.search_input.blockSignals(True)
+        window.search_input.setText("qwen")
+        window.search_input.blockSignals(False)
+
+    run(benchmark, size, window.filter_models, setup)
+    assert window.model_table.rowCount() <= size
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_populate_table(benchmark, window, size):
+    models = make_models(size)
+
+    def setup():
+        window.models_data = models
+        window.model_table.setRowCount(0)
+
+    run(benchmark, size, window.update_table_from_data, setup)
+    assert window.model_table.rowCount() == size
@@ -0,0 +1,292 @@
+"""Ollama REST API 客户端
+"""
+import errno
+import json
+import os
+import socket
+import urllib.error
+import urllib.request
+from datetime import datetime
+from urllib.parse import urlsplit
+
+from .records import ModelRecord
+from .throttle import bandwidth
+from .tracing import timed
+
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
+DEFAULT_HOST = "http://127.0.0.1:11434"
+
+
+def normalize_host(host):
+    """把 OLLAMA_HOST 风格的地址规范化为 scheme://host:port
+
+    与 Ollama 解析 OLLAMA_HOST 的方式一致：没有写协议时默认端口为 11434，写了协议时使用协议的
+    默认端口（http 为 80，https 为 443），便于登记反向代理后面的服务器。
+    """
+    if not host:
+        return DEFAULT_HOST
+    host = host.strip().rstrip('/')
+    scheme, default_port = "http", 11434
+    if "://" in host:
+        scheme, host = host.split("://", 1)
+        scheme = scheme.lower()
+        default_port = 443 if scheme == "https" else 80
+    url = urlsplit(f"{scheme}://{host}")
+    try:
+        port = url.port or default_port
+    except ValueError:
+        raise Exception(f"Invalid port in Ollama host: {host}")
+    hostname = url.hostname or "127.0.0.1"
+    # 监听地址 0.0.0.0 和 :: 不能直接连接
+    hostname = {"0.0.0.0": "127.0.0.1", "::": "::1"}.get(hostname, hostname)
+    if ':' in hostname:
+        hostname = f"[{hostname}]"
+    return f"{scheme}://{hostname}:{port}{url.path.rstrip('/')}"
+
+
+def is_local_url(url):
+    """地址是否指向本机，只有本机的服务器与本进程共用同一个模型目录"""
+    netloc = normalize_host(url).split("://", 1)[1].split('/', 1)[0]
+    host = netloc.rsplit(':', 1)[0].strip('[]').lower()
+    return host in ("127.0.0.1", "localhost", "::1")
+
+
+def format_size(num_bytes):
+    """按 ollama list 的格式显示大小"""
+    for unit, factor in (("GB", 1000 ** 3), ("MB", 1000 ** 2), ("KB", 1000)):
+        if num_bytes >= factor:
+            return f"{num_bytes / factor:.1f} {unit}"
+    return f"{num_bytes} B"
+
+
+def parse_timestamp(value):
+    """把 API 返回的 RFC3339 时间解析为 datetime，失败时抛出 ValueError"""
+    # 去掉纳秒部分，fromisoformat 最多支持微秒
+    if '.' in value:
+        head, tail = value.split('.', 1)
+        digits = ''.join(c for c in tail if c.isdigit())
+        zone = tail[len(digits):]
+        value = f"{head}.{digits[:6]}{zone}"
+    value = value.replace('Z', '+00:00')
+    return datetime.fromisoformat(value)
+
+
+def format_timestamp(value):
+    """把 API 返回的 RFC3339 时间转换为本地时间字符串"""
+    if not value:
+        return ""
+    try:
+        return parse_timestamp(value).astimezone().strftime("%Y-%m-%d %H:%M:%S")
+    except ValueError:
+        return value
+
+
+def format_processor(size, size_vram):
+    """按 ollama ps 的格式显示模型在CPU和GPU之间的分布"""
+    if not size or not size_vram:
+        return "100% CPU"
+    if size_vram >= size:
+        return "100% GPU"
+    gpu = round(size_vram * 100 / size)
+    return f"{100 - gpu}%/{gpu}% CPU/GPU"
+
+
+def model_from_tag(entry):
+    """把 /api/tags 中的一项转换为 ModelRecord"""
+    try:
+        modified_at = parse_timestamp(entry.get('modified_at', '')).timestamp()
+    except ValueError:
+        modified_at = 0
+    return ModelRecord.create(entry.get('name') or entry.get('model', ''), entry.get('digest', '')[:12],
+                              entry.get('size', 0), modified_at)
+
+
+def loaded_model_from_ps(entry):
+    """把 /api/ps 中的一项转换为字典，expires_at 为时间戳，None 表示一直驻留"""
+    expires_at = None
+    try:
+        expires = parse_timestamp(entry.get('expires_at', ''))
+        # keep_alive 为负数时，Ollama 返回一个很遥远的到期时间
+        if expires.year < 2200:
+            expires_at = expires.timestamp()
+    except ValueError:
+        pass
+    size = entry.get('size', 0)
+    size_vram = entry.get('size_vram', 0)
+    return {
+        'full_name': entry.get('name') or entry.get('model', ''),
+        'id': entry.get('digest', '')[:12],
+        'size': format_size(size),
+        'size_bytes': size,
+        'processor': format_processor(size, size_vram),
+        'expires_at': expires_at,
+    }
+
+
+_request_observers = []
+
+# 连接阶段的这些错误说明服务器不可用
+_UNREACHABLE_ERRNOS = (errno.ENETUNREACH, errno.EHOSTUNREACH, errno.EHOSTDOWN, errno.EADDRNOTAVAIL)
+
+
+def is_connect_error(error):
+    """是否为连接阶段的错误（拒绝连接、网络或主机不可达、域名解析失败）
+
+    超时和已建立的连接被断开不算：大模型的 /api/create 或上传超过了超时时间，只说明这个请求慢，
+    服务器仍然在线。完全没有响应的服务器由 ConnectionManager 的健康检查发现。
+    """
+    if isinstance(error, (ConnectionRefusedError, socket.gaierror)):
+        return True
+    return isinstance(error, OSError) and not isinstance(error, TimeoutError) and error.errno in _UNREACHABLE_ERRNOS
+
+
+def add_request_observer(callback):
+    """注册每次请求后的回调 callback(base_url, error)；连接失败时 error 为异常，收到响应时为 None
+
+    只有连接阶段的错误（见 is_connect_error）会通知回调，超时等其他错误不会。
+    """
+    _request_observers.append(callback)
+
+
+class OllamaClient:
+    """Ollama REST API 的轻量客户端"""
+
+    def __init__(self, base_url=None, timeout=10, observe=True):
+        self.base_url = normalize_host(base_url or os.environ.get("OLLAMA_HOST"))
+        self.timeout = timeout
+        self.observe = observe
+
+    def _report(self, error=None):
+        if self.observe:
+            for callback in _request_observers:
+                callback(self.base_url, error)
+
+    def _open(self, method, path, payload=None, timeout=None, data=None, headers=None):
+        """发送请求并返回响应对象，HTTP错误和连接错误统一转换为 Exception"""
+        headers = dict(headers or {})
+        if payload is not None:
+            data = json.dumps(payload).encode('utf-8')
+            headers['Content-Type'] = 'application/json'
+        req = urllib.request.Request(self.base_url + path, data=data, headers=headers, method=method)
+        try:
+            with timed("http"):
+                response = urllib.request.urlopen(req, timeout=timeout or self.timeout)
+            self._report()
+            return response
+        except urllib.error.HTTPError as e:
+            self._report()
+            detail = e.read().decode('utf-8', errors='replace')
+            try:
+                detail = json.loads(detail).get('error', detail)
+            except (ValueError, AttributeError):
+                pass
+            raise Exception(f"{method} {path} failed ({e.code}): {detail}")
+        except (urllib.error.URLError, OSError) as e:
+            reason = getattr(e, 'reason', e)
+            if is_connect_error(reason):
+                self._report(reason)
+            raise Exception(f"Cannot connect to {self.base_url}: {reason}")
+
+    def request(self, method, path, payload=None, timeout=None, data=None, headers=None):
+        """发送请求并返回解析后的JSON"""
+        with self._open(method, path, payload, timeout, data, headers) as response:
+            with timed("http"):
+                body = response.read()
+        return json.loads(body) if body else {}
+
+    def stream(self, method, path, payload=None, timeout=None):
+        """发送请求并逐条返回NDJSON流中的对象"""
+        with self._open(method, path, payload, timeout) as response:
+            while True:
+                with timed("http"):
+                    line = response.readline()
+                if not line:
+                    break
+                line = line.strip()
+                if line:
+                    yield json.loads(line)
+
+    def version(self):
+        """返回服务器版本号"""
+        return self.request("GET", "/api/version").get('version', '')
+
+    def list_models(self):
+        """列出服务器上的模型"""
+        tags = self.request("GET", "/api/tags")
+        return [model_from_tag(entry) for entry in tags.get('models', [])]
+
+    def loaded_models(self):
+        """列出当前加载在内存或显存中的模型"""
+        ps = self.request("GET", "/api/ps")
+        return [loaded_model_from_ps(entry) for entry in ps.get('models', [])]
+
+    def load_model(self, model, keep_alive=None):
+        """预加载模型并设置驻留时间；加载大模型可能需要较长时间"""
+        payload = {'model': model}
+        if keep_alive is not None:
+            payload['keep_alive'] = keep_alive
+        self.request("POST", "/api/generate", payload, timeout=600)
+
+    def unload_model(self, model):
+        """立即从内存中卸载模型"""
+        self.request("POST", "/api/generate", {'model': model, 'keep_alive': 0})
+
+    def delete_model(self, model):
+        """删除模型"""
+        self.request("DELETE", "/api/delete", {'model': model}, timeout=30)
+
+    def pull_model(self, model, progress=None):
+        """从仓库拉取（更新）模型；progress(状态, 已完成字节, 总字节) 在每条进度消息后调用"""
+        for line in self.stream("POST", "/api/pull", {'model': model}, timeout=300):
+            if line.get('error'):
+                raise Exception(line['error'])
+            if progress:
+                progress(line.get('status', ''), line.get('completed', 0), line.get('total', 0))
+
+    def has_blob(self, digest):
+        """服务器上是否已有该摘要的blob"""
+        try:
+            self.request("HEAD", f"/api/blobs/{digest}")
+            return True
+        except Exception as e:
+            if "(404)" in str(e):
+                return False
+            raise
+
+    def upload_blob(self, digest, path, progress=None, cancelled=None, drop_behind=None):
+        """通过 POST /api/blobs 上传文件，服务器会校验摘要
+
+        上传速度受 throttle.bandwidth 的总带宽限制；progress(已上传字节, 总字节) 在每个块之后调用，
+        cancelled() 返回 True 时中止上传。传入 fileio.DropBehind 时按窗口丢弃已发送的页。
+        """
+        size = os.path.getsize(path)
+
+        def chunks():
+            sent = 0
+            with open(path, 'rb') as f:
+                while True:
+                    if cancelled and cancelled():
+                        raise Exception("Upload cancelled")
+                    chunk = f.read(UPLOAD_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    bandwidth.consume(len(chunk))
+                    yield chunk
+                    sent += len(chunk)
+                    if drop_behind:
+                        drop_behind.advance(sent)
+                    if progress:
+                        progress(sent, size)
+
+        headers = {'Content-Length': str(size), 'Content-Type': 'application/octet-stream'}
+        with self._open("POST", f"/api/blobs/{digest}", data=chunks(), headers=headers, timeout=600) as response:
+            response.read()
+
+    def create_model(self, request):
+        """用 /api/create 创建模型，request 为API请求体（files/template/system/parameters 等）"""
+        request = dict(request, stream=False)
+        response = self.request("POST", "/api/create", request, timeout=600)
+        if response.get('error'):
+            raise Exception(response['error'])
+        return response
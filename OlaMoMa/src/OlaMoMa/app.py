@@ -10,22 +10,57 @@ from PySide6 import QtWidgets
 
 import sys
 import os
+import asyncio
+import itertools
 import json
+import re
 import shutil
 import subprocess
+import time
 from pathlib import Path
 from PySide6.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, 
                              QWidget, QPushButton, QListWidget, QLabel, QFileDialog, 
                              QMessageBox, QProgressBar, QInputDialog, QMenuBar, QMenu,
-                             QTableWidget, QTableWidgetItem, QHeaderView, QComboBox, QLineEdit)
-from PySide6.QtCore import Qt, QThread, Signal, QTranslator, QLocale, QTimer
+                             QTableWidget, QTableWidgetItem, QHeaderView, QComboBox, QLineEdit,
+                             QDialog, QDialogButtonBox, QDockWidget, QCheckBox, QSpinBox)
+from PySide6.QtCore import Qt, QEvent, QObject, QThread, Signal, QTranslator, QLocale, QTimer
 from PySide6.QtGui import QAction
 
+from .hosts import HostRegistry, MultiHostLister, LOCAL_HOST
+from .tracing import get_tracer, current_span, timed
+from . import asyncops, profiling, throttle
+from .api import OllamaClient, format_size, is_local_url
+from .connection import ServiceUnavailable, add_listener, get_connection
+from .deploy import deploy, format_deploy_report
+from .inference import BenchmarkHistory, benchmark_model
+from .loadtest import run_load_test, write_csv
+from .monitor import AdaptiveInterval, format_remaining, parse_keep_alive
+from .pagecache import format_report, warm_model
+from .fileio import DropBehind, check_free_space, copy_file, existing_parent, link_file, same_filesystem
+from .folderimport import plan_folder_import, run_folder_import, summarize
+from .gguf import read_metadata
+from .hashing import HashEngine, file_digest, format_verify_report, verify_blobs
+from .manifests import MODEL_MEDIA_TYPE, blob_path, model_blobs
+from .modelfile import create_request, parse_modelfile
+from .templates import get_registry
+from .records import format_modified, parse_list_output
+from .session import get_session
+
+# 导入文件夹时同时进行的导入数
+FOLDER_IMPORT_CONCURRENCY = 2
+# 批量导出规划时为每个Modelfile预留的空间，模型文件本身的大小取自manifest
+MODELFILE_ALLOWANCE = 1024 * 1024
+
+
 class OllamaManager:
-    """管理Ollama模型的类"""
+    """管理Ollama模型的类
     
-    def __init__(self):
-        self.ollama_path = self.find_ollama()
+    可执行文件、模型目录和服务器能力来自共享的 Session，创建 OllamaManager 不再重新查找。
+    """
+    
+    def __init__(self, session=None):
+        self.session = session or get_session()
+        self.ollama_path = self.session.ollama_path
     
     def tr(self, text):
         """简单的翻译方法，实际应用中应使用更完整的国际化方案"""
@@ -41,184 +76,151 @@ class OllamaManager:
             translated = translated.replace(f"%{i+1}", str(arg))
         return translated
     
-    def find_ollama(self):
-        """查找Ollama可执行文件"""
-        # 常见的Ollama安装路径
-        possible_paths = [
-            "ollama",
-            "C:\\Program Files\\Ollama\\ollama.exe",
-            "C:\\Users\\%USERNAME%\\AppData\\Local\\Ollama\\ollama.exe",
-            "/usr/bin/ollama",
-            "/usr/local/bin/ollama"
-        ]
+    def run_command(self, cmd, **kwargs):
+        """运行 ollama 命令，并把耗时计入当前操作的追踪记录"""
+        with timed("subprocess"):
+            return subprocess.run(cmd, capture_output=True, text=True, shell=False, encoding='utf-8', **kwargs)
+    
+    def check_service(self):
+        """确认Ollama服务在运行
         
-        # 尝试在PATH中查找
-        import shutil
-        ollama_path = shutil.which("ollama")
-        if ollama_path:
-            return ollama_path
-            
-        # 如果在PATH中找不到，则尝试常见路径
-        for path in possible_paths:
-            # 在Windows上，替换%USERNAME%
-            if os.name == 'nt' and '%USERNAME%' in path:
-                import getpass
-                username = getpass.getuser()
-                path = path.replace('%USERNAME%', username)
-            
-            if os.path.exists(path):
-                return path
-                
-        return None
+        使用共享的连接状态：几秒内检查过就不再请求，服务不可用时在退避时间内立即失败，
+        不必每个操作都等待自己的超时。
+        """
+        try:
+            get_connection(self.session.base_url).ensure_online()
+        except ServiceUnavailable as e:
+            raise Exception(f"Ollama service is not running. Please start Ollama first. {e}")
     
     def list_models(self):
         """列出所有已下载的模型，返回详细的模型信息"""
         try:
-            result = subprocess.run([self.ollama_path, "list"], 
-                                  capture_output=True, text=True, shell=False, encoding='utf-8', timeout=10)
+            # 服务已知不可用时立即失败
+            connection = get_connection(self.session.base_url)
+            connection.raise_if_open()
+            # 服务器可用时直接请求 /api/tags，不启动 ollama 子进程
+            if self.session.detect():
+                return OllamaClient(self.session.base_url).list_models()
+            if not self.ollama_path:
+                raise Exception("Ollama executable not found")
+            result = self.run_command([self.ollama_path, "list"], timeout=10)
             if result.returncode != 0:
                 raise Exception(f"Failed to list models: {result.stderr}")
             
-            # 解析输出，提取详细的模型信息
-            import re
-            models = []
-            for line in result.stdout.split('\n'):
-                line = line.strip()
-                if not line or line.startswith('NAME'):  # 跳过标题行和空行
-                    continue
-                
-                # 使用正则表达式匹配 ollama list 的输出格式
-                # 格式: model_name:tag    ID    size    modified_date
-                # 例如: llama3.2:3b    a80c4f17acd5    2.0 GB    7 minutes ago
-                pattern = r'^([a-zA-Z0-9_./-]+):([a-zA-Z0-9_.-]+)\s+([a-f0-9]+)\s+([0-9.]+\s*[KMG]?B?)\s+(.+)$'
-                match = re.match(pattern, line)
-                
-                if match:
-                    # 匹配成功，提取各个字段
-                    model_name = match.group(1).strip()
-                    tag = match.group(2).strip()
-                    model_id = match.group(3).strip()
-                    size = match.group(4).strip()
-                    modified_date = match.group(5).strip()
-                    
-                    # 创建完整的模型标识符
-                    full_name = f"{model_name}:{tag}"
-                    
-                    models.append({
-                        'name': model_name,
-                        'tag': tag,
-                        'id': model_id,
-                        'full_name': full_name,
-                        'size': size,
-                        'modified_date': modified_date
-                    })
-                else:
-                    # 如果没有匹配到，尝试处理没有标签的模型
-                    # 格式: model_name    ID    size    modified_date
-                    pattern_no_tag = r'^([a-zA-Z0-9_./-]+)\s+([a-f0-9]+)\s+([0-9.]+[KMG]?B?)\s+(.+)$'
-                    match_no_tag = re.match(pattern_no_tag, line)
-                    
-                    if match_no_tag:
-                        model_name = match_no_tag.group(1).strip()
-                        model_id = match_no_tag.group(2).strip()
-                        size = match_no_tag.group(3).strip()
-                        modified_date = match_no_tag.group(4).strip()
-                        
-                        # 创建完整的模型标识符
-                        full_name = model_name
-                        
-                        models.append({
-                            'name': model_name,
-                            'tag': "",
-                            'id': model_id,
-                            'full_name': full_name,
-                            'size': size,
-                            'modified_date': modified_date
-                        })
-                    else:
-                        # 如果还是无法匹配，使用简单的分割方法
-                        parts = line.split()
-                        if len(parts) >= 4:
-                            # 检查第一个部分是否包含冒号（有标签）
-                            if ':' in parts[0]:
-                                name_parts = parts[0].split(':', 1)
-                                model_name = name_parts[0].strip()
-                                tag = name_parts[1].strip()
-                                full_name = f"{model_name}:{tag}"
-                            else:
-                                model_name = parts[0].strip()
-                                tag = ""
-                                full_name = model_name
-                            
-                            model_id = parts[1] if len(parts) > 1 else ""
-                            size = parts[2] if len(parts) > 2 else ""
-                            modified_date = " ".join(parts[3:]) if len(parts) > 3 else ""
-                            
-                            models.append({
-                                'name': model_name,
-                                'tag': tag,
-                                'id': model_id,
-                                'full_name': full_name,
-                                'size': size,
-                                'modified_date': modified_date
-                            })
-            
-            return models
+            connection.record_success()
+            return self.parse_list_output(result.stdout)
         except subprocess.TimeoutExpired:
             raise Exception("Timeout while listing models")
         except Exception as e:
             raise Exception(f"Error listing models: {str(e)}")
     
+    async def list_models_async(self):
+        """list_models 的协程版本，多主机列表在事件循环中使用"""
+        try:
+            return await asyncops.list_local(self.session, self.ollama_path)
+        except Exception as e:
+            raise Exception(f"Error listing models: {str(e)}")
+    
+    parse_list_output = staticmethod(parse_list_output)
+    
+    def resolve_model_file(self, model_name):
+        """通过 ollama show --modelfile 找到模型文件，返回 (模型文件路径, Modelfile内容)"""
+        if not self.ollama_path:
+            raise Exception("Ollama executable not found")
+        
+        # 使用 ollama show --modelfile 命令获取模型文件内容
+        cmd = [self.ollama_path, "show", "--modelfile", model_name]
+        result = self.run_command(cmd)
+        
+        if result.returncode != 0:
+            raise Exception(f"Failed to get model file: {result.stderr}")
+        
+        # 解析 Modelfile 内容找到实际的模型文件路径
+        modelfile_content = result.stdout
+        model_file_path = None
+        
+        # 查找 FROM 行中的模型文件路径
+        for line in modelfile_content.split('\n'):
+            if line.startswith('FROM '):
+                model_file_path = line.split(' ')[1].strip()
+                break
+        
+        if not model_file_path:
+            raise Exception("Could not find model file path")
+        
+        # 如果模型文件路径是相对路径，则转换为绝对路径
+        if model_file_path.startswith('~'):
+            model_file_path = os.path.expanduser(model_file_path)
+        elif not os.path.isabs(model_file_path):
+            # 假设模型文件在 Ollama 的模型目录下
+            model_file_path = os.path.join(self.session.models_dir, 'blobs', model_file_path)
+        # 如果模型文件路径已经是绝对路径，直接使用
+        
+        # 检查模型文件是否存在
+        if not os.path.exists(model_file_path):
+            raise Exception(f"Model file does not exist: {model_file_path}")
+        
+        return model_file_path, modelfile_content
+    
+    def export_size(self, model_name):
+        """导出模型需要的字节数：优先读取manifest中的模型层大小，找不到manifest时通过 ollama show 获取"""
+        try:
+            for blob in model_blobs(self.session.models_dir, model_name):
+                if blob['media_type'] == MODEL_MEDIA_TYPE:
+                    return blob['size'] + MODELFILE_ALLOWANCE
+        except Exception:
+            pass
+        model_file_path, modelfile_content = self.resolve_model_file(model_name)
+        return os.path.getsize(model_file_path) + len(modelfile_content.encode('utf-8'))
+    
+    def plan_exports(self, items):
+        """在开始复制之前检查批量导出所需的空间
+        
+        items 为 [(模型名, 导出路径)]，按目标文件系统汇总所需空间（会被覆盖的文件不计入），
+        任何一个文件系统空间不足都会抛出异常。返回 [(模型名, 导出路径, 字节数)]。
+        """
+        plan = []
+        devices = {}  # 文件系统 -> [目录, 所需字节数]
+        for model_name, export_path in items:
+            size = self.export_size(model_name)
+            plan.append((model_name, export_path, size))
+            directory = existing_parent(os.path.dirname(os.path.abspath(export_path)))
+            entry = devices.setdefault(os.stat(directory).st_dev, [directory, 0])
+            entry[1] += size
+            if os.path.exists(export_path):
+                entry[1] -= os.path.getsize(export_path)
+        for directory, required in devices.values():
+            check_free_space(directory, required)
+        return plan
+    
     def export_model(self, model_name, export_path):
         """导出模型到指定路径"""
         if not self.ollama_path:
             raise Exception("Ollama executable not found")
         
         try:
-            # 使用 ollama show --modelfile 命令获取模型文件内容
-            cmd = [self.ollama_path, "show", "--modelfile", model_name]
-            result = subprocess.run(cmd, capture_output=True, text=True, shell=False, encoding='utf-8')
-            
-            if result.returncode != 0:
-                raise Exception(f"Failed to get model file: {result.stderr}")
-            
-            # 解析 Modelfile 内容找到实际的模型文件路径
-            modelfile_content = result.stdout
-            model_file_path = None
-            
-            # 查找 FROM 行中的模型文件路径
-            for line in modelfile_content.split('\n'):
-                if line.startswith('FROM '):
-                    model_file_path = line.split(' ')[1].strip()
-                    break
-            
-            if not model_file_path:
-                raise Exception("Could not find model file path")
-            
-            # 如果模型文件路径是相对路径，则转换为绝对路径
-            if model_file_path.startswith('~'):
-                model_file_path = os.path.expanduser(model_file_path)
-            elif not os.path.isabs(model_file_path):
-                # 假设模型文件在 Ollama 默认存储路径下
-                ollama_models_dir = os.environ.get('OLLAMA_MODELS', os.path.expanduser('~/.ollama/models'))
-                model_file_path = os.path.join(ollama_models_dir, 'blobs', model_file_path)
-            # 如果模型文件路径已经是绝对路径，直接使用
+            model_file_path, modelfile_content = self.resolve_model_file(model_name)
+            modelfile_path = os.path.splitext(export_path)[0] + ".modelfile"
             
-            # 检查模型文件是否存在
-            if not os.path.exists(model_file_path):
-                raise Exception(f"Model file does not exist: {model_file_path}")
+            # 开始复制之前检查目标磁盘的剩余空间，被覆盖的旧文件所占空间会被释放
+            required = os.path.getsize(model_file_path) + len(modelfile_content.encode('utf-8'))
+            for path in (export_path, modelfile_path):
+                if os.path.exists(path):
+                    required -= os.path.getsize(path)
+            check_free_space(export_path, required)
             
             # 创建导出目录
             export_dir = os.path.dirname(export_path)
             if not os.path.exists(export_dir):
                 os.makedirs(export_dir)
             
-            # 复制模型文件到导出路径
-            import shutil
-            shutil.copy2(model_file_path, export_path)
+            # 复制模型文件到导出路径，复制过的页不留在页缓存中，避免挤掉正在使用的模型
+            copy_file(model_file_path, export_path)
+            span = current_span()
+            if span is not None:
+                span.add_bytes(os.path.getsize(export_path))
             
             # 导出Modelfile到同一目录
-            modelfile_path = os.path.splitext(export_path)[0] + ".modelfile"
             with open(modelfile_path, 'w', encoding='utf-8') as f:
                 f.write(modelfile_content)
             
@@ -226,21 +228,10 @@ class OllamaManager:
         except Exception as e:
             raise Exception(f"Error exporting model: {str(e)}")
     
-    def import_model(self, import_path, new_model_name=None):
-        """从指定路径导入模型"""
-        if not self.ollama_path:
-            raise Exception("Ollama executable not found")
-        
+    def import_model(self, import_path, new_model_name=None, progress=None, cancelled=None, digest=None):
+        """从指定路径导入模型，progress、cancelled 和 digest 见 import_by_digest"""
         # 检查Ollama服务是否运行
-        try:
-            result = subprocess.run([self.ollama_path, "list"], 
-                                  capture_output=True, text=True, shell=False, encoding='utf-8', timeout=10)
-            if result.returncode != 0:
-                raise Exception("Ollama service is not running. Please start Ollama first.")
-        except subprocess.TimeoutExpired:
-            raise Exception("Ollama service is not responding. Please start Ollama first.")
-        except Exception as e:
-            raise Exception(f"Failed to connect to Ollama service: {str(e)}")
+        self.check_service()
         
         try:
             # 检查文件是否存在
@@ -258,10 +249,10 @@ class OllamaManager:
             if not new_model_name:
                 new_model_name = os.path.splitext(os.path.basename(import_path))[0]
             
-            # 验证模型名是否有效（不能包含特殊字符）
-            import re
-            if not re.match(r'^[a-zA-Z0-9_-]+$', new_model_name):
-                raise Exception("Model name can only contain letters, numbers, underscores, and hyphens")
+            # 验证模型名是否有效（不能包含特殊字符，可以带 :标签）
+            if not re.match(r'^[a-zA-Z0-9_-][a-zA-Z0-9_.-]*(:[a-zA-Z0-9_][a-zA-Z0-9_.-]*)?$', new_model_name):
+                raise Exception("Model name can only contain letters, numbers, underscores, hyphens and dots, "
+                                "optionally followed by :tag")
             
             # 检查是否存在对应的Modelfile
             modelfile_path = os.path.splitext(import_path)[0] + ".modelfile"
@@ -284,338 +275,142 @@ class OllamaManager:
                 # 如果没有找到Modelfile，使用默认配置
                 modelfile_content = self.create_modelfile_content(import_path, new_model_name)
             
-            # 使用系统临时目录创建临时文件
-            import tempfile
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.modelfile', delete=False, encoding='utf-8') as f:
-                f.write(modelfile_content)
-                temp_modelfile = f.name
+            # 读取前不在页缓存中的源文件窗口，计算摘要和上传时读完即丢弃，失败和取消时同样丢弃
+            with DropBehind(import_path) as source_cache:
+                # 服务器已有相同内容时不再上传；同一文件系统时直接链接到blobs中
+                if self.import_by_digest(import_path, new_model_name, modelfile_content, progress, cancelled, digest,
+                                         source_cache):
+                    return True
             
-            try:
-                # 使用ollama create命令创建模型
-                cmd = [self.ollama_path, "create", new_model_name, "-f", temp_modelfile]
-                result = subprocess.run(cmd, capture_output=True, text=True, shell=False, encoding='utf-8')
+                if not self.ollama_path:
+                    raise Exception("Ollama executable not found")
+            
+                # 使用系统临时目录创建临时文件
+                import tempfile
+                with tempfile.NamedTemporaryFile(mode='w', suffix='.modelfile', delete=False, encoding='utf-8') as f:
+                    f.write(modelfile_content)
+                    temp_modelfile = f.name
+            
+                try:
+                    # 使用ollama create命令创建模型
+                    cmd = [self.ollama_path, "create", new_model_name, "-f", temp_modelfile]
+                    result = self.run_command(cmd)
                 
-                if result.returncode != 0:
-                    error_msg = result.stderr.strip() if result.stderr else result.stdout.strip()
-                    raise Exception(f"Failed to import model: {error_msg}")
+                    if result.returncode != 0:
+                        error_msg = result.stderr.strip() if result.stderr else result.stdout.strip()
+                        raise Exception(f"Failed to import model: {error_msg}")
                 
-                return True
-            finally:
-                # 清理临时文件
-                if os.path.exists(temp_modelfile):
-                    try:
-                        os.remove(temp_modelfile)
-                    except:
-                        pass
+                    span = current_span()
+                    if span is not None:
+                        span.add_bytes(os.path.getsize(import_path))
+                    return True
+                finally:
+                    # 清理临时文件
+                    if os.path.exists(temp_modelfile):
+                        try:
+                            os.remove(temp_modelfile)
+                        except:
+                            pass
                         
         except Exception as e:
             raise Exception(f"Error importing model: {str(e)}")
     
-    def create_modelfile_content(self, import_path, model_name):
-        """根据模型类型创建相应的Modelfile内容"""
-        filename = os.path.basename(import_path).lower()
-        
-        # 根据文件名推测模型类型
-        if any(keyword in filename for keyword in ['qwen', 'qwen2', 'qwen3']):
-            return self.create_qwen_modelfile(import_path, model_name)
-        elif any(keyword in filename for keyword in ['llama', 'llama2', 'llama3']):
-            return self.create_llama_modelfile(import_path, model_name)
-        elif any(keyword in filename for keyword in ['mistral', 'mixtral']):
-            return self.create_mistral_modelfile(import_path, model_name)
-        elif any(keyword in filename for keyword in ['gemma']):
-            return self.create_gemma_modelfile(import_path, model_name)
-        elif any(keyword in filename for keyword in ['phi', 'phi2', 'phi3']):
-            return self.create_phi_modelfile(import_path, model_name)
-        elif any(keyword in filename for keyword in ['yi', '01-yi']):
-            return self.create_yi_modelfile(import_path, model_name)
-        elif any(keyword in filename for keyword in ['deepseek']):
-            return self.create_deepseek_modelfile(import_path, model_name)
-        elif any(keyword in filename for keyword in ['codellama', 'code-llama']):
-            return self.create_codellama_modelfile(import_path, model_name)
-        else:
-            # 默认配置
-            return self.create_default_modelfile(import_path, model_name)
-    
-    def create_qwen_modelfile(self, import_path, model_name):
-        """创建Qwen模型的Modelfile"""
-        return f"""FROM {import_path}
-
-# 模型参数
-PARAMETER temperature 0.7
-PARAMETER top_p 0.9
-PARAMETER top_k 40
-PARAMETER repeat_penalty 1.1
-
-# 系统提示词
-SYSTEM "You are Qwen, a helpful AI assistant. You provide accurate, helpful, and safe responses to user queries."
-
-# Qwen模板
-TEMPLATE "{{ if .System }}<|system|>
-{{ .System }}
-<|end|>
-
-{{ end }}{{ if .Prompt }}<|user|>
-{{ .Prompt }}
-<|end|>
-
-{{ end }}<|assistant|>
-{{ .Response }}
-<|end|>"
-
-# 停止标记
-STOP "<|system|>"
-STOP "<|user|>"
-STOP "<|assistant|>"
-STOP "<|end|>"
-"""
-    
-    def create_llama_modelfile(self, import_path, model_name):
-        """创建Llama模型的Modelfile"""
-        return f"""FROM {import_path}
-
-# 模型参数
-PARAMETER temperature 0.7
-PARAMETER top_p 0.9
-PARAMETER top_k 40
-PARAMETER repeat_penalty 1.1
-
-# 系统提示词
-SYSTEM "You are a helpful AI assistant. You provide accurate, helpful, and safe responses to user queries."
-
-# Llama模板
-TEMPLATE "{{ if .System }}<s>[INST] <<SYS>>
-{{ .System }}
-<</SYS>>
-
-{{ .Prompt }} [/INST]{{ else }}{{ if .Prompt }}<s>[INST] {{ .Prompt }} [/INST]{{ end }}{{ end }} {{ .Response }}</s>"
-
-# 停止标记
-STOP "</s>"
-STOP "[INST]"
-"""
-    
-    def create_mistral_modelfile(self, import_path, model_name):
-        """创建Mistral模型的Modelfile"""
-        return f"""FROM {import_path}
-
-# 模型参数
-PARAMETER temperature 0.7
-PARAMETER top_p 0.9
-PARAMETER top_k 40
-PARAMETER repeat_penalty 1.1
-
-# 系统提示词
-SYSTEM "You are a helpful AI assistant. You provide accurate, helpful, and safe responses to user queries."
-
-# Mistral模板
-TEMPLATE "{{ if .System }}<s>[INST] {{ .System }}
-
-{{ .Prompt }} [/INST]{{ else }}{{ if .Prompt }}<s>[INST] {{ .Prompt }} [/INST]{{ end }}{{ end }} {{ .Response }}</s>"
-
-# 停止标记
-STOP "</s>"
-STOP "[INST]"
-"""
-    
-    def create_gemma_modelfile(self, import_path, model_name):
-        """创建Gemma模型的Modelfile"""
-        return f"""FROM {import_path}
-
-# 模型参数
-PARAMETER temperature 0.7
-PARAMETER top_p 0.9
-PARAMETER top_k 40
-PARAMETER repeat_penalty 1.1
-
-# 系统提示词
-SYSTEM "You are a helpful AI assistant. You provide accurate, helpful, and safe responses to user queries."
-
-# Gemma模板
-TEMPLATE "{{ if .System }}<start_of_turn>user
-{{ .System }}
-
-{{ .Prompt }}<end_of_turn>
-<start_of_turn>model
-{{ .Response }}<end_of_turn>{{ else }}{{ if .Prompt }}<start_of_turn>user
-{{ .Prompt }}<end_of_turn>
-<start_of_turn>model
-{{ .Response }}<end_of_turn>{{ end }}{{ end }}"
-
-# 停止标记
-STOP "<start_of_turn>"
-STOP "<end_of_turn>"
-"""
-    
-    def create_phi_modelfile(self, import_path, model_name):
-        """创建Phi模型的Modelfile"""
-        return f"""FROM {import_path}
-
-# 模型参数
-PARAMETER temperature 0.7
-PARAMETER top_p 0.9
-PARAMETER top_k 40
-PARAMETER repeat_penalty 1.1
-
-# 系统提示词
-SYSTEM "You are a helpful AI assistant. You provide accurate, helpful, and safe responses to user queries."
-
-# Phi模板
-TEMPLATE "{{ if .System }}<|system|>
-{{ .System }}
-<|end|>
-{{ end }}{{ if .Prompt }}<|user|>
-{{ .Prompt }}
-<|end|>
-{{ end }}<|assistant|>
-{{ .Response }}
-<|end|>"
-
-# 停止标记
-STOP "<|system|>"
-STOP "<|user|>"
-STOP "<|assistant|>"
-STOP "<|end|>"
-"""
-    
-    def create_yi_modelfile(self, import_path, model_name):
-        """创建Yi模型的Modelfile"""
-        return f"""FROM {import_path}
-
-# 模型参数
-PARAMETER temperature 0.7
-PARAMETER top_p 0.9
-PARAMETER top_k 40
-PARAMETER repeat_penalty 1.1
-
-# 系统提示词
-SYSTEM "You are a helpful AI assistant. You provide accurate, helpful, and safe responses to user queries."
-
-# Yi模板
-TEMPLATE "{{ if .System }}<|system|>
-{{ .System }}
-<|end|>
-
-{{ end }}{{ if .Prompt }}<|user|>
-{{ .Prompt }}
-<|end|>
-
-{{ end }}<|assistant|>
-{{ .Response }}
-<|end|>"
-
-# 停止标记
-STOP "<|system|>"
-STOP "<|user|>"
-STOP "<|assistant|>"
-STOP "<|end|>"
-"""
-    
-    def create_deepseek_modelfile(self, import_path, model_name):
-        """创建DeepSeek模型的Modelfile"""
-        return f"""FROM {import_path}
-
-# 模型参数
-PARAMETER temperature 0.7
-PARAMETER top_p 0.9
-PARAMETER top_k 40
-PARAMETER repeat_penalty 1.1
-
-# 系统提示词
-SYSTEM "You are a helpful AI assistant. You provide accurate, helpful, and safe responses to user queries."
-
-# DeepSeek模板
-TEMPLATE "{{ if .System }}<|system|>
-{{ .System }}
-<|end|>
-
-{{ end }}{{ if .Prompt }}<|user|>
-{{ .Prompt }}
-<|end|>
-
-{{ end }}<|assistant|>
-{{ .Response }}
-<|end|>"
-
-# 停止标记
-STOP "<|system|>"
-STOP "<|user|>"
-STOP "<|assistant|>"
-STOP "<|end|>"
-"""
+    def import_by_digest(self, import_path, model_name, modelfile_content, progress=None, cancelled=None,
+                         digest=None, source_cache=None):
+        """按摘要导入：服务器已有相同内容的blob时不再上传，重复导入只需计算一次摘要
+        
+        先计算GGUF的 sha256，用 HEAD /api/blobs 检查服务器是否已有该blob；没有时，本机服务器且
+        同一文件系统的情况下用 reflink 或硬链接放入 blobs/，否则通过 POST /api/blobs 上传。
+        最后用 /api/create 引用该摘要创建模型。Modelfile 无法用API表达（ADAPTER）时返回 False，
+        由调用方退回 ollama create；服务器版本不支持 blob API 或 /api/create 的 files 字段时同样返回 False。
+        progress(阶段, 已完成字节, 总字节) 报告计算摘要和上传的进度；
+        已经算好摘要时（例如批量导入）可以通过 digest 传入，不再重复计算；
+        source_cache 是 fileio.DropBehind，读取时按窗口丢弃源文件的页。
+        """
+        if not (self.session.supports('blobs') and self.session.supports('create_files')):
+            return False
+        try:
+            parsed = parse_modelfile(modelfile_content)
+        except Exception:
+            return False
+        if parsed.get('adapter'):
+            return False
+        
+        client = OllamaClient(self.session.base_url)
+        size = os.path.getsize(import_path)
+        if not digest:
+            digest = file_digest(import_path, progress=progress and (lambda done: progress("hash", done, size)),
+                                 cancelled=cancelled, drop_behind=source_cache)
+        method = "existing"
+        if not client.has_blob(digest):
+            method = self._link_blob(client, import_path, digest)
+            if method is None:
+                client.upload_blob(digest, import_path, progress=progress and (
+                    lambda done, total: progress("upload", done, total)), cancelled=cancelled,
+                    drop_behind=source_cache)
+                method = "upload"
+        
+        request = create_request(parsed, model_name)
+        request['files'] = {os.path.basename(import_path): digest}
+        client.create_model(request)
+        
+        span = current_span()
+        if span is not None:
+            span.attrs['import_method'] = method
+            span.add_bytes(size)
+        return True
     
-    def create_codellama_modelfile(self, import_path, model_name):
-        """创建CodeLlama模型的Modelfile"""
-        return f"""FROM {import_path}
-
-# 模型参数
-PARAMETER temperature 0.7
-PARAMETER top_p 0.9
-PARAMETER top_k 40
-PARAMETER repeat_penalty 1.1
-
-# 系统提示词
-SYSTEM "You are an expert programmer. You write clean, efficient, and well-documented code. Always provide helpful explanations for your code."
-
-# CodeLlama模板
-TEMPLATE "{{ if .System }}<s>[INST] <<SYS>>
-{{ .System }}
-<</SYS>>
-
-{{ .Prompt }} [/INST]{{ else }}{{ if .Prompt }}<s>[INST] {{ .Prompt }} [/INST]{{ end }}{{ end }} {{ .Response }}</s>"
-
-# 停止标记
-STOP "</s>"
-STOP "[INST]"
-"""
+    def _link_blob(self, client, import_path, digest):
+        """本机服务器且源文件与模型目录在同一文件系统时，用 reflink 或硬链接放入blob
+        
+        返回使用的方式；不满足条件、链接失败或服务器使用的是另一个模型目录时返回 None。
+        """
+        models_dir = self.session.models_dir
+        blobs_dir = os.path.join(models_dir, "blobs")
+        if not is_local_url(client.base_url) or not os.path.isdir(blobs_dir) or not same_filesystem(import_path, blobs_dir):
+            return None
+        target = blob_path(models_dir, digest)
+        if os.path.exists(target):
+            return None
+        temp_path = f"{target}-partial-{os.getpid()}"
+        try:
+            method = link_file(import_path, temp_path)
+            os.replace(temp_path, target)
+        except OSError:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            return None
+        # 服务器看不到这个blob说明它使用的是另一个模型目录
+        if not client.has_blob(digest):
+            os.remove(target)
+            return None
+        return method
     
-    def create_default_modelfile(self, import_path, model_name):
-        """创建默认的Modelfile"""
-        return f"""FROM {import_path}
-
-# 模型参数
-PARAMETER temperature 0.7
-PARAMETER top_p 0.9
-PARAMETER top_k 40
-PARAMETER repeat_penalty 1.1
-
-# 系统提示词
-SYSTEM "You are a helpful AI assistant. You provide accurate, helpful, and safe responses to user queries."
-
-# 通用模板
-TEMPLATE "{{ if .System }}<|system|>
-{{ .System }}
-<|end|>
-
-{{ end }}{{ if .Prompt }}<|user|>
-{{ .Prompt }}
-<|end|>
-
-{{ end }}<|assistant|>
-{{ .Response }}
-<|end|>"
-
-# 停止标记
-STOP "<|system|>"
-STOP "<|user|>"
-STOP "<|assistant|>"
-STOP "<|end|>"
-"""
+    def create_modelfile_content(self, import_path, model_name):
+        """根据GGUF文件头的元数据和文件名，从模板注册表中选择相应的Modelfile"""
+        try:
+            _, _, metadata = read_metadata(import_path)
+        except Exception:
+            metadata = {}
+        registry = get_registry()
+        return registry.render(registry.resolve(metadata, os.path.basename(import_path)), import_path)
 
     def delete_model(self, model_name):
         """删除指定的模型"""
-        if not self.ollama_path:
-            raise Exception("Ollama executable not found")
-        
         try:
             # 检查Ollama服务是否运行
-            result = subprocess.run([self.ollama_path, "list"], 
-                                  capture_output=True, text=True, shell=False, encoding='utf-8', timeout=10)
-            if result.returncode != 0:
-                raise Exception("Ollama service is not running. Please start Ollama first.")
+            self.check_service()
+            
+            # 服务器可用时直接请求 /api/delete，不启动 ollama 子进程
+            if self.session.detect():
+                OllamaClient(self.session.base_url).delete_model(model_name)
+                return True
+            if not self.ollama_path:
+                raise Exception("Ollama executable not found")
             
             # 使用 ollama rm 命令删除模型
             cmd = [self.ollama_path, "rm", model_name]
-            result = subprocess.run(cmd, capture_output=True, text=True, shell=False, encoding='utf-8', timeout=30)
+            result = self.run_command(cmd, timeout=30)
             
             if result.returncode != 0:
                 error_msg = result.stderr.strip() if result.stderr else result.stdout.strip()
@@ -627,21 +422,22 @@ STOP "<|end|>"
         except Exception as e:
             raise Exception(f"Error deleting model: {str(e)}")
     
-    def update_model(self, model_name):
-        """更新指定模型"""
-        if not self.ollama_path:
-            raise Exception("Ollama executable not found")
-        
+    def update_model(self, model_name, progress=None):
+        """更新指定模型，progress(状态, 已完成字节, 总字节) 报告拉取进度"""
         try:
             # 检查Ollama服务是否运行
-            result = subprocess.run([self.ollama_path, "list"], 
-                                  capture_output=True, text=True, shell=False, encoding='utf-8', timeout=10)
-            if result.returncode != 0:
-                raise Exception("Ollama service is not running. Please start Ollama first.")
+            self.check_service()
+            
+            # 服务器支持流式进度时通过 /api/pull 拉取，可以显示进度
+            if self.session.supports('streaming'):
+                OllamaClient(self.session.base_url).pull_model(model_name, progress=progress)
+                return True
+            if not self.ollama_path:
+                raise Exception("Ollama executable not found")
             
             # 使用 ollama pull 命令更新模型
             cmd = [self.ollama_path, "pull", model_name]
-            result = subprocess.run(cmd, capture_output=True, text=True, shell=False, encoding='utf-8', timeout=300)  # 5分钟超时
+            result = self.run_command(cmd, timeout=300)  # 5分钟超时
             
             if result.returncode != 0:
                 error_msg = result.stderr.strip() if result.stderr else result.stdout.strip()
@@ -654,67 +450,245 @@ STOP "<|end|>"
             raise Exception(f"Error updating model: {str(e)}")
 
 
+class JobRegistry(QObject):
+    """后台操作的开始、进度和结束通知，供任务面板显示"""
+    started = Signal(int, str, str)
+    progress = Signal(int, str)
+    finished = Signal(int, str, str)
+
+
+jobs = JobRegistry()
+_job_ids = itertools.count(1)
+
+
+class ConnectionStatus(QObject):
+    """把本机服务器连接状态的变化（可能发生在任意线程）转发到界面线程"""
+    changed = Signal(str, str)
+
+    def report(self, connection):
+        if connection.base_url == get_connection().base_url:
+            self.changed.emit(connection.describe(), connection.last_error or "")
+
+
+connection_status = ConnectionStatus()
+add_listener(connection_status.report)
+
+
+class AsyncBridge(QObject):
+    """在事件循环中运行 asyncops 的协程，并在界面线程中调用回调 callback(结果, 错误)
+    
+    main 安装了 qasync 的事件循环时，协程直接在Qt事件循环中运行；否则提交到共享的后台事件循环线程，
+    结果通过信号回到界面线程。列表、/api/ps 这类短请求因此不再各占一个 QThread。
+    """
+    _done = Signal(object, object, object)
+    
+    def __init__(self):
+        super().__init__()
+        self.loop = None  # qasync.QEventLoop
+        self._done.connect(self._deliver)
+    
+    def submit(self, coro, callback=None):
+        """运行协程，返回可以 cancel() 的 Future；被取消的协程不会调用回调"""
+        if self.loop is not None:
+            future = asyncio.ensure_future(coro, loop=self.loop)
+        else:
+            future = asyncops.get_loop_thread().submit(coro)
+        if callback is not None:
+            future.add_done_callback(lambda done: self._finish(done, callback))
+        return future
+    
+    def _finish(self, future, callback):
+        # 可能在后台事件循环线程中调用，回调通过信号转到界面线程
+        if future.cancelled():
+            return
+        error = future.exception()
+        self._done.emit(callback, None if error else future.result(), error)
+    
+    def _deliver(self, callback, result, error):
+        callback(result, error)
+
+
+async_bridge = AsyncBridge()
+
+
 class WorkerThread(QThread):
     """工作线程，用于执行耗时操作"""
     progress = Signal(str)
     finished = Signal(bool, str)
     
+    BACKGROUND_OPERATIONS = ("export", "export_batch", "import", "import_folder", "warm", "verify", "deploy")
+    
     def __init__(self, operation, *args):
         super().__init__()
         self.operation = operation
         self.args = args
         self._is_cancelled = False
+        self.created_at = time.monotonic()
+        self.job_id = next(_job_ids)
+        self.progress.connect(lambda message: jobs.progress.emit(self.job_id, message))
     
     def cancel(self):
         """取消操作"""
         self._is_cancelled = True
     
     def run(self):
+        job_started = False
+        status, message = "Finished", ""
         try:
             if self._is_cancelled:
                 return
-                
-            if self.operation == "list":
-                manager = OllamaManager()
-                models = manager.list_models()
-                if not self._is_cancelled:
-                    self.finished.emit(True, json.dumps(models))
-            elif self.operation == "export":
-                manager = OllamaManager()
-                model_name, export_path = self.args
-                manager.export_model(model_name, export_path)
-                if not self._is_cancelled:
-                    modelfile_path = os.path.splitext(export_path)[0] + ".modelfile"
-                    message = f"Model {model_name} successfully exported to {export_path} and Modelfile to {modelfile_path}"
-                    self.finished.emit(True, message)
-            elif self.operation == "import":
-                manager = OllamaManager()
-                import_path, new_model_name = self.args
-                manager.import_model(import_path, new_model_name)
-                
-                if not self._is_cancelled:
-                    message = f"Model successfully imported from {import_path} with name {new_model_name}"
-                    self.finished.emit(True, message)
-            elif self.operation == "delete":
-                manager = OllamaManager()
-                model_name = self.args[0]
-                manager.delete_model(model_name)
-                if not self._is_cancelled:
-                    message = f"Model {model_name} successfully deleted"
-                    self.finished.emit(True, message)
-            elif self.operation == "update":
-                manager = OllamaManager()
-                model_name = self.args[0]
-                manager.update_model(model_name)
-                if not self._is_cancelled:
-                    message = f"Model {model_name} successfully updated"
-                    self.finished.emit(True, message)
+            
+            jobs.started.emit(self.job_id, self.operation, ", ".join(arg for arg in self.args if isinstance(arg, str)))
+            job_started = True
+            # 开启了低优先级时，I/O密集的后台操作以低CPU和I/O优先级运行
+            if self.operation in self.BACKGROUND_OPERATIONS:
+                throttle.apply_background_priority()
+            
+            # 每个操作都在追踪记录中执行，排队时间为创建线程到开始执行的间隔
+            queue_wait = time.monotonic() - self.created_at
+            with get_tracer().span(self.operation, queue_wait=queue_wait, args=[arg for arg in self.args if isinstance(arg, str)]):
+                # 开启分析时，在 cProfile/tracemalloc 下运行并保存结果
+                with profiling.profile_operation(self.operation):
+                    self.run_operation()
         except Exception as e:
+            status, message = "Failed", str(e)
             if not self._is_cancelled:
                 self.finished.emit(False, str(e))
         finally:
+            if job_started:
+                jobs.finished.emit(self.job_id, "Cancelled" if self._is_cancelled else status, message)
             # Ensure thread is properly cleaned up
             self._is_cancelled = True
+    
+    def run_operation(self):
+        """执行具体的操作"""
+        if self.operation == "export":
+            manager = OllamaManager()
+            model_name, export_path = self.args
+            manager.export_model(model_name, export_path)
+            if not self._is_cancelled:
+                modelfile_path = os.path.splitext(export_path)[0] + ".modelfile"
+                message = f"Model {model_name} successfully exported to {export_path} and Modelfile to {modelfile_path}"
+                self.finished.emit(True, message)
+        elif self.operation == "export_batch":
+            manager = OllamaManager()
+            # 先按所有模型的总大小检查空间，空间不足时一个也不导出
+            plan = manager.plan_exports(self.args[0])
+            total = sum(size for _, _, size in plan)
+            for index, (model_name, export_path, _) in enumerate(plan):
+                if self._is_cancelled:
+                    return
+                self.progress.emit(f"{index + 1}/{len(plan)} {model_name}")
+                manager.export_model(model_name, export_path)
+            if not self._is_cancelled:
+                directory = os.path.dirname(plan[0][1]) if plan else ""
+                self.finished.emit(True, f"{len(plan)} models ({format_size(total)}) exported to {directory}")
+        elif self.operation == "import":
+            manager = OllamaManager()
+            import_path, new_model_name = self.args
+            stages = {"hash": "Hashing", "upload": "Uploading"}
+            manager.import_model(import_path, new_model_name,
+                                 progress=lambda stage, done, total: self.progress.emit(
+                                     f"{stages[stage]} {done * 100 // max(total, 1)}%"),
+                                 cancelled=lambda: self._is_cancelled)
+            
+            if not self._is_cancelled:
+                message = f"Model successfully imported from {import_path} with name {new_model_name}"
+                self.finished.emit(True, message)
+        elif self.operation == "import_folder":
+            manager = OllamaManager()
+            root, concurrency = self.args
+            existing = [model.full_name for model in manager.list_models()]
+            stages = {'scan': "Scanning", 'hash': "Hashing"}
+            entries = plan_folder_import(root, existing, progress=lambda stage, done, total: self.progress.emit(
+                f"{stages[stage]} {done * 100 // max(total, 1)}%"), cancelled=lambda: self._is_cancelled)
+            entries = run_folder_import(
+                entries, lambda path, name, digest: manager.import_model(path, name, digest=digest),
+                concurrency=concurrency, cancelled=lambda: self._is_cancelled,
+                progress=lambda done, total, entry: self.progress.emit(f"{done}/{total} {entry['name']}"))
+            if not self._is_cancelled:
+                failed = any(entry.get('status') == 'failed' for entry in entries)
+                self.finished.emit(not failed, f"{root}: {summarize(entries)}")
+        elif self.operation == "delete":
+            manager = OllamaManager()
+            model_name = self.args[0]
+            manager.delete_model(model_name)
+            if not self._is_cancelled:
+                message = f"Model {model_name} successfully deleted"
+                self.finished.emit(True, message)
+        elif self.operation == "benchmark":
+            host_url, model_names = self.args
+            client = OllamaClient(host_url)
+            history = BenchmarkHistory()
+            lines = []
+            for model_name in model_names:
+                if self._is_cancelled:
+                    return
+                self.progress.emit(model_name)
+                result = benchmark_model(client, model_name)
+                history.add(result)
+                lines.append(f"{model_name}: TTFT {result['ttft_s']:.2f} s, "
+                             f"{result['gen_tps']:.1f} tokens/s, load {result['load_s']:.2f} s")
+            if not self._is_cancelled:
+                self.finished.emit(True, "\n".join(lines))
+        elif self.operation == "loadtest":
+            host_url, model_name, levels, requests = self.args
+            rows = run_load_test(host_url, model_name, levels=levels, requests=requests,
+                                 progress=lambda level: self.progress.emit(str(level)))
+            if not self._is_cancelled:
+                self.finished.emit(True, json.dumps(rows))
+        elif self.operation == "preload":
+            host_url, model_name, keep_alive = self.args
+            OllamaClient(host_url).load_model(model_name, keep_alive)
+            if not self._is_cancelled:
+                self.finished.emit(True, f"Model {model_name} loaded")
+        elif self.operation == "unload":
+            host_url, model_name = self.args
+            OllamaClient(host_url).unload_model(model_name)
+            if not self._is_cancelled:
+                self.finished.emit(True, f"Model {model_name} unloaded")
+        elif self.operation == "warm":
+            model_name = self.args[0]
+            result = warm_model(model_name, progress=lambda done, total: self.progress.emit(f"{done * 100 // total}%"),
+                                cancelled=lambda: self._is_cancelled)
+            span = current_span()
+            if span is not None:
+                span.add_bytes(result['bytes'])
+            if not self._is_cancelled:
+                self.finished.emit(True, format_report(result))
+        elif self.operation == "verify":
+            model_name = self.args[0]
+            blobs = model_blobs(None, model_name)
+            results = verify_blobs(blobs, HashEngine(),
+                                   progress=lambda done, total: self.progress.emit(f"{done * 100 // total}%"),
+                                   cancelled=lambda: self._is_cancelled)
+            span = current_span()
+            if span is not None:
+                span.add_bytes(sum(blob['size'] for blob in blobs))
+            if not self._is_cancelled:
+                self.finished.emit(all(result['ok'] for result in results),
+                                   f"{model_name}:\n{format_verify_report(results)}")
+        elif self.operation == "update":
+            manager = OllamaManager()
+            model_name = self.args[0]
+            manager.update_model(model_name, progress=lambda status, done, total: self.progress.emit(
+                f"{status} {done * 100 // total}%" if total else status))
+            if not self._is_cancelled:
+                message = f"Model {model_name} successfully updated"
+                self.finished.emit(True, message)
+        elif self.operation == "deploy":
+            model_name, hosts, target_name = self.args
+            stages = {'check': "Checking", 'upload': "Uploading", 'create': "Creating"}
+            results = asyncio.run(deploy(get_session().models_dir, model_name, hosts, target_name,
+                                         progress=lambda stage, done, total: self.progress.emit(
+                                             f"{stages[stage]} {done * 100 // max(total, 1)}%"),
+                                         cancelled=lambda: self._is_cancelled))
+            span = current_span()
+            if span is not None:
+                span.add_bytes(sum(result['bytes'] for result in results.values()))
+            if not self._is_cancelled:
+                self.finished.emit(not any(result['error'] for result in results.values()),
+                                   f"{target_name or model_name}:\n{format_deploy_report(results)}")
 
 
 class MainWindow(QMainWindow):
@@ -746,19 +720,48 @@ class MainWindow(QMainWindow):
         if app:
             app.installTranslator(self.translator)
         
-        self.setWindowTitle(self.tr("Ollama Model Manager"))
         self.setGeometry(100, 100, 600, 400)
         
         self.manager = OllamaManager()
         self.worker_thread = None
+        self.list_future = None
+        self.list_job = None  # 正在进行的刷新在任务面板中的编号
+        
+        # 多主机注册表与按主机缓存的模型列表
+        self.host_registry = HostRegistry()
+        self.host_lister = MultiHostLister(self.host_registry, OllamaManager)
+        
+        # 已加载模型面板，默认隐藏，可从“视图”菜单打开
+        self.loaded_panel = LoadedModelsPanel(self)
+        self.addDockWidget(Qt.RightDockWidgetArea, self.loaded_panel)
+        self.loaded_panel.hide()
+        
+        # 任务面板，显示后台操作并调整限速和优先级
+        self.jobs_panel = JobsPanel(self)
+        self.addDockWidget(Qt.BottomDockWidgetArea, self.jobs_panel)
+        self.jobs_panel.hide()
         
         self.init_ui()
         
+        # 连接状态显示在状态栏右侧，随普通请求的结果更新，不额外发出请求
+        self.connection_label = QLabel(get_connection().describe())
+        self.status_bar.addPermanentWidget(self.connection_label)
+        connection_status.changed.connect(self.on_connection_changed)
+        
         # Use a timer to delay the initial model loading
         QTimer.singleShot(500, self.load_models)
     
+    def on_connection_changed(self, text, error):
+        """本机服务器的连接状态变化"""
+        self.connection_label.setText(text)
+        self.connection_label.setToolTip(error)
+    
     def closeEvent(self, event):
         """窗口关闭事件，确保线程正确清理"""
+        self.loaded_panel.stop()
+        if self.list_future is not None:
+            self.list_future.cancel()
+            self.list_future = None
         if self.worker_thread and self.worker_thread.isRunning():
             try:
                 self.worker_thread.finished.disconnect()
@@ -771,11 +774,7 @@ class MainWindow(QMainWindow):
         event.accept()
     
     def init_ui(self):
-        """初始化用户界面"""
-        # 清除现有的中央部件（如果存在）
-        if self.centralWidget():
-            self.centralWidget().setParent(None)
-        
+        """初始化用户界面，界面上的文字由 retranslateUi 设置"""
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
         
@@ -786,58 +785,54 @@ class MainWindow(QMainWindow):
         self.create_menu_bar()
         
         # 标题
-        title_label = QLabel(self.tr("Ollama Model Manager"))
-        title_label.setAlignment(Qt.AlignCenter)
-        layout.addWidget(title_label)
+        self.title_label = QLabel()
+        self.title_label.setAlignment(Qt.AlignCenter)
+        layout.addWidget(self.title_label)
         
         # 排序控件
         sort_layout = QHBoxLayout()
-        sort_layout.addWidget(QLabel(self.tr("Sort by:")))
+        self.sort_label = QLabel()
+        sort_layout.addWidget(self.sort_label)
         
         self.sort_combo = QComboBox()
-        self.sort_combo.addItems([
-            self.tr("Name (A-Z)"),
-            self.tr("Name (Z-A)"),
-            self.tr("Size (Largest First)"),
-            self.tr("Size (Smallest First)"),
-            self.tr("Date (Newest First)"),
-            self.tr("Date (Oldest First)")
-        ])
+        self.sort_combo.addItems([""] * 6)
         self.sort_combo.currentIndexChanged.connect(self.sort_models)
         sort_layout.addWidget(self.sort_combo)
         
         sort_layout.addStretch()
         
         # 搜索控件
-        sort_layout.addWidget(QLabel(self.tr("Search:")))
+        self.search_label = QLabel()
+        sort_layout.addWidget(self.search_label)
         self.search_input = QLineEdit()
-        self.search_input.setPlaceholderText(self.tr("Enter model name to search..."))
         self.search_input.textChanged.connect(self.filter_models)
         sort_layout.addWidget(self.search_input)
         
         # 清除搜索按钮
-        self.clear_search_button = QPushButton(self.tr("Clear"))
+        self.clear_search_button = QPushButton()
         self.clear_search_button.clicked.connect(self.clear_search)
         self.clear_search_button.setMaximumWidth(60)
         sort_layout.addWidget(self.clear_search_button)
         
+        # 主机筛选控件，切换时直接使用缓存数据
+        self.host_label = QLabel()
+        sort_layout.addWidget(self.host_label)
+        self.host_combo = QComboBox()
+        self.update_host_combo()
+        self.host_combo.currentIndexChanged.connect(self.filter_models)
+        sort_layout.addWidget(self.host_combo)
+        
         layout.addLayout(sort_layout)
         
         # 模型表格
-        layout.addWidget(QLabel(self.tr("Downloaded Models:")))
+        self.models_label = QLabel()
+        layout.addWidget(self.models_label)
         self.model_table = QTableWidget()
-        self.model_table.setColumnCount(5)
-        self.model_table.setHorizontalHeaderLabels([
-            self.tr("Model Name"),
-            self.tr("Tag"),
-            self.tr("ID"),
-            self.tr("Size"),
-            self.tr("Modified Date")
-        ])
+        self.model_table.setColumnCount(6)
         
         # 设置表格属性
         self.model_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.model_table.setSelectionMode(QTableWidget.SingleSelection)
+        self.model_table.setSelectionMode(QTableWidget.ExtendedSelection)
         self.model_table.setAlternatingRowColors(True)
         self.model_table.setContextMenuPolicy(Qt.CustomContextMenu)
         self.model_table.customContextMenuRequested.connect(self.show_context_menu)
@@ -849,6 +844,7 @@ class MainWindow(QMainWindow):
         header.setSectionResizeMode(2, QHeaderView.ResizeToContents)  # ID列自适应内容
         header.setSectionResizeMode(3, QHeaderView.ResizeToContents)  # 大小列自适应内容
         header.setSectionResizeMode(4, QHeaderView.ResizeToContents)  # 日期列自适应内容
+        header.setSectionResizeMode(5, QHeaderView.ResizeToContents)  # 主机列自适应内容
         
         # 启用表头点击排序
         header.setSectionsClickable(True)
@@ -863,23 +859,27 @@ class MainWindow(QMainWindow):
         # 按钮布局
         button_layout = QHBoxLayout()
         
-        self.refresh_button = QPushButton(self.tr("Refresh List"))
+        self.refresh_button = QPushButton()
         self.refresh_button.clicked.connect(self.load_models)
         button_layout.addWidget(self.refresh_button)
         
-        self.export_button = QPushButton(self.tr("Export Selected Model"))
+        self.export_button = QPushButton()
         self.export_button.clicked.connect(self.export_model)
         button_layout.addWidget(self.export_button)
         
-        self.import_button = QPushButton(self.tr("Import Model"))
+        self.import_button = QPushButton()
         self.import_button.clicked.connect(self.import_model)
         button_layout.addWidget(self.import_button)
 
-        self.delete_button = QPushButton(self.tr("Delete Selected Model"))
+        self.import_folder_button = QPushButton()
+        self.import_folder_button.clicked.connect(self.import_folder)
+        button_layout.addWidget(self.import_folder_button)
+
+        self.delete_button = QPushButton()
         self.delete_button.clicked.connect(self.delete_model)
         button_layout.addWidget(self.delete_button)
         
-        self.update_button = QPushButton(self.tr("Update Selected Model"))
+        self.update_button = QPushButton()
         self.update_button.clicked.connect(self.update_model)
         button_layout.addWidget(self.update_button)
         
@@ -891,66 +891,156 @@ class MainWindow(QMainWindow):
         layout.addWidget(self.progress_bar)
         
         # 状态标签
-        self.status_label = QLabel(self.tr("Ready"))
+        self.status_label = QLabel()
         self.status_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(self.status_label)
+        self.show_status(lambda: self.tr("Ready"))
         
         # 状态栏
-        self.statusBar = self.statusBar()
-        self.statusBar.showMessage(self.tr("Ready - Press F5 to refresh, Ctrl+F to search"))
+        self.status_bar = self.statusBar()
+        self.show_message(lambda: self.tr("Ready - Press F5 to refresh, Ctrl+F to search"))
         
         # 存储模型数据
         self.models_data = []
         self.original_models_data = []  # 存储原始数据用于搜索
+        
+        self.retranslateUi()
+    
+    def retranslateUi(self):
+        """按当前语言设置界面上的文字，不重建控件，也不重新加载模型列表"""
+        self.setWindowTitle(self.tr("Ollama Model Manager"))
+        self.title_label.setText(self.tr("Ollama Model Manager"))
+        self.sort_label.setText(self.tr("Sort by:"))
+        sort_options = [
+            self.tr("Name (A-Z)"),
+            self.tr("Name (Z-A)"),
+            self.tr("Size (Largest First)"),
+            self.tr("Size (Smallest First)"),
+            self.tr("Date (Newest First)"),
+            self.tr("Date (Oldest First)")
+        ]
+        for index, text in enumerate(sort_options):
+            self.sort_combo.setItemText(index, text)
+        self.search_label.setText(self.tr("Search:"))
+        self.search_input.setPlaceholderText(self.tr("Enter model name to search..."))
+        self.clear_search_button.setText(self.tr("Clear"))
+        self.host_label.setText(self.tr("Host:"))
+        self.host_combo.setItemText(0, self.tr("All Hosts"))
+        self.models_label.setText(self.tr("Downloaded Models:"))
+        self.model_table.setHorizontalHeaderLabels([
+            self.tr("Model Name"),
+            self.tr("Tag"),
+            self.tr("ID"),
+            self.tr("Size"),
+            self.tr("Modified Date"),
+            self.tr("Host")
+        ])
+        self.refresh_button.setText(self.tr("Refresh List"))
+        self.export_button.setText(self.tr("Export Selected Model"))
+        self.import_button.setText(self.tr("Import Model"))
+        self.import_folder_button.setText(self.tr("Import Folder"))
+        self.delete_button.setText(self.tr("Delete Selected Model"))
+        self.update_button.setText(self.tr("Update Selected Model"))
+        
+        # 菜单
+        self.lang_menu.setTitle(self.tr("Language"))
+        self.host_menu.setTitle(self.tr("Hosts"))
+        self.add_host_action.setText(self.tr("Add Host..."))
+        self.remove_host_action.setText(self.tr("Remove Host..."))
+        self.view_menu.setTitle(self.tr("View"))
+        self.diagnostics_menu.setTitle(self.tr("Diagnostics"))
+        self.profile_action.setText(self.tr("Enable Profiling"))
+        self.history_action.setText(self.tr("Benchmark History"))
+        self.collect_action.setText(self.tr("Collect Diagnostics..."))
+        
+        # 状态标签和状态栏按当前语言重新生成最后一次显示的文字
+        self.status_label.setText(self.status_render())
+        self.status_bar.showMessage(self.message_render())
+    
+    def show_status(self, render):
+        """设置状态标签；render() 返回当前语言的文字，切换语言时会再次调用"""
+        self.status_render = render
+        self.status_label.setText(render())
+    
+    def show_message(self, render):
+        """设置状态栏消息，与 show_status 相同，切换语言时重新生成"""
+        self.message_render = render
+        self.status_bar.showMessage(render())
+    
+    def changeEvent(self, event):
+        """安装或移除翻译器后 Qt 会发送 LanguageChange 事件，此时就地更新文字"""
+        if event.type() == QEvent.LanguageChange and self.centralWidget() is not None:
+            self.retranslateUi()
+        super().changeEvent(event)
     
     def load_models(self):
-        """加载模型列表"""
-        # 如果已有线程在运行，先清理
-        if self.worker_thread and self.worker_thread.isRunning():
-            try:
-                self.worker_thread.finished.disconnect()
-            except:
-                pass
-            self.worker_thread.quit()
-            if not self.worker_thread.wait(1000):
-                self.worker_thread.terminate()
-                self.worker_thread.wait(500)
-        
-        self.status_label.setText(self.tr("Loading model list..."))
+        """加载模型列表：所有主机的请求在事件循环中并发执行，不占用工作线程"""
+        # 还在进行的上一次刷新直接取消
+        if self.list_future is not None:
+            self.list_future.cancel()
+            self.list_future = None
+            jobs.finished.emit(self.list_job, "Cancelled", "")
+        
+        self.show_status(lambda: self.tr("Loading model list..."))
         self.progress_bar.setVisible(True)
-        
-        self.worker_thread = WorkerThread("list")
-        self.worker_thread.finished.connect(self.on_models_loaded)
-        self.worker_thread.start()
+        # 刷新不经过工作线程，在这里通知任务面板；操作日志和指标由 fetch_all_async 记录
+        self.list_job = next(_job_ids)
+        jobs.started.emit(self.list_job, "list", ", ".join(self.host_registry.names()))
+        
+        # 只处理最近一次刷新的结果，已取消或窗口关闭后到达的结果直接丢弃
+        self.list_future = future = async_bridge.submit(
+            self.host_lister.fetch_all_async(),
+            lambda errors, error: future is self.list_future and self.on_hosts_listed(errors, error))
+    
+    def on_hosts_listed(self, errors, error):
+        """所有主机的列表请求结束的回调"""
+        self.list_future = None
+        message = str(error) if error is not None else "; ".join(f"{host}: {e}" for host, e in errors.items())
+        jobs.finished.emit(self.list_job, "Finished" if error is None else "Failed", message)
+        if error is not None:
+            self.on_list_failed(str(error))
+            return
+        self.on_models_loaded(self.host_lister.cached_models(), errors)
     
-    def on_models_loaded(self, success, data):
-        """模型列表加载完成的回调"""
+    def on_models_loaded(self, models, errors):
+        """模型列表加载完成的回调，models 为 ModelRecord 列表"""
         self.progress_bar.setVisible(False)
         
-        if success:
-            models = json.loads(data)
-            self.models_data = models  # 存储模型数据用于排序
-            self.original_models_data = models # 存储原始数据用于搜索
-            self.model_table.setRowCount(0)  # 清空现有行
-            for model in models:
-                self.add_model_to_table(model)
-            self.status_label.setText(self.tr("Loaded %n models", "", len(models)))
-            self.statusBar.showMessage(self.tr("Ready - %n models loaded. Press F5 to refresh, Ctrl+F to search").replace("%n", str(len(models))))
+        if errors and len(errors) == len(self.host_registry.names()):
+            # 所有主机都失败时才视为加载失败
+            self.on_list_failed("; ".join(f"{host}: {error}" for host, error in errors.items()))
+            return
+        self.original_models_data = models # 存储原始数据用于搜索
+        self.filter_models()  # 应用当前的主机筛选、搜索和排序
+        self.show_status(lambda: self.tr("Loaded %n models", "", len(models)))
+        if errors:
+            self.show_message(lambda: self.tr("Some hosts failed: %1").replace("%1", ", ".join(errors)))
         else:
-            QMessageBox.critical(self, self.tr("Error"), self.tr("Failed to load model list: %1").replace("%1", data))
-            self.status_label.setText(self.tr("Failed to load model list"))
-            self.statusBar.showMessage(self.tr("Error loading models"))
+            self.show_message(lambda: self.tr("Ready - %n models loaded. Press F5 to refresh, Ctrl+F to search").replace("%n", str(len(models))))
+    
+    def on_list_failed(self, message):
+        """加载模型列表失败"""
+        self.progress_bar.setVisible(False)
+        QMessageBox.critical(self, self.tr("Error"), self.tr("Failed to load model list: %1").replace("%1", message))
+        self.show_status(lambda: self.tr("Failed to load model list"))
+        self.show_message(lambda: self.tr("Error loading models"))
     
     def export_model(self):
-        """导出选中的模型"""
+        """导出选中的模型，选中多个模型时批量导出到一个目录"""
         selected_items = self.model_table.selectedItems()
         if not selected_items:
             QMessageBox.warning(self, self.tr("Warning"), self.tr("Please select a model first"))
             return
         
+        if len(self.selected_models()) > 1:
+            self.export_models_batch()
+            return
+        
         # 获取选中行的模型完整名称
         row = selected_items[0].row()
         model_full_name = self.model_table.item(row, 0).data(Qt.UserRole)
+        if not self.is_local_row(row):
+            return
         
         # 选择导出路径
         export_path, _ = QFileDialog.getSaveFileName(
@@ -970,23 +1060,58 @@ class MainWindow(QMainWindow):
                 self.worker_thread.terminate()
                 self.worker_thread.wait(500)
         
-        self.status_label.setText(self.tr("Exporting model %1...").replace("%1", model_full_name))
+        self.show_status(lambda: self.tr("Exporting model %1...").replace("%1", model_full_name))
         self.progress_bar.setVisible(True)
         
         self.worker_thread = WorkerThread("export", model_full_name, export_path)
         self.worker_thread.finished.connect(self.on_export_finished)
         self.worker_thread.start()
     
+    def export_models_batch(self):
+        """把选中的多个本机模型导出到同一个目录"""
+        selected = self.selected_models()
+        if any(host != LOCAL_HOST for _, host in selected):
+            QMessageBox.warning(self, self.tr("Warning"),
+                              self.tr("This operation is only available for models on the local host"))
+            return
+        
+        export_dir = QFileDialog.getExistingDirectory(self, self.tr("Select Export Directory"))
+        if not export_dir:
+            return
+        # 文件名中不能包含路径分隔符和 Windows 不允许的字符
+        items = [(name, os.path.join(export_dir, re.sub(r'[\\/:*?"<>|]', '_', name) + ".gguf"))
+                 for name, _ in selected]
+        
+        # 如果已有线程在运行，先清理
+        if self.worker_thread and self.worker_thread.isRunning():
+            try:
+                self.worker_thread.finished.disconnect()
+            except:
+                pass
+            self.worker_thread.quit()
+            if not self.worker_thread.wait(1000):
+                self.worker_thread.terminate()
+                self.worker_thread.wait(500)
+        
+        self.show_status(lambda: self.tr("Exporting %1 models...").replace("%1", str(len(items))))
+        self.progress_bar.setVisible(True)
+        
+        self.worker_thread = WorkerThread("export_batch", items)
+        self.worker_thread.progress.connect(
+            lambda message: self.show_status(lambda: self.tr("Exporting model %1...").replace("%1", message)))
+        self.worker_thread.finished.connect(self.on_export_finished)
+        self.worker_thread.start()
+    
     def on_export_finished(self, success, message):
         """导出完成的回调"""
         self.progress_bar.setVisible(False)
         
         if success:
             QMessageBox.information(self, self.tr("Success"), message)
-            self.status_label.setText(self.tr("Model exported successfully"))
+            self.show_status(lambda: self.tr("Model exported successfully"))
         else:
             QMessageBox.critical(self, self.tr("Error"), self.tr("Export failed: %1").replace("%1", message))
-            self.status_label.setText(self.tr("Model export failed"))
+            self.show_status(lambda: self.tr("Model export failed"))
     
     def import_model(self):
         """导入模型"""
@@ -1010,7 +1135,7 @@ class MainWindow(QMainWindow):
                 text=model_name.replace(re.sub(r'[^a-zA-Z0-9_-]', '', model_name), ''))
             
             if not ok:
-                self.status_label.setText(self.tr("Import operation cancelled"))
+                self.show_status(lambda: self.tr("Import operation cancelled"))
                 return
             
             if not new_model_name:
@@ -1025,7 +1150,7 @@ class MainWindow(QMainWindow):
             
             # 如果用户取消输入对话框，返回
             if not ok:
-                self.status_label.setText(self.tr("Import operation cancelled"))
+                self.show_status(lambda: self.tr("Import operation cancelled"))
                 return
             
             # 如果用户没有输入新名称，使用默认名称
@@ -1049,10 +1174,39 @@ class MainWindow(QMainWindow):
                 self.worker_thread.terminate()
                 self.worker_thread.wait(500)
         
-        self.status_label.setText(self.tr("Importing model %1...").replace("%1", new_model_name))
+        self.show_status(lambda: self.tr("Importing model %1...").replace("%1", new_model_name))
         self.progress_bar.setVisible(True)
         
         self.worker_thread = WorkerThread("import", import_path, new_model_name)
+        self.worker_thread.progress.connect(
+            lambda message: self.show_status(lambda: 
+                self.tr("Importing model %1...").replace("%1", f"{new_model_name} ({message})")))
+        self.worker_thread.finished.connect(self.on_import_finished)
+        self.worker_thread.start()
+    
+    def import_folder(self):
+        """导入一个目录及其子目录中的所有GGUF文件，模型名和标签取自文件头的元数据"""
+        root = QFileDialog.getExistingDirectory(self, self.tr("Select Folder to Import"))
+        if not root:
+            return
+        
+        # 如果已有线程在运行，先清理
+        if self.worker_thread and self.worker_thread.isRunning():
+            try:
+                self.worker_thread.finished.disconnect()
+            except:
+                pass
+            self.worker_thread.quit()
+            if not self.worker_thread.wait(1000):
+                self.worker_thread.terminate()
+                self.worker_thread.wait(500)
+        
+        self.show_status(lambda: self.tr("Importing models from %1...").replace("%1", root))
+        self.progress_bar.setVisible(True)
+        
+        self.worker_thread = WorkerThread("import_folder", root, FOLDER_IMPORT_CONCURRENCY)
+        self.worker_thread.progress.connect(
+            lambda message: self.show_status(lambda: self.tr("Importing models: %1").replace("%1", message)))
         self.worker_thread.finished.connect(self.on_import_finished)
         self.worker_thread.start()
     
@@ -1062,12 +1216,12 @@ class MainWindow(QMainWindow):
         
         if success:
             QMessageBox.information(self, self.tr("Success"), message)
-            self.status_label.setText(self.tr("Model imported successfully"))
+            self.show_status(lambda: self.tr("Model imported successfully"))
             # 重新加载模型列表
             self.load_models()
         else:
             QMessageBox.critical(self, self.tr("Error"), self.tr("Import failed: %1").replace("%1", message))
-            self.status_label.setText(self.tr("Model import failed"))
+            self.show_status(lambda: self.tr("Model import failed"))
     
 
     def delete_model(self):
@@ -1080,6 +1234,8 @@ class MainWindow(QMainWindow):
         # 获取选中行的模型完整名称
         row = selected_items[0].row()
         model_full_name = self.model_table.item(row, 0).data(Qt.UserRole)
+        if not self.is_local_row(row):
+            return
         
         reply = QMessageBox.question(
             self, self.tr("Confirm Deletion"),
@@ -1099,14 +1255,14 @@ class MainWindow(QMainWindow):
                     self.worker_thread.terminate()
                     self.worker_thread.wait(500)
             
-            self.status_label.setText(self.tr("Deleting model %1...").replace("%1", model_full_name))
+            self.show_status(lambda: self.tr("Deleting model %1...").replace("%1", model_full_name))
             self.progress_bar.setVisible(True)
             
             self.worker_thread = WorkerThread("delete", model_full_name)
             self.worker_thread.finished.connect(self.on_delete_finished)
             self.worker_thread.start()
         else:
-            self.status_label.setText(self.tr("Model deletion cancelled"))
+            self.show_status(lambda: self.tr("Model deletion cancelled"))
 
     def update_model(self):
         """更新选中的模型"""
@@ -1118,6 +1274,8 @@ class MainWindow(QMainWindow):
         # 获取选中行的模型完整名称
         row = selected_items[0].row()
         model_full_name = self.model_table.item(row, 0).data(Qt.UserRole)
+        if not self.is_local_row(row):
+            return
         
         reply = QMessageBox.question(
             self, self.tr("Confirm Update"),
@@ -1137,35 +1295,261 @@ class MainWindow(QMainWindow):
                     self.worker_thread.terminate()
                     self.worker_thread.wait(500)
             
-            self.status_label.setText(self.tr("Updating model %1...").replace("%1", model_full_name))
+            self.show_status(lambda: self.tr("Updating model %1...").replace("%1", model_full_name))
             self.progress_bar.setVisible(True)
             
             self.worker_thread = WorkerThread("update", model_full_name)
+            self.worker_thread.progress.connect(
+                lambda message, name=model_full_name: self.show_status(lambda: 
+                    self.tr("Updating model %1...").replace("%1", f"{name} ({message})")))
             self.worker_thread.finished.connect(self.on_update_finished)
             self.worker_thread.start()
         else:
-            self.status_label.setText(self.tr("Model update cancelled"))
+            self.show_status(lambda: self.tr("Model update cancelled"))
 
     def create_menu_bar(self):
-        """创建菜单栏"""
+        """创建菜单栏，菜单和动作的文字由 retranslateUi 设置"""
         menu_bar = self.menuBar()
         
-        # 清除现有菜单
-        menu_bar.clear()
-        
         # 语言菜单
-        lang_menu = menu_bar.addMenu(self.tr("Language"))
+        self.lang_menu = menu_bar.addMenu("")
         
         # 中文菜单项
         cn_action = QAction("中文", self)
         cn_action.triggered.connect(lambda: self.switch_language("zh"))
-        lang_menu.addAction(cn_action)
+        self.lang_menu.addAction(cn_action)
         
         # 英文菜单项
         en_action = QAction("English", self)
         en_action.triggered.connect(lambda: self.switch_language("en"))
-        lang_menu.addAction(en_action)
-    
+        self.lang_menu.addAction(en_action)
+        
+        # 主机菜单
+        self.host_menu = menu_bar.addMenu("")
+        
+        self.add_host_action = QAction(self)
+        self.add_host_action.triggered.connect(self.add_host)
+        self.host_menu.addAction(self.add_host_action)
+        
+        self.remove_host_action = QAction(self)
+        self.remove_host_action.triggered.connect(self.remove_host)
+        self.host_menu.addAction(self.remove_host_action)
+        
+        # 视图菜单
+        self.view_menu = menu_bar.addMenu("")
+        self.view_menu.addAction(self.loaded_panel.toggleViewAction())
+        self.view_menu.addAction(self.jobs_panel.toggleViewAction())
+        
+        # 诊断菜单
+        self.diagnostics_menu = menu_bar.addMenu("")
+        
+        self.profile_action = QAction(self)
+        self.profile_action.setCheckable(True)
+        self.profile_action.setChecked(bool(profiling.enabled_modes()))
+        self.profile_action.toggled.connect(self.toggle_profiling)
+        self.diagnostics_menu.addAction(self.profile_action)
+        
+        self.history_action = QAction(self)
+        self.history_action.triggered.connect(self.show_benchmark_history)
+        self.diagnostics_menu.addAction(self.history_action)
+        
+        self.collect_action = QAction(self)
+        self.collect_action.triggered.connect(self.collect_diagnostics)
+        self.diagnostics_menu.addAction(self.collect_action)
+    
+    def toggle_profiling(self, checked):
+        """开启或关闭操作的性能分析"""
+        profiling.set_modes(profiling.MODES if checked else ())
+        if checked:
+            self.show_message(lambda: self.tr("Profiling enabled - results are saved to %1").replace(
+                "%1", profiling.get_diagnostics_dir()))
+        else:
+            self.show_message(lambda: self.tr("Profiling disabled"))
+    
+    def collect_diagnostics(self):
+        """把诊断信息打包为zip文件"""
+        zip_path, _ = QFileDialog.getSaveFileName(
+            self, self.tr("Save Diagnostics"), "olamoma-diagnostics.zip", self.tr("Zip Files (*.zip)"))
+        if not zip_path:
+            return
+        try:
+            count = profiling.collect_diagnostics(zip_path)
+        except Exception as e:
+            QMessageBox.critical(self, self.tr("Error"), self.tr("Failed to collect diagnostics: %1").replace("%1", str(e)))
+            return
+        QMessageBox.information(self, self.tr("Success"),
+                                self.tr("Saved %1 diagnostic files to %2").replace("%1", str(count)).replace("%2", zip_path))
+    
+    def add_host(self):
+        """注册新的Ollama主机"""
+        name, ok = QInputDialog.getText(self, self.tr("Add Host"), self.tr("Host name:"))
+        if not ok or not name.strip():
+            return
+        url, ok = QInputDialog.getText(
+            self, self.tr("Add Host"), self.tr("Host address (e.g. http://192.168.1.10:11434):"))
+        if not ok or not url.strip():
+            return
+        try:
+            self.host_registry.add(name, url)
+        except Exception as e:
+            QMessageBox.warning(self, self.tr("Warning"), str(e))
+            return
+        self.update_host_combo()
+        self.load_models()
+    
+    def remove_host(self):
+        """移除已注册的主机"""
+        names = list(self.host_registry.hosts)
+        if not names:
+            QMessageBox.information(self, self.tr("Hosts"), self.tr("No remote hosts registered"))
+            return
+        name, ok = QInputDialog.getItem(self, self.tr("Remove Host"), self.tr("Host:"), names, 0, False)
+        if not ok:
+            return
+        self.host_registry.remove(name)
+        self.update_host_combo()
+        self.original_models_data = self.host_lister.cached_models()
+        self.filter_models()
+    
+    def update_host_combo(self):
+        """根据注册表刷新主机筛选下拉框"""
+        current = self.host_combo.currentData()
+        self.host_combo.blockSignals(True)
+        self.host_combo.clear()
+        self.host_combo.addItem(self.tr("All Hosts"), None)
+        for name in self.host_registry.names():
+            self.host_combo.addItem(name, name)
+        index = self.host_combo.findData(current)
+        self.host_combo.setCurrentIndex(max(index, 0))
+        self.host_combo.blockSignals(False)
+        self.loaded_panel.set_hosts(self.host_registry.names())
+    
+    def selected_models(self):
+        """返回选中的模型列表 [(完整名称, 主机名)]，按行顺序去重"""
+        rows = sorted({item.row() for item in self.model_table.selectedItems()})
+        return [(self.model_table.item(row, 0).data(Qt.UserRole),
+                 self.model_table.item(row, 0).data(Qt.UserRole + 1) or LOCAL_HOST) for row in rows]
+    
+    def host_url(self, host):
+        """返回主机的API地址，本机返回 None（使用 OLLAMA_HOST）"""
+        return None if host == LOCAL_HOST else self.host_registry.hosts.get(host)
+    
+    def benchmark_models(self):
+        """对选中的模型运行推理基准测试"""
+        selected = self.selected_models()
+        if not selected:
+            QMessageBox.warning(self, self.tr("Warning"), self.tr("Please select a model first"))
+            return
+        hosts = {host for _, host in selected}
+        if len(hosts) > 1:
+            QMessageBox.warning(self, self.tr("Warning"), self.tr("Please select models from a single host"))
+            return
+        
+        # 如果已有线程在运行，先清理
+        if self.worker_thread and self.worker_thread.isRunning():
+            try:
+                self.worker_thread.finished.disconnect()
+            except:
+                pass
+            self.worker_thread.quit()
+            if not self.worker_thread.wait(1000):
+                self.worker_thread.terminate()
+                self.worker_thread.wait(500)
+        
+        model_names = [name for name, _ in selected]
+        self.show_status(lambda: self.tr("Benchmarking %1...").replace("%1", ", ".join(model_names)))
+        self.progress_bar.setVisible(True)
+        
+        self.worker_thread = WorkerThread("benchmark", self.host_url(hosts.pop()), model_names)
+        self.worker_thread.progress.connect(
+            lambda name: self.show_status(lambda: self.tr("Benchmarking %1...").replace("%1", name)))
+        self.worker_thread.finished.connect(self.on_benchmark_finished)
+        self.worker_thread.start()
+    
+    def load_test_model(self):
+        """对选中的模型运行并发负载测试"""
+        selected = self.selected_models()
+        if not selected:
+            QMessageBox.warning(self, self.tr("Warning"), self.tr("Please select a model first"))
+            return
+        model_name, host = selected[0]
+        
+        levels_text, ok = QInputDialog.getText(self, self.tr("Load Test"),
+                                               self.tr("Concurrency levels (separated by spaces):"),
+                                               text="1 2 4 8")
+        if not ok:
+            return
+        try:
+            levels = [int(value) for value in levels_text.replace(',', ' ').split()]
+        except ValueError:
+            levels = []
+        if not levels or min(levels) < 1:
+            QMessageBox.warning(self, self.tr("Warning"), self.tr("Invalid concurrency levels"))
+            return
+        requests, ok = QInputDialog.getInt(self, self.tr("Load Test"),
+                                           self.tr("Requests per concurrency level:"), 32, 1, 10000)
+        if not ok:
+            return
+        
+        # 如果已有线程在运行，先清理
+        if self.worker_thread and self.worker_thread.isRunning():
+            try:
+                self.worker_thread.finished.disconnect()
+            except:
+                pass
+            self.worker_thread.quit()
+            if not self.worker_thread.wait(1000):
+                self.worker_thread.terminate()
+                self.worker_thread.wait(500)
+        
+        self.show_status(lambda: self.tr("Load testing %1...").replace("%1", model_name))
+        self.progress_bar.setVisible(True)
+        
+        self.worker_thread = WorkerThread("loadtest", self.host_url(host), model_name, levels, requests)
+        self.worker_thread.progress.connect(
+            lambda level: self.show_status(lambda: 
+                self.tr("Load testing %1 at concurrency %2...").replace("%1", model_name).replace("%2", level)))
+        self.worker_thread.finished.connect(
+            lambda success, message: self.on_load_test_finished(model_name, success, message))
+        self.worker_thread.start()
+    
+    def on_load_test_finished(self, model_name, success, message):
+        """负载测试完成的回调"""
+        self.progress_bar.setVisible(False)
+        
+        if success:
+            self.show_status(lambda: self.tr("Load test finished"))
+            dialog = LoadTestDialog(model_name, json.loads(message), self)
+            dialog.exec()
+        else:
+            QMessageBox.critical(self, self.tr("Error"), self.tr("Load test failed: %1").replace("%1", message))
+            self.show_status(lambda: self.tr("Load test failed"))
+    
+    def on_benchmark_finished(self, success, message):
+        """基准测试完成的回调"""
+        self.progress_bar.setVisible(False)
+        
+        if success:
+            self.show_status(lambda: self.tr("Benchmark finished"))
+            self.show_benchmark_history()
+        else:
+            QMessageBox.critical(self, self.tr("Error"), self.tr("Benchmark failed: %1").replace("%1", message))
+            self.show_status(lambda: self.tr("Benchmark failed"))
+    
+    def show_benchmark_history(self):
+        """显示基准测试历史记录"""
+        dialog = BenchmarkHistoryDialog(BenchmarkHistory().rows(), self)
+        dialog.exec()
+    
+    def is_local_row(self, row):
+        """检查选中行是否属于本机，远程主机上的模型只能查看"""
+        host = self.model_table.item(row, 0).data(Qt.UserRole + 1)
+        if host and host != LOCAL_HOST:
+            QMessageBox.warning(self, self.tr("Warning"),
+                              self.tr("This operation is only available for models on the local host"))
+            return False
+        return True
+    
     def switch_language(self, language_code):
         """切换语言"""
         # 移除旧的翻译器
@@ -1190,93 +1574,38 @@ class MainWindow(QMainWindow):
         if app:
             app.installTranslator(self.translator)
         
-        # 更新语言代码
+        # 更新语言代码；安装翻译器后各窗口收到 LanguageChange 事件，在 changeEvent 中就地更新文字
         self.language_code = language_code
-        
-        # 重新初始化UI以应用新的翻译
-        self.init_ui()
-        
-        # 显示语言切换成功的消息
-        # QMessageBox.information(self, self.tr("Language Switched"), 
-        #                       self.tr("Language switched to %1. Changes will be applied immediately.").replace("%1", language_code))
-        self.load_models()
-
-    def parse_size(self, size_str):
-        """解析大小字符串，返回字节数用于排序"""
-        if not size_str:
-            return 0
-        
-        size_str = size_str.strip().upper()
-        try:
-            if size_str.endswith('B'):
-                size_str = size_str[:-1]
-            
-            if size_str.endswith('K'):
-                return int(float(size_str[:-1]) * 1024)
-            elif size_str.endswith('M'):
-                return int(float(size_str[:-1]) * 1024 * 1024)
-            elif size_str.endswith('G'):
-                return int(float(size_str[:-1]) * 1024 * 1024 * 1024)
-            else:
-                return int(float(size_str))
-        except:
-            return 0
-    
-    def parse_date(self, date_str):
-        """解析日期字符串，返回时间戳用于排序"""
-        if not date_str:
-            return 0
-        
-        try:
-            from datetime import datetime
-            # 尝试解析常见的日期格式
-            formats = [
-                "%Y-%m-%d %H:%M:%S",
-                "%Y-%m-%d %H:%M",
-                "%Y-%m-%d",
-                "%m/%d/%Y %H:%M:%S",
-                "%m/%d/%Y %H:%M",
-                "%m/%d/%Y"
-            ]
-            
-            for fmt in formats:
-                try:
-                    return datetime.strptime(date_str.strip(), fmt).timestamp()
-                except:
-                    continue
-            
-            # 如果所有格式都失败，返回0
-            return 0
-        except:
-            return 0
 
     def sort_models(self):
         """根据选择的排序方式对模型列表进行排序"""
         sort_by = self.sort_combo.currentText()
         
         if sort_by == self.tr("Name (A-Z)"):
-            self.models_data.sort(key=lambda x: x['name'].lower())
+            self.models_data.sort(key=lambda x: x.name.lower())
         elif sort_by == self.tr("Name (Z-A)"):
-            self.models_data.sort(key=lambda x: x['name'].lower(), reverse=True)
+            self.models_data.sort(key=lambda x: x.name.lower(), reverse=True)
         elif sort_by == self.tr("Size (Largest First)"):
-            self.models_data.sort(key=lambda x: self.parse_size(x['size']), reverse=True)
+            self.models_data.sort(key=lambda x: x.size, reverse=True)
         elif sort_by == self.tr("Size (Smallest First)"):
-            self.models_data.sort(key=lambda x: self.parse_size(x['size']))
+            self.models_data.sort(key=lambda x: x.size)
         elif sort_by == self.tr("Date (Newest First)"):
-            self.models_data.sort(key=lambda x: self.parse_date(x['modified_date']), reverse=True)
+            self.models_data.sort(key=lambda x: x.modified_at, reverse=True)
         elif sort_by == self.tr("Date (Oldest First)"):
-            self.models_data.sort(key=lambda x: self.parse_date(x['modified_date']))
+            self.models_data.sort(key=lambda x: x.modified_at)
         
         self.update_table_from_data()
 
     def filter_models(self):
         """根据搜索框内容过滤模型列表"""
         search_text = self.search_input.text().lower()
+        host = self.host_combo.currentData()
         
         # 从原始数据中过滤
         filtered_data = [
             model for model in self.original_models_data
-            if search_text in model['name'].lower() or search_text in model['tag'].lower()
+            if (search_text in model.name.lower() or search_text in model.tag.lower())
+            and (host is None or model.host == host)
         ]
         
         # 应用当前排序
@@ -1300,25 +1629,30 @@ class MainWindow(QMainWindow):
         self.model_table.insertRow(row_position)
         
         # 模型名称
-        model_name_item = QTableWidgetItem(model['name'])
-        model_name_item.setData(Qt.UserRole, model['full_name']) # 存储完整名称
+        model_name_item = QTableWidgetItem(model.name)
+        model_name_item.setData(Qt.UserRole, model.full_name) # 存储完整名称
+        model_name_item.setData(Qt.UserRole + 1, model.host) # 存储所属主机
         self.model_table.setItem(row_position, 0, model_name_item)
         
         # 模型标签
-        tag_item = QTableWidgetItem(model['tag'])
+        tag_item = QTableWidgetItem(model.tag)
         self.model_table.setItem(row_position, 1, tag_item)
         
         # 模型ID
-        id_item = QTableWidgetItem(model.get('id', ''))
+        id_item = QTableWidgetItem(model.id)
         self.model_table.setItem(row_position, 2, id_item)
         
         # 模型大小
-        size_item = QTableWidgetItem(model['size'])
+        size_item = QTableWidgetItem(format_size(model.size))
         self.model_table.setItem(row_position, 3, size_item)
         
         # 模型修改日期
-        date_item = QTableWidgetItem(model['modified_date'])
+        date_item = QTableWidgetItem(format_modified(model.modified_at))
         self.model_table.setItem(row_position, 4, date_item)
+        
+        # 所属主机
+        host_item = QTableWidgetItem(model.host)
+        self.model_table.setItem(row_position, 5, host_item)
 
     def on_delete_finished(self, success, message):
         """删除完成的回调"""
@@ -1326,12 +1660,12 @@ class MainWindow(QMainWindow):
         
         if success:
             QMessageBox.information(self, self.tr("Success"), message)
-            self.status_label.setText(self.tr("Model deleted successfully"))
+            self.show_status(lambda: self.tr("Model deleted successfully"))
             # 重新加载模型列表
             self.load_models()
         else:
             QMessageBox.critical(self, self.tr("Error"), self.tr("Delete failed: %1").replace("%1", message))
-            self.status_label.setText(self.tr("Model deletion failed"))
+            self.show_status(lambda: self.tr("Model deletion failed"))
 
     def on_update_finished(self, success, message):
         """更新完成的回调"""
@@ -1339,11 +1673,11 @@ class MainWindow(QMainWindow):
         
         if success:
             QMessageBox.information(self, self.tr("Success"), message)
-            self.status_label.setText(self.tr("Model updated successfully"))
+            self.show_status(lambda: self.tr("Model updated successfully"))
             self.load_models()
         else:
             QMessageBox.critical(self, self.tr("Error"), self.tr("Update failed: %1").replace("%1", message))
-            self.status_label.setText(self.tr("Model update failed"))
+            self.show_status(lambda: self.tr("Model update failed"))
 
     def show_context_menu(self, position):
         """显示右键菜单"""
@@ -1357,9 +1691,14 @@ class MainWindow(QMainWindow):
         row = selected_items[0].row()
         model_full_name = self.model_table.item(row, 0).data(Qt.UserRole)
 
+        # 远程主机上的模型只能查看
+        host = self.model_table.item(row, 0).data(Qt.UserRole + 1)
+        is_local = not host or host == LOCAL_HOST
+
         # 添加导出选项
         export_action = menu.addAction(self.tr("Export Selected Model"))
         export_action.triggered.connect(lambda: self.export_model_context_menu(model_full_name))
+        export_action.setEnabled(is_local)
 
         # 添加导入选项
         import_action = menu.addAction(self.tr("Import Model"))
@@ -1368,13 +1707,173 @@ class MainWindow(QMainWindow):
         # 添加删除选项
         delete_action = menu.addAction(self.tr("Delete Selected Model"))
         delete_action.triggered.connect(lambda: self.delete_model_context_menu(model_full_name))
+        delete_action.setEnabled(is_local)
 
         # 添加更新选项
         update_action = menu.addAction(self.tr("Update Selected Model"))
         update_action.triggered.connect(lambda: self.update_model_context_menu(model_full_name))
+        update_action.setEnabled(is_local)
+
+        menu.addSeparator()
+
+        # 添加推理基准测试选项（可选择多个模型）
+        benchmark_action = menu.addAction(self.tr("Benchmark Selected Models"))
+        benchmark_action.triggered.connect(self.benchmark_models)
+
+        # 添加页缓存预热选项（只能读取本机的模型文件）
+        warm_action = menu.addAction(self.tr("Warm Page Cache"))
+        warm_action.triggered.connect(lambda: self.warm_model_context_menu(model_full_name))
+        warm_action.setEnabled(is_local)
+
+        # 添加校验模型文件选项（计算blob的摘要并与文件名比较）
+        verify_action = menu.addAction(self.tr("Verify Model Files"))
+        verify_action.triggered.connect(lambda: self.verify_model_context_menu(model_full_name))
+        verify_action.setEnabled(is_local)
+
+        # 添加部署到其他主机的选项（只上传目标主机缺少的层）
+        deploy_action = menu.addAction(self.tr("Deploy to Hosts..."))
+        deploy_action.triggered.connect(lambda: self.deploy_model_context_menu(model_full_name))
+        deploy_action.setEnabled(is_local and bool(self.host_registry.hosts))
+
+        # 添加预加载和卸载选项
+        preload_action = menu.addAction(self.tr("Preload Model..."))
+        preload_action.triggered.connect(lambda: self.preload_model_context_menu(model_full_name, host or LOCAL_HOST))
+        unload_action = menu.addAction(self.tr("Unload Model"))
+        unload_action.triggered.connect(lambda: self.unload_model_context_menu(model_full_name, host or LOCAL_HOST))
+
+        # 添加并发负载测试选项
+        load_test_action = menu.addAction(self.tr("Load Test Model..."))
+        load_test_action.triggered.connect(self.load_test_model)
 
         menu.exec(self.model_table.mapToGlobal(position))
 
+    def warm_model_context_menu(self, model_full_name):
+        """把模型文件预读进页缓存，缩短下次加载的时间"""
+        # 如果已有线程在运行，先清理
+        if self.worker_thread and self.worker_thread.isRunning():
+            try:
+                self.worker_thread.finished.disconnect()
+            except:
+                pass
+            self.worker_thread.quit()
+            if not self.worker_thread.wait(1000):
+                self.worker_thread.terminate()
+                self.worker_thread.wait(500)
+        
+        self.show_status(lambda: self.tr("Warming %1...").replace("%1", model_full_name))
+        self.progress_bar.setVisible(True)
+        
+        self.worker_thread = WorkerThread("warm", model_full_name)
+        self.worker_thread.progress.connect(
+            lambda percent: self.show_status(lambda: 
+                self.tr("Warming %1: %2").replace("%1", model_full_name).replace("%2", percent)))
+        self.worker_thread.progress.connect(lambda percent: self.progress_bar.setValue(int(percent.rstrip('%'))))
+        self.worker_thread.finished.connect(self.on_warm_finished)
+        self.worker_thread.start()
+
+    def on_warm_finished(self, success, message):
+        """页缓存预热完成的回调"""
+        self.progress_bar.setVisible(False)
+        self.progress_bar.reset()
+        
+        if success:
+            self.show_status(lambda: self.tr("Page cache warmed"))
+            QMessageBox.information(self, self.tr("Page Cache"), message)
+        else:
+            QMessageBox.critical(self, self.tr("Error"), self.tr("Failed to warm page cache: %1").replace("%1", message))
+            self.show_status(lambda: self.tr("Failed to warm page cache"))
+
+    def verify_model_context_menu(self, model_full_name):
+        """校验模型的所有blob是否与其sha256摘要一致"""
+        # 如果已有线程在运行，先清理
+        if self.worker_thread and self.worker_thread.isRunning():
+            try:
+                self.worker_thread.finished.disconnect()
+            except:
+                pass
+            self.worker_thread.quit()
+            if not self.worker_thread.wait(1000):
+                self.worker_thread.terminate()
+                self.worker_thread.wait(500)
+        
+        self.show_status(lambda: self.tr("Verifying %1...").replace("%1", model_full_name))
+        self.progress_bar.setVisible(True)
+        
+        self.worker_thread = WorkerThread("verify", model_full_name)
+        self.worker_thread.progress.connect(
+            lambda percent: self.show_status(lambda: 
+                self.tr("Verifying %1: %2").replace("%1", model_full_name).replace("%2", percent)))
+        self.worker_thread.progress.connect(lambda percent: self.progress_bar.setValue(int(percent.rstrip('%'))))
+        self.worker_thread.finished.connect(self.on_verify_finished)
+        self.worker_thread.start()
+
+    def on_verify_finished(self, success, message):
+        """模型文件校验完成的回调"""
+        self.progress_bar.setVisible(False)
+        self.progress_bar.reset()
+        
+        if success:
+            self.show_status(lambda: self.tr("Model files verified"))
+            QMessageBox.information(self, self.tr("Verify Model Files"), message)
+        else:
+            QMessageBox.critical(self, self.tr("Error"), self.tr("Model files failed verification: %1").replace("%1", message))
+            self.show_status(lambda: self.tr("Model files failed verification"))
+
+    def deploy_model_context_menu(self, model_full_name):
+        """把本机的模型部署到选中的远程主机"""
+        dialog = DeployDialog(model_full_name, list(self.host_registry.hosts), self)
+        if dialog.exec() != QDialog.Accepted:
+            return
+        hosts = {name: self.host_registry.hosts[name] for name in dialog.selected_hosts()}
+        if not hosts:
+            return
+        target_name = dialog.target_name()
+        
+        # 如果已有线程在运行，先清理
+        if self.worker_thread and self.worker_thread.isRunning():
+            try:
+                self.worker_thread.finished.disconnect()
+            except:
+                pass
+            self.worker_thread.quit()
+            if not self.worker_thread.wait(1000):
+                self.worker_thread.terminate()
+                self.worker_thread.wait(500)
+        
+        self.show_status(lambda: self.tr("Deploying %1...").replace("%1", model_full_name))
+        self.progress_bar.setVisible(True)
+        
+        self.worker_thread = WorkerThread("deploy", model_full_name, hosts, target_name)
+        self.worker_thread.progress.connect(
+            lambda status: self.show_status(lambda: 
+                self.tr("Deploying %1: %2").replace("%1", model_full_name).replace("%2", status)))
+        self.worker_thread.finished.connect(self.on_deploy_finished)
+        self.worker_thread.start()
+
+    def on_deploy_finished(self, success, message):
+        """部署完成的回调，message 中每个主机一行结果"""
+        self.progress_bar.setVisible(False)
+        
+        if success:
+            self.show_status(lambda: self.tr("Model deployed"))
+            QMessageBox.information(self, self.tr("Deploy to Hosts"), message)
+        else:
+            QMessageBox.critical(self, self.tr("Error"), self.tr("Deployment failed: %1").replace("%1", message))
+            self.show_status(lambda: self.tr("Deployment failed"))
+        self.load_models()
+
+    def preload_model_context_menu(self, model_full_name, host):
+        """从右键菜单预加载模型，并打开已加载模型面板"""
+        self.loaded_panel.show()
+        self.loaded_panel.select_host(host)
+        self.loaded_panel.preload_model(model_full_name)
+
+    def unload_model_context_menu(self, model_full_name, host):
+        """从右键菜单卸载模型"""
+        self.loaded_panel.show()
+        self.loaded_panel.select_host(host)
+        self.loaded_panel.unload_model(model_full_name)
+
     def export_model_context_menu(self, model_full_name):
         """从右键菜单导出模型"""
         export_path, _ = QFileDialog.getSaveFileName(
@@ -1394,7 +1893,7 @@ class MainWindow(QMainWindow):
                 self.worker_thread.terminate()
                 self.worker_thread.wait(500)
         
-        self.status_label.setText(self.tr("Exporting model %1...").replace("%1", model_full_name))
+        self.show_status(lambda: self.tr("Exporting model %1...").replace("%1", model_full_name))
         self.progress_bar.setVisible(True)
         
         self.worker_thread = WorkerThread("export", model_full_name, export_path)
@@ -1423,7 +1922,7 @@ class MainWindow(QMainWindow):
                 text=model_name.replace(re.sub(r'[^a-zA-Z0-9_-]', '', model_name), ''))
             
             if not ok:
-                self.status_label.setText(self.tr("Import operation cancelled"))
+                self.show_status(lambda: self.tr("Import operation cancelled"))
                 return
             
             if not new_model_name:
@@ -1438,7 +1937,7 @@ class MainWindow(QMainWindow):
             
             # 如果用户取消输入对话框，返回
             if not ok:
-                self.status_label.setText(self.tr("Import operation cancelled"))
+                self.show_status(lambda: self.tr("Import operation cancelled"))
                 return
             
             # 如果用户没有输入新名称，使用默认名称
@@ -1462,10 +1961,13 @@ class MainWindow(QMainWindow):
                 self.worker_thread.terminate()
                 self.worker_thread.wait(500)
         
-        self.status_label.setText(self.tr("Importing model %1...").replace("%1", new_model_name))
+        self.show_status(lambda: self.tr("Importing model %1...").replace("%1", new_model_name))
         self.progress_bar.setVisible(True)
         
         self.worker_thread = WorkerThread("import", import_path, new_model_name)
+        self.worker_thread.progress.connect(
+            lambda message: self.show_status(lambda: 
+                self.tr("Importing model %1...").replace("%1", f"{new_model_name} ({message})")))
         self.worker_thread.finished.connect(self.on_import_finished)
         self.worker_thread.start()
 
@@ -1489,14 +1991,14 @@ class MainWindow(QMainWindow):
                     self.worker_thread.terminate()
                     self.worker_thread.wait(500)
             
-            self.status_label.setText(self.tr("Deleting model %1...").replace("%1", model_full_name))
+            self.show_status(lambda: self.tr("Deleting model %1...").replace("%1", model_full_name))
             self.progress_bar.setVisible(True)
             
             self.worker_thread = WorkerThread("delete", model_full_name)
             self.worker_thread.finished.connect(self.on_delete_finished)
             self.worker_thread.start()
         else:
-            self.status_label.setText(self.tr("Model deletion cancelled"))
+            self.show_status(lambda: self.tr("Model deletion cancelled"))
 
     def update_model_context_menu(self, model_full_name):
         """从右键菜单更新模型"""
@@ -1518,14 +2020,17 @@ class MainWindow(QMainWindow):
                     self.worker_thread.terminate()
                     self.worker_thread.wait(500)
             
-            self.status_label.setText(self.tr("Updating model %1...").replace("%1", model_full_name))
+            self.show_status(lambda: self.tr("Updating model %1...").replace("%1", model_full_name))
             self.progress_bar.setVisible(True)
             
             self.worker_thread = WorkerThread("update", model_full_name)
+            self.worker_thread.progress.connect(
+                lambda message, name=model_full_name: self.show_status(lambda: 
+                    self.tr("Updating model %1...").replace("%1", f"{name} ({message})")))
             self.worker_thread.finished.connect(self.on_update_finished)
             self.worker_thread.start()
         else:
-            self.status_label.setText(self.tr("Model update cancelled"))
+            self.show_status(lambda: self.tr("Model update cancelled"))
 
     def on_header_clicked(self, logical_index):
         """表头点击事件处理"""
@@ -1548,6 +2053,8 @@ class MainWindow(QMainWindow):
             self.sort_models_by_size()
         elif logical_index == 4:  # 日期列
             self.sort_models_by_date()
+        elif logical_index == 5:  # 主机列
+            self.sort_models_by_host()
         
         # 更新表头显示排序指示器
         header = self.model_table.horizontalHeader()
@@ -1556,41 +2063,49 @@ class MainWindow(QMainWindow):
     def sort_models_by_name(self):
         """按模型名称排序"""
         if self.current_sort_order == Qt.AscendingOrder:
-            self.models_data.sort(key=lambda x: x['name'].lower())
+            self.models_data.sort(key=lambda x: x.name.lower())
         else:
-            self.models_data.sort(key=lambda x: x['name'].lower(), reverse=True)
+            self.models_data.sort(key=lambda x: x.name.lower(), reverse=True)
         self.update_table_from_data()
     
     def sort_models_by_tag(self):
         """按Tag排序"""
         if self.current_sort_order == Qt.AscendingOrder:
-            self.models_data.sort(key=lambda x: x['tag'].lower())
+            self.models_data.sort(key=lambda x: x.tag.lower())
         else:
-            self.models_data.sort(key=lambda x: x['tag'].lower(), reverse=True)
+            self.models_data.sort(key=lambda x: x.tag.lower(), reverse=True)
         self.update_table_from_data()
     
     def sort_models_by_id(self):
         """按ID排序"""
         if self.current_sort_order == Qt.AscendingOrder:
-            self.models_data.sort(key=lambda x: x.get('id', '').lower())
+            self.models_data.sort(key=lambda x: x.id.lower())
         else:
-            self.models_data.sort(key=lambda x: x.get('id', '').lower(), reverse=True)
+            self.models_data.sort(key=lambda x: x.id.lower(), reverse=True)
         self.update_table_from_data()
     
     def sort_models_by_size(self):
         """按大小排序"""
         if self.current_sort_order == Qt.AscendingOrder:
-            self.models_data.sort(key=lambda x: self.parse_size(x['size']))
+            self.models_data.sort(key=lambda x: x.size)
         else:
-            self.models_data.sort(key=lambda x: self.parse_size(x['size']), reverse=True)
+            self.models_data.sort(key=lambda x: x.size, reverse=True)
         self.update_table_from_data()
     
     def sort_models_by_date(self):
         """按日期排序"""
         if self.current_sort_order == Qt.AscendingOrder:
-            self.models_data.sort(key=lambda x: self.parse_date(x['modified_date']))
+            self.models_data.sort(key=lambda x: x.modified_at)
         else:
-            self.models_data.sort(key=lambda x: self.parse_date(x['modified_date']), reverse=True)
+            self.models_data.sort(key=lambda x: x.modified_at, reverse=True)
+        self.update_table_from_data()
+
+    def sort_models_by_host(self):
+        """按主机排序"""
+        if self.current_sort_order == Qt.AscendingOrder:
+            self.models_data.sort(key=lambda x: x.host.lower())
+        else:
+            self.models_data.sort(key=lambda x: x.host.lower(), reverse=True)
         self.update_table_from_data()
 
     def keyPressEvent(self, event):
@@ -1614,6 +2129,435 @@ class MainWindow(QMainWindow):
 
 
 
+class JobsPanel(QDockWidget):
+    """显示后台操作的状态，并可随时调整I/O限速和后台优先级"""
+    
+    MAX_ROWS = 50
+    
+    def __init__(self, main_window):
+        super().__init__(main_window)
+        self.setObjectName("jobs_panel")
+        self.main_window = main_window
+        self.started_at = {}
+        
+        widget = QWidget()
+        layout = QVBoxLayout()
+        widget.setLayout(layout)
+        
+        limit_layout = QHBoxLayout()
+        self.limit_label = QLabel()
+        limit_layout.addWidget(self.limit_label)
+        self.limit_spin = QSpinBox()
+        self.limit_spin.setRange(0, 100000)
+        self.limit_spin.setSuffix(" MB/s")
+        self.limit_spin.setValue(int(throttle.bandwidth_limit()))
+        self.limit_spin.valueChanged.connect(lambda value: throttle.set_bandwidth_limit(value, persist=True))
+        limit_layout.addWidget(self.limit_spin)
+        self.priority_check = QCheckBox()
+        self.priority_check.setChecked(throttle.low_priority_enabled())
+        self.priority_check.toggled.connect(lambda checked: throttle.set_low_priority(checked, persist=True))
+        limit_layout.addWidget(self.priority_check)
+        limit_layout.addStretch()
+        layout.addLayout(limit_layout)
+        
+        self.table = QTableWidget(0, 5)
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.table.horizontalHeader().setStretchLastSection(True)
+        layout.addWidget(self.table)
+        
+        self.setWidget(widget)
+        jobs.started.connect(self.on_job_started)
+        jobs.progress.connect(self.on_job_progress)
+        jobs.finished.connect(self.on_job_finished)
+        self.retranslateUi()
+    
+    def retranslateUi(self):
+        """按当前语言设置面板上的文字"""
+        self.setWindowTitle(self.tr("Jobs"))
+        self.limit_label.setText(self.tr("Bandwidth limit:"))
+        self.limit_spin.setSpecialValueText(self.tr("Unlimited"))
+        self.limit_spin.setToolTip(self.tr("Total read rate of exports, imports and cache warming; applies immediately"))
+        self.priority_check.setText(self.tr("Low priority (nice/ionice)"))
+        self.priority_check.setToolTip(self.tr("Applies to jobs started after the change"))
+        self.table.setHorizontalHeaderLabels([self.tr("Operation"), self.tr("Details"), self.tr("Status"),
+                                              self.tr("Progress"), self.tr("Duration (s)")])
+    
+    def changeEvent(self, event):
+        if event.type() == QEvent.LanguageChange:
+            self.retranslateUi()
+        super().changeEvent(event)
+    
+    def find_row(self, job_id):
+        for row in range(self.table.rowCount()):
+            if self.table.item(row, 0).data(Qt.UserRole) == job_id:
+                return row
+        return -1
+    
+    def on_job_started(self, job_id, operation, details):
+        """新任务显示在最上面，只保留最近的任务"""
+        self.started_at[job_id] = time.monotonic()
+        self.table.insertRow(0)
+        for column, value in enumerate([operation, details, self.tr("Running"), "", ""]):
+            item = QTableWidgetItem(value)
+            item.setData(Qt.UserRole, job_id)
+            self.table.setItem(0, column, item)
+        while self.table.rowCount() > self.MAX_ROWS:
+            self.table.removeRow(self.table.rowCount() - 1)
+    
+    def on_job_progress(self, job_id, message):
+        row = self.find_row(job_id)
+        if row >= 0:
+            self.table.item(row, 3).setText(message)
+    
+    def on_job_finished(self, job_id, status, message):
+        row = self.find_row(job_id)
+        started = self.started_at.pop(job_id, None)
+        if row < 0:
+            return
+        self.table.item(row, 2).setText(self.tr(status))
+        self.table.item(row, 2).setToolTip(message)
+        if started is not None:
+            self.table.item(row, 4).setText(f"{time.monotonic() - started:.1f}")
+
+
+class LoadedModelsPanel(QDockWidget):
+    """显示当前加载在内存或显存中的模型（轮询 /api/ps），并提供预加载和卸载操作
+    
+    面板可见时才轮询：列表有变化时每2秒刷新，稳定时逐步放慢到30秒。
+    """
+    
+    def __init__(self, main_window):
+        super().__init__(main_window)
+        self.setObjectName("loaded_models_panel")
+        self.main_window = main_window
+        self.interval = AdaptiveInterval()
+        self.poll_future = None
+        self.action_thread = None
+        self.last_state = None
+        
+        # 单次定时器，每次轮询结束后按自适应间隔重新启动
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.poll)
+        
+        widget = QWidget()
+        layout = QVBoxLayout()
+        widget.setLayout(layout)
+        
+        host_layout = QHBoxLayout()
+        self.host_label = QLabel()
+        host_layout.addWidget(self.host_label)
+        self.host_combo = QComboBox()
+        self.host_combo.currentIndexChanged.connect(self.refresh)
+        host_layout.addWidget(self.host_combo)
+        host_layout.addStretch()
+        layout.addLayout(host_layout)
+        
+        self.table = QTableWidget(0, 4)
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.table.setSelectionMode(QTableWidget.SingleSelection)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        layout.addWidget(self.table)
+        
+        self.status_label = QLabel("")
+        layout.addWidget(self.status_label)
+        
+        button_layout = QHBoxLayout()
+        self.preload_button = QPushButton()
+        self.preload_button.clicked.connect(lambda: self.preload_model())
+        button_layout.addWidget(self.preload_button)
+        self.unload_button = QPushButton()
+        self.unload_button.clicked.connect(lambda: self.unload_model())
+        button_layout.addWidget(self.unload_button)
+        self.refresh_button = QPushButton()
+        self.refresh_button.clicked.connect(self.refresh)
+        button_layout.addWidget(self.refresh_button)
+        layout.addLayout(button_layout)
+        
+        self.setWidget(widget)
+        self.visibilityChanged.connect(self.on_visibility_changed)
+        self.retranslateUi()
+    
+    def retranslateUi(self):
+        """按当前语言设置面板上的文字"""
+        self.setWindowTitle(self.tr("Loaded Models"))
+        self.host_label.setText(self.tr("Host:"))
+        self.table.setHorizontalHeaderLabels([self.tr("Model"), self.tr("Size"), self.tr("Processor"), self.tr("Until")])
+        self.preload_button.setText(self.tr("Preload..."))
+        self.unload_button.setText(self.tr("Unload"))
+        self.refresh_button.setText(self.tr("Refresh"))
+    
+    def changeEvent(self, event):
+        if event.type() == QEvent.LanguageChange:
+            self.retranslateUi()
+        super().changeEvent(event)
+    
+    def set_hosts(self, names):
+        """更新可监视的主机列表"""
+        current = self.host_combo.currentData()
+        self.host_combo.blockSignals(True)
+        self.host_combo.clear()
+        for name in names:
+            self.host_combo.addItem(name, name)
+        self.host_combo.setCurrentIndex(max(self.host_combo.findData(current), 0))
+        self.host_combo.blockSignals(False)
+    
+    def select_host(self, host):
+        """切换到指定主机"""
+        index = self.host_combo.findData(host)
+        if index >= 0:
+            self.host_combo.setCurrentIndex(index)
+    
+    def host(self):
+        return self.host_combo.currentData() or LOCAL_HOST
+    
+    def on_visibility_changed(self, visible):
+        if visible:
+            self.refresh()
+        else:
+            self.timer.stop()
+    
+    def refresh(self):
+        """立即刷新并恢复最短轮询间隔"""
+        self.interval.reset()
+        self.last_state = None
+        self.poll()
+    
+    def poll(self):
+        """在事件循环中获取已加载的模型"""
+        self.timer.stop()
+        if not self.isVisible() or self.poll_future is not None:
+            return
+        self.poll_future = future = async_bridge.submit(
+            asyncops.loaded_models(self.main_window.host_url(self.host())),
+            lambda models, error: future is self.poll_future and self.on_polled(models, error))
+    
+    def on_polled(self, models, error):
+        """轮询完成的回调，根据结果安排下一次轮询"""
+        self.poll_future = None
+        changed = False
+        until_expiry = None
+        if error is None:
+            state = [(model['full_name'], model['expires_at']) for model in models]
+            changed = state != self.last_state
+            self.last_state = state
+            self.update_table(models)
+            now = time.time()
+            expiries = [model['expires_at'] - now for model in models if model['expires_at'] is not None]
+            until_expiry = min(expiries) if expiries else None
+            self.status_label.setText(self.tr("%1 model(s) loaded").replace("%1", str(len(models))))
+        else:
+            self.status_label.setText(str(error))
+        if self.isVisible():
+            self.timer.start(int(self.interval.next(changed, until_expiry) * 1000))
+    
+    def update_table(self, models):
+        """用最新的 /api/ps 结果更新表格"""
+        now = time.time()
+        self.table.setRowCount(len(models))
+        for row, model in enumerate(models):
+            remaining = None if model['expires_at'] is None else model['expires_at'] - now
+            values = [model['full_name'], model['size'], model['processor'], format_remaining(remaining)]
+            for column, value in enumerate(values):
+                item = QTableWidgetItem(value)
+                item.setData(Qt.UserRole, model['full_name'])
+                self.table.setItem(row, column, item)
+    
+    def preload_model(self, model_name=None):
+        """以指定的 keep_alive 预加载模型"""
+        if model_name is None:
+            names = sorted({model.full_name for model in self.main_window.host_lister.cached_models(self.host())})
+            if not names:
+                QMessageBox.warning(self, self.tr("Warning"), self.tr("No models available on this host"))
+                return
+            model_name, ok = QInputDialog.getItem(self, self.tr("Preload Model"), self.tr("Model:"), names, 0, False)
+            if not ok:
+                return
+        text, ok = QInputDialog.getText(self, self.tr("Preload Model"),
+                                        self.tr("Keep alive (e.g. 5m, 1h, -1 for forever):"), text="5m")
+        if not ok:
+            return
+        try:
+            keep_alive = parse_keep_alive(text)
+        except Exception as e:
+            QMessageBox.warning(self, self.tr("Warning"), str(e))
+            return
+        self.run_action("preload", model_name, keep_alive)
+    
+    def unload_model(self, model_name=None):
+        """立即卸载模型"""
+        if model_name is None:
+            items = self.table.selectedItems()
+            if not items:
+                QMessageBox.warning(self, self.tr("Warning"), self.tr("Please select a model first"))
+                return
+            model_name = items[0].data(Qt.UserRole)
+        self.run_action("unload", model_name)
+    
+    def run_action(self, operation, model_name, *args):
+        """在后台线程中执行预加载或卸载"""
+        if self.action_thread and self.action_thread.isRunning():
+            QMessageBox.warning(self, self.tr("Warning"), self.tr("Another operation is still running"))
+            return
+        if operation == "preload":
+            self.status_label.setText(self.tr("Loading %1...").replace("%1", model_name))
+        else:
+            self.status_label.setText(self.tr("Unloading %1...").replace("%1", model_name))
+        self.action_thread = WorkerThread(operation, self.main_window.host_url(self.host()), model_name, *args)
+        self.action_thread.finished.connect(self.on_action_finished)
+        self.action_thread.start()
+    
+    def on_action_finished(self, success, message):
+        """预加载或卸载完成的回调"""
+        if not success:
+            QMessageBox.critical(self, self.tr("Error"), message)
+        self.refresh()
+    
+    def stop(self):
+        """停止轮询，取消进行中的请求并等待后台线程结束"""
+        self.timer.stop()
+        if self.poll_future is not None:
+            self.poll_future.cancel()
+            self.poll_future = None
+        thread = self.action_thread
+        if thread and thread.isRunning():
+            try:
+                thread.finished.disconnect()
+            except:
+                pass
+            if not thread.wait(3000):
+                thread.terminate()
+                thread.wait(1000)
+
+
+class DeployDialog(QDialog):
+    """选择要部署到的主机和模型在这些主机上的名称"""
+    
+    def __init__(self, model_name, host_names, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle(self.tr("Deploy %1").replace("%1", model_name))
+        
+        layout = QVBoxLayout()
+        self.setLayout(layout)
+        
+        layout.addWidget(QLabel(self.tr("Hosts:")))
+        self.host_list = QListWidget()
+        for name in host_names:
+            self.host_list.addItem(name)
+            item = self.host_list.item(self.host_list.count() - 1)
+            item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
+            item.setCheckState(Qt.Checked)
+        layout.addWidget(self.host_list)
+        
+        layout.addWidget(QLabel(self.tr("Model name on the hosts:")))
+        self.name_edit = QLineEdit(model_name)
+        layout.addWidget(self.name_edit)
+        
+        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+    
+    def selected_hosts(self):
+        """返回勾选的主机名"""
+        items = (self.host_list.item(row) for row in range(self.host_list.count()))
+        return [item.text() for item in items if item.checkState() == Qt.Checked]
+    
+    def target_name(self):
+        return self.name_edit.text().strip() or None
+
+
+class ResultsTableDialog(QDialog):
+    """以可排序表格显示测试结果，headers 为 [(列标题, 字段名)]；提供 save_csv 时显示保存按钮"""
+    
+    def __init__(self, title, headers, rows, parent=None, save_csv=None):
+        super().__init__(parent)
+        self.setWindowTitle(title)
+        self.resize(900, 400)
+        self.rows = rows
+        self.save_csv = save_csv
+        
+        layout = QVBoxLayout()
+        self.setLayout(layout)
+        
+        self.table = QTableWidget(len(rows), len(headers))
+        self.table.setHorizontalHeaderLabels([label for label, _ in headers])
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        for row, record in enumerate(rows):
+            for column, (_, key) in enumerate(headers):
+                value = record[key]
+                item = QTableWidgetItem()
+                if isinstance(value, float):
+                    # 以数值存储，保证按数值排序
+                    item.setData(Qt.DisplayRole, round(value, 3))
+                else:
+                    item.setData(Qt.DisplayRole, value)
+                self.table.setItem(row, column, item)
+        self.table.setSortingEnabled(True)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        layout.addWidget(self.table)
+        
+        button_layout = QHBoxLayout()
+        if save_csv:
+            save_button = QPushButton(self.tr("Save CSV"))
+            save_button.clicked.connect(self.save)
+            button_layout.addWidget(save_button)
+        button_layout.addStretch()
+        close_button = QPushButton(self.tr("Close"))
+        close_button.clicked.connect(self.accept)
+        button_layout.addWidget(close_button)
+        layout.addLayout(button_layout)
+    
+    def save(self):
+        """把结果保存为CSV文件"""
+        path, _ = QFileDialog.getSaveFileName(self, self.tr("Save CSV"), "", "CSV Files (*.csv)")
+        if not path:
+            return
+        try:
+            self.save_csv(self.rows, path)
+        except Exception as e:
+            QMessageBox.critical(self, self.tr("Error"), str(e))
+
+
+class BenchmarkHistoryDialog(ResultsTableDialog):
+    """推理基准测试的历史记录"""
+    
+    def __init__(self, rows, parent=None):
+        headers = [
+            (self.tr("Time"), 'timestamp'),
+            (self.tr("Host"), 'host'),
+            (self.tr("Model"), 'model'),
+            (self.tr("Load (s)"), 'load_s'),
+            (self.tr("TTFT (s)"), 'ttft_s'),
+            (self.tr("Prompt tokens/s"), 'prompt_tps'),
+            (self.tr("Generation tokens/s"), 'gen_tps'),
+            (self.tr("Total (s)"), 'total_s'),
+        ]
+        super().__init__(self.tr("Benchmark History"), headers, rows, parent)
+
+
+class LoadTestDialog(ResultsTableDialog):
+    """负载测试报告，每个并发级别一行"""
+    
+    def __init__(self, model_name, rows, parent=None):
+        headers = [
+            (self.tr("Concurrency"), 'concurrency'),
+            (self.tr("Requests"), 'requests'),
+            (self.tr("Errors"), 'errors'),
+            (self.tr("Error rate"), 'error_rate'),
+            (self.tr("p50 (s)"), 'p50_s'),
+            (self.tr("p95 (s)"), 'p95_s'),
+            (self.tr("p99 (s)"), 'p99_s'),
+            (self.tr("Requests/s"), 'requests_per_s'),
+            (self.tr("Tokens/s"), 'tokens_per_s'),
+        ]
+        super().__init__(self.tr("Load Test: %1").replace("%1", model_name), headers, rows, parent,
+                         save_csv=write_csv)
+
+
 def main():
     # Linux desktop environments use an app's .desktop file to integrate the app
     # in to their application menus. The .desktop file of this app will include
@@ -1641,12 +2585,29 @@ def main():
         QtWidgets.QApplication.setApplicationName("OlaMoMa")
 
     app = QtWidgets.QApplication(sys.argv)
+    # 安装了 qasync 时，asyncops 的协程直接在Qt事件循环中运行，否则使用后台事件循环线程
+    try:
+        import qasync
+        async_bridge.loop = qasync.QEventLoop(app)
+        asyncio.set_event_loop(async_bridge.loop)
+    except ImportError:
+        pass
+    # 初始化追踪；如果配置了 OLAMOMA_METRICS_PORT，会在这里启动指标接口
+    get_tracer()
+    # 恢复上次设置的I/O限速和后台优先级
+    throttle.load_from_settings()
     window = MainWindow()
     window.show()
     if app:
         try:
             # Ensure the application stays alive and processes events
-            exit_code = app.exec()
+            if async_bridge.loop is not None:
+                # qasync 的 run_forever 内部运行 app.exec()
+                with async_bridge.loop:
+                    async_bridge.loop.run_forever()
+                exit_code = 0
+            else:
+                exit_code = app.exec()
             # Clean up threads before exiting
             if window and window.worker_thread and window.worker_thread.isRunning():
                 try:
@@ -0,0 +1,109 @@
+"""基于 asyncio 的最小HTTP/1.1客户端，不依赖第三方库
+"""
+import asyncio
+import json
+from urllib.parse import urlsplit
+
+from .tracing import timed
+
+
+class HTTPError(Exception):
+    """服务器返回了非2xx状态码"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+async def _read_body(reader, headers):
+    if headers.get('transfer-encoding', '').lower() == 'chunked':
+        chunks = []
+        while True:
+            size = int((await reader.readline()).split(b';')[0].strip(), 16)
+            if size == 0:
+                await reader.readline()
+                break
+            chunks.append(await reader.readexactly(size))
+            await reader.readline()
+        return b"".join(chunks)
+    if 'content-length' in headers:
+        return await reader.readexactly(int(headers['content-length']))
+    return await reader.read()
+
+
+async def open_request(base_url, method, path, content_length=0, content_type=None):
+    """建立连接并发送请求头，返回 (reader, writer)；请求体由调用方写入 writer"""
+    url = urlsplit(base_url)
+    port = url.port or (443 if url.scheme == 'https' else 80)
+    reader, writer = await asyncio.open_connection(url.hostname, port, ssl=url.scheme == 'https' or None)
+    prefix = url.path.rstrip('/')
+    head = [f"{method} {prefix}{path} HTTP/1.1", f"Host: {url.netloc}", "Connection: close",
+            f"Content-Length: {content_length}"]
+    if content_type:
+        head.append(f"Content-Type: {content_type}")
+    writer.write(("\r\n".join(head) + "\r\n\r\n").encode('ascii'))
+    return reader, writer
+
+
+async def read_response(reader, method):
+    """读取响应，返回 (状态码, 响应体)"""
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError("Server closed the connection")
+    status = int(status_line.split()[1])
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+    data = b"" if method == "HEAD" else await _read_body(reader, headers)
+    return status, data
+
+
+async def close(writer):
+    """关闭连接，忽略对方已经断开的错误"""
+    writer.close()
+    try:
+        await writer.wait_closed()
+    except (ConnectionError, OSError):
+        pass
+
+
+def raise_for_status(method, path, status, data):
+    """非2xx状态码时抛出 HTTPError，信息取自响应中的 error 字段"""
+    if status >= 400:
+        message = data.decode('utf-8', errors='replace')
+        try:
+            message = json.loads(message).get('error', message)
+        except (ValueError, AttributeError):
+            pass
+        raise HTTPError(status, f"{method} {path} failed ({status}): {message}")
+
+
+async def _exchange(base_url, method, path, payload):
+    # 与 OllamaClient 一样把请求耗时计入当前 Span 的HTTP时间
+    with timed("http"):
+        body = json.dumps(payload).encode('utf-8') if payload is not None else b""
+        reader, writer = await open_request(base_url, method, path, len(body),
+                                            "application/json" if payload is not None else None)
+        try:
+            writer.write(body)
+            await writer.drain()
+            return await read_response(reader, method)
+        finally:
+            await close(writer)
+
+
+async def request(base_url, method, path, payload=None, timeout=None):
+    """发送请求并返回 (状态码, 响应体)；非2xx状态码抛出 HTTPError，超时抛出 asyncio.TimeoutError"""
+    status, data = await asyncio.wait_for(_exchange(base_url, method, path, payload), timeout)
+    raise_for_status(method, path, status, data)
+    return status, data
+
+
+async def request_json(base_url, method, path, payload=None, timeout=None):
+    """发送请求并返回解析后的JSON"""
+    _, data = await request(base_url, method, path, payload, timeout)
+    return json.loads(data) if data else {}
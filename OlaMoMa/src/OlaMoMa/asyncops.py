@@ -0,0 +1,179 @@
+"""基于 asyncio 的操作核心
+
+列表、show、/api/ps 和版本探测这类短请求不再各占一个线程：这里的协程使用 asynchttp 和 asyncio 子进程，
+几十个请求可以在同一个线程的事件循环中并发执行。gather 为每个调用设置超时，外层任务被取消时，
+未完成的请求和 ollama 子进程也会一起取消。
+
+同一套协程在命令行中由 asyncio.run 执行；在界面中由 app.AsyncBridge 执行（安装了 qasync 时直接在
+Qt 事件循环中运行，否则在 get_loop_thread 返回的共享后台事件循环线程中运行）。
+"""
+import asyncio
+import threading
+
+from . import asynchttp
+from .api import is_connect_error, loaded_model_from_ps, model_from_tag
+from .connection import get_connection
+from .records import parse_list_output
+from .session import get_session
+from .tracing import timed
+
+DEFAULT_TIMEOUT = 10
+
+
+def _record(base_url, error=None):
+    """与 OllamaClient 一样把请求结果计入共享的连接状态：收到任何HTTP响应记为在线"""
+    connection = get_connection(base_url)
+    if error is None:
+        connection.record_success()
+    else:
+        connection.record_failure(error)
+
+
+async def request_json(base_url, method, path, payload=None, timeout=DEFAULT_TIMEOUT):
+    """发送请求并返回解析后的JSON；断路器打开时立即失败，各种错误统一转换为 Exception"""
+    get_connection(base_url).raise_if_open()
+    try:
+        data = await asynchttp.request_json(base_url, method, path, payload, timeout)
+    except asynchttp.HTTPError as e:
+        _record(base_url)
+        raise Exception(str(e))
+    except asyncio.TimeoutError:
+        # 与 OllamaClient 一样，超时只说明这个请求慢，不把服务器标记为离线
+        raise Exception(f"Timeout while requesting {method} {path} from {base_url}")
+    except (OSError, EOFError) as e:
+        if is_connect_error(e):
+            _record(base_url, e)
+        raise Exception(f"Cannot connect to {base_url}: {e}")
+    _record(base_url)
+    return data
+
+
+async def probe(base_url, timeout=2):
+    """请求 /api/version 并返回服务器版本号"""
+    version = (await request_json(base_url, "GET", "/api/version", timeout=timeout)).get('version', '')
+    get_connection(base_url).record_success(version)
+    return version
+
+
+async def detect(session, timeout=2):
+    """Session.detect 的协程版本：检测成功后不再重复，失败时返回 False"""
+    if session.detected:
+        return True
+    if get_connection(session.base_url).is_open():
+        return False
+    try:
+        version = await probe(session.base_url, timeout)
+    except Exception:
+        return False
+    session.record_version(version)
+    return True
+
+
+async def run_cli(ollama_path, *args, timeout=DEFAULT_TIMEOUT):
+    """运行 ollama 子命令并返回标准输出；超时或任务被取消时结束子进程"""
+    with timed("subprocess"):
+        process = await asyncio.create_subprocess_exec(ollama_path, *args, stdout=asyncio.subprocess.PIPE,
+                                                       stderr=asyncio.subprocess.PIPE)
+        try:
+            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+        except asyncio.TimeoutError:
+            raise Exception(f"Timeout while running ollama {args[0]}")
+        finally:
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+    if process.returncode != 0:
+        raise Exception(f"ollama {args[0]} failed: {stderr.decode('utf-8', errors='replace').strip()}")
+    return stdout.decode('utf-8', errors='replace')
+
+
+async def list_host(base_url, timeout=DEFAULT_TIMEOUT):
+    """通过 /api/tags 列出服务器上的模型"""
+    tags = await request_json(base_url, "GET", "/api/tags", timeout=timeout)
+    return [model_from_tag(entry) for entry in tags.get('models', [])]
+
+
+async def list_local(session, ollama_path=None, timeout=DEFAULT_TIMEOUT):
+    """列出本机的模型：服务器可用时请求 /api/tags，否则运行 ollama list"""
+    connection = get_connection(session.base_url)
+    connection.raise_if_open()
+    if await detect(session):
+        return await list_host(session.base_url, timeout)
+    ollama_path = ollama_path or session.ollama_path
+    if not ollama_path:
+        raise Exception("Ollama executable not found")
+    output = await run_cli(ollama_path, "list", timeout=timeout)
+    connection.record_success()
+    return parse_list_output(output)
+
+
+async def show(base_url, model, timeout=DEFAULT_TIMEOUT):
+    """返回 /api/show 中模型的 Modelfile、参数和详细信息"""
+    return await request_json(base_url, "POST", "/api/show", {'model': model}, timeout=timeout)
+
+
+async def loaded_models(base_url, timeout=5):
+    """列出当前加载在内存或显存中的模型"""
+    session = get_session(base_url)
+    # 旧版本的服务器没有 /api/ps，不必等待一个404
+    if await detect(session) and 'ps' not in session.capabilities:
+        raise Exception(f"Ollama {session.version} does not report loaded models, please upgrade the server")
+    ps = await request_json(base_url, "GET", "/api/ps", timeout=timeout)
+    return [loaded_model_from_ps(entry) for entry in ps.get('models', [])]
+
+
+async def gather(calls, timeout=DEFAULT_TIMEOUT, limit=None):
+    """并发执行 {键: 协程}，返回 {键: (结果, 错误信息)}；单个调用失败或超时不影响其他调用
+
+    每个调用最多运行 timeout 秒，limit 限制同时进行的调用数（等待名额的时间不计入超时）。
+    外层任务被取消时，所有未完成的调用一起取消。
+    """
+    semaphore = asyncio.Semaphore(limit or max(len(calls), 1))
+
+    async def run(coro):
+        try:
+            async with semaphore:
+                return await asyncio.wait_for(coro, timeout)
+        finally:
+            # 还没开始就被取消的协程也要关闭，避免 "never awaited" 警告
+            coro.close()
+
+    keys = list(calls)
+    outcomes = await asyncio.gather(*(run(calls[key]) for key in keys), return_exceptions=True)
+    results = {}
+    for key, outcome in zip(keys, outcomes):
+        if isinstance(outcome, asyncio.TimeoutError):
+            results[key] = (None, f"Timed out after {timeout:g}s")
+        elif isinstance(outcome, BaseException):
+            if not isinstance(outcome, Exception):
+                raise outcome
+            results[key] = (None, str(outcome))
+        else:
+            results[key] = (outcome, None)
+    return results
+
+
+class LoopThread:
+    """在后台线程中一直运行的事件循环，供没有 asyncio 事件循环的线程（如Qt界面线程）提交协程"""
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, name="asyncops", daemon=True)
+        self.thread.start()
+
+    def submit(self, coro):
+        """提交协程并返回 concurrent.futures.Future；调用它的 cancel() 会取消协程"""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+
+_loop_thread = None
+_loop_thread_lock = threading.Lock()
+
+
+def get_loop_thread():
+    """返回进程内共享的后台事件循环线程，第一次调用时启动"""
+    global _loop_thread
+    with _loop_thread_lock:
+        if _loop_thread is None:
+            _loop_thread = LoopThread()
+        return _loop_thread
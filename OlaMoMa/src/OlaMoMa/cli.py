@@ -0,0 +1,226 @@
+"""无界面的命令行入口
+
+用法: python -m OlaMoMa.cli <命令> [参数]
+"""
+import argparse
+import asyncio
+import sys
+
+from . import asyncops
+from .api import format_size, normalize_host
+from .deploy import deploy, format_deploy_report
+from .hashing import HashEngine, format_verify_report, verify_blobs
+from .loadtest import format_table, run_load_test, write_csv
+from .manifests import iter_manifests, model_blobs
+from .hosts import LOCAL_HOST, HostRegistry
+from .pagecache import format_report, warm_model
+from .records import format_modified
+from .registrycache import DEFAULT_PORT, DEFAULT_UPSTREAM, RegistryCache, RegistryCacheServer
+from .session import get_session
+from .tracing import get_tracer
+from . import profiling, throttle
+
+
+def cmd_loadtest(args):
+    rows = run_load_test(args.host, args.model, levels=args.concurrency, requests=args.requests,
+                         rate=args.rate, num_predict=args.num_predict,
+                         progress=lambda level: print(f"concurrency {level}...", file=sys.stderr))
+    print(format_table(rows))
+    for row in rows:
+        if row['first_error']:
+            print(f"concurrency {row['concurrency']}: first error: {row['first_error']}", file=sys.stderr)
+    if args.csv:
+        write_csv(rows, args.csv)
+    return 1 if any(row['errors'] == row['requests'] for row in rows) else 0
+
+
+def _print_percent(done, total):
+    print(f"\r  {done * 100 // total}%", end="", file=sys.stderr, flush=True)
+
+
+def cmd_warm(args):
+    models = sorted(name for name, _ in iter_manifests(args.models_dir)) if args.all else args.models
+    if not models:
+        raise Exception("No models given")
+    for model in models:
+        print(f"{model}:")
+        result = warm_model(model, args.models_dir, readers=args.readers, check_only=args.check,
+                            progress=None if args.check else _print_percent)
+        if not args.check:
+            print(file=sys.stderr)
+        print(format_report(result))
+    return 0
+
+
+def cmd_verify(args):
+    models = sorted(name for name, _ in iter_manifests(args.models_dir)) if args.all else args.models
+    if not models:
+        raise Exception("No models given")
+    engine = HashEngine(args.workers)
+    failed = False
+    for model in models:
+        print(f"{model}:")
+        results = verify_blobs(model_blobs(args.models_dir, model), engine, progress=_print_percent)
+        print(file=sys.stderr)
+        print(format_verify_report(results))
+        failed = failed or not all(result['ok'] for result in results)
+    return 1 if failed else 0
+
+
+def _select_hosts(names, all_hosts):
+    """把命令行中的主机（hosts.json 中的名称或地址）解析为 {名称: 地址}；没有指定时只使用本机"""
+    registry = HostRegistry()
+    if all_hosts:
+        names = registry.names()
+    hosts = {}
+    for name in names or [LOCAL_HOST]:
+        hosts[name] = get_session().base_url if name == LOCAL_HOST else registry.hosts.get(name, normalize_host(name))
+    return hosts
+
+
+def _report_errors(results):
+    failed = False
+    for name, (_, error) in results.items():
+        if error is not None:
+            print(f"{name}: {error}", file=sys.stderr)
+            failed = True
+    return 1 if failed else 0
+
+
+def cmd_list(args):
+    hosts = _select_hosts(args.hosts, args.all)
+    calls = {name: asyncops.list_local(get_session(), timeout=args.timeout) if name == LOCAL_HOST
+             else asyncops.list_host(url, timeout=args.timeout) for name, url in hosts.items()}
+    # 所有主机在同一个事件循环中并发请求，和界面中的刷新一样记录为一个 "list" 操作
+    with get_tracer().span("list", args=list(hosts)), profiling.profile_operation("list"):
+        results = asyncio.run(asyncops.gather(calls, timeout=args.timeout + 1))
+    print(f"{'HOST':<12} {'NAME':<40} {'ID':<12} {'SIZE':>10}  MODIFIED")
+    for name, (models, _) in results.items():
+        for model in sorted(models or [], key=lambda model: model.full_name):
+            print(f"{name:<12} {model.full_name:<40} {model.id:<12} {format_size(model.size):>10}  "
+                  f"{format_modified(model.modified_at)}")
+    return _report_errors(results)
+
+
+def cmd_probe(args):
+    hosts = _select_hosts(args.hosts, args.all)
+    results = asyncio.run(asyncops.gather({name: asyncops.probe(url, timeout=args.timeout)
+                                           for name, url in hosts.items()}, timeout=args.timeout + 1))
+    for name, (version, _) in results.items():
+        if version is not None:
+            print(f"{name:<12} {hosts[name]:<32} {version}")
+    return _report_errors(results)
+
+
+def cmd_deploy(args):
+    hosts = {name: url for name, url in _select_hosts(args.hosts, args.all).items() if name != LOCAL_HOST}
+    if not hosts:
+        raise Exception("No hosts given")
+    stages = {'check': "checking layers", 'upload': "uploading", 'create': "creating model"}
+    results = asyncio.run(deploy(args.models_dir or get_session().models_dir, args.model, hosts, args.name,
+                                 progress=lambda stage, done, total: print(
+                                     f"\r  {stages[stage]} {done * 100 // max(total, 1)}%", end="",
+                                     file=sys.stderr, flush=True)))
+    print(file=sys.stderr)
+    print(format_deploy_report(results))
+    return 1 if any(result['error'] for result in results.values()) else 0
+
+
+def cmd_cache(args):
+    cache = RegistryCache(args.dir, upstream=args.upstream, quota=int(args.quota * 1000 ** 3),
+                          manifest_ttl=args.manifest_ttl)
+    server = RegistryCacheServer(cache, args.bind, args.port)
+    print(f"Caching {cache.upstream} in {cache.root} ({format_size(cache.cached_bytes())} cached), "
+          f"listening on port {server.server_address[1]}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(", ".join(f"{key}: {value}" for key, value in cache.stats.items()), file=sys.stderr)
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="OlaMoMa.cli", description="Ollama Model Manager command line tools")
+    parser.add_argument("--limit", type=float, default=None,
+                        help="bandwidth limit for file I/O in MB/s (default: the GUI setting, 0 = unlimited)")
+    parser.add_argument("--low-priority", action="store_true", help="run with nice 10 and the idle I/O class")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    loadtest = sub.add_parser("loadtest", help="measure latency percentiles and throughput under concurrency")
+    loadtest.add_argument("model")
+    loadtest.add_argument("--host", default=None, help="Ollama API address (default: OLLAMA_HOST)")
+    loadtest.add_argument("--concurrency", type=int, nargs='+', default=[1, 2, 4, 8],
+                          help="concurrency levels to test")
+    loadtest.add_argument("--requests", type=int, default=32, help="requests per concurrency level")
+    loadtest.add_argument("--rate", type=float, default=None,
+                          help="requests started per second (default: as fast as possible)")
+    loadtest.add_argument("--num-predict", type=int, default=64, help="tokens generated per request")
+    loadtest.add_argument("--csv", help="write the report to a CSV file")
+    loadtest.set_defaults(func=cmd_loadtest)
+
+    warm = sub.add_parser("warm", help="read model blobs into the page cache")
+    warm.add_argument("models", nargs='*')
+    warm.add_argument("--all", action="store_true", help="warm every model in the models directory")
+    warm.add_argument("--models-dir", default=None, help="Ollama models directory (default: OLLAMA_MODELS)")
+    warm.add_argument("--readers", type=int, default=4, help="number of parallel readers")
+    warm.add_argument("--check", action="store_true", help="only report how much is already cached")
+    warm.set_defaults(func=cmd_warm)
+
+    verify = sub.add_parser("verify", help="check that model blobs match their sha256 digests")
+    verify.add_argument("models", nargs='*')
+    verify.add_argument("--all", action="store_true", help="verify every model in the models directory")
+    verify.add_argument("--models-dir", default=None, help="Ollama models directory (default: OLLAMA_MODELS)")
+    verify.add_argument("--workers", type=int, default=None, help="hashing processes (default: CPU count)")
+    verify.set_defaults(func=cmd_verify)
+
+    list_parser = sub.add_parser("list", help="list models on several hosts concurrently")
+    list_parser.add_argument("hosts", nargs='*', help="registered host names or addresses (default: local)")
+    list_parser.add_argument("--all", action="store_true", help="list every registered host")
+    list_parser.add_argument("--timeout", type=float, default=10, help="seconds to wait for each host")
+    list_parser.set_defaults(func=cmd_list)
+
+    probe = sub.add_parser("probe", help="check which hosts are online and their Ollama versions")
+    probe.add_argument("hosts", nargs='*', help="registered host names or addresses (default: local)")
+    probe.add_argument("--all", action="store_true", help="probe every registered host")
+    probe.add_argument("--timeout", type=float, default=2, help="seconds to wait for each host")
+    probe.set_defaults(func=cmd_probe)
+
+    deploy_parser = sub.add_parser("deploy", help="copy a local model to other hosts, uploading only missing layers")
+    deploy_parser.add_argument("model")
+    deploy_parser.add_argument("hosts", nargs='*', help="registered host names or addresses")
+    deploy_parser.add_argument("--all", action="store_true", help="deploy to every registered host")
+    deploy_parser.add_argument("--name", default=None, help="model name on the hosts (default: the same name)")
+    deploy_parser.add_argument("--models-dir", default=None, help="Ollama models directory (default: OLLAMA_MODELS)")
+    deploy_parser.set_defaults(func=cmd_deploy)
+
+    cache = sub.add_parser("cache", help="run a pull-through cache of the model registry for other hosts")
+    cache.add_argument("--port", type=int, default=DEFAULT_PORT)
+    cache.add_argument("--bind", default="0.0.0.0", help="address to listen on")
+    cache.add_argument("--dir", default=None, help="cache directory (default: registry-cache in the config directory)")
+    cache.add_argument("--quota", type=float, default=0, help="maximum size of cached blobs in GB (0 = unlimited)")
+    cache.add_argument("--upstream", default=DEFAULT_UPSTREAM, help="registry to fetch missing content from")
+    cache.add_argument("--manifest-ttl", type=float, default=300,
+                       help="seconds before a cached tag is checked with the upstream again")
+    cache.set_defaults(func=cmd_cache)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    throttle.load_from_settings()
+    if args.limit is not None:
+        throttle.set_bandwidth_limit(args.limit)
+    if args.low_priority:
+        throttle.lower_current_thread_priority()
+    try:
+        return args.func(args)
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,38 @@
+"""OlaMoMa 的配置与数据目录
+"""
+import json
+import os
+
+
+def get_config_dir():
+    """返回OlaMoMa的配置目录，可通过 OLAMOMA_HOME 环境变量覆盖"""
+    path = os.environ.get("OLAMOMA_HOME") or os.path.join(os.path.expanduser("~"), ".olamoma")
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def get_models_dir():
+    """返回Ollama模型存储目录"""
+    return os.environ.get("OLLAMA_MODELS", os.path.expanduser("~/.ollama/models"))
+
+
+def _settings_path():
+    return os.path.join(get_config_dir(), "settings.json")
+
+
+def load_settings():
+    """读取用户设置，文件不存在或损坏时返回空字典"""
+    try:
+        with open(_settings_path(), 'r', encoding='utf-8') as f:
+            settings = json.load(f)
+        return settings if isinstance(settings, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def save_setting(key, value):
+    """修改一项用户设置并写回磁盘"""
+    settings = load_settings()
+    settings[key] = value
+    with open(_settings_path(), 'w', encoding='utf-8') as f:
+        json.dump(settings, f, indent=2)
@@ -0,0 +1,153 @@
+"""到 Ollama 服务器的连接状态：带缓存的健康检查和断路器
+
+每个服务器地址对应一个 ConnectionManager，由 get_connection 共享给所有线程。
+ensure_online 在 TTL 内直接使用上一次的结果，过期后请求 /api/version 重新检查。
+检查失败时断路器打开：在退避时间内所有操作立即失败，不再各自等待超时；连续失败时退避时间加倍。
+所有 OllamaClient 请求的结果也会更新状态，因此界面显示的状态不需要额外的请求。
+"""
+import os
+import threading
+import time
+
+from . import api
+from .api import OllamaClient, normalize_host
+
+ONLINE = "online"
+OFFLINE = "offline"
+UNKNOWN = "unknown"
+
+
+class ServiceUnavailable(Exception):
+    """服务器不可用，断路器处于打开状态"""
+
+
+class ConnectionManager:
+    """单个服务器的健康状态
+
+    ttl 秒内成功过的检查不再重复；失败后断路器打开 backoff 秒，连续失败时加倍，最多 max_backoff 秒。
+    """
+
+    def __init__(self, base_url, ttl=5.0, timeout=2.0, backoff=1.0, max_backoff=30.0, clock=time.monotonic):
+        self.base_url = normalize_host(base_url)
+        self.ttl = ttl
+        self.timeout = timeout
+        self.min_backoff = backoff
+        self.max_backoff = max_backoff
+        self.clock = clock
+        self.state = UNKNOWN
+        self.version = None
+        self.last_error = None
+        self.failures = 0
+        self.checked_at = None
+        self.retry_at = 0.0
+        self._lock = threading.RLock()
+        self._probe_lock = threading.Lock()
+
+    def describe(self):
+        """状态栏中显示的文字"""
+        if self.state == ONLINE:
+            return f"Ollama {self.version}: online" if self.version else "Ollama: online"
+        if self.state == OFFLINE:
+            return "Ollama: offline"
+        return "Ollama: unknown"
+
+    def is_open(self):
+        """断路器是否打开（退避时间尚未结束）"""
+        return self.state == OFFLINE and self.clock() < self.retry_at
+
+    def raise_if_open(self):
+        """断路器打开时立即抛出异常，不发出请求"""
+        if self.is_open():
+            raise ServiceUnavailable(
+                f"Ollama service at {self.base_url} is not reachable ({self.last_error}); "
+                f"retrying in {self.retry_at - self.clock():.0f}s")
+
+    def record_success(self, version=None):
+        with self._lock:
+            changed = self.state != ONLINE or (version and version != self.version)
+            self.state = ONLINE
+            self.version = version or self.version
+            self.failures = 0
+            self.last_error = None
+            self.checked_at = self.clock()
+            self.retry_at = 0.0
+        if changed:
+            _notify(self)
+
+    def record_failure(self, error):
+        with self._lock:
+            self.failures += 1
+            self.state = OFFLINE
+            self.last_error = str(error)
+            self.checked_at = self.clock()
+            self.retry_at = self.checked_at + min(self.max_backoff, self.min_backoff * 2 ** (self.failures - 1))
+        _notify(self)
+
+    def check(self, force=False):
+        """返回服务器是否在线；TTL 内成功过或断路器打开时不发出请求"""
+        if not force:
+            with self._lock:
+                if self.state == ONLINE and self.clock() - self.checked_at < self.ttl:
+                    return True
+                if self.is_open():
+                    return False
+        # 同一时间只有一个线程检查，其他线程等待并使用它的结果
+        started = self.clock()
+        with self._probe_lock:
+            with self._lock:
+                if not force and self.checked_at is not None and self.checked_at >= started:
+                    return self.state == ONLINE
+            try:
+                version = OllamaClient(self.base_url, timeout=self.timeout, observe=False).version()
+            except Exception as e:
+                self.record_failure(e)
+                return False
+            self.record_success(version)
+            return True
+
+    def ensure_online(self):
+        """服务器不在线时抛出 ServiceUnavailable"""
+        if not self.check():
+            self.raise_if_open()
+            raise ServiceUnavailable(f"Ollama service at {self.base_url} is not reachable ({self.last_error})")
+
+
+_connections = {}
+_connections_lock = threading.Lock()
+_listeners = []
+
+
+def get_connection(base_url=None):
+    """返回服务器地址（默认 OLLAMA_HOST）对应的共享 ConnectionManager"""
+    key = normalize_host(base_url or os.environ.get("OLLAMA_HOST"))
+    with _connections_lock:
+        if key not in _connections:
+            _connections[key] = ConnectionManager(key)
+        return _connections[key]
+
+
+def add_listener(callback):
+    """注册状态变化的回调 callback(connection)，可能在任意线程中调用"""
+    _listeners.append(callback)
+
+
+def remove_listener(callback):
+    if callback in _listeners:
+        _listeners.remove(callback)
+
+
+def _notify(connection):
+    for callback in list(_listeners):
+        callback(connection)
+
+
+def _observe(base_url, error):
+    """OllamaClient 每次请求后的回调：连接错误记为失败，收到任何HTTP响应记为在线"""
+    connection = get_connection(base_url)
+    if error is None:
+        connection.record_success()
+    else:
+        connection.record_failure(error)
+
+
+api.add_request_observer(_observe)
@@ -0,0 +1,201 @@
+"""把本机的模型部署到多个 Ollama 主机
+
+先用 HEAD /api/blobs 并发检查每个目标主机已有哪些层，已有的层不再上传。缺少的blob逐个上传：
+源文件只读取一次，每个块同时写入所有缺少该blob的主机的连接，最慢的主机决定整体速度，单个主机
+出错时断开它的连接，其他主机继续。所有blob都到位后才在各主机上用 /api/create 创建模型（写入manifest），
+上传失败的主机不会留下不完整的模型。
+"""
+import asyncio
+import json
+import os
+
+from . import asynchttp, asyncops
+from .api import UPLOAD_CHUNK_SIZE, format_size
+from .manifests import MODEL_MEDIA_TYPE, model_blobs
+from .throttle import bandwidth
+
+PROJECTOR_MEDIA_TYPE = "application/vnd.ollama.image.projector"
+ADAPTER_MEDIA_TYPE = "application/vnd.ollama.image.adapter"
+# 这些层很小，作为 /api/create 的字段发送，由目标服务器重新生成
+TEXT_LAYERS = {
+    "application/vnd.ollama.image.template": 'template',
+    "application/vnd.ollama.image.system": 'system',
+    "application/vnd.ollama.image.license": 'license',
+}
+JSON_LAYERS = {
+    "application/vnd.ollama.image.params": 'parameters',
+    "application/vnd.ollama.image.messages": 'messages',
+}
+CHECK_TIMEOUT = 30
+# 上传时单个块写入一个主机的最长等待时间，以及创建模型的超时
+TIMEOUT = 600
+
+
+def plan_deploy(models_dir, model, target_name=None):
+    """读取模型的manifest，返回 (需要上传的blob列表, /api/create 请求体)"""
+    request = {'model': target_name or model}
+    files, adapters, uploads = {}, {}, []
+    for blob in model_blobs(models_dir, model):
+        media_type = blob['media_type']
+        if media_type in (MODEL_MEDIA_TYPE, PROJECTOR_MEDIA_TYPE, ADAPTER_MEDIA_TYPE):
+            uploads.append(blob)
+            filename = blob['digest'].split(':', 1)[-1][:12] + ".gguf"
+            (adapters if media_type == ADAPTER_MEDIA_TYPE else files)[filename] = blob['digest']
+        elif media_type in TEXT_LAYERS:
+            with open(blob['path'], 'r', encoding='utf-8') as f:
+                request[TEXT_LAYERS[media_type]] = f.read()
+        elif media_type in JSON_LAYERS:
+            with open(blob['path'], 'rb') as f:
+                request[JSON_LAYERS[media_type]] = json.load(f)
+    if not files:
+        raise Exception(f"Model {model} has no model layer")
+    # model_blobs 把模型权重层排在最前面，服务器把第一个文件当作模型
+    request['files'] = files
+    if adapters:
+        request['adapters'] = adapters
+    return uploads, request
+
+
+def _describe(error):
+    return "timed out" if isinstance(error, asyncio.TimeoutError) else str(error) or type(error).__name__
+
+
+async def has_blob(base_url, digest, timeout=CHECK_TIMEOUT):
+    """服务器上是否已有该摘要的blob"""
+    try:
+        await asynchttp.request(base_url, "HEAD", f"/api/blobs/{digest}", timeout=timeout)
+        return True
+    except asynchttp.HTTPError as e:
+        if e.status == 404:
+            return False
+        raise
+
+
+def _read_chunk(f):
+    # 在线程池中读取并按总带宽限速，不阻塞事件循环
+    chunk = f.read(UPLOAD_CHUNK_SIZE)
+    bandwidth.consume(len(chunk))
+    return chunk
+
+
+async def fan_out_blob(blob, targets, progress=None, cancelled=None, timeout=TIMEOUT):
+    """把一个blob同时上传到 targets（{主机名: 地址}），文件只读取一次；返回 {主机名: 错误信息}
+
+    progress(已上传字节, 总字节) 在每个块之后调用，cancelled() 返回 True 时中止。
+    """
+    digest, path = blob['digest'], blob['path']
+    size = os.path.getsize(path)
+    api_path = f"/api/blobs/{digest}"
+    errors = {}
+    connections = {}
+    opened = await asyncio.gather(*(asyncio.wait_for(asynchttp.open_request(
+        url, "POST", api_path, size, "application/octet-stream"), CHECK_TIMEOUT) for url in targets.values()),
+        return_exceptions=True)
+    for name, outcome in zip(targets, opened):
+        if isinstance(outcome, Exception):
+            errors[name] = f"Cannot connect to {targets[name]}: {_describe(outcome)}"
+        else:
+            connections[name] = outcome
+
+    async def drop(name, error):
+        errors[name] = error
+        await asynchttp.close(connections.pop(name)[1])
+
+    try:
+        with open(path, 'rb') as f:
+            sent = 0
+            while connections and sent < size:
+                if cancelled and cancelled():
+                    raise Exception("Upload cancelled")
+                chunk = await asyncio.to_thread(_read_chunk, f)
+                if not chunk:
+                    raise Exception(f"{path} is shorter than expected")
+                names = list(connections)
+                for name in names:
+                    connections[name][1].write(chunk)
+                drained = await asyncio.gather(*(asyncio.wait_for(connections[name][1].drain(), timeout)
+                                                 for name in names), return_exceptions=True)
+                for name, outcome in zip(names, drained):
+                    if isinstance(outcome, Exception):
+                        await drop(name, f"Upload to {targets[name]} failed: {_describe(outcome)}")
+                sent += len(chunk)
+                if progress:
+                    progress(sent, size)
+
+        names = list(connections)
+        responses = await asyncio.gather(*(asyncio.wait_for(asynchttp.read_response(connections[name][0], "POST"),
+                                                            timeout) for name in names), return_exceptions=True)
+        for name, outcome in zip(names, responses):
+            try:
+                if isinstance(outcome, Exception):
+                    raise outcome
+                asynchttp.raise_for_status("POST", api_path, *outcome)
+            except Exception as e:
+                errors[name] = f"Upload to {targets[name]} failed: {_describe(e)}"
+    finally:
+        for _, writer in connections.values():
+            await asynchttp.close(writer)
+    return errors
+
+
+async def deploy(models_dir, model, hosts, target_name=None, progress=None, cancelled=None):
+    """把本机的模型部署到 hosts（{主机名: 地址}）
+
+    返回 {主机名: {'uploaded': 上传的层数, 'existing': 已有的层数, 'bytes': 上传的字节数, 'error': 错误信息}}。
+    progress(阶段, 已完成, 总数) 报告 "check"、"upload"（字节）和 "create" 三个阶段的进度。
+    """
+    uploads, request = plan_deploy(models_dir, model, target_name)
+    results = {name: {'uploaded': 0, 'existing': 0, 'bytes': 0, 'error': None} for name in hosts}
+
+    # 1. 并发检查每个主机已有哪些层
+    checks = await asyncops.gather({(name, blob['digest']): has_blob(url, blob['digest'])
+                                    for name, url in hosts.items() for blob in uploads}, timeout=CHECK_TIMEOUT)
+    for (name, _), (present, error) in checks.items():
+        if error is not None:
+            results[name]['error'] = results[name]['error'] or error
+        elif present:
+            results[name]['existing'] += 1
+    if progress:
+        progress("check", len(checks), len(checks))
+
+    # 2. 逐个上传缺少的blob，每个blob只读取一次，同时发送给所有缺少它的主机
+    missing = {blob['digest']: [name for name in hosts if checks[(name, blob['digest'])][0] is False]
+               for blob in uploads}
+    total = sum(blob['size'] for blob in uploads if missing[blob['digest']])
+    done = 0
+    for blob in uploads:
+        targets = {name: hosts[name] for name in missing[blob['digest']] if not results[name]['error']}
+        if not targets:
+            continue
+        errors = await fan_out_blob(blob, targets, progress=progress and (
+            lambda sent, size, done=done: progress("upload", done + sent, total)), cancelled=cancelled)
+        for name in targets:
+            if errors.get(name):
+                results[name]['error'] = errors[name]
+            else:
+                results[name]['uploaded'] += 1
+                results[name]['bytes'] += blob['size']
+        done += blob['size']
+
+    # 3. 所有层都到位后最后创建模型
+    ready = [name for name in hosts if not results[name]['error']]
+    created = await asyncops.gather({name: asynchttp.request_json(hosts[name], "POST", "/api/create",
+                                                                  dict(request, stream=False))
+                                     for name in ready}, timeout=TIMEOUT)
+    for name, (_, error) in created.items():
+        results[name]['error'] = error
+    if progress:
+        progress("create", len(ready), len(ready))
+    return results
+
+
+def format_deploy_report(results):
+    """把 deploy 的结果格式化为每个主机一行的文本"""
+    lines = []
+    for name, result in results.items():
+        if result['error']:
+            lines.append(f"{name}: failed: {result['error']}")
+        else:
+            lines.append(f"{name}: uploaded {result['uploaded']} layer(s) ({format_size(result['bytes'])}), "
+                         f"{result['existing']} already present")
+    return "\n".join(lines)
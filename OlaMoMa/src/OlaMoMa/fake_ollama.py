@@ -0,0 +1,661 @@
+"""用于测试的模拟Ollama服务器和命令行工具
+
+FakeOllama 保存模型状态并把 blobs 和 manifests 按真实的目录结构写入 models_dir，
+FakeOllamaServer 提供与Ollama相同的REST接口（包括流式的拉取进度），
+write_cli_shim 生成一个假的 ollama 可执行文件，它像真实的CLI一样通过 OLLAMA_HOST 访问服务器。
+
+可以注入延迟、失败以及大量模型，用于离线、可重复的集成测试和性能测试::
+
+    with FakeOllamaServer(FakeOllama(models_dir)) as server:
+        server.state.add_model("llama3.2:3b")
+        server.state.fail("/api/tags", status=500)
+        ...
+
+也可以单独运行::
+
+    python -m OlaMoMa.fake_ollama serve --models-dir /tmp/models --count 1000
+    OLLAMA_HOST=127.0.0.1:11434 python -m OlaMoMa.fake_ollama cli list
+"""
+import argparse
+import hashlib
+import json
+import os
+import random
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from .api import OllamaClient, format_size
+from .manifests import MODEL_MEDIA_TYPE, blob_path, full_model_name, manifest_path
+from .monitor import duration_seconds
+from .modelfile import parse_modelfile
+
+FAKE_VERSION = "0.6.8"
+CONFIG_MEDIA_TYPE = "application/vnd.docker.container.image.v1+json"
+
+
+def now_iso():
+    return datetime.now(timezone.utc).isoformat()
+
+
+class FakeOllama:
+    """模拟服务器的状态：模型、blobs、已加载的模型以及注入的延迟和失败"""
+
+    def __init__(self, models_dir, version=FAKE_VERSION):
+        self.models_dir = models_dir
+        self.version = version
+        self.models = {}  # 完整模型名 -> 模型信息
+        self.loaded = {}  # 完整模型名 -> 过期时间戳
+        self.latency = {}  # 路径 -> 秒，键 None 表示所有请求
+        self.failures = {}  # 路径 -> [状态码, 剩余次数, 错误信息]
+        self.pull_chunks = 5
+        self.requests = []  # 收到的请求 (方法, 路径)
+        self.lock = threading.RLock()
+        os.makedirs(os.path.join(models_dir, "blobs"), exist_ok=True)
+
+    # ---- 测试注入 ----
+
+    def set_latency(self, seconds, path=None):
+        """为某个路径（或所有请求）注入延迟"""
+        self.latency[path] = seconds
+
+    def fail(self, path, status=500, times=1, message="injected failure"):
+        """让某个路径的后续 times 次请求失败，times 为 None 表示一直失败"""
+        self.failures[path] = [status, times, message]
+
+    def take_failure(self, path):
+        """如果该路径需要失败，返回 (状态码, 信息)"""
+        with self.lock:
+            failure = self.failures.get(path)
+            if not failure:
+                return None
+            status, times, message = failure
+            if times is not None:
+                if times <= 1:
+                    del self.failures[path]
+                else:
+                    failure[1] -= 1
+            return status, message
+
+    def delay(self, path):
+        seconds = self.latency.get(path, self.latency.get(None, 0))
+        if seconds:
+            time.sleep(seconds)
+
+    # ---- 模型与blobs ----
+
+    def has_blob(self, digest):
+        return os.path.exists(blob_path(self.models_dir, digest))
+
+    def write_blob(self, data):
+        """写入blob并返回其摘要"""
+        digest = "sha256:" + hashlib.sha256(data).hexdigest()
+        path = blob_path(self.models_dir, digest)
+        if not os.path.exists(path):
+            with open(path, 'wb') as f:
+                f.write(data)
+        return digest
+
+    def add_model(self, name, size=1024 * 1024, digest=None, template="{{ .Prompt }}", system="",
+                  parameters=None, family="llama", materialize=True):
+        """添加模型；materialize 为 False 时不写入blob和manifest，用于模拟海量模型"""
+        name = full_model_name(name)
+        if materialize and digest is None:
+            # 用模型名生成可重复的内容，保证摘要真实有效
+            seed = hashlib.sha256(name.encode('utf-8')).digest()
+            data = b"GGUF" + (seed * (size // len(seed) + 1))[:max(size - 4, 0)]
+            digest = self.write_blob(data)
+        elif digest is None:
+            digest = "sha256:" + hashlib.sha256(name.encode('utf-8')).hexdigest()
+        layers = [{'mediaType': MODEL_MEDIA_TYPE, 'digest': digest, 'size': size}]
+        if materialize and template:
+            template_digest = self.write_blob(template.encode('utf-8'))
+            layers.append({'mediaType': "application/vnd.ollama.image.template",
+                           'digest': template_digest, 'size': len(template.encode('utf-8'))})
+        model = {
+            'name': name,
+            'size': size,
+            'modified_at': now_iso(),
+            'layers': layers,
+            'template': template,
+            'system': system,
+            'parameters': parameters or {},
+            'details': {'format': "gguf", 'family': family, 'parameter_size': "1B",
+                        'quantization_level': "Q4_K_M"},
+        }
+        config = json.dumps({'model_format': "gguf", 'model_family': family}).encode('utf-8')
+        manifest = {
+            'schemaVersion': 2,
+            'mediaType': "application/vnd.docker.distribution.manifest.v2+json",
+            'config': {'mediaType': CONFIG_MEDIA_TYPE,
+                       'digest': "sha256:" + hashlib.sha256(config).hexdigest(), 'size': len(config)},
+            'layers': layers,
+        }
+        manifest_bytes = json.dumps(manifest).encode('utf-8')
+        model['digest'] = hashlib.sha256(manifest_bytes).hexdigest()
+        if materialize:
+            self.write_blob(config)
+            path = manifest_path(self.models_dir, name)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'wb') as f:
+                f.write(manifest_bytes)
+        with self.lock:
+            self.models[name] = model
+        return model
+
+    def populate(self, count, materialize=False, seed=0):
+        """批量添加模型，默认不落盘，便于模拟成千上万的模型"""
+        rng = random.Random(seed)
+        for i in range(count):
+            self.add_model(f"model-{i}:q{rng.randint(2, 8)}", size=rng.randint(10 ** 8, 5 * 10 ** 10),
+                           materialize=materialize)
+
+    def remove_model(self, name):
+        name = full_model_name(name)
+        with self.lock:
+            if name not in self.models:
+                raise KeyError(name)
+            del self.models[name]
+            self.loaded.pop(name, None)
+        path = manifest_path(self.models_dir, name)
+        if os.path.exists(path):
+            os.remove(path)
+
+    def get_model(self, name):
+        with self.lock:
+            return self.models.get(full_model_name(name))
+
+    def modelfile(self, model):
+        """生成与 ollama show --modelfile 相同格式的Modelfile"""
+        lines = [
+            '# Modelfile generated by "ollama show"',
+            '# To build a new Modelfile based on this, replace FROM with:',
+            f"# FROM {model['name']}",
+            "",
+            f"FROM {blob_path(self.models_dir, model['layers'][0]['digest'])}",
+        ]
+        if model['template']:
+            lines.append(f'TEMPLATE """{model["template"]}"""')
+        if model['system']:
+            lines.append(f'SYSTEM """{model["system"]}"""')
+        for key, value in model['parameters'].items():
+            for item in (value if isinstance(value, list) else [value]):
+                lines.append(f"PARAMETER {key} {item}")
+        return '\n'.join(lines) + '\n'
+
+
+class FakeOllamaHandler(BaseHTTPRequestHandler):
+    """把HTTP请求分发给 FakeOllama"""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    @property
+    def state(self):
+        return self.server.state
+
+    # ---- 辅助方法 ----
+
+    def read_json(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else b""
+        return json.loads(body) if body else {}
+
+    def send_json(self, status, payload):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(body)
+
+    def send_error_json(self, status, message):
+        self.send_json(status, {'error': message})
+
+    def start_stream(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/x-ndjson')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+
+    def stream(self, payload):
+        data = json.dumps(payload).encode('utf-8') + b"\n"
+        self.wfile.write(f"{len(data):x}\r\n".encode('ascii') + data + b"\r\n")
+        self.wfile.flush()
+
+    def end_stream(self):
+        self.wfile.write(b"0\r\n\r\n")
+        self.wfile.flush()
+
+    def respond(self, status, payload, stream):
+        """根据请求的 stream 参数返回单个对象或流式的最后一条消息"""
+        if stream:
+            self.start_stream()
+            self.stream(payload)
+            self.end_stream()
+        else:
+            self.send_json(status, payload)
+
+    def dispatch(self):
+        path = self.path.split('?', 1)[0]
+        self.state.requests.append((self.command, path))
+        self.state.delay(path)
+        route = path
+        if path.startswith("/api/blobs/"):
+            route = "/api/blobs"
+        failure = self.state.take_failure(path) or self.state.take_failure(route)
+        if failure:
+            # 丢弃请求体，保持连接可用
+            length = int(self.headers.get('Content-Length') or 0)
+            if length:
+                self.rfile.read(length)
+            self.send_error_json(*failure)
+            return
+        handler = getattr(self, f"handle_{self.command}_{route.strip('/').replace('/', '_')}", None)
+        if handler is None:
+            self.send_error_json(404, f"{self.command} {path} not found")
+            return
+        try:
+            handler()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    do_GET = do_POST = do_DELETE = do_HEAD = dispatch
+
+    # ---- API ----
+
+    def handle_GET_api_version(self):
+        self.send_json(200, {'version': self.state.version})
+
+    def handle_GET_api_tags(self):
+        with self.state.lock:
+            models = [{
+                'name': m['name'], 'model': m['name'], 'modified_at': m['modified_at'],
+                'size': m['size'], 'digest': m['digest'], 'details': m['details'],
+            } for m in self.state.models.values()]
+        self.send_json(200, {'models': models})
+
+    def handle_GET_api_ps(self):
+        now = time.time()
+        models = []
+        with self.state.lock:
+            for name, expires in list(self.state.loaded.items()):
+                if expires is not None and expires <= now:
+                    del self.state.loaded[name]
+                    continue
+                m = self.state.models[name]
+                models.append({
+                    'name': name, 'model': name, 'size': m['size'], 'size_vram': m['size'],
+                    'digest': m['digest'], 'details': m['details'],
+                    # keep_alive 为负数时与Ollama一样返回遥远的到期时间
+                    'expires_at': (datetime.fromtimestamp(expires, timezone.utc) if expires is not None
+                                   else datetime(2318, 1, 1, tzinfo=timezone.utc)).isoformat(),
+                })
+        self.send_json(200, {'models': models})
+
+    def handle_POST_api_show(self):
+        request = self.read_json()
+        model = self.state.get_model(request.get('model') or request.get('name', ''))
+        if not model:
+            self.send_error_json(404, f"model '{request.get('model')}' not found")
+            return
+        parameters = '\n'.join(f"{k} {v}" for k, values in model['parameters'].items()
+                               for v in (values if isinstance(values, list) else [values]))
+        self.send_json(200, {
+            'modelfile': self.state.modelfile(model),
+            'parameters': parameters,
+            'template': model['template'],
+            'system': model['system'],
+            'details': model['details'],
+            'model_info': {'general.architecture': model['details']['family']},
+            'modified_at': model['modified_at'],
+        })
+
+    def handle_DELETE_api_delete(self):
+        request = self.read_json()
+        try:
+            self.state.remove_model(request.get('model') or request.get('name', ''))
+        except KeyError:
+            self.send_error_json(404, f"model '{request.get('model')}' not found")
+            return
+        self.send_response(200)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def handle_HEAD_api_blobs(self):
+        digest = self.path.rsplit('/', 1)[-1]
+        self.send_response(200 if self.state.has_blob(digest) else 404)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def handle_POST_api_blobs(self):
+        digest = self.path.rsplit('/', 1)[-1]
+        length = int(self.headers.get('Content-Length') or 0)
+        hasher = hashlib.sha256()
+        temp_path = blob_path(self.state.models_dir, digest) + f"-partial-{threading.get_ident()}"
+        with open(temp_path, 'wb') as f:
+            if self.headers.get('Transfer-Encoding', '').lower() == 'chunked':
+                while True:
+                    size = int(self.rfile.readline().split(b';')[0].strip(), 16)
+                    if size == 0:
+                        self.rfile.readline()
+                        break
+                    chunk = self.rfile.read(size)
+                    self.rfile.readline()
+                    hasher.update(chunk)
+                    f.write(chunk)
+            else:
+                remaining = length
+                while remaining > 0:
+                    chunk = self.rfile.read(min(remaining, 1 << 20))
+                    if not chunk:
+                        break
+                    hasher.update(chunk)
+                    f.write(chunk)
+                    remaining -= len(chunk)
+        if "sha256:" + hasher.hexdigest() != digest:
+            os.remove(temp_path)
+            self.send_error_json(400, "digest mismatch")
+            return
+        os.replace(temp_path, blob_path(self.state.models_dir, digest))
+        self.send_response(201)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def handle_POST_api_create(self):
+        request = self.read_json()
+        name = request.get('model') or request.get('name')
+        stream = request.get('stream', True)
+        parsed = parse_modelfile(request['modelfile']) if request.get('modelfile') else {}
+        digest = None
+        if request.get('files'):
+            digest = next(iter(request['files'].values()))
+        elif request.get('from') or parsed.get('from'):
+            source = request.get('from') or parsed['from']
+            base = self.state.get_model(source)
+            if base:
+                digest = base['layers'][0]['digest']
+            elif source.startswith('@sha256:'):
+                digest = source[1:]
+            elif os.path.isfile(source):
+                with open(source, 'rb') as f:
+                    digest = self.state.write_blob(f.read())
+        if not digest or not self.state.has_blob(digest):
+            self.respond(400, {'error': f"invalid model reference for '{name}'"}, False)
+            return
+        size = os.path.getsize(blob_path(self.state.models_dir, digest))
+        parameters = dict(request.get('parameters') or parsed.get('parameters') or {})
+        self.state.add_model(name, size=size, digest=digest,
+                             template=request.get('template') or parsed.get('template') or "",
+                             system=request.get('system') or parsed.get('system') or "",
+                             parameters=parameters)
+        if stream:
+            self.start_stream()
+            for status in ("parsing modelfile", "using existing layer " + digest, "writing manifest"):
+                self.stream({'status': status})
+            self.stream({'status': "success"})
+            self.end_stream()
+        else:
+            self.send_json(200, {'status': "success"})
+
+    def handle_POST_api_pull(self):
+        request = self.read_json()
+        name = full_model_name(request.get('model') or request.get('name', ''))
+        stream = request.get('stream', True)
+        existing = self.state.get_model(name)
+        size = existing['size'] if existing else 4 * 1024 * 1024
+        digest = existing['layers'][0]['digest'] if existing else "sha256:" + hashlib.sha256(
+            name.encode('utf-8')).hexdigest()
+        if not stream:
+            if not existing:
+                self.state.add_model(name, size=size)
+            self.send_json(200, {'status': "success"})
+            return
+        self.start_stream()
+        self.stream({'status': "pulling manifest"})
+        chunks = max(self.state.pull_chunks, 1)
+        for i in range(chunks + 1):
+            self.stream({'status': f"pulling {digest[7:19]}", 'digest': digest,
+                         'total': size, 'completed': size * i // chunks})
+            self.state.delay("/api/pull#chunk")
+        if not existing:
+            self.state.add_model(name, size=size)
+        for status in ("verifying sha256 digest", "writing manifest", "success"):
+            self.stream({'status': status})
+        self.end_stream()
+
+    def handle_POST_api_generate(self):
+        request = self.read_json()
+        name = full_model_name(request.get('model', ''))
+        model = self.state.get_model(name)
+        if not model:
+            self.send_error_json(404, f"model '{request.get('model')}' not found")
+            return
+        keep_alive = request.get('keep_alive', 300)
+        try:
+            keep_alive = duration_seconds(keep_alive)
+        except Exception as e:
+            self.send_error_json(400, str(e))
+            return
+        load_duration = 0 if name in self.state.loaded else 50_000_000
+        with self.state.lock:
+            if keep_alive == 0:
+                self.state.loaded.pop(name, None)
+            else:
+                self.state.loaded[name] = None if keep_alive < 0 else time.time() + keep_alive
+        prompt = request.get('prompt', '')
+        if not prompt:
+            done_reason = "unload" if keep_alive == 0 else "load"
+            self.respond(200, {'model': name, 'created_at': now_iso(), 'response': "", 'done': True,
+                               'done_reason': done_reason}, request.get('stream', True))
+            return
+        words = ["token"] * max(1, min(int(request.get('options', {}).get('num_predict', 16)), 512))
+        prompt_count = len(prompt.split())
+        final = {
+            'model': name, 'created_at': now_iso(), 'response': "", 'done': True, 'done_reason': "stop",
+            'total_duration': load_duration + 30_000_000 + len(words) * 10_000_000,
+            'load_duration': load_duration,
+            'prompt_eval_count': prompt_count, 'prompt_eval_duration': 30_000_000,
+            'eval_count': len(words), 'eval_duration': len(words) * 10_000_000,
+        }
+        if request.get('stream', True):
+            self.start_stream()
+            for word in words:
+                self.stream({'model': name, 'created_at': now_iso(), 'response': word + " ", 'done': False})
+            self.stream(final)
+            self.end_stream()
+        else:
+            final['response'] = " ".join(words)
+            self.send_json(200, final)
+
+
+class FakeOllamaServer(ThreadingHTTPServer):
+    """在后台线程中运行的模拟Ollama服务器"""
+
+    daemon_threads = True
+    # 异步客户端会同时发起几十个连接，默认的监听队列（5）会让多余的连接等待重传
+    request_queue_size = 128
+
+    def __init__(self, state, host="127.0.0.1", port=0):
+        super().__init__((host, port), FakeOllamaHandler)
+        self.state = state
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def write_cli_shim(bin_dir, server_url=None):
+    """在 bin_dir 中生成假的 ollama 可执行文件，返回其路径
+
+    如果给出 server_url，会把它写入 OLLAMA_HOST，否则使用调用时的环境变量。
+    """
+    os.makedirs(bin_dir, exist_ok=True)
+    src_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if os.name == 'nt':
+        path = os.path.join(bin_dir, "ollama.bat")
+        lines = ["@echo off", f'set "PYTHONPATH={src_dir};%PYTHONPATH%"']
+        if server_url:
+            lines.append(f'set "OLLAMA_HOST={server_url}"')
+        lines.append(f'"{sys.executable}" -m OlaMoMa.fake_ollama cli %*')
+    else:
+        path = os.path.join(bin_dir, "ollama")
+        lines = ["#!/bin/sh", f'PYTHONPATH="{src_dir}${{PYTHONPATH:+:$PYTHONPATH}}"', "export PYTHONPATH"]
+        if server_url:
+            lines.append(f'OLLAMA_HOST="{server_url}"; export OLLAMA_HOST')
+        lines.append(f'exec "{sys.executable}" -m OlaMoMa.fake_ollama cli "$@"')
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(lines) + '\n')
+    os.chmod(path, 0o755)
+    return path
+
+
+def human_time(timestamp):
+    """与 ollama list 一致的相对时间"""
+    try:
+        seconds = time.time() - datetime.fromisoformat(timestamp).timestamp()
+    except ValueError:
+        return timestamp
+    for unit, length in (("day", 86400), ("hour", 3600), ("minute", 60)):
+        if seconds >= length:
+            count = int(seconds // length)
+            return f"{count} {unit}{'s' if count > 1 else ''} ago"
+    return "Less than a second ago" if seconds < 1 else f"{int(seconds)} seconds ago"
+
+
+def run_cli(argv):
+    """模拟 ollama 命令行：list/show/create/rm/pull/ps/--version"""
+    client = OllamaClient(timeout=600)
+    if not argv:
+        print("Usage: ollama [command]", file=sys.stderr)
+        return 1
+    command, args = argv[0], argv[1:]
+    try:
+        if command in ("-v", "--version"):
+            print(f"ollama version is {client.version()}")
+        elif command in ("list", "ls"):
+            models = client.request("GET", "/api/tags").get('models', [])
+            print(f"{'NAME':<40}{'ID':<16}{'SIZE':<10}MODIFIED")
+            for m in models:
+                print(f"{m['name']:<40}{m['digest'][:12]:<16}{format_size(m['size']):<10}"
+                      f"{human_time(m['modified_at'])}")
+        elif command == "show":
+            name = args[-1]
+            info = client.request("POST", "/api/show", {'model': name})
+            if "--modelfile" in args:
+                print(info['modelfile'], end="")
+            elif "--template" in args:
+                print(info['template'])
+            elif "--parameters" in args:
+                print(info['parameters'])
+            else:
+                print(json.dumps(info['details'], indent=2))
+        elif command == "create":
+            name = args[0]
+            path = args[args.index("-f") + 1] if "-f" in args else "Modelfile"
+            with open(path, 'r', encoding='utf-8') as f:
+                content = f.read()
+            parsed = parse_modelfile(content)
+            request = {'model': name, 'stream': False, 'template': parsed['template'],
+                       'system': parsed['system'], 'parameters': parsed['parameters']}
+            source = parsed['from'] or ""
+            if os.path.isfile(source):
+                # 与真实CLI一样：先计算摘要，服务器缺少该blob时才上传
+                hasher = hashlib.sha256()
+                with open(source, 'rb') as f:
+                    for chunk in iter(lambda: f.read(1 << 20), b""):
+                        hasher.update(chunk)
+                digest = "sha256:" + hasher.hexdigest()
+                try:
+                    client.request("HEAD", f"/api/blobs/{digest}")
+                except Exception:
+                    with open(source, 'rb') as f:
+                        client.request("POST", f"/api/blobs/{digest}", data=f,
+                                       headers={'Content-Length': str(os.path.getsize(source))})
+                request['files'] = {os.path.basename(source): digest}
+            else:
+                request['from'] = source
+            client.request("POST", "/api/create", request)
+            print("success")
+        elif command in ("rm", "delete"):
+            for name in args:
+                client.request("DELETE", "/api/delete", {'model': name})
+                print(f"deleted '{name}'")
+        elif command == "pull":
+            for line in client.stream("POST", "/api/pull", {'model': args[0]}):
+                if 'error' in line:
+                    raise Exception(line['error'])
+                status = line.get('status', '')
+                if line.get('total'):
+                    status += f" {line.get('completed', 0) * 100 // line['total']}%"
+                print(status, file=sys.stderr)
+            print("success")
+        elif command == "ps":
+            models = client.request("GET", "/api/ps").get('models', [])
+            print(f"{'NAME':<40}{'ID':<16}{'SIZE':<10}UNTIL")
+            for m in models:
+                print(f"{m['name']:<40}{m['digest'][:12]:<16}{format_size(m['size']):<10}{m['expires_at']}")
+        else:
+            print(f"Error: unknown command \"{command}\" for \"ollama\"", file=sys.stderr)
+            return 1
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] == "cli":
+        return run_cli(argv[1:])
+
+    parser = argparse.ArgumentParser(description="Fake Ollama server for tests")
+    sub = parser.add_subparsers(dest="command", required=True)
+    serve = sub.add_parser("serve")
+    serve.add_argument("--models-dir", required=True)
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=11434)
+    serve.add_argument("--count", type=int, default=0, help="number of synthetic models")
+    serve.add_argument("--latency", type=float, default=0.0, help="seconds added to every request")
+    args = parser.parse_args(argv)
+
+    state = FakeOllama(args.models_dir)
+    state.populate(args.count)
+    state.set_latency(args.latency)
+    server = FakeOllamaServer(state, args.host, args.port)
+    print(f"Fake Ollama listening on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,237 @@
+"""模型文件的复制：分块复制，并在复制窗口之后丢弃页缓存
+
+导出或导入几十GB的模型时，如果像 shutil.copy2 一样经过页缓存，会把Ollama正在使用的模型挤出内存。
+copy_file 每复制完一个窗口，就用 posix_fadvise(DONTNEED) 丢弃该窗口中源文件和目标文件的页：
+源文件只丢弃复制前不在缓存中的部分，正在被使用的模型不受影响；目标文件先 fdatasync 再丢弃，
+因为脏页无法被丢弃。不支持 posix_fadvise 的平台（Windows、macOS）退化为普通的分块复制。
+
+导入时源文件要被读取两遍（计算摘要、上传），DropBehind 在这两个读取循环中按同样的窗口丢弃页；
+如果源文件与模型目录在同一文件系统，link_file 用 reflink 或硬链接代替复制。
+"""
+import contextlib
+import errno
+import os
+import shutil
+import sys
+
+from .api import format_size
+from .pagecache import resident_bytes
+from .throttle import bandwidth
+
+CHUNK_SIZE = 8 * 1024 * 1024
+WINDOW_SIZE = 64 * 1024 * 1024
+# Linux 的 FICLONE ioctl：在 Btrfs、XFS 等文件系统上创建共享数据块的写时复制副本
+FICLONE = 0x40049409
+
+
+def _fadvise(fd, offset, length, advice):
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(fd, offset, length, advice)
+        except OSError:
+            pass
+
+
+def drop_cache(path, offset=0, length=0):
+    """丢弃文件在页缓存中的干净页，length 为0表示到文件末尾"""
+    if not hasattr(os, "posix_fadvise"):
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.posix_fadvise(fd, offset, length, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
+
+
+def mostly_resident(path, offset=0, length=None):
+    """文件（或其中一段）是否大部分已在页缓存中；无法判断时返回 False"""
+    size = os.path.getsize(path)
+    length = size - offset if length is None else min(length, size - offset)
+    if length <= 0:
+        return False
+    resident = resident_bytes(path, offset, length)
+    # 顺序读取会触发内核预读，少量驻留的页不代表文件正在被使用
+    return resident is not None and resident * 2 > length
+
+
+class DropBehind:
+    """顺序读取大文件时，按窗口丢弃已经读过的页
+
+    创建时（读取之前）记录每个窗口是否已在页缓存中，已缓存的窗口（例如正在被使用的模型）不丢弃。
+    读取循环每读一块调用 advance(已读取字节)，丢弃已读完的窗口；再次从头读取时 advance 自动从头开始。
+    finish() 丢弃其余读过的部分，作为上下文管理器使用时在失败和取消时也会调用。
+    不支持 posix_fadvise 的平台上什么也不做。
+    """
+
+    def __init__(self, path):
+        self.enabled = hasattr(os, "posix_fadvise")
+        self.keep = []
+        self.position = 0
+        self._fd = None
+        if self.enabled:
+            size = os.path.getsize(path)
+            self.keep = [mostly_resident(path, offset, WINDOW_SIZE) for offset in range(0, size, WINDOW_SIZE)]
+            self._fd = os.open(path, os.O_RDONLY)
+
+    def _drop(self, index):
+        if index < len(self.keep) and not self.keep[index]:
+            _fadvise(self._fd, index * WINDOW_SIZE, WINDOW_SIZE, os.POSIX_FADV_DONTNEED)
+
+    def advance(self, position):
+        """已顺序读取到 position，丢弃其中已读完的窗口"""
+        if self._fd is None:
+            return
+        if position < self.position:
+            self.position = 0
+        for index in range(self.position // WINDOW_SIZE, position // WINDOW_SIZE):
+            self._drop(index)
+        self.position = position
+
+    def finish(self):
+        """丢弃所有读取前不在缓存中的窗口并关闭文件"""
+        if self._fd is None:
+            return
+        for index in range(len(self.keep)):
+            self._drop(index)
+        os.close(self._fd)
+        self._fd = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.finish()
+
+
+def existing_parent(path):
+    """返回 path 本身或最近的已存在的上级目录"""
+    path = os.path.abspath(path)
+    while not os.path.exists(path):
+        parent = os.path.dirname(path)
+        if parent == path:
+            break
+        path = parent
+    return path
+
+
+def free_space(path):
+    """返回 path 所在文件系统中当前用户可用的字节数（statvfs 的 f_bavail）"""
+    path = existing_parent(path)
+    if hasattr(os, "statvfs"):
+        stat = os.statvfs(path)
+        return stat.f_bavail * stat.f_frsize
+    return shutil.disk_usage(path).free
+
+
+def check_free_space(path, required):
+    """空间不足时抛出异常，在开始写入之前调用"""
+    available = free_space(path)
+    if required > available:
+        raise Exception(f"Not enough free space in {existing_parent(path)}: "
+                        f"{format_size(required)} needed, {format_size(available)} available")
+
+
+def preallocate(fd, size):
+    """用 posix_fallocate 预先分配空间，避免碎片和复制到一半时磁盘已满；文件系统不支持时忽略"""
+    if size <= 0 or not hasattr(os, "posix_fallocate"):
+        return
+    try:
+        os.posix_fallocate(fd, 0, size)
+    except OSError as e:
+        if e.errno == errno.ENOSPC:
+            raise Exception(f"Not enough free space to allocate {format_size(size)}")
+        if e.errno not in (errno.EOPNOTSUPP, errno.EINVAL, getattr(errno, "ENOTSUP", errno.EOPNOTSUPP)):
+            raise
+
+
+def same_filesystem(path, other):
+    """两个路径（或它们最近的已存在的上级目录）是否位于同一文件系统"""
+    return os.stat(existing_parent(path)).st_dev == os.stat(existing_parent(other)).st_dev
+
+
+def reflink(src, dst):
+    """用 FICLONE 创建 dst 作为 src 的写时复制副本，不支持时抛出 OSError"""
+    if not sys.platform.startswith("linux"):
+        raise OSError(errno.EOPNOTSUPP, "reflink is not supported on this platform")
+    import fcntl
+    with open(src, 'rb') as fin:
+        fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        try:
+            fcntl.ioctl(fd, FICLONE, fin.fileno())
+        except OSError:
+            os.close(fd)
+            os.remove(dst)
+            raise
+        os.close(fd)
+
+
+def link_file(src, dst):
+    """不复制数据地把 src 放到 dst：优先 reflink，其次硬链接，返回使用的方式
+
+    两种方式都不可用时（跨文件系统、不支持链接、没有权限）抛出 OSError。
+    硬链接与源文件共享同一个inode，之后原地修改源文件也会改变 dst。
+    """
+    try:
+        reflink(src, dst)
+        return "reflink"
+    except OSError:
+        pass
+    os.link(src, dst)
+    return "hardlink"
+
+
+def _write_all(f, data):
+    while data:
+        written = f.write(data)
+        data = data[written:]
+
+
+def copy_file(src, dst, progress=None, cancelled=None, cache_neutral=True):
+    """复制文件并保留修改时间等元数据，返回复制的字节数
+
+    progress(已复制字节, 总字节) 在每个块之后调用，cancelled() 返回 True 时中止复制。
+    复制速度受 throttle.bandwidth 的总带宽限制。目标文件会先预分配空间；复制失败时删除不完整的目标文件。
+    """
+    size = os.path.getsize(src)
+    neutral = cache_neutral and hasattr(os, "posix_fadvise")
+    sync = getattr(os, "fdatasync", os.fsync)
+    copied = 0
+    try:
+        # 在开始读取之前记录每个窗口是否已被缓存，之后的读取会触发内核预读，影响判断
+        with open(src, 'rb', buffering=0) as fin, open(dst, 'wb', buffering=0) as fout, \
+                DropBehind(src) if neutral else contextlib.nullcontext() as source_cache:
+            if neutral:
+                _fadvise(fin.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            preallocate(fout.fileno(), size)
+            buffer = memoryview(bytearray(CHUNK_SIZE))
+            while True:
+                window_start = copied
+                window_end = window_start + WINDOW_SIZE
+                while copied < window_end:
+                    if cancelled and cancelled():
+                        raise Exception("Copy cancelled")
+                    count = fin.readinto(buffer[:min(CHUNK_SIZE, window_end - copied)])
+                    if not count:
+                        break
+                    bandwidth.consume(count)
+                    _write_all(fout, buffer[:count])
+                    copied += count
+                    if progress:
+                        progress(copied, size)
+                if neutral and copied > window_start:
+                    sync(fout.fileno())
+                    _fadvise(fout.fileno(), window_start, copied - window_start, os.POSIX_FADV_DONTNEED)
+                    source_cache.advance(copied)
+                if copied < window_end:
+                    break
+            # 源文件在复制过程中变短时，去掉预分配的多余部分
+            if copied != size:
+                fout.truncate(copied)
+    except BaseException:
+        try:
+            os.remove(dst)
+        except OSError:
+            pass
+        raise
+    shutil.copystat(src, dst)
+    return copied
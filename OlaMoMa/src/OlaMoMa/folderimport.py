@@ -0,0 +1,147 @@
+"""批量导入一个目录（含子目录）中的所有 GGUF 文件
+
+步骤：查找 *.gguf → 并行读取文件头得到模型名和标签 → 用 HashEngine 计算摘要，跳过服务器上已有的
+blob → 用有限的并发逐个导入。每个模型的导入是独立的：失败只影响这一个模型，不会留下半成品。
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from .api import OllamaClient
+from .gguf import SPLIT_PATTERN, model_name, read_metadata
+from .hashing import HashEngine
+
+SCAN_WORKERS = 8
+
+
+def find_gguf_files(root):
+    """递归查找 root 下的 .gguf 文件（跳过隐藏目录），按路径排序"""
+    found = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(name for name in dirnames if not name.startswith('.'))
+        for filename in filenames:
+            if filename.lower().endswith('.gguf'):
+                found.append(os.path.join(dirpath, filename))
+    return sorted(found)
+
+
+def _scan(path):
+    entry = {'path': path, 'name': None, 'size': os.path.getsize(path), 'metadata': None, 'error': None}
+    try:
+        _, _, metadata = read_metadata(path)
+    except Exception as e:
+        entry['error'] = str(e) or f"Cannot read GGUF header ({type(e).__name__})"
+        return entry
+    split = SPLIT_PATTERN.search(path)
+    if metadata.get('split.count', 1) > 1 or (split and split.group(2) != "00001"):
+        entry['error'] = "Split GGUF files cannot be imported"
+        return entry
+    entry['metadata'] = metadata
+    entry['name'] = model_name(metadata, path)
+    return entry
+
+
+def scan_headers(paths, workers=SCAN_WORKERS):
+    """并行读取多个文件的GGUF文件头，按输入顺序返回每个文件的 {'path', 'name', 'size', 'metadata', 'error'}"""
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        return list(pool.map(_scan, paths))
+
+
+def _unique_names(entries, taken):
+    """多个文件得到相同的模型名时，在名称后面加 -2、-3 区分"""
+    for entry in entries:
+        if not entry['name']:
+            continue
+        name, tag = entry['name'].split(':', 1)
+        candidate, number = entry['name'], 1
+        while candidate in taken:
+            number += 1
+            candidate = f"{name}-{number}:{tag}"
+        entry['name'] = candidate
+        taken.add(candidate)
+
+
+def plan_folder_import(root, existing_names=(), engine=None, client=None, progress=None, cancelled=None):
+    """扫描目录并决定每个文件的处理方式，返回条目列表
+
+    每个条目的 'action' 为 'import'、'skip'（服务器已有相同摘要的blob，或目录中有内容相同的文件）或 'error'。
+    只按摘要跳过：名称与 existing_names 中已有模型相同但内容不同的文件（例如另一个微调或量化版本）
+    按 -2、-3 改名后导入。
+    progress(阶段, 已完成, 总数) 报告扫描和计算摘要的进度，阶段为 'scan' 或 'hash'。
+    """
+    client = client or OllamaClient()
+    paths = find_gguf_files(root)
+    if progress:
+        progress('scan', 0, len(paths))
+    entries = scan_headers(paths)
+    if progress:
+        progress('scan', len(paths), len(paths))
+
+    candidates = []
+    for entry in entries:
+        if entry['error']:
+            entry['action'] = 'error'
+        else:
+            candidates.append(entry)
+
+    engine = engine or HashEngine()
+    digests = engine.hash_files([entry['path'] for entry in candidates],
+                                progress=progress and (lambda done, total: progress('hash', done, total)),
+                                cancelled=cancelled)
+    seen = {}
+    for entry in candidates:
+        entry['digest'] = digests[entry['path']]
+        if entry['digest'] in seen:
+            entry['action'] = 'skip'
+            entry['reason'] = f"same content as {seen[entry['digest']]}"
+        elif client.has_blob(entry['digest']):
+            entry['action'] = 'skip'
+            entry['reason'] = "already present on the server"
+        else:
+            entry['action'] = 'import'
+            seen[entry['digest']] = entry['path']
+    _unique_names([entry for entry in entries if entry.get('action') == 'import'], set(existing_names))
+    return entries
+
+
+def run_folder_import(entries, import_file, concurrency=2, progress=None, cancelled=None):
+    """用最多 concurrency 个并发导入计划中 action 为 'import' 的文件
+
+    import_file(路径, 模型名, 摘要) 导入一个文件，失败时抛出异常；结果写回条目的 'status' 和 'message'。
+    progress(已完成, 总数, 条目) 在每个文件完成后调用。cancelled() 返回 True 后不再开始新的导入。
+    """
+    queued = [entry for entry in entries if entry.get('action') == 'import']
+    for entry in entries:
+        if entry.get('action') == 'skip':
+            entry['status'], entry['message'] = 'skipped', entry['reason']
+        elif entry.get('action') == 'error':
+            entry['status'], entry['message'] = 'failed', entry['error']
+
+    def run(entry):
+        if cancelled and cancelled():
+            entry['status'], entry['message'] = 'cancelled', "Import cancelled"
+            return entry
+        try:
+            import_file(entry['path'], entry['name'], entry['digest'])
+            entry['status'], entry['message'] = 'imported', entry['name']
+        except Exception as e:
+            entry['status'], entry['message'] = 'failed', str(e)
+        return entry
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+        futures = [pool.submit(run, entry) for entry in queued]
+        for done, future in enumerate(as_completed(futures), 1):
+            if progress:
+                progress(done, len(queued), future.result())
+    return entries
+
+
+def summarize(entries):
+    """汇总结果：各状态的数量，以及失败的文件"""
+    counts = {}
+    for entry in entries:
+        counts[entry.get('status', 'pending')] = counts.get(entry.get('status', 'pending'), 0) + 1
+    lines = [", ".join(f"{count} {status}" for status, count in sorted(counts.items()))]
+    for entry in entries:
+        if entry.get('status') == 'failed':
+            lines.append(f"{entry['path']}: {entry['message']}")
+    return "\n".join(lines)
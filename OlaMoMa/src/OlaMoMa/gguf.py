@@ -0,0 +1,126 @@
+"""读取 GGUF 文件头中的元数据
+
+只解析文件头的键值对（general.architecture、general.name、tokenizer.chat_template 等），
+不读取张量信息和权重，即使是几十GB的文件也只需读取几MB。
+格式参见 https://github.com/ggml-org/ggml/blob/master/docs/gguf.md
+"""
+import os
+import re
+import struct
+
+GGUF_MAGIC = b"GGUF"
+
+# 元数据值的类型编号
+_UINT8, _INT8, _UINT16, _INT16, _UINT32, _INT32, _FLOAT32, _BOOL, _STRING, _ARRAY, _UINT64, _INT64, _FLOAT64 = range(13)
+_SCALARS = {
+    _UINT8: "<B", _INT8: "<b", _UINT16: "<H", _INT16: "<h", _UINT32: "<I", _INT32: "<i",
+    _FLOAT32: "<f", _BOOL: "<?", _UINT64: "<Q", _INT64: "<q", _FLOAT64: "<d",
+}
+
+# 超过这个长度的数组（词表、合并规则等）只记录长度，不保存内容
+MAX_ARRAY_ITEMS = 64
+# 文件头中单个字符串和键值对数量的上限，超过说明文件头已损坏
+MAX_STRING_LENGTH = 64 * 1024 * 1024
+MAX_KV_COUNT = 1024 * 1024
+
+# general.file_type 对应的量化类型（llama.cpp 的 LLAMA_FTYPE）
+FILE_TYPES = {
+    0: "F32", 1: "F16", 2: "Q4_0", 3: "Q4_1", 7: "Q8_0", 8: "Q5_0", 9: "Q5_1", 10: "Q2_K",
+    11: "Q3_K_S", 12: "Q3_K_M", 13: "Q3_K_L", 14: "Q4_K_S", 15: "Q4_K_M", 16: "Q5_K_S", 17: "Q5_K_M",
+    18: "Q6_K", 19: "IQ2_XXS", 20: "IQ2_XS", 21: "Q2_K_S", 22: "IQ3_XS", 23: "IQ3_XXS", 24: "IQ1_S",
+    25: "IQ4_NL", 26: "IQ3_S", 27: "IQ3_M", 28: "IQ2_S", 29: "IQ2_M", 30: "IQ4_XS", 31: "IQ1_M",
+    32: "BF16", 36: "TQ1_0", 37: "TQ2_0",
+}
+
+# 分片文件（model-00002-of-00003.gguf）
+SPLIT_PATTERN = re.compile(r"-(\d{5})-of-(\d{5})\.gguf$", re.IGNORECASE)
+
+
+class _Reader:
+    def __init__(self, f):
+        self.f = f
+
+    def read(self, count):
+        data = self.f.read(count)
+        if len(data) != count:
+            raise Exception("Truncated GGUF header")
+        return data
+
+    def unpack(self, fmt):
+        return struct.unpack(fmt, self.read(struct.calcsize(fmt)))[0]
+
+    def string(self):
+        return self.read(self.length()).decode('utf-8', errors='replace')
+
+    def length(self):
+        length = self.unpack("<Q")
+        if length > MAX_STRING_LENGTH:
+            raise Exception("Corrupt GGUF header")
+        return length
+
+    def value(self, value_type):
+        if value_type == _STRING:
+            return self.string()
+        if value_type == _ARRAY:
+            item_type = self.unpack("<I")
+            count = self.unpack("<Q")
+            if count > MAX_ARRAY_ITEMS:
+                self.skip_array(item_type, count)
+                return {'type': item_type, 'length': count}
+            return [self.value(item_type) for _ in range(count)]
+        if value_type not in _SCALARS:
+            raise Exception(f"Unknown GGUF value type {value_type}")
+        return self.unpack(_SCALARS[value_type])
+
+    def skip_array(self, item_type, count):
+        if item_type in _SCALARS:
+            self.f.seek(struct.calcsize(_SCALARS[item_type]) * count, 1)
+        elif item_type == _STRING:
+            for _ in range(count):
+                self.f.seek(self.length(), 1)
+        else:
+            for _ in range(count):
+                self.value(item_type)
+
+
+def read_metadata(path):
+    """返回 (版本, 张量数, 元数据字典)；不是GGUF文件或文件头损坏时抛出异常"""
+    with open(path, 'rb') as f:
+        reader = _Reader(f)
+        if f.read(4) != GGUF_MAGIC:
+            raise Exception(f"Not a GGUF file: {path}")
+        version = reader.unpack("<I")
+        if version < 2:
+            raise Exception(f"Unsupported GGUF version {version}: {path}")
+        tensor_count = reader.unpack("<Q")
+        kv_count = reader.unpack("<Q")
+        if kv_count > MAX_KV_COUNT:
+            raise Exception(f"Corrupt GGUF header: {path}")
+        metadata = {}
+        for _ in range(kv_count):
+            key = reader.string()
+            metadata[key] = reader.value(reader.unpack("<I"))
+    return version, tensor_count, metadata
+
+
+def quantization(metadata):
+    """由 general.file_type 得到量化类型名，未知时返回 None"""
+    file_type = metadata.get('general.file_type')
+    return FILE_TYPES.get(file_type) if isinstance(file_type, int) else None
+
+
+def _slug(text):
+    return re.sub(r"[^a-z0-9_.-]+", "-", text.lower()).strip("-.")
+
+
+def model_name(metadata, path):
+    """由元数据推导 Ollama 模型名 名称:标签，例如 qwen2.5-coder:7b-instruct-q4_k_m
+
+    名称取 general.basename 或 general.name，没有时用文件名；标签由参数规模、微调类型和量化类型组成。
+    """
+    stem = SPLIT_PATTERN.sub(".gguf", os.path.basename(path))
+    stem = os.path.splitext(stem)[0]
+    name = _slug(str(metadata.get('general.basename') or metadata.get('general.name') or stem)) or "model"
+    parts = [metadata.get('general.size_label'), metadata.get('general.finetune'), quantization(metadata)]
+    tag = "-".join(_slug(str(part)) for part in parts if part)
+    return f"{name}:{tag}" if tag else f"{name}:latest"
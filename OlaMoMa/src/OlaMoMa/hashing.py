@@ -0,0 +1,266 @@
+"""计算模型文件的 sha256 摘要，格式与 Ollama 的 blob 摘要一致（sha256:<hex>）
+
+file_digest 在当前线程中顺序读取一个文件，用于导入时的去重。HashEngine 用于大批量的校验：
+文件通过 mmap 映射，交给 ProcessPoolExecutor 中的多个进程计算，可以同时计算多个文件，
+也可以把一个文件分成固定大小的块分别计算（两层的哈希树），用于逐块校验。
+工作进程通过队列把已读取的字节数报告给调用方，用于进度显示。限速时工作进程每读取一块之前
+从调用方领取一块的额度，调用方按已读取的字节数扣除令牌并控制发放额度的速度，因此限速作用在
+实际的读取上，调用方线程也不会长时间阻塞，可以随时取消。
+"""
+import hashlib
+import mmap
+import multiprocessing
+import os
+import queue
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+
+from .throttle import bandwidth
+
+CHUNK_SIZE = 8 * 1024 * 1024
+TREE_CHUNK_SIZE = 64 * 1024 * 1024
+# 总量小于此值时不启动进程池，直接在当前线程中计算
+POOL_THRESHOLD = 256 * 1024 * 1024
+
+
+def file_digest(path, progress=None, cancelled=None, drop_behind=None):
+    """顺序读取文件并返回 sha256:<hex>
+
+    读取速度受 throttle.bandwidth 的总带宽限制；progress(已读取字节) 在每个块之后调用，
+    cancelled() 返回 True 时中止。传入 fileio.DropBehind 时按窗口丢弃已读过的页。
+    """
+    hasher = hashlib.sha256()
+    done = 0
+    with open(path, 'rb', buffering=0) as f:
+        buffer = memoryview(bytearray(CHUNK_SIZE))
+        while True:
+            if cancelled and cancelled():
+                raise Exception("Hashing cancelled")
+            count = f.readinto(buffer)
+            if not count:
+                break
+            bandwidth.consume(count)
+            hasher.update(buffer[:count])
+            done += count
+            if drop_behind:
+                drop_behind.advance(done)
+            if progress:
+                progress(done)
+    return "sha256:" + hasher.hexdigest()
+
+
+def tree_root(chunks):
+    """由各块的摘要计算整棵树的根摘要"""
+    return "sha256:" + hashlib.sha256(b"".join(bytes.fromhex(chunk) for chunk in chunks)).hexdigest()
+
+
+# 工作进程中的进度队列、取消标志、当前限速和读取额度队列，由 _init_worker 设置
+_progress_queue = None
+_cancel_event = None
+_rate = None
+_grants = None
+
+
+def _init_worker(progress_queue, cancel_event, rate, grants):
+    global _progress_queue, _cancel_event, _rate, _grants
+    _progress_queue = progress_queue
+    _cancel_event = cancel_event
+    _rate = rate
+    _grants = grants
+
+
+def _take_grant(count):
+    """限速时在读取一块之前等待调用方发放的额度，不限速时直接返回"""
+    while _rate.value > 0:
+        if _cancel_event.is_set():
+            raise Exception("Hashing cancelled")
+        try:
+            _grants.get(timeout=0.1)
+            return
+        except queue.Empty:
+            pass
+
+
+def _hash_range(path, offset, length, report=None, cancelled=None, throttle=None):
+    """用 mmap 计算文件中一段数据的 sha256，返回十六进制摘要"""
+    hasher = hashlib.sha256()
+    if length <= 0:
+        return hasher.hexdigest()
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        if hasattr(mapped, "madvise"):
+            mapped.madvise(mmap.MADV_SEQUENTIAL)
+        view = memoryview(mapped)
+        try:
+            position, end = offset, offset + length
+            while position < end:
+                if cancelled and cancelled():
+                    raise Exception("Hashing cancelled")
+                count = min(CHUNK_SIZE, end - position)
+                if throttle:
+                    throttle(count)
+                hasher.update(view[position:position + count])
+                position += count
+                if report:
+                    report(count)
+        finally:
+            view.release()
+    return hasher.hexdigest()
+
+
+def _pool_task(path, offset, length):
+    """在工作进程中执行的任务"""
+    return _hash_range(path, offset, length, report=_progress_queue.put, cancelled=_cancel_event.is_set,
+                       throttle=_take_grant)
+
+
+class HashEngine:
+    """多进程的哈希计算，workers 默认为CPU核数"""
+
+    def __init__(self, workers=None):
+        if not workers:
+            # 只计算本进程允许使用的CPU
+            workers = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count()
+        self.workers = max(1, workers or 1)
+
+    def _run(self, tasks, progress=None, cancelled=None):
+        """计算 tasks 中每个 (路径, 偏移, 长度) 的摘要，按顺序返回十六进制摘要列表"""
+        total = sum(length for _, _, length in tasks)
+        done = 0
+
+        def report(count):
+            nonlocal done
+            done += count
+            if progress:
+                progress(done, total)
+
+        if self.workers > 1 and len(tasks) > 1 and total >= POOL_THRESHOLD:
+            try:
+                return self._run_pool(tasks, report, cancelled)
+            except BrokenProcessPool:
+                # 无法启动工作进程（例如打包后的程序），退回当前线程计算
+                done = 0
+        return [_hash_range(path, offset, length, report, cancelled, bandwidth.consume)
+                for path, offset, length in tasks]
+
+    def _run_pool(self, tasks, report, cancelled):
+        """在进程池中计算，工作进程读取的字节数经队列传回后调用 report
+
+        限速时每个工作进程读取一块之前要领取一个额度。读取的字节数传回后从 bandwidth 中扣除，
+        令牌不足时推迟发放下一个额度；未使用的额度最多为工作进程数，突发读取不会超过这些块。
+        """
+        # 用 spawn 启动工作进程，避免在有多个线程的GUI进程中 fork
+        context = multiprocessing.get_context("spawn")
+        progress_queue = context.Queue()
+        cancel_event = context.Event()
+        rate = context.Value('d', bandwidth.rate, lock=False)
+        grants = context.Queue()
+        issued = 0  # 已发放的额度数
+        chunks_read = 0  # 工作进程已读取的块数，每块用掉一个额度
+        next_grant = 0.0  # 令牌恢复后才能发放下一个额度的时间
+
+        def on_read(count):
+            nonlocal chunks_read, next_grant
+            chunks_read += 1
+            delay = bandwidth.reserve(count)
+            if delay:
+                next_grant = max(next_grant, time.monotonic() + delay)
+            report(count)
+
+        results = [None] * len(tasks)
+        pending = {}
+        next_task = 0
+        with ProcessPoolExecutor(self.workers, mp_context=context, initializer=_init_worker,
+                                 initargs=(progress_queue, cancel_event, rate, grants)) as pool:
+            try:
+                while next_task < len(tasks) or pending:
+                    while next_task < len(tasks) and len(pending) < self.workers * 2:
+                        path, offset, length = tasks[next_task]
+                        pending[pool.submit(_pool_task, path, offset, length)] = next_task
+                        next_task += 1
+                    # 限速可以在运行中修改，工作进程在每块之前读取当前值
+                    rate.value = bandwidth.rate
+                    timeout = 0.1
+                    if bandwidth.rate > 0:
+                        while issued - chunks_read < self.workers and time.monotonic() >= next_grant:
+                            grants.put(None)
+                            issued += 1
+                        timeout = 0.02
+                    else:
+                        issued = chunks_read
+                    finished, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                    self._drain(progress_queue, on_read)
+                    if cancelled and cancelled():
+                        raise Exception("Hashing cancelled")
+                    for future in finished:
+                        results[pending.pop(future)] = future.result()
+            except BaseException:
+                cancel_event.set()
+                for future in pending:
+                    future.cancel()
+                raise
+        # 工作进程退出前会把队列中剩余的进度写完
+        self._drain(progress_queue, on_read)
+        return results
+
+    @staticmethod
+    def _drain(progress_queue, report):
+        while True:
+            try:
+                count = progress_queue.get_nowait()
+            except queue.Empty:
+                return
+            report(count)
+
+    def hash_files(self, paths, progress=None, cancelled=None):
+        """并行计算多个文件的摘要，返回 {路径: sha256:<hex>}
+
+        progress(已读取字节, 总字节) 在当前线程中调用，cancelled() 返回 True 时中止。
+        """
+        tasks = [(path, 0, os.path.getsize(path)) for path in paths]
+        return {path: "sha256:" + digest for (path, _, _), digest in zip(tasks, self._run(tasks, progress, cancelled))}
+
+    def hash_tree(self, path, chunk_size=TREE_CHUNK_SIZE, progress=None, cancelled=None):
+        """把一个文件分成 chunk_size 大小的块并行计算，返回包含根摘要和各块摘要的字典"""
+        size = os.path.getsize(path)
+        tasks = [(path, offset, min(chunk_size, size - offset)) for offset in range(0, size, chunk_size)]
+        chunks = self._run(tasks, progress, cancelled)
+        return {'size': size, 'chunk_size': chunk_size, 'chunks': chunks, 'digest': tree_root(chunks)}
+
+    def verify_tree(self, path, tree, progress=None, cancelled=None):
+        """按之前 hash_tree 的结果逐块校验文件，返回内容不一致的块的序号列表"""
+        current = self.hash_tree(path, tree['chunk_size'], progress, cancelled)
+        count = max(len(current['chunks']), len(tree['chunks']))
+        old = tree['chunks'] + [None] * (count - len(tree['chunks']))
+        new = current['chunks'] + [None] * (count - len(current['chunks']))
+        return [index for index in range(count) if old[index] != new[index]]
+
+
+def verify_blobs(blobs, engine=None, progress=None, cancelled=None):
+    """校验 blob 文件的内容是否与文件名中的摘要一致
+
+    blobs 为 manifests.model_blobs 返回的列表，返回每个blob的 {'digest', 'path', 'ok', 'actual'}。
+    """
+    engine = engine or HashEngine()
+    present = [blob for blob in blobs if os.path.exists(blob['path'])]
+    digests = engine.hash_files([blob['path'] for blob in present], progress, cancelled)
+    results = []
+    for blob in blobs:
+        actual = digests.get(blob['path'])
+        results.append({'digest': blob['digest'], 'path': blob['path'], 'ok': actual == blob['digest'],
+                        'actual': actual})
+    return results
+
+
+def format_verify_report(results):
+    """校验结果，每个blob一行"""
+    lines = []
+    for result in results:
+        if result['actual'] is None:
+            status = "MISSING"
+        elif result['ok']:
+            status = "OK"
+        else:
+            status = f"CORRUPT (content is {result['actual']})"
+        lines.append(f"  {result['digest']} {status}")
+    return "\n".join(lines)
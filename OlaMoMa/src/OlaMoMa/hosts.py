@@ -0,0 +1,131 @@
+"""多主机支持：主机注册表与并发的模型列表获取
+
+所有主机的列表请求由 asyncops 在同一个事件循环中并发执行。一次刷新记录为一个 "list" 操作，
+各主机的HTTP和子进程耗时都计入这个 Span。
+"""
+import asyncio
+import json
+import os
+import threading
+import time
+
+from . import asyncops, profiling
+from .api import normalize_host
+from .config import get_config_dir
+from .tracing import get_tracer
+
+LOCAL_HOST = "local"
+
+
+class HostRegistry:
+    """已注册的Ollama主机，保存在配置目录下的 hosts.json 中"""
+
+    def __init__(self, path=None):
+        self.path = path or os.path.join(get_config_dir(), "hosts.json")
+        self.hosts = {}
+        self.load()
+
+    def load(self):
+        """从磁盘读取主机列表"""
+        self.hosts = {}
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    for entry in json.load(f):
+                        self.hosts[entry['name']] = normalize_host(entry['url'])
+            except (OSError, ValueError, KeyError, TypeError):
+                self.hosts = {}
+
+    def save(self):
+        """把主机列表写回磁盘"""
+        entries = [{'name': name, 'url': url} for name, url in self.hosts.items()]
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump(entries, f, indent=2)
+
+    def add(self, name, url):
+        """注册主机"""
+        name = name.strip()
+        if not name or name == LOCAL_HOST:
+            raise Exception(f"Invalid host name: {name}")
+        self.hosts[name] = normalize_host(url)
+        self.save()
+
+    def remove(self, name):
+        """移除主机"""
+        if self.hosts.pop(name, None) is not None:
+            self.save()
+
+    def names(self):
+        """返回所有主机名，本机始终排在第一位"""
+        return [LOCAL_HOST] + list(self.hosts)
+
+
+class MultiHostLister:
+    """并发获取多个主机的模型列表，并按主机缓存结果"""
+
+    def __init__(self, registry, manager_factory, timeout=5):
+        self.registry = registry
+        self.manager_factory = manager_factory
+        self.timeout = timeout
+        self._cache = {}  # 主机名 -> {'models', 'error', 'timestamp'}
+        self._lock = threading.Lock()
+
+    async def _list_host(self, name):
+        """获取单个主机的模型列表"""
+        if name == LOCAL_HOST:
+            models = await self.manager_factory().list_models_async()
+        else:
+            # 已知不可用的主机立即失败，不再等待超时
+            models = await asyncops.list_host(self.registry.hosts[name], timeout=self.timeout)
+        for model in models:
+            model.host = name
+        return models
+
+    def _store(self, name, models=None, error=None):
+        with self._lock:
+            entry = {'models': models, 'error': error, 'timestamp': time.time()}
+            # 失败时保留上一次成功的结果，便于继续显示
+            previous = self._cache.get(name)
+            if models is None and previous and previous['models'] is not None:
+                entry['models'] = previous['models']
+            self._cache[name] = entry
+
+    async def fetch_all_async(self, names=None):
+        """在一个事件循环中并发刷新所有主机，单个主机超时不会阻塞其他主机；返回 {主机名: 错误信息}"""
+        names = names or self.registry.names()
+        # 与工作线程中的操作一样写入操作日志和指标；开启分析时 cProfile 记录的是事件循环线程，
+        # 同一时间在循环中运行的其他协程也会出现在结果中
+        with get_tracer().span("list", args=list(names)), profiling.profile_operation("list"):
+            # 本机可能通过CLI获取，自带10秒超时；远程主机使用HTTP超时，这里再留出余量
+            results = await asyncops.gather({name: self._list_host(name) for name in names},
+                                            timeout=max(self.timeout, 10) + 1)
+        errors = {}
+        for name, (models, error) in results.items():
+            if error is None:
+                self._store(name, models=models)
+            else:
+                errors[name] = error
+                self._store(name, error=error)
+        return errors
+
+    def fetch_all(self, names=None):
+        """在当前线程中运行 fetch_all_async（命令行和测试使用，界面通过 AsyncBridge 调用协程版本）"""
+        return asyncio.run(self.fetch_all_async(names))
+
+    def cached_models(self, host=None):
+        """从缓存中返回合并后的模型列表，host 为 None 时返回所有主机"""
+        with self._lock:
+            models = []
+            for name, entry in self._cache.items():
+                if host not in (None, name) or not entry['models']:
+                    continue
+                if name != LOCAL_HOST and name not in self.registry.hosts:
+                    continue
+                models.extend(entry['models'])
+            return models
+
+    def cached_error(self, host):
+        """返回某个主机最近一次的错误信息"""
+        with self._lock:
+            entry = self._cache.get(host)
+            return entry['error'] if entry else None
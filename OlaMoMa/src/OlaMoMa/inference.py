@@ -0,0 +1,109 @@
+"""模型推理基准测试：加载时间、首个token延迟和每秒token数
+"""
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+from .config import get_config_dir
+
+# 固定的提示词集合，保证不同模型和量化版本之间的结果可比较
+DEFAULT_PROMPTS = [
+    "Explain in two sentences why the sky is blue.",
+    "Write a Python function that returns the n-th Fibonacci number.",
+    "Summarize the plot of Romeo and Juliet in one paragraph.",
+    "List five practical tips for writing clear technical documentation.",
+]
+
+COLUMNS = ("timestamp", "host", "model", "prompts", "load_s", "ttft_s", "prompt_tps", "gen_tps", "total_s")
+
+
+def _rate(count, duration_ns):
+    return count / (duration_ns / 1e9) if duration_ns else 0.0
+
+
+def run_prompt(client, model, prompt, num_predict=128):
+    """流式运行一个提示词，返回服务器的计时数据和本地测得的首个token延迟"""
+    request = {'model': model, 'prompt': prompt, 'stream': True,
+               'options': {'num_predict': num_predict, 'temperature': 0, 'seed': 42}}
+    start = time.perf_counter()
+    ttft = None
+    final = None
+    for chunk in client.stream("POST", "/api/generate", request, timeout=600):
+        if 'error' in chunk:
+            raise Exception(chunk['error'])
+        if ttft is None and chunk.get('response'):
+            ttft = time.perf_counter() - start
+        if chunk.get('done'):
+            final = chunk
+    if final is None:
+        raise Exception(f"Incomplete response from {model}")
+    final['ttft'] = ttft if ttft is not None else time.perf_counter() - start
+    final['wall'] = time.perf_counter() - start
+    return final
+
+
+def benchmark_model(client, model, prompts=None, num_predict=128, progress=None):
+    """对一个模型运行整组提示词，返回汇总结果
+
+    load_s 为第一次请求的加载时间（模型未驻留内存时即冷启动时间）。
+    """
+    prompts = prompts or DEFAULT_PROMPTS
+    runs = []
+    for i, prompt in enumerate(prompts):
+        if progress:
+            progress(i, len(prompts))
+        runs.append(run_prompt(client, model, prompt, num_predict))
+    prompt_count = sum(r.get('prompt_eval_count', 0) for r in runs)
+    prompt_ns = sum(r.get('prompt_eval_duration', 0) for r in runs)
+    eval_count = sum(r.get('eval_count', 0) for r in runs)
+    eval_ns = sum(r.get('eval_duration', 0) for r in runs)
+    return {
+        'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        'host': client.base_url,
+        'model': model,
+        'prompts': len(runs),
+        'load_s': runs[0].get('load_duration', 0) / 1e9,
+        'ttft_s': sum(r['ttft'] for r in runs) / len(runs),
+        'prompt_tps': _rate(prompt_count, prompt_ns),
+        'gen_tps': _rate(eval_count, eval_ns),
+        'total_s': sum(r['wall'] for r in runs),
+    }
+
+
+class BenchmarkHistory:
+    """保存在SQLite中的基准测试历史记录"""
+
+    def __init__(self, path=None):
+        self.path = path or os.path.join(get_config_dir(), "benchmarks.sqlite")
+        with self._connect() as db:
+            db.execute("""CREATE TABLE IF NOT EXISTS runs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                timestamp TEXT, host TEXT, model TEXT, prompts INTEGER,
+                load_s REAL, ttft_s REAL, prompt_tps REAL, gen_tps REAL, total_s REAL)""")
+
+    @contextmanager
+    def _connect(self):
+        db = sqlite3.connect(self.path)
+        try:
+            with db:
+                yield db
+        finally:
+            db.close()
+
+    def add(self, result):
+        """记录一次测试结果"""
+        with self._connect() as db:
+            db.execute(f"INSERT INTO runs ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})",
+                       [result[column] for column in COLUMNS])
+
+    def rows(self, model=None):
+        """按时间倒序返回历史记录"""
+        query = f"SELECT {', '.join(COLUMNS)} FROM runs"
+        params = []
+        if model:
+            query += " WHERE model = ?"
+            params.append(model)
+        with self._connect() as db:
+            return [dict(zip(COLUMNS, row)) for row in db.execute(query + " ORDER BY id DESC", params)]
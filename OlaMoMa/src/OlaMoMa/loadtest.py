@@ -0,0 +1,117 @@
+"""Ollama服务器并发负载测试
+
+在给定的并发数（以及可选的请求速率）下发送 /api/generate 请求，
+统计 p50/p95/p99 延迟、吞吐量和错误率，用于比较不同 OLLAMA_NUM_PARALLEL 设置下的表现。
+"""
+import asyncio
+import csv
+import json
+import math
+import os
+import time
+
+from .api import normalize_host
+from .asynchttp import request
+
+DEFAULT_PROMPT = "Write a short paragraph about the history of the printing press."
+
+REPORT_COLUMNS = ("concurrency", "rate", "requests", "errors", "error_rate", "p50_s", "p95_s", "p99_s",
+                  "mean_s", "requests_per_s", "tokens_per_s", "duration_s")
+
+
+def percentile(values, fraction):
+    """最近秩法计算百分位数"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, math.ceil(fraction * len(ordered)) - 1)
+    return ordered[index]
+
+
+async def _one_request(base_url, model, prompt, num_predict, timeout):
+    payload = {'model': model, 'prompt': prompt, 'stream': False,
+               'options': {'num_predict': num_predict}}
+    start = time.perf_counter()
+    _, data = await request(base_url, "POST", "/api/generate", payload, timeout)
+    latency = time.perf_counter() - start
+    return latency, json.loads(data).get('eval_count', 0)
+
+
+async def run_level(base_url, model, concurrency, requests, rate=None, prompt=DEFAULT_PROMPT,
+                    num_predict=64, timeout=300):
+    """在一个并发级别下运行 requests 个请求；rate 为每秒发起的请求数（开环），None 表示尽快发送
+
+    base_url 为空时使用 OLLAMA_HOST。
+    """
+    base_url = normalize_host(base_url or os.environ.get("OLLAMA_HOST"))
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+    errors = []
+    tokens = 0
+
+    async def worker(delay):
+        nonlocal tokens
+        if delay:
+            await asyncio.sleep(delay)
+        async with semaphore:
+            try:
+                latency, count = await _one_request(base_url, model, prompt, num_predict, timeout)
+            except Exception as e:
+                errors.append(str(e) or type(e).__name__)
+                return
+            latencies.append(latency)
+            tokens += count
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(i / rate if rate else 0) for i in range(requests)))
+    duration = time.perf_counter() - start
+    return {
+        'concurrency': concurrency,
+        'rate': rate or 0,
+        'requests': requests,
+        'errors': len(errors),
+        'error_rate': len(errors) / requests if requests else 0.0,
+        'p50_s': percentile(latencies, 0.50),
+        'p95_s': percentile(latencies, 0.95),
+        'p99_s': percentile(latencies, 0.99),
+        'mean_s': sum(latencies) / len(latencies) if latencies else 0.0,
+        'requests_per_s': len(latencies) / duration if duration else 0.0,
+        'tokens_per_s': tokens / duration if duration else 0.0,
+        'duration_s': duration,
+        'first_error': errors[0] if errors else "",
+    }
+
+
+def run_load_test(base_url, model, levels=(1, 2, 4, 8), requests=32, rate=None, num_predict=64,
+                  progress=None):
+    """依次运行每个并发级别，返回报告行列表"""
+    rows = []
+    for concurrency in levels:
+        if progress:
+            progress(concurrency)
+        # 先发送一个请求让模型驻留内存，避免加载时间计入第一个级别
+        if not rows:
+            asyncio.run(run_level(base_url, model, 1, 1, num_predict=1))
+        rows.append(asyncio.run(run_level(base_url, model, concurrency, requests, rate,
+                                          num_predict=num_predict)))
+    return rows
+
+
+def format_table(rows):
+    """把报告格式化为文本表格"""
+    header = (f"{'conc':>5}{'rate':>7}{'reqs':>6}{'err%':>7}{'p50 s':>9}{'p95 s':>9}{'p99 s':>9}"
+              f"{'req/s':>9}{'tok/s':>9}")
+    lines = [header]
+    for r in rows:
+        lines.append(f"{r['concurrency']:>5}{r['rate']:>7.1f}{r['requests']:>6}{r['error_rate'] * 100:>6.1f}%"
+                     f"{r['p50_s']:>9.3f}{r['p95_s']:>9.3f}{r['p99_s']:>9.3f}"
+                     f"{r['requests_per_s']:>9.2f}{r['tokens_per_s']:>9.1f}")
+    return '\n'.join(lines)
+
+
+def write_csv(rows, path):
+    """把报告写入CSV文件"""
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=REPORT_COLUMNS, extrasaction='ignore')
+        writer.writeheader()
+        writer.writerows(rows)
@@ -0,0 +1,84 @@
+"""读取 Ollama 模型目录中的 manifests，解析模型对应的 blob 文件
+
+目录结构：models/manifests/<registry>/<namespace>/<repo>/<tag> 为JSON清单，
+models/blobs/sha256-<hex> 为实际内容。
+"""
+import json
+import os
+
+from .config import get_models_dir
+
+REGISTRY = "registry.ollama.ai"
+MODEL_MEDIA_TYPE = "application/vnd.ollama.image.model"
+
+
+def full_model_name(name):
+    """补全默认标签 latest"""
+    return name if ':' in name.rsplit('/', 1)[-1] else f"{name}:latest"
+
+
+def manifest_path(models_dir, name):
+    """返回模型manifest文件的路径"""
+    name = full_model_name(name)
+    repo, tag = name.rsplit(':', 1)
+    parts = repo.split('/')
+    if len(parts) == 1:
+        parts = [REGISTRY, "library"] + parts
+    elif len(parts) == 2:
+        parts = [REGISTRY] + parts
+    return os.path.join(models_dir, "manifests", *parts, tag)
+
+
+def blob_path(models_dir, digest):
+    """sha256:xxx 对应的blob文件路径"""
+    return os.path.join(models_dir, "blobs", digest.replace(':', '-'))
+
+
+def model_name_from_manifest(models_dir, path):
+    """由manifest路径还原 ollama list 中显示的模型名"""
+    parts = os.path.relpath(path, os.path.join(models_dir, "manifests")).split(os.sep)
+    *repo, tag = parts
+    if len(repo) == 3 and repo[0] == REGISTRY:
+        repo = repo[2:] if repo[1] == "library" else repo[1:]
+    return f"{'/'.join(repo)}:{tag}"
+
+
+def iter_manifests(models_dir=None):
+    """遍历模型目录中的所有manifest，返回 (模型名, manifest路径)"""
+    models_dir = models_dir or get_models_dir()
+    root = os.path.join(models_dir, "manifests")
+    for dirpath, _, filenames in os.walk(root):
+        for filename in filenames:
+            path = os.path.join(dirpath, filename)
+            yield model_name_from_manifest(models_dir, path), path
+
+
+def read_manifest(models_dir, name):
+    """读取并解析模型的manifest"""
+    path = manifest_path(models_dir, name)
+    try:
+        with open(path, 'rb') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        raise Exception(f"Manifest not found for model {name}: {path}")
+    except ValueError as e:
+        raise Exception(f"Invalid manifest for model {name}: {e}")
+
+
+def model_blobs(models_dir, name):
+    """返回模型引用的所有blob（配置和各层），模型权重层排在最前面"""
+    models_dir = models_dir or get_models_dir()
+    manifest = read_manifest(models_dir, name)
+    layers = list(manifest.get('layers', []))
+    if manifest.get('config'):
+        layers.append(manifest['config'])
+    blobs = []
+    for layer in layers:
+        blobs.append({
+            'media_type': layer.get('mediaType', ''),
+            'digest': layer['digest'],
+            'size': layer.get('size', 0),
+            'path': blob_path(models_dir, layer['digest']),
+        })
+    blobs.sort(key=lambda blob: blob['media_type'] != MODEL_MEDIA_TYPE)
+    return blobs
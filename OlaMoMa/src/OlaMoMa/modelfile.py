@@ -0,0 +1,114 @@
+"""Modelfile 解析
+"""
+
+
+def _read_value(text, pos):
+    """从 pos 开始读取一个指令的值，支持 \"\"\"...\"\"\" 和跨行的 "..." 形式，返回 (值, 新位置)"""
+    if text.startswith('"""', pos):
+        end = text.find('"""', pos + 3)
+        if end == -1:
+            raise Exception("Unterminated triple-quoted string in Modelfile")
+        return text[pos + 3:end], end + 3
+    if text.startswith('"', pos):
+        chars = []
+        i = pos + 1
+        while i < len(text):
+            c = text[i]
+            if c == '\\' and i + 1 < len(text) and text[i + 1] in '"\\':
+                chars.append(text[i + 1])
+                i += 2
+                continue
+            if c == '"':
+                return ''.join(chars), i + 1
+            chars.append(c)
+            i += 1
+        raise Exception("Unterminated quoted string in Modelfile")
+    end = text.find('\n', pos)
+    if end == -1:
+        end = len(text)
+    return text[pos:end].strip(), end
+
+
+def _parameter_value(value):
+    """把参数值转换为数字（如果可能）"""
+    for convert in (int, float):
+        try:
+            return convert(value)
+        except ValueError:
+            pass
+    return value
+
+
+def parse_modelfile(text):
+    """解析Modelfile，返回包含 from/template/system/parameters 等字段的字典
+
+    stop 参数可以出现多次，会被合并为列表。
+    """
+    result = {'from': None, 'template': None, 'system': None, 'license': None,
+              'adapter': None, 'parameters': {}, 'messages': []}
+    pos = 0
+    while pos < len(text):
+        # 跳过空白和注释
+        while pos < len(text) and text[pos] in ' \t\r\n':
+            pos += 1
+        if pos >= len(text):
+            break
+        if text[pos] == '#':
+            end = text.find('\n', pos)
+            pos = len(text) if end == -1 else end
+            continue
+
+        end = pos
+        while end < len(text) and text[end] not in ' \t\r\n':
+            end += 1
+        command = text[pos:end].upper()
+        pos = end
+        while pos < len(text) and text[pos] in ' \t':
+            pos += 1
+
+        if command == 'PARAMETER':
+            end = pos
+            while end < len(text) and text[end] not in ' \t\r\n':
+                end += 1
+            key = text[pos:end]
+            pos = end
+            while pos < len(text) and text[pos] in ' \t':
+                pos += 1
+            value, pos = _read_value(text, pos)
+            if key == 'stop':
+                result['parameters'].setdefault('stop', []).append(value)
+            else:
+                result['parameters'][key] = _parameter_value(value)
+        elif command == 'MESSAGE':
+            end = pos
+            while end < len(text) and text[end] not in ' \t\r\n':
+                end += 1
+            role = text[pos:end]
+            pos = end
+            while pos < len(text) and text[pos] in ' \t':
+                pos += 1
+            value, pos = _read_value(text, pos)
+            result['messages'].append({'role': role, 'content': value})
+        elif command == 'STOP':
+            # 旧版本生成的Modelfile使用 STOP 指令，按 PARAMETER stop 处理
+            value, pos = _read_value(text, pos)
+            result['parameters'].setdefault('stop', []).append(value)
+        elif command in ('FROM', 'TEMPLATE', 'SYSTEM', 'LICENSE', 'ADAPTER'):
+            value, pos = _read_value(text, pos)
+            result[command.lower()] = value
+        else:
+            raise Exception(f"Unknown Modelfile instruction: {command}")
+    return result
+
+
+def create_request(parsed, model_name):
+    """把解析后的Modelfile转换为 /api/create 的请求体，不包含 FROM（由调用方给出 from 或 files）"""
+    request = {'model': model_name}
+    for key in ('template', 'system', 'license'):
+        if parsed.get(key):
+            request[key] = parsed[key]
+    if parsed.get('parameters'):
+        request['parameters'] = dict(parsed['parameters'])
+    if parsed.get('messages'):
+        request['messages'] = list(parsed['messages'])
+    return request
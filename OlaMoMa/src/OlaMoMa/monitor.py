@@ -0,0 +1,70 @@
+"""已加载模型监视：keep_alive 解析、剩余时间显示和自适应轮询间隔
+"""
+import re
+
+# Go 的 time.Duration 格式，例如 "5m"、"1h30m"、"-1s"
+_DURATION = re.compile(r"^-?(\d+(\.\d+)?(ns|us|µs|ms|s|m|h))+$")
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ns|us|µs|ms|s|m|h)")
+_UNITS = {'ns': 1e-9, 'us': 1e-6, 'µs': 1e-6, 'ms': 1e-3, 's': 1, 'm': 60, 'h': 3600}
+
+
+def parse_keep_alive(text):
+    """把用户输入的 keep_alive 转换为API接受的值：纯数字为秒数（整数），其余按时长字符串原样传递
+
+    "-1" 或负数表示一直驻留，"0" 表示立即卸载。
+    """
+    text = str(text).strip()
+    if re.fullmatch(r"-?\d+", text):
+        return int(text)
+    if _DURATION.match(text):
+        return text
+    raise Exception(f"Invalid keep_alive value: {text}")
+
+
+def duration_seconds(value):
+    """把 keep_alive 值（秒数或时长字符串）转换为秒数"""
+    if isinstance(value, (int, float)):
+        return value
+    value = parse_keep_alive(value)
+    if isinstance(value, int):
+        return value
+    sign = -1 if value.startswith('-') else 1
+    return sign * sum(float(number) * _UNITS[unit] for number, unit in _DURATION_PART.findall(value))
+
+
+def format_remaining(seconds):
+    """按 ollama ps 的风格显示剩余时间，None 表示一直驻留"""
+    if seconds is None:
+        return "Forever"
+    if seconds <= 0:
+        return "Expiring"
+    for unit, size in (("hours", 3600), ("minutes", 60)):
+        if seconds >= size * 2:
+            return f"{int(seconds // size)} {unit}"
+    return f"{int(seconds)} seconds"
+
+
+class AdaptiveInterval:
+    """轮询间隔：列表有变化时快速轮询，稳定时逐步放慢，并在模型即将到期时提前刷新"""
+
+    def __init__(self, minimum=2.0, maximum=30.0, factor=2.0):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.factor = factor
+        self.current = minimum
+
+    def reset(self):
+        """用户操作后恢复最短间隔"""
+        self.current = self.minimum
+
+    def next(self, changed, until_expiry=None):
+        """根据本次轮询结果返回下一次轮询前等待的秒数"""
+        if changed:
+            self.current = self.minimum
+        else:
+            self.current = min(self.current * self.factor, self.maximum)
+        interval = self.current
+        if until_expiry is not None:
+            # 在最早到期的模型被卸载后立即刷新
+            interval = min(interval, max(self.minimum, until_expiry + 1))
+        return interval
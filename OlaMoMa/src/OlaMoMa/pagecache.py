@@ -0,0 +1,175 @@
+"""把模型的 blob 文件预读进操作系统页缓存，减少冷启动加载时间
+
+通过 manifest 找到模型引用的所有 blob，把它们切分为若干连续的段，由多个线程并行地
+顺序读取；读取前用 posix_fadvise(WILLNEED) 提示内核预读。读取前后用 mincore
+统计每个 blob 已驻留在页缓存中的比例（仅 Linux/macOS 等 POSIX 系统支持，其他平台显示为未知）。
+"""
+import ctypes
+import ctypes.util
+import mmap
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .api import format_size
+from .config import get_models_dir
+from .manifests import model_blobs
+from .throttle import bandwidth
+
+CHUNK_SIZE = 8 * 1024 * 1024
+SEGMENT_SIZE = 256 * 1024 * 1024
+# mincore 每次映射的窗口大小，避免为大文件一次性分配过大的结果数组
+RESIDENCY_WINDOW = 1024 * 1024 * 1024
+
+_libc = None
+
+
+def _load_libc():
+    """加载带 mmap/mincore 的C库，不支持的平台返回 None"""
+    global _libc
+    if _libc is None:
+        _libc = False
+        if os.name == "posix":
+            try:
+                libc = ctypes.CDLL(ctypes.util.find_library("c") or None, use_errno=True)
+                libc.mmap.restype = ctypes.c_void_p
+                libc.mmap.argtypes = [ctypes.c_void_p, ctypes.c_size_t, ctypes.c_int, ctypes.c_int,
+                                      ctypes.c_int, ctypes.c_int64 if sys.maxsize > 2 ** 32 else ctypes.c_long]
+                libc.munmap.argtypes = [ctypes.c_void_p, ctypes.c_size_t]
+                libc.mincore.argtypes = [ctypes.c_void_p, ctypes.c_size_t, ctypes.c_void_p]
+                _libc = libc
+            except (OSError, AttributeError):
+                pass
+    return _libc or None
+
+
+def resident_bytes(path, offset=0, length=None):
+    """返回文件（或从 offset 开始的 length 字节）已在页缓存中的字节数，平台不支持时返回 None"""
+    libc = _load_libc()
+    if libc is None:
+        return None
+    size = os.path.getsize(path)
+    end = size if length is None else min(size, offset + length)
+    # mmap 的偏移量必须按页对齐
+    start = offset - offset % mmap.PAGESIZE
+    if end <= start:
+        return 0
+    failed = ctypes.c_void_p(-1).value
+    resident_pages = 0
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        for window in range(start, end, RESIDENCY_WINDOW):
+            window_length = min(RESIDENCY_WINDOW, end - window)
+            address = libc.mmap(None, window_length, mmap.PROT_READ, mmap.MAP_SHARED, fd, window)
+            if address in (None, failed):
+                errno = ctypes.get_errno()
+                raise OSError(errno, os.strerror(errno), path)
+            try:
+                pages = (window_length + mmap.PAGESIZE - 1) // mmap.PAGESIZE
+                vector = (ctypes.c_ubyte * pages)()
+                if libc.mincore(address, window_length, vector) != 0:
+                    errno = ctypes.get_errno()
+                    raise OSError(errno, os.strerror(errno), path)
+                data = bytes(vector)
+                resident_pages += len(data) - data.count(0)
+            finally:
+                libc.munmap(address, window_length)
+    finally:
+        os.close(fd)
+    return min(resident_pages * mmap.PAGESIZE, end - start)
+
+
+class _Progress:
+    """多个读取线程共享的进度，只在百分比变化时回调"""
+
+    def __init__(self, total, callback=None, cancelled=None):
+        self.total = total
+        self.done = 0
+        self.callback = callback
+        self.cancelled = cancelled or (lambda: False)
+        self._percent = -1
+        self._lock = threading.Lock()
+
+    def add(self, count):
+        with self._lock:
+            self.done += count
+            percent = self.done * 100 // self.total if self.total else 100
+            if percent == self._percent or not self.callback:
+                return
+            self._percent = percent
+            self.callback(self.done, self.total)
+
+
+def _read_segment(path, offset, length, progress):
+    """顺序读取文件的一段，数据直接丢弃，只为让内核把它留在页缓存中"""
+    with open(path, 'rb', buffering=0) as f:
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(f.fileno(), offset, length, os.POSIX_FADV_WILLNEED)
+            os.posix_fadvise(f.fileno(), offset, length, os.POSIX_FADV_SEQUENTIAL)
+        f.seek(offset)
+        view = memoryview(bytearray(min(CHUNK_SIZE, length) or 1))
+        remaining = length
+        while remaining > 0 and not progress.cancelled():
+            count = f.readinto(view[:min(len(view), remaining)])
+            if not count:
+                break
+            bandwidth.consume(count)
+            remaining -= count
+            progress.add(count)
+
+
+def warm_model(model_name, models_dir=None, readers=4, progress=None, cancelled=None, check_only=False):
+    """把模型的所有 blob 读入页缓存
+
+    progress(已读字节, 总字节) 在百分比变化时从读取线程中调用，cancelled() 返回 True 时停止。
+    返回 {'model', 'blobs', 'bytes', 'seconds'}，每个 blob 带有读取前后的驻留字节数
+    （resident_before/resident_after，平台不支持时为 None）。check_only 为 True 时只统计驻留情况。
+    """
+    models_dir = models_dir or get_models_dir()
+    blobs = model_blobs(models_dir, model_name)
+    segments = []
+    for blob in blobs:
+        if not os.path.exists(blob['path']):
+            raise Exception(f"Blob file does not exist: {blob['path']}")
+        blob['size'] = os.path.getsize(blob['path'])
+        blob['resident_before'] = resident_bytes(blob['path'])
+        for offset in range(0, blob['size'], SEGMENT_SIZE):
+            segments.append((blob['path'], offset, min(SEGMENT_SIZE, blob['size'] - offset)))
+
+    total = sum(length for _, _, length in segments)
+    start = time.perf_counter()
+    if not check_only:
+        tracker = _Progress(total, progress, cancelled)
+        # 各段按文件顺序提交，多个线程同时顺序读取相邻的段
+        with ThreadPoolExecutor(max_workers=max(1, readers)) as executor:
+            for future in [executor.submit(_read_segment, path, offset, length, tracker)
+                           for path, offset, length in segments]:
+                future.result()
+    seconds = time.perf_counter() - start
+
+    for blob in blobs:
+        blob['resident_after'] = resident_bytes(blob['path'])
+    return {'model': model_name, 'blobs': blobs, 'bytes': 0 if check_only else total, 'seconds': seconds}
+
+
+def _percent(resident, size):
+    if resident is None:
+        return "unknown"
+    return f"{resident * 100 / size:.0f}%" if size else "100%"
+
+
+def format_report(result):
+    """把预热结果格式化为文本"""
+    lines = []
+    for blob in result['blobs']:
+        media_type = blob['media_type']
+        kind = media_type.rsplit('.', 1)[-1] if "ollama.image." in media_type else "config"
+        lines.append(f"{blob['digest'][:19]}  {kind:<10}{format_size(blob['size']):>10}  "
+                     f"resident {_percent(blob['resident_before'], blob['size'])} -> "
+                     f"{_percent(blob['resident_after'], blob['size'])}")
+    if result['bytes']:
+        rate = result['bytes'] / result['seconds'] if result['seconds'] else 0
+        lines.append(f"Read {format_size(result['bytes'])} in {result['seconds']:.1f} s ({format_size(int(rate))}/s)")
+    return '\n'.join(lines)
@@ -0,0 +1,134 @@
+"""可选的操作性能分析与诊断信息收集
+
+通过环境变量 OLAMOMA_PROFILE 或“诊断”菜单开启：
+
+- cpu：用 cProfile 运行操作，保存 .prof 文件（可用 snakeviz 或 pstats 查看）
+- mem：用 tracemalloc 跟踪内存分配，保存快照和占用最多的代码行
+
+OLAMOMA_PROFILE=1 表示同时开启两者。结果保存在配置目录的 diagnostics 文件夹中，
+collect_diagnostics 会把它们和操作日志一起打包成zip。
+"""
+import cProfile
+import json
+import os
+import platform
+import sys
+import threading
+import time
+import tracemalloc
+import zipfile
+from contextlib import contextmanager
+
+from .config import get_config_dir
+from .session import get_session
+
+MODES = ("cpu", "mem")
+
+_modes = None
+_tracemalloc_users = 0
+_tracemalloc_lock = threading.Lock()
+
+
+def parse_modes(value):
+    """把 "1"、"cpu"、"cpu,mem" 这样的值解析为模式集合"""
+    value = (value or "").strip().lower()
+    if value in ("", "0", "false", "off", "no"):
+        return frozenset()
+    if value in ("1", "true", "on", "yes", "all"):
+        return frozenset(MODES)
+    return frozenset(mode.strip() for mode in value.split(',') if mode.strip() in MODES)
+
+
+def enabled_modes():
+    """返回当前开启的分析模式"""
+    if _modes is None:
+        return parse_modes(os.environ.get("OLAMOMA_PROFILE"))
+    return _modes
+
+
+def set_modes(modes):
+    """在运行时开启或关闭分析（菜单开关使用）"""
+    global _modes
+    _modes = frozenset(modes)
+
+
+def get_diagnostics_dir():
+    """返回保存分析结果的目录"""
+    path = os.path.join(get_config_dir(), "diagnostics")
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def _start_tracemalloc():
+    global _tracemalloc_users
+    with _tracemalloc_lock:
+        if _tracemalloc_users == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start(25)
+        _tracemalloc_users += 1
+
+
+def _stop_tracemalloc():
+    global _tracemalloc_users
+    with _tracemalloc_lock:
+        _tracemalloc_users -= 1
+        if _tracemalloc_users == 0:
+            tracemalloc.stop()
+
+
+@contextmanager
+def profile_operation(name):
+    """在开启分析时用 cProfile/tracemalloc 运行代码块，并把结果写入诊断目录"""
+    modes = enabled_modes()
+    if not modes:
+        yield None
+        return
+
+    base = os.path.join(get_diagnostics_dir(), f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}-"
+                                               f"{threading.get_ident()}-{name}")
+    profiler = cProfile.Profile() if "cpu" in modes else None
+    if "mem" in modes:
+        _start_tracemalloc()
+    if profiler:
+        profiler.enable()
+    try:
+        yield base
+    finally:
+        if profiler:
+            profiler.disable()
+            profiler.dump_stats(base + ".prof")
+        if "mem" in modes:
+            snapshot = tracemalloc.take_snapshot()
+            current, peak = tracemalloc.get_traced_memory()
+            _stop_tracemalloc()
+            snapshot.dump(base + ".tracemalloc")
+            with open(base + "-memory.txt", 'w', encoding='utf-8') as f:
+                f.write(f"current: {current} bytes\npeak: {peak} bytes\n\n")
+                for stat in snapshot.statistics('lineno')[:30]:
+                    f.write(f"{stat}\n")
+
+
+def collect_diagnostics(zip_path):
+    """把诊断目录、操作日志和系统信息打包为zip，返回写入的文件数"""
+    config_dir = get_config_dir()
+    count = 0
+    with zipfile.ZipFile(zip_path, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+        info = {
+            'platform': platform.platform(),
+            'python': sys.version,
+            'executable': sys.executable,
+            'cpu_count': os.cpu_count(),
+            'profile_modes': sorted(enabled_modes()),
+            'environment': {k: v for k, v in os.environ.items() if k.startswith(("OLLAMA_", "OLAMOMA_"))},
+            'ollama': get_session().describe(),
+        }
+        archive.writestr("system.json", json.dumps(info, indent=2))
+        for folder in ("diagnostics", "logs"):
+            root = os.path.join(config_dir, folder)
+            if not os.path.isdir(root):
+                continue
+            for dirpath, _, filenames in os.walk(root):
+                for filename in filenames:
+                    path = os.path.join(dirpath, filename)
+                    archive.write(path, os.path.relpath(path, config_dir))
+                    count += 1
+    return count
@@ -0,0 +1,113 @@
+"""模型列表中的一条记录
+
+列表可能有成千上万个模型，每个模型用一个带 __slots__ 的 ModelRecord 表示：名称、标签和主机名经过
+sys.intern，相同的字符串只保存一份；大小（字节）和修改时间（Unix 时间戳）为整数，排序时不必再解析文本，
+显示时才格式化。
+"""
+import re
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime
+
+# ollama list 显示的大小使用1000进制
+SIZE_UNITS = {'B': 1, 'KB': 1000, 'MB': 1000 ** 2, 'GB': 1000 ** 3, 'TB': 1000 ** 4}
+TIME_UNITS = {'second': 1, 'minute': 60, 'hour': 3600, 'day': 86400, 'week': 7 * 86400,
+              'month': 30 * 86400, 'year': 365 * 86400}
+DATE_FORMATS = ["%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M", "%Y-%m-%d", "%m/%d/%Y %H:%M:%S", "%m/%d/%Y %H:%M", "%m/%d/%Y"]
+DISPLAY_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+_SIZE_PATTERN = re.compile(r"^([0-9.]+)\s*([KMGT]?B)?$")
+_RELATIVE_PATTERN = re.compile(r"^(?:about )?(an?|\d+) (second|minute|hour|day|week|month|year)s? ago$")
+
+
+@dataclass(slots=True)
+class ModelRecord:
+    """一个模型：full_name 为 名称:标签，host 为所属主机名"""
+    full_name: str
+    name: str
+    tag: str
+    id: str
+    size: int = 0  # 字节数，未知时为 0
+    modified_at: int = 0  # Unix 时间戳（秒），未知时为 0
+    host: str = ""
+
+    @classmethod
+    def create(cls, full_name, id="", size=0, modified_at=0, host=""):
+        """由完整名称创建记录，拆分名称和标签并驻留字符串"""
+        name, _, tag = full_name.rpartition(':') if ':' in full_name else (full_name, "", "")
+        intern = sys.intern
+        return cls(intern(full_name), intern(name), intern(tag), id, int(size), int(modified_at), intern(host))
+
+
+def parse_size(text):
+    """把 ollama list 中的 "2.0 GB" 这样的大小转换为字节数，无法解析时返回 0"""
+    match = _SIZE_PATTERN.match(text.strip().upper())
+    if not match:
+        return 0
+    try:
+        return int(float(match.group(1)) * SIZE_UNITS[match.group(2) or 'B'])
+    except ValueError:
+        return 0
+
+
+def parse_modified(text, now=None):
+    """把 ollama list 中的 "7 minutes ago" 或日期转换为 Unix 时间戳，无法解析时返回 0"""
+    text = text.strip()
+    lower = text.lower()
+    now = time.time() if now is None else now
+    if lower.startswith("less than a second"):
+        return int(now)
+    match = _RELATIVE_PATTERN.match(lower)
+    if match:
+        count = 1 if match.group(1) in ("a", "an") else int(match.group(1))
+        return int(now - count * TIME_UNITS[match.group(2)])
+    for fmt in DATE_FORMATS:
+        try:
+            return int(datetime.strptime(text, fmt).timestamp())
+        except ValueError:
+            continue
+    return 0
+
+
+def parse_list_output(output, now=None):
+    """解析 ollama list 的输出，返回 ModelRecord 列表"""
+    now = time.time() if now is None else now
+    models = []
+    for line in output.split('\n'):
+        line = line.strip()
+        if not line or line.startswith('NAME'):  # 跳过标题行和空行
+            continue
+
+        # 使用正则表达式匹配 ollama list 的输出格式
+        # 格式: model_name:tag    ID    size    modified_date
+        # 例如: llama3.2:3b    a80c4f17acd5    2.0 GB    7 minutes ago
+        pattern = r'^([a-zA-Z0-9_./-]+:[a-zA-Z0-9_.-]+)\s+([a-f0-9]+)\s+([0-9.]+\s*[KMG]?B?)\s+(.+)$'
+        match = re.match(pattern, line)
+        if not match:
+            # 如果没有匹配到，尝试处理没有标签的模型
+            # 格式: model_name    ID    size    modified_date
+            pattern_no_tag = r'^([a-zA-Z0-9_./-]+)\s+([a-f0-9]+)\s+([0-9.]+[KMG]?B?)\s+(.+)$'
+            match = re.match(pattern_no_tag, line)
+
+        if match:
+            full_name, model_id, size, modified_date = (group.strip() for group in match.groups())
+        else:
+            # 如果还是无法匹配，使用简单的分割方法
+            parts = line.split()
+            if len(parts) < 4:
+                continue
+            full_name, model_id, size = parts[0].strip(), parts[1], parts[2]
+            modified_date = " ".join(parts[3:])
+
+        models.append(ModelRecord.create(full_name, model_id, parse_size(size),
+                                         parse_modified(modified_date, now)))
+
+    return models
+
+
+def format_modified(timestamp):
+    """按本地时间显示修改时间"""
+    if not timestamp:
+        return ""
+    return time.strftime(DISPLAY_DATE_FORMAT, time.localtime(timestamp))
@@ -0,0 +1,386 @@
+"""局域网内共享的模型仓库缓存（pull-through cache）
+
+提供 Ollama 拉取模型时使用的仓库接口（/v2/<名称>/manifests/<标签> 和 /v2/<名称>/blobs/<摘要>），
+内容从本地目录返回；缓存中没有时才从上游仓库（默认 registry.ollama.ai）下载。多个主机同时请求
+同一个blob时只下载一次，其他请求等待这次下载完成。blob按最近使用顺序（LRU）在超过磁盘配额时淘汰。
+
+各主机这样从缓存拉取模型：
+
+    ollama pull --insecure cache-host:8800/library/llama3.2:3b
+
+按标签的manifest会在 manifest_ttl 秒后重新向上游确认，上游不可用时继续使用缓存中的版本；
+按摘要引用的manifest和blob内容不会变化，不需要确认。
+"""
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import OrderedDict
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from .config import get_config_dir
+
+DEFAULT_UPSTREAM = "https://registry.ollama.ai"
+DEFAULT_PORT = 8800
+MANIFEST_MEDIA_TYPE = "application/vnd.docker.distribution.manifest.v2+json"
+CHUNK_SIZE = 1024 * 1024
+
+_NAME_PATTERN = re.compile(r"^[a-z0-9]+(?:[._-][a-z0-9]+)*(?:/[a-z0-9]+(?:[._-][a-z0-9]+)*)*$")
+_TAG_PATTERN = re.compile(r"^[A-Za-z0-9_][A-Za-z0-9._-]{0,127}$")
+_DIGEST_PATTERN = re.compile(r"^sha256:[0-9a-f]{64}$")
+_PATH_PATTERN = re.compile(r"^/v2/(.+)/(manifests|blobs)/([^/]+)$")
+_RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+# 转发给上游的请求头
+FORWARDED_HEADERS = ("Accept", "Authorization")
+
+
+class RegistryError(Exception):
+    """无法提供请求的内容，status 为返回给客户端的HTTP状态码"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def get_cache_dir():
+    """返回默认的缓存目录"""
+    return os.path.join(get_config_dir(), "registry-cache")
+
+
+class RegistryCache:
+    """按摘要存放blob、按名称和标签存放manifest的本地缓存
+
+    quota 为blob占用的最大字节数，0 表示不限制。
+    """
+
+    def __init__(self, root=None, upstream=DEFAULT_UPSTREAM, quota=0, manifest_ttl=300, timeout=60):
+        self.root = root or get_cache_dir()
+        self.upstream = upstream.rstrip('/')
+        self.quota = quota
+        self.manifest_ttl = manifest_ttl
+        self.timeout = timeout
+        self.stats = {'hits': 0, 'misses': 0, 'coalesced': 0, 'upstream_bytes': 0, 'evictions': 0}
+        self._lock = threading.Lock()
+        self._inflight = {}  # ('blob', 摘要) 或 ('manifest', 名称, 标签) -> Future
+        self._sizes = OrderedDict()  # 摘要 -> 字节数，最久未使用的在前
+        self._total = 0
+        os.makedirs(os.path.join(self.root, "blobs"), exist_ok=True)
+        os.makedirs(os.path.join(self.root, "manifests"), exist_ok=True)
+        self._load_index()
+
+    def _load_index(self):
+        """按修改时间（即最后一次使用的时间）重建LRU顺序，并清理上次未完成的下载"""
+        entries = []
+        blobs_dir = os.path.join(self.root, "blobs")
+        for filename in os.listdir(blobs_dir):
+            path = os.path.join(blobs_dir, filename)
+            if "-partial-" in filename:
+                os.remove(path)
+                continue
+            stat = os.stat(path)
+            entries.append((stat.st_mtime, filename.replace('-', ':', 1), stat.st_size))
+        for _, digest, size in sorted(entries):
+            self._sizes[digest] = size
+            self._total += size
+
+    def blob_path(self, digest):
+        return os.path.join(self.root, "blobs", digest.replace(':', '-'))
+
+    def manifest_path(self, name, reference):
+        return os.path.join(self.root, "manifests", *name.split('/'), reference.replace(':', '-'))
+
+    def cached_bytes(self):
+        """缓存中blob的总字节数"""
+        with self._lock:
+            return self._total
+
+    def _get(self, key, lookup, fetch):
+        """lookup() 在锁内检查缓存；未命中时由第一个请求调用 fetch()，同时到达的相同请求等待它的结果"""
+        with self._lock:
+            cached = lookup()
+            if cached is not None:
+                self.stats['hits'] += 1
+                return cached
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+                self.stats['misses'] += 1
+            else:
+                self.stats['coalesced'] += 1
+        if not leader:
+            return future.result()
+        try:
+            future.set_result(fetch())
+        except Exception as e:
+            future.set_exception(e)
+        finally:
+            with self._lock:
+                del self._inflight[key]
+        return future.result()
+
+    def _open_upstream(self, path, headers=None):
+        """请求上游仓库；HTTP错误按原状态码转换为 RegistryError，连接错误为502"""
+        forwarded = {key: value for key, value in (headers or {}).items() if key in FORWARDED_HEADERS}
+        request = urllib.request.Request(self.upstream + path, headers=forwarded)
+        try:
+            return urllib.request.urlopen(request, timeout=self.timeout)
+        except urllib.error.HTTPError as e:
+            raise RegistryError(e.code, f"Upstream returned {e.code} for {path}")
+        except (urllib.error.URLError, OSError) as e:
+            raise RegistryError(502, f"Cannot reach upstream {self.upstream}: {getattr(e, 'reason', e)}")
+
+    # ---- blobs ----
+
+    def blob(self, name, digest, headers=None):
+        """返回缓存中blob的路径，未命中时从上游下载；同一blob的并发请求只下载一次"""
+        if not _NAME_PATTERN.match(name):
+            raise RegistryError(400, f"Invalid repository name: {name}")
+        if not _DIGEST_PATTERN.match(digest):
+            raise RegistryError(400, f"Invalid digest: {digest}")
+        path = self.blob_path(digest)
+
+        def lookup():
+            if digest in self._sizes:
+                self._sizes.move_to_end(digest)
+                return path
+            return None
+
+        result = self._get(('blob', digest), lookup, lambda: self._download_blob(name, digest, headers))
+        try:
+            # 修改时间记录最后一次使用，重启后据此恢复LRU顺序
+            os.utime(path)
+        except OSError:
+            pass
+        return result
+
+    def _download_blob(self, name, digest, headers):
+        path = self.blob_path(digest)
+        temp_path = f"{path}-partial-{threading.get_ident()}"
+        hasher = hashlib.sha256()
+        size = 0
+        try:
+            with self._open_upstream(f"/v2/{name}/blobs/{digest}", headers) as response, open(temp_path, 'wb') as f:
+                while True:
+                    chunk = response.read(CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    hasher.update(chunk)
+                    f.write(chunk)
+                    size += len(chunk)
+            if "sha256:" + hasher.hexdigest() != digest:
+                raise RegistryError(502, f"Upstream sent data that does not match {digest}")
+            os.replace(temp_path, path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        with self._lock:
+            self._sizes[digest] = size
+            self._total += size
+            self.stats['upstream_bytes'] += size
+        self._evict(keep=digest)
+        return path
+
+    def _evict(self, keep=None):
+        """超过配额时按LRU顺序删除blob；正在发送的文件在POSIX上删除后仍可读完"""
+        if not self.quota:
+            return
+        victims = []
+        with self._lock:
+            for digest in list(self._sizes):
+                if self._total <= self.quota:
+                    break
+                if digest == keep:
+                    continue
+                self._total -= self._sizes.pop(digest)
+                victims.append(digest)
+            self.stats['evictions'] += len(victims)
+        for digest in victims:
+            try:
+                os.remove(self.blob_path(digest))
+            except OSError:
+                pass
+
+    # ---- manifests ----
+
+    def manifest(self, name, reference, headers=None):
+        """返回 (Content-Type, manifest内容)；按标签的manifest超过 manifest_ttl 后向上游重新获取"""
+        if not _NAME_PATTERN.match(name):
+            raise RegistryError(400, f"Invalid repository name: {name}")
+        if not (_TAG_PATTERN.match(reference) or _DIGEST_PATTERN.match(reference)):
+            raise RegistryError(400, f"Invalid reference: {reference}")
+        path = self.manifest_path(name, reference)
+        immutable = reference.startswith("sha256:")
+
+        def lookup():
+            try:
+                if immutable or time.time() - os.path.getmtime(path) < self.manifest_ttl:
+                    return self._read_manifest(path)
+            except OSError:
+                pass
+            return None
+
+        def fetch():
+            try:
+                return self._download_manifest(name, reference, path, headers)
+            except RegistryError:
+                # 上游不可用时继续使用过期的缓存
+                if os.path.exists(path):
+                    return self._read_manifest(path)
+                raise
+
+        return self._get(('manifest', name, reference), lookup, fetch)
+
+    @staticmethod
+    def _read_manifest(path):
+        with open(path, 'rb') as f:
+            data = f.read()
+        try:
+            media_type = json.loads(data).get('mediaType') or MANIFEST_MEDIA_TYPE
+        except (ValueError, AttributeError):
+            media_type = MANIFEST_MEDIA_TYPE
+        return media_type, data
+
+    def _download_manifest(self, name, reference, path, headers):
+        headers = dict(headers or {})
+        headers.setdefault('Accept', MANIFEST_MEDIA_TYPE)
+        with self._open_upstream(f"/v2/{name}/manifests/{reference}", headers) as response:
+            data = response.read()
+            media_type = response.headers.get('Content-Type') or MANIFEST_MEDIA_TYPE
+        if reference.startswith("sha256:") and "sha256:" + hashlib.sha256(data).hexdigest() != reference:
+            raise RegistryError(502, f"Upstream sent data that does not match {reference}")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}-partial-{threading.get_ident()}"
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, path)
+        return media_type, data
+
+
+class RegistryCacheHandler(BaseHTTPRequestHandler):
+    """把仓库接口的请求交给 RegistryCache"""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    @property
+    def cache(self):
+        return self.server.cache
+
+    def send_error_json(self, status, message):
+        code = {400: "NAME_INVALID", 401: "UNAUTHORIZED", 404: "NOT_FOUND"}.get(status, "UNKNOWN")
+        body = json.dumps({'errors': [{'code': code, 'message': message}]}).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(body)
+
+    def dispatch(self):
+        path = self.path.split('?', 1)[0]
+        if path in ("/v2", "/v2/"):
+            self.send_response(200)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        match = _PATH_PATTERN.match(path)
+        if not match:
+            self.send_error_json(404, f"{path} not found")
+            return
+        name, kind, reference = match.groups()
+        headers = {key: self.headers[key] for key in FORWARDED_HEADERS if self.headers.get(key)}
+        try:
+            if kind == "manifests":
+                media_type, data = self.cache.manifest(name, reference, headers)
+                self.send_response(200)
+                self.send_header('Content-Type', media_type)
+                self.send_header('Content-Length', str(len(data)))
+                self.send_header('Docker-Content-Digest', "sha256:" + hashlib.sha256(data).hexdigest())
+                self.end_headers()
+                if self.command != 'HEAD':
+                    self.wfile.write(data)
+            else:
+                try:
+                    self.send_blob(self.cache.blob(name, reference, headers), reference)
+                except FileNotFoundError:
+                    # 刚好被淘汰，重新下载一次
+                    self.send_blob(self.cache.blob(name, reference, headers), reference)
+        except RegistryError as e:
+            self.send_error_json(e.status, str(e))
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    do_GET = do_HEAD = dispatch
+
+    def send_blob(self, path, digest):
+        """发送blob，支持 Ollama 分段下载使用的单个 Range"""
+        with open(path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            start, end = 0, size - 1
+            match = _RANGE_PATTERN.match(self.headers.get('Range', '').strip())
+            if match and (match.group(1) or match.group(2)):
+                if match.group(1):
+                    start = int(match.group(1))
+                    end = min(int(match.group(2)), size - 1) if match.group(2) else size - 1
+                else:
+                    start = max(size - int(match.group(2)), 0)
+                if start > end:
+                    self.send_response(416)
+                    self.send_header('Content-Range', f"bytes */{size}")
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+                self.send_response(206)
+                self.send_header('Content-Range', f"bytes {start}-{end}/{size}")
+            else:
+                self.send_response(200)
+            self.send_header('Content-Type', 'application/octet-stream')
+            self.send_header('Content-Length', str(end - start + 1))
+            self.send_header('Docker-Content-Digest', digest)
+            self.send_header('Accept-Ranges', 'bytes')
+            self.end_headers()
+            if self.command != 'HEAD' and end >= start:
+                # 由内核直接从文件发送到套接字
+                self.connection.sendfile(f, start, end - start + 1)
+
+
+class RegistryCacheServer(ThreadingHTTPServer):
+    """在后台线程中运行的仓库缓存服务器"""
+
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(self, cache, host="0.0.0.0", port=DEFAULT_PORT):
+        super().__init__((host, port), RegistryCacheHandler)
+        self.cache = cache
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{'127.0.0.1' if host == '0.0.0.0' else host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
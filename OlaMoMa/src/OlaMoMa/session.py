@@ -0,0 +1,153 @@
+"""进程内共享的 Ollama 会话
+
+每个服务器地址和模型目录对应一个 Session，由 get_session 共享：ollama 可执行文件、模型目录和
+服务器版本只确定一次，并按版本记录服务器支持的能力。各操作根据这些记录选择最快的方式，
+例如服务器可用时用HTTP API代替启动 ollama 子进程，服务器支持 /api/create 的 files 字段时按摘要导入。
+"""
+import os
+import re
+import shutil
+import threading
+
+from .api import OllamaClient, normalize_host
+from .config import get_models_dir
+from .connection import OFFLINE, get_connection
+
+# 各项能力最早出现的 Ollama 版本
+CAPABILITIES = {
+    'streaming': (0, 1, 0),     # /api/pull 以NDJSON流返回进度
+    'blobs': (0, 1, 17),        # HEAD/POST /api/blobs/:digest
+    'ps': (0, 1, 38),           # /api/ps
+    'create_files': (0, 5, 5),  # /api/create 的 files 字段（按摘要创建模型）
+}
+
+
+def find_ollama():
+    """查找Ollama可执行文件"""
+    # 常见的Ollama安装路径
+    possible_paths = [
+        "ollama",
+        "C:\\Program Files\\Ollama\\ollama.exe",
+        "C:\\Users\\%USERNAME%\\AppData\\Local\\Ollama\\ollama.exe",
+        "/usr/bin/ollama",
+        "/usr/local/bin/ollama"
+    ]
+
+    # 尝试在PATH中查找
+    ollama_path = shutil.which("ollama")
+    if ollama_path:
+        return ollama_path
+
+    # 如果在PATH中找不到，则尝试常见路径
+    for path in possible_paths:
+        # 在Windows上，替换%USERNAME%
+        if os.name == 'nt' and '%USERNAME%' in path:
+            import getpass
+            username = getpass.getuser()
+            path = path.replace('%USERNAME%', username)
+
+        if os.path.exists(path):
+            return path
+
+    return None
+
+
+def parse_version(text):
+    """把 "0.6.8"、"0.5.7-rc1" 这样的版本号解析为元组；开发版（0.0.0）和无法解析时返回 None"""
+    match = re.match(r"^v?(\d+)\.(\d+)\.(\d+)", text or "")
+    if not match:
+        return None
+    version = tuple(int(part) for part in match.groups())
+    return version if version != (0, 0, 0) else None
+
+
+def capabilities_for(version):
+    """返回该版本支持的能力；版本未知（开发版）时认为支持全部能力"""
+    parsed = parse_version(version)
+    return frozenset(name for name, since in CAPABILITIES.items() if parsed is None or parsed >= since)
+
+
+class Session:
+    """一个 Ollama 服务器的会话信息，服务器版本和能力在第一次需要时检测"""
+
+    def __init__(self, base_url=None, models_dir=None):
+        self.base_url = normalize_host(base_url or os.environ.get("OLLAMA_HOST"))
+        self.models_dir = models_dir or get_models_dir()
+        self.ollama_path = find_ollama()
+        self.version = None
+        self.capabilities = frozenset()
+        self._detected = False
+        self._lock = threading.Lock()
+
+    @property
+    def detected(self):
+        """是否已经检测到服务器版本"""
+        with self._lock:
+            self._follow_connection()
+            return self._detected
+
+    def _follow_connection(self):
+        """按共享的连接状态更新检测结果（调用方持有锁）
+
+        ConnectionManager 的健康检查会重新读取 /api/version：服务器离线后作废检测结果，恢复后重新检测；
+        检查中发现版本变化（服务器升级或降级）时更新能力。
+        """
+        connection = get_connection(self.base_url)
+        if connection.state == OFFLINE:
+            self._detected = False
+        elif self._detected and connection.version and connection.version != self.version:
+            self.version = connection.version
+            self.capabilities = capabilities_for(self.version)
+
+    def detect(self, force=False):
+        """读取服务器版本并记录能力，返回服务器是否可用
+
+        检测成功后不再重复，直到连接状态显示服务器离线或版本变化；服务器不可用时不记录结果，
+        下次调用时重试（断路器打开时立即返回）。
+        """
+        with self._lock:
+            self._follow_connection()
+            if self._detected and not force:
+                return True
+            if get_connection(self.base_url).is_open():
+                return False
+            try:
+                version = OllamaClient(self.base_url, timeout=2).version()
+            except Exception:
+                return False
+            self.record_version(version)
+            return True
+
+    def record_version(self, version):
+        """记录检测到的服务器版本和能力（asyncops 中的异步检测也使用）"""
+        self.version = version
+        self.capabilities = capabilities_for(version)
+        self._detected = True
+        get_connection(self.base_url).record_success(version)
+
+    def supports(self, capability):
+        """服务器是否支持某项能力；服务器不可用时返回 False"""
+        return self.detect() and capability in self.capabilities
+
+    def describe(self):
+        """诊断信息中使用的摘要"""
+        return {
+            'base_url': self.base_url,
+            'models_dir': self.models_dir,
+            'ollama_path': self.ollama_path,
+            'version': self.version,
+            'capabilities': sorted(self.capabilities),
+        }
+
+
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+
+def get_session(base_url=None, models_dir=None):
+    """返回服务器地址（默认 OLLAMA_HOST）和模型目录（默认 OLLAMA_MODELS）对应的共享会话"""
+    key = (normalize_host(base_url or os.environ.get("OLLAMA_HOST")), models_dir or get_models_dir())
+    with _sessions_lock:
+        if key not in _sessions:
+            _sessions[key] = Session(*key)
+        return _sessions[key]
@@ -0,0 +1,158 @@
+"""导入GGUF时使用的 Modelfile 模板注册表
+
+模板定义在 resources/modelfile_templates.json 中，用户可以在配置目录中放置同样格式的
+modelfile_templates.json：同名的模板覆盖内置模板中给出的字段，新名称的模板追加在内置模板之后。
+新增模型家族只需修改JSON，不需要改代码。
+
+注册表在第一次使用时加载，每个模板的 Modelfile 正文（参数、SYSTEM、TEMPLATE）在加载时生成，
+导入时只需加上 FROM 行。选择模板的顺序：
+1. tokenizer.chat_template 中出现的标记（markers），多个模板匹配时取列表中靠前的；
+2. 文件名中的关键字（keywords），同样按列表顺序，因此 codellama 排在 llama 之前；
+3. general.architecture（architectures）；
+4. 名为 default 的模板。
+"""
+import json
+import os
+import re
+
+from .config import get_config_dir
+
+BUNDLED_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "resources", "modelfile_templates.json")
+USER_FILENAME = "modelfile_templates.json"
+DEFAULT_TEMPLATE = "default"
+
+
+def _quote(value):
+    """Modelfile 中的多行值使用三引号"""
+    if '"""' in value:
+        raise Exception('Modelfile values cannot contain """')
+    return f'"""{value}"""'
+
+
+def _format_parameter(key, value):
+    if isinstance(value, str):
+        return f'PARAMETER {key} "{value}"'
+    if isinstance(value, bool):
+        return f"PARAMETER {key} {'true' if value else 'false'}"
+    return f"PARAMETER {key} {value}"
+
+
+def compile_template(entry, defaults):
+    """生成模板的 Modelfile 正文（不含 FROM 行）"""
+    parameters = dict(defaults.get('parameters', {}))
+    parameters.update(entry.get('parameters', {}))
+    lines = ["", "# 模型参数"]
+    lines += [_format_parameter(key, value) for key, value in parameters.items()]
+    lines += [_format_parameter("stop", stop) for stop in entry.get('stop', [])]
+    system = entry.get('system', defaults.get('system'))
+    if system:
+        lines += ["", "# 系统提示词", f"SYSTEM {_quote(system)}"]
+    if entry.get('template'):
+        lines += ["", f"# {entry['name']} 模板", f"TEMPLATE {_quote(entry['template'])}"]
+    return "\n".join(lines) + "\n"
+
+
+def _tokens(filename):
+    """把文件名拆成小写的词，并加上相邻两个词用 - 连接的形式（用于 code-llama、llama-3 这样的关键字）"""
+    words = [word for word in re.split(r"[^a-z0-9]+", os.path.splitext(filename.lower())[0]) if word]
+    return words + [f"{a}-{b}" for a, b in zip(words, words[1:])]
+
+
+class TemplateRegistry:
+    """按 chat_template 标记、文件名关键字和架构索引的模板集合"""
+
+    def __init__(self, data):
+        self.defaults = data.get('defaults', {})
+        self.entries = {}
+        for entry in data.get('templates', []):
+            self.entries[entry['name']] = entry
+        if DEFAULT_TEMPLATE not in self.entries:
+            raise Exception(f"Modelfile template registry has no '{DEFAULT_TEMPLATE}' template")
+
+        self.compiled = {name: compile_template(entry, self.defaults) for name, entry in self.entries.items()}
+        # 列表中靠前的模板优先：setdefault 保留第一个注册的
+        self.priority = {name: index for index, name in enumerate(self.entries)}
+        # 标记 -> 使用该标记的模板（按列表顺序）；例如 ChatML 的标记由 chatml、qwen 和 yi 共用
+        self.by_marker = {}
+        self.by_architecture = {}
+        self.keywords = []
+        for name, entry in self.entries.items():
+            for marker in entry.get('markers', []):
+                self.by_marker.setdefault(marker, []).append(name)
+            for architecture in entry.get('architectures', []):
+                self.by_architecture.setdefault(architecture.lower(), name)
+            self.keywords += [(keyword.lower(), name) for keyword in entry.get('keywords', [])]
+        # 所有标记合成一个正则，一次扫描找出 chat_template 中出现的全部标记
+        markers = sorted(self.by_marker, key=len, reverse=True)
+        self.marker_pattern = re.compile("|".join(re.escape(marker) for marker in markers)) if markers else None
+
+    @classmethod
+    def load(cls, paths):
+        """依次读取多个JSON文件并合并，后面的文件覆盖前面的"""
+        data = {'defaults': {}, 'templates': []}
+        for path in paths:
+            if not os.path.exists(path):
+                continue
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    extra = json.load(f)
+            except (OSError, ValueError) as e:
+                raise Exception(f"Cannot read Modelfile templates from {path}: {e}")
+            defaults = extra.get('defaults', {})
+            data['defaults'].setdefault('parameters', {}).update(defaults.get('parameters', {}))
+            data['defaults'].update({key: value for key, value in defaults.items() if key != 'parameters'})
+            existing = {entry['name']: entry for entry in data['templates']}
+            for entry in extra.get('templates', []):
+                if entry['name'] in existing:
+                    existing[entry['name']].update(entry)
+                else:
+                    data['templates'].append(dict(entry))
+        return cls(data)
+
+    def resolve(self, metadata=None, filename=""):
+        """根据GGUF元数据和文件名选择模板，返回模板名"""
+        metadata = metadata or {}
+        tokens = _tokens(filename)
+        architecture = metadata.get('general.architecture')
+        architecture = architecture.lower() if isinstance(architecture, str) else None
+        chat_template = metadata.get('tokenizer.chat_template')
+        if self.marker_pattern and isinstance(chat_template, str):
+            found = {match.group(0) for match in self.marker_pattern.finditer(chat_template)}
+            if found:
+                # 优先级最高的标记决定对话格式；多个模板共用这个标记时，由文件名关键字和架构决定用哪一个，
+                # 都不匹配时使用列表中靠前的（通用的）模板
+                names = self.by_marker[min(found, key=lambda marker: self.priority[self.by_marker[marker][0]])]
+                return (self._match_keyword(tokens, names) or self._match_architecture(architecture, names)
+                        or names[0])
+        return self._match_keyword(tokens) or self._match_architecture(architecture) or DEFAULT_TEMPLATE
+
+    def _match_keyword(self, tokens, names=None):
+        for keyword, name in self.keywords:
+            if (names is None or name in names) and any(token.startswith(keyword) for token in tokens):
+                return name
+        return None
+
+    def _match_architecture(self, architecture, names=None):
+        name = self.by_architecture.get(architecture)
+        return name if names is None or name in names else None
+
+    def render(self, name, import_path):
+        """返回完整的 Modelfile 内容"""
+        return f"FROM {import_path}\n" + self.compiled[name]
+
+
+_registry = None
+
+
+def get_registry():
+    """返回注册表，第一次调用时加载内置模板和用户模板"""
+    global _registry
+    if _registry is None:
+        _registry = TemplateRegistry.load([BUNDLED_PATH, os.path.join(get_config_dir(), USER_FILENAME)])
+    return _registry
+
+
+def reload_registry():
+    """丢弃已加载的注册表，下次使用时重新读取（修改用户模板后调用）"""
+    global _registry
+    _registry = None
@@ -0,0 +1,159 @@
+"""后台操作的I/O限速与进程优先级
+
+所有复制、预热和哈希管道在每读取一块数据后调用 bandwidth.consume，共享同一个令牌桶，
+因此限制的是所有后台操作的总带宽。限速值可以随时修改，正在运行的操作立即生效。
+
+开启低优先级后，后台操作所在的线程在开始时把自己设为 nice 10 和 idle 的I/O调度类，
+由它启动的线程和子进程（例如 ollama create）会继承这一优先级。
+"""
+import ctypes
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import threading
+import time
+
+from .config import load_settings, save_setting
+
+NICE_INCREMENT = 10
+
+# ioprio_set 的系统调用号
+_IOPRIO_SET = {"x86_64": 251, "amd64": 251, "aarch64": 30, "arm64": 30, "i386": 289, "i686": 289}
+_IOPRIO_WHO_PROCESS = 1
+_IOPRIO_CLASS_IDLE = 3
+_IOPRIO_CLASS_SHIFT = 13
+# Windows 的后台模式同时降低线程的CPU和I/O优先级
+_THREAD_MODE_BACKGROUND_BEGIN = 0x00010000
+
+
+class TokenBucket:
+    """令牌桶限速器，rate 为每秒字节数，0 表示不限速"""
+
+    def __init__(self, rate=0):
+        self._lock = threading.Lock()
+        self.rate = 0
+        self.tokens = 0.0
+        self._last = time.monotonic()
+        self.set_rate(rate)
+
+    def set_rate(self, rate):
+        """修改速率，正在等待的调用会按新速率继续"""
+        with self._lock:
+            self._refill()
+            self.rate = max(0, rate)
+            # 最多积攒一秒的令牌，避免空闲后出现过大的突发
+            self.tokens = min(self.tokens, self.rate)
+
+    def _refill(self):
+        now = time.monotonic()
+        if self.rate > 0:
+            self.tokens = min(self.rate, self.tokens + (now - self._last) * self.rate)
+        self._last = now
+
+    def consume(self, count):
+        """取走 count 个字节的令牌，令牌不足时等待"""
+        with self._lock:
+            if self.rate <= 0:
+                return
+            self._refill()
+            self.tokens -= count
+        while True:
+            with self._lock:
+                if self.rate <= 0:
+                    self.tokens = max(self.tokens, 0.0)
+                    return
+                self._refill()
+                if self.tokens >= 0:
+                    return
+                wait = -self.tokens / self.rate
+            # 分段等待，限速被调高或取消时能及时响应
+            time.sleep(min(wait, 0.25))
+
+
+    def reserve(self, count):
+        """取走 count 个字节的令牌但不等待，返回令牌恢复为非负还需要等待的秒数
+
+        用于在其他进程中读取的数据：调用方在读取之后扣除，并按返回的时间推迟下一次读取。
+        """
+        with self._lock:
+            if self.rate <= 0:
+                return 0.0
+            self._refill()
+            self.tokens -= count
+            return max(0.0, -self.tokens / self.rate)
+
+
+bandwidth = TokenBucket()
+
+_low_priority = False
+
+
+def set_bandwidth_limit(mb_per_second, persist=False):
+    """设置所有后台I/O的总带宽上限（MB/s），0 表示不限速"""
+    bandwidth.set_rate(int(max(0, mb_per_second) * 1000 * 1000))
+    if persist:
+        save_setting("bandwidth_mb_s", mb_per_second)
+
+
+def bandwidth_limit():
+    """返回当前的带宽上限（MB/s）"""
+    return bandwidth.rate / (1000 * 1000)
+
+
+def set_low_priority(enabled, persist=False):
+    """开启或关闭后台操作的低优先级，对之后开始的操作生效"""
+    global _low_priority
+    _low_priority = bool(enabled)
+    if persist:
+        save_setting("low_priority", _low_priority)
+
+
+def low_priority_enabled():
+    return _low_priority
+
+
+def load_from_settings():
+    """启动时从用户设置中恢复限速和优先级"""
+    settings = load_settings()
+    try:
+        set_bandwidth_limit(float(settings.get("bandwidth_mb_s", 0)))
+    except (TypeError, ValueError):
+        pass
+    set_low_priority(settings.get("low_priority", False))
+
+
+def _set_io_idle(thread_id):
+    number = _IOPRIO_SET.get(platform.machine().lower())
+    if number is not None:
+        libc = ctypes.CDLL(None, use_errno=True)
+        value = _IOPRIO_CLASS_IDLE << _IOPRIO_CLASS_SHIFT
+        if libc.syscall(number, _IOPRIO_WHO_PROCESS, thread_id, value) == 0:
+            return True
+    ionice = shutil.which("ionice")
+    if ionice:
+        return subprocess.run([ionice, "-c", "3", "-p", str(thread_id)], capture_output=True).returncode == 0
+    return False
+
+
+def lower_current_thread_priority():
+    """把当前线程降为低CPU优先级和空闲I/O优先级，返回是否成功"""
+    try:
+        if sys.platform.startswith("linux"):
+            # Linux 上 nice 值和I/O优先级都是按线程设置的
+            thread_id = threading.get_native_id()
+            os.setpriority(os.PRIO_PROCESS, thread_id, min(19, os.getpriority(os.PRIO_PROCESS, thread_id) + NICE_INCREMENT))
+            return _set_io_idle(thread_id)
+        if sys.platform == "win32":
+            kernel32 = ctypes.windll.kernel32
+            return bool(kernel32.SetThreadPriority(kernel32.GetCurrentThread(), _THREAD_MODE_BACKGROUND_BEGIN))
+    except (OSError, AttributeError):
+        pass
+    return False
+
+
+def apply_background_priority():
+    """开启了低优先级时降低当前线程的优先级"""
+    if _low_priority:
+        lower_current_thread_priority()
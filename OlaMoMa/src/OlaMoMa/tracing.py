@@ -0,0 +1,248 @@
+"""操作追踪与指标导出
+
+每个操作都在一个 Span 中执行，记录总耗时、子进程耗时、HTTP耗时、传输字节数、排队时间和结果。
+结束的 Span 以JSON行的形式写入轮转日志（配置目录下的 logs/operations.jsonl），
+同时汇总为Prometheus/OpenMetrics格式的指标：
+
+- OLAMOMA_METRICS_TEXTFILE：每次操作结束后把指标写入该文件（node_exporter textfile collector）
+- OLAMOMA_METRICS_PORT：在该端口提供 /metrics 接口
+"""
+import contextvars
+import json
+import logging
+import logging.handlers
+import os
+import socket
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from .config import get_config_dir
+
+DURATION_BUCKETS = (0.05, 0.1, 0.5, 1, 5, 10, 30, 60, 300, 1800)
+
+# 当前的 Span 随线程和 asyncio 任务传递：gather 创建的子任务和 asyncio.to_thread 都会继承
+_current_span = contextvars.ContextVar('olamoma_span', default=None)
+
+
+class Span:
+    """一次操作的计时记录"""
+
+    def __init__(self, op, queue_wait=0.0, **attrs):
+        self.op = op
+        self.attrs = attrs
+        self.queue_wait = queue_wait
+        self.start = time.time()
+        self.duration = 0.0
+        self.subprocess_time = 0.0
+        self.http_time = 0.0
+        self.bytes = 0
+        self.result = "ok"
+        self.error = None
+        # 并发的子任务（例如多主机列表）可能同时累加
+        self._lock = threading.Lock()
+
+    def add_subprocess_time(self, seconds):
+        with self._lock:
+            self.subprocess_time += seconds
+
+    def add_http_time(self, seconds):
+        with self._lock:
+            self.http_time += seconds
+
+    def add_bytes(self, count):
+        with self._lock:
+            self.bytes += count
+
+    def to_dict(self):
+        return {
+            'ts': datetime.fromtimestamp(self.start, timezone.utc).isoformat(),
+            'host': socket.gethostname(),
+            'op': self.op,
+            'result': self.result,
+            'duration_s': round(self.duration, 6),
+            'subprocess_s': round(self.subprocess_time, 6),
+            'http_s': round(self.http_time, 6),
+            'bytes': self.bytes,
+            'queue_wait_s': round(self.queue_wait, 6),
+            'error': self.error,
+            'attrs': self.attrs,
+        }
+
+
+def current_span():
+    """返回当前线程或 asyncio 任务正在执行的 Span（如果有）"""
+    return _current_span.get()
+
+
+@contextmanager
+def use_span(span):
+    """在其他线程中把耗时计入指定的 Span（例如线程池中的子任务）"""
+    token = _current_span.set(span)
+    try:
+        yield span
+    finally:
+        _current_span.reset(token)
+
+
+@contextmanager
+def timed(kind):
+    """把代码块的耗时计入当前 Span 的子进程或HTTP时间"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        span = current_span()
+        if span is not None:
+            elapsed = time.perf_counter() - start
+            if kind == "subprocess":
+                span.add_subprocess_time(elapsed)
+            else:
+                span.add_http_time(elapsed)
+
+
+class Tracer:
+    """记录 Span 并汇总为指标"""
+
+    def __init__(self, log_path=None, max_bytes=5 * 1024 * 1024, backup_count=5, textfile=None):
+        if log_path is None:
+            log_dir = os.path.join(get_config_dir(), "logs")
+            os.makedirs(log_dir, exist_ok=True)
+            log_path = os.path.join(log_dir, "operations.jsonl")
+        self.log_path = log_path
+        self.textfile = textfile
+        self._logger = logging.getLogger(f"olamoma.trace.{id(self)}")
+        self._logger.propagate = False
+        self._logger.setLevel(logging.INFO)
+        handler = logging.handlers.RotatingFileHandler(log_path, maxBytes=max_bytes,
+                                                       backupCount=backup_count, encoding='utf-8')
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        self._logger.addHandler(handler)
+        self._lock = threading.Lock()
+        # (操作, 结果) -> 汇总数据
+        self._metrics = {}
+        self._server = None
+
+    @contextmanager
+    def span(self, op, queue_wait=0.0, **attrs):
+        """在 Span 中执行代码块，异常会被记录后继续抛出"""
+        span = Span(op, queue_wait, **attrs)
+        token = _current_span.set(span)
+        start = time.perf_counter()
+        try:
+            yield span
+        except BaseException as e:
+            span.result = "error"
+            span.error = str(e)
+            raise
+        finally:
+            span.duration = time.perf_counter() - start
+            _current_span.reset(token)
+            self.record(span)
+
+    def record(self, span):
+        """写入日志并更新指标"""
+        self._logger.info(json.dumps(span.to_dict(), ensure_ascii=False))
+        with self._lock:
+            entry = self._metrics.setdefault((span.op, span.result), {
+                'count': 0, 'duration': 0.0, 'subprocess': 0.0, 'http': 0.0, 'bytes': 0,
+                'queue_wait': 0.0, 'buckets': [0] * len(DURATION_BUCKETS)})
+            entry['count'] += 1
+            entry['duration'] += span.duration
+            entry['subprocess'] += span.subprocess_time
+            entry['http'] += span.http_time
+            entry['bytes'] += span.bytes
+            entry['queue_wait'] += span.queue_wait
+            for i, bound in enumerate(DURATION_BUCKETS):
+                if span.duration <= bound:
+                    entry['buckets'][i] += 1
+        if self.textfile:
+            try:
+                self.write_textfile(self.textfile)
+            except OSError:
+                pass
+
+    def metrics_text(self):
+        """以OpenMetrics文本格式返回指标（同样可被Prometheus解析）"""
+        lines = [
+            "# TYPE olamoma_operation_duration_seconds histogram",
+            "# HELP olamoma_operation_duration_seconds Wall time of OlaMoMa operations.",
+        ]
+        with self._lock:
+            metrics = sorted(self._metrics.items())
+            for (op, result), entry in metrics:
+                labels = f'op="{op}",result="{result}"'
+                for bound, count in zip(DURATION_BUCKETS, entry['buckets']):
+                    lines.append(f'olamoma_operation_duration_seconds_bucket{{{labels},le="{float(bound)}"}} {count}')
+                lines.append(f'olamoma_operation_duration_seconds_bucket{{{labels},le="+Inf"}} {entry["count"]}')
+                lines.append(f"olamoma_operation_duration_seconds_sum{{{labels}}} {entry['duration']:.6f}")
+                lines.append(f"olamoma_operation_duration_seconds_count{{{labels}}} {entry['count']}")
+            for name, key, help_text in (
+                    ("olamoma_operation_subprocess_seconds", 'subprocess', "Time spent in ollama subprocesses."),
+                    ("olamoma_operation_http_seconds", 'http', "Time spent in Ollama HTTP requests."),
+                    ("olamoma_operation_queue_wait_seconds", 'queue_wait', "Time operations waited to start."),
+                    ("olamoma_operation_bytes", 'bytes', "Bytes moved by operations.")):
+                lines.append(f"# TYPE {name} counter")
+                lines.append(f"# HELP {name} {help_text}")
+                for (op, result), entry in metrics:
+                    lines.append(f'{name}_total{{op="{op}",result="{result}"}} {entry[key]}')
+        lines.append("# EOF")
+        return '\n'.join(lines) + '\n'
+
+    def write_textfile(self, path):
+        """原子地写入textfile，避免采集端读到一半的文件"""
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(self.metrics_text())
+        os.replace(temp_path, path)
+
+    def start_http_server(self, port, host="127.0.0.1"):
+        """在后台线程中提供 /metrics 接口"""
+        tracer = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                if self.path.split('?', 1)[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = tracer.metrics_text().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/openmetrics-text; version=1.0.0; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        self._server = ThreadingHTTPServer((host, port), MetricsHandler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self._server
+
+    def stop_http_server(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+_tracer = None
+_tracer_lock = threading.Lock()
+
+
+def get_tracer():
+    """返回全局的 Tracer，首次调用时根据环境变量配置"""
+    global _tracer
+    with _tracer_lock:
+        if _tracer is None:
+            _tracer = Tracer(textfile=os.environ.get("OLAMOMA_METRICS_TEXTFILE") or None)
+            port = os.environ.get("OLAMOMA_METRICS_PORT")
+            if port:
+                try:
+                    _tracer.start_http_server(int(port), os.environ.get("OLAMOMA_METRICS_BIND", "127.0.0.1"))
+                except (OSError, ValueError):
+                    pass
+        return _tracer
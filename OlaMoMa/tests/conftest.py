@@ -0,0 +1,34 @@
+"""测试的公共 fixture 和辅助函数：假的 Ollama 服务器、使用 CLI 模拟程序的 OllamaManager 和不可用的地址"""
+import socket
+
+import pytest
+
+from OlaMoMa.fake_ollama import FakeOllama, FakeOllamaServer, write_cli_shim
+
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    """空的假服务器，OLLAMA_HOST 和 OLLAMA_MODELS 指向它；需要模型的测试在自己的 fixture 中添加"""
+    state = FakeOllama(str(tmp_path / "models"))
+    with FakeOllamaServer(state) as server:
+        monkeypatch.setenv("OLLAMA_HOST", server.url)
+        monkeypatch.setenv("OLLAMA_MODELS", state.models_dir)
+        yield server
+
+
+@pytest.fixture
+def manager(server, tmp_path):
+    """连接到 server 的 OllamaManager，ollama 命令由 CLI 模拟程序代替"""
+    pytest.importorskip("PySide6")
+    from OlaMoMa.app import OllamaManager
+
+    manager = OllamaManager()
+    manager.ollama_path = write_cli_shim(str(tmp_path / "bin"))
+    return manager
+
+
+def unused_url():
+    """返回一个没有服务在监听的本机地址，用于模拟不可用的主机"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return f"http://127.0.0.1:{sock.getsockname()[1]}"
@@ -1,3 +1,49 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from OlaMoMa.records import ModelRecord
+
+
 def test_first():
     """An initial test for the app."""
     assert 1 + 1 == 2
+
+
+def test_switch_language_retranslates_in_place(tmp_path, monkeypatch):
+    pytest.importorskip("PySide6")
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    monkeypatch.setenv("OLAMOMA_HOME", str(tmp_path))
+    # 翻译文件按相对路径加载
+    monkeypatch.chdir(Path(__file__).resolve().parents[2])
+    from PySide6.QtWidgets import QApplication
+    from OlaMoMa.app import MainWindow
+
+    app = QApplication.instance() or QApplication([])
+    window = MainWindow("en")
+    try:
+        window.original_models_data = [ModelRecord.create("llama3.2:3b", "a80c4f17acd5", 2 * 10 ** 9, 0, "local")]
+        window.filter_models()
+        window.model_table.selectRow(0)
+        table, button = window.model_table, window.refresh_button
+        monkeypatch.setattr(window, "load_models", lambda: pytest.fail("switching language reloaded the models"))
+        window.show_status(lambda: window.tr("Exporting model %1...").replace("%1", "llama3.2:3b"))
+
+        window.switch_language("zh")
+        app.processEvents()
+        assert window.refresh_button.text() == "刷新列表"
+        # 状态标签重新生成最后一次的状态，而不是保留英文
+        assert window.status_label.text() == "正在导出模型llama3.2:3b..."
+        assert window.jobs_panel.windowTitle() == "任务"
+        assert window.model_table is table and window.refresh_button is button
+        assert table.rowCount() == 1 and table.selectedItems()
+        assert window.sort_combo.count() == 6
+
+        window.switch_language("en")
+        app.processEvents()
+        assert window.refresh_button.text() == "Refresh List"
+        assert window.status_label.text() == "Exporting model llama3.2:3b..."
+    finally:
+        window.switch_language("en")
+        window.close()
@@ -0,0 +1,105 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+from OlaMoMa import asyncops, cli
+from OlaMoMa.fake_ollama import write_cli_shim
+from OlaMoMa.session import Session
+
+from .conftest import unused_url
+
+
+@pytest.fixture
+def server(server):
+    server.state.add_model("llama3.2:3b", size=2048)
+    server.state.add_model("qwen2.5:7b", size=4096)
+    return server
+
+
+def test_many_calls_share_one_thread(server):
+    server.state.latency["/api/tags"] = 0.3
+    threads = threading.active_count()
+
+    async def main():
+        calls = {i: asyncops.list_host(server.url) for i in range(30)}
+        calls["show"] = asyncops.show(server.url, "qwen2.5:7b")
+        calls["probe"] = asyncops.probe(server.url)
+        return await asyncops.gather(calls)
+
+    start = time.monotonic()
+    results = asyncio.run(main())
+    # 30个各需0.3秒的请求同时进行，也没有为它们创建线程
+    assert time.monotonic() - start < 3
+    assert threading.active_count() <= threads + 1
+    assert all(error is None for _, error in results.values())
+    assert sorted(model.full_name for model in results[0][0]) == ["llama3.2:3b", "qwen2.5:7b"]
+    assert results["show"][0]["details"]["family"] == "llama"
+    assert results["probe"][0] == server.state.version
+
+
+def test_timeouts_are_per_call(server):
+    server.state.latency["/api/ps"] = 2
+
+    async def main():
+        return await asyncops.gather({'slow': asyncops.loaded_models(server.url),
+                                      'fast': asyncops.list_host(server.url)}, timeout=0.5)
+
+    results = asyncio.run(main())
+    assert results['slow'] == (None, "Timed out after 0.5s")
+    assert len(results['fast'][0]) == 2
+
+
+def test_cancel_kills_subprocess():
+    async def main():
+        task = asyncio.ensure_future(asyncops.gather(
+            {'sleep': asyncops.run_cli(sys.executable, "-c", "import time; time.sleep(30)", timeout=60)}))
+        await asyncio.sleep(0.5)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    start = time.monotonic()
+    asyncio.run(main())
+    assert time.monotonic() - start < 5
+
+
+def test_local_list_falls_back_to_cli(server, tmp_path):
+    session = Session(unused_url(), models_dir=server.state.models_dir)
+    shim = write_cli_shim(str(tmp_path / "bin"), server.url)
+    models = asyncio.run(asyncops.list_local(session, ollama_path=shim))
+    assert sorted(model.full_name for model in models) == ["llama3.2:3b", "qwen2.5:7b"]
+    assert not session.detected
+
+
+def test_cli_list_and_probe(server, capsys):
+    down = unused_url()
+    assert cli.main(["list", server.url]) == 0
+    assert "qwen2.5:7b" in capsys.readouterr().out
+    assert cli.main(["probe", server.url, down, "--timeout", "1"]) == 1
+    captured = capsys.readouterr()
+    assert server.state.version in captured.out and down in captured.err
+
+
+def test_bridge_delivers_on_gui_thread(server):
+    pytest.importorskip("PySide6")
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PySide6.QtWidgets import QApplication
+
+    from OlaMoMa.app import async_bridge
+
+    app = QApplication.instance() or QApplication([])
+    results = []
+    async_bridge.submit(asyncops.probe(server.url),
+                        lambda result, error: results.append((result, error, threading.current_thread())))
+    cancelled = async_bridge.submit(asyncio.sleep(30), lambda result, error: results.append("cancelled"))
+    cancelled.cancel()
+    deadline = time.monotonic() + 5
+    while not results and time.monotonic() < deadline:
+        # 只投递排队的信号，不触发其他测试留下的定时器
+        app.sendPostedEvents()
+        time.sleep(0.01)
+    assert results == [(server.state.version, None, threading.main_thread())]
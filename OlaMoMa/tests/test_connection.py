@@ -0,0 +1,100 @@
+import asyncio
+
+import pytest
+
+from OlaMoMa import asyncops, connection
+from OlaMoMa.api import OllamaClient
+from OlaMoMa.connection import OFFLINE, ONLINE, ConnectionManager, ServiceUnavailable
+from OlaMoMa.fake_ollama import FakeOllama, FakeOllamaServer
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def server(tmp_path):
+    state = FakeOllama(str(tmp_path / "models"))
+    with FakeOllamaServer(state) as server:
+        yield server
+
+
+def version_requests(server):
+    return [path for _, path in server.state.requests if path == "/api/version"]
+
+
+def test_check_is_cached_for_ttl(server):
+    clock = FakeClock()
+    manager = ConnectionManager(server.url, ttl=5, clock=clock)
+    for _ in range(10):
+        manager.ensure_online()
+    assert len(version_requests(server)) == 1
+    assert manager.state == ONLINE and manager.version
+
+    clock.now += 6
+    manager.ensure_online()
+    assert len(version_requests(server)) == 2
+
+
+def test_breaker_fails_fast_and_backs_off(server):
+    clock = FakeClock()
+    url = server.url
+    server.stop()
+    manager = ConnectionManager(url, backoff=1, max_backoff=4, clock=clock)
+
+    with pytest.raises(ServiceUnavailable):
+        manager.ensure_online()
+    assert manager.state == OFFLINE and manager.retry_at == clock.now + 1
+    # 退避时间内不再发出请求，失败次数不变
+    with pytest.raises(ServiceUnavailable, match="retrying in"):
+        manager.ensure_online()
+    assert manager.failures == 1
+
+    for expected in (2, 4, 4):
+        clock.now = manager.retry_at
+        assert not manager.check()
+        assert manager.retry_at - clock.now == expected
+
+
+def test_recovers_and_follows_client_traffic(server):
+    seen = []
+
+    def listener(c):
+        seen.append((c.base_url, c.state))
+
+    connection.add_listener(listener)
+    try:
+        manager = connection.get_connection(server.url)
+        assert connection.get_connection(server.url + "/") is manager
+        manager.record_failure("connection refused")
+        assert manager.is_open()
+
+        # 普通请求成功后状态恢复为在线，不需要额外的健康检查
+        OllamaClient(server.url).list_models()
+        assert manager.state == ONLINE and not manager.is_open()
+        assert [state for url, state in seen if url == manager.base_url] == [OFFLINE, ONLINE]
+
+        url = server.url
+        server.stop()
+        with pytest.raises(Exception):
+            OllamaClient(url).list_models()
+        assert manager.state == OFFLINE and manager.is_open()
+    finally:
+        connection.remove_listener(listener)
+
+
+def test_slow_request_does_not_open_breaker(server):
+    manager = connection.get_connection(server.url)
+    OllamaClient(server.url).version()
+    # 服务器在忙：请求超时，但连接已经建立，服务器仍然在线
+    server.state.set_latency(1.0, path="/api/tags")
+    with pytest.raises(Exception, match="timed out"):
+        OllamaClient(server.url, timeout=0.2).list_models()
+    with pytest.raises(Exception, match="Timeout"):
+        asyncio.run(asyncops.list_host(server.url, timeout=0.2))
+    assert manager.state == ONLINE and not manager.is_open()
+    manager.ensure_online()
@@ -0,0 +1,74 @@
+import asyncio
+
+import pytest
+
+from OlaMoMa import deploy as deploy_module
+from OlaMoMa.deploy import deploy, format_deploy_report, plan_deploy
+from OlaMoMa.fake_ollama import FakeOllama, FakeOllamaServer
+
+from .conftest import unused_url
+
+SIZE = 3 * 1024 * 1024 + 17
+
+
+@pytest.fixture
+def source(tmp_path):
+    state = FakeOllama(str(tmp_path / "source"))
+    state.add_model("tuned:q4", size=SIZE, template="{{ .System }} {{ .Prompt }}")
+    return state
+
+
+@pytest.fixture
+def targets(tmp_path):
+    servers = [FakeOllamaServer(FakeOllama(str(tmp_path / f"target{i}"))).start() for i in range(3)]
+    yield servers
+    for server in servers:
+        server.stop()
+
+
+def test_plan_sends_small_layers_as_fields(source):
+    uploads, request = plan_deploy(source.models_dir, "tuned:q4", "tuned:prod")
+    model = source.get_model("tuned:q4")
+    assert [blob['digest'] for blob in uploads] == [model['layers'][0]['digest']]
+    assert request['model'] == "tuned:prod" and request['template'] == "{{ .System }} {{ .Prompt }}"
+    assert list(request['files'].values()) == [model['layers'][0]['digest']]
+
+
+def test_deploy_uploads_missing_layers_once(source, targets, monkeypatch):
+    # 第一个主机已经有这个模型的权重层
+    with open(deploy_module.model_blobs(source.models_dir, "tuned:q4")[0]['path'], 'rb') as f:
+        targets[0].state.write_blob(f.read())
+    read = []
+    real_read = deploy_module._read_chunk
+    monkeypatch.setattr(deploy_module, "_read_chunk", lambda f: read.append(len(chunk := real_read(f))) or chunk)
+    monkeypatch.setattr(deploy_module, "UPLOAD_CHUNK_SIZE", 1024 * 1024)
+    hosts = {f"box{i}": server.url for i, server in enumerate(targets)}
+    hosts["down"] = unused_url()
+    updates = []
+
+    results = asyncio.run(deploy(source.models_dir, "tuned:q4", hosts,
+                                 progress=lambda *args: updates.append(args)))
+
+    # 源文件只读了一遍，同时发给了两个缺少该层的主机
+    assert sum(read) == SIZE
+    assert results["box0"] == {'uploaded': 0, 'existing': 1, 'bytes': 0, 'error': None}
+    assert results["box1"]['uploaded'] == results["box2"]['uploaded'] == 1
+    assert results["down"]['error']
+    for server in targets:
+        requests = server.state.requests
+        assert server.state.get_model("tuned:q4")['template'] == "{{ .System }} {{ .Prompt }}"
+        # manifest 最后创建
+        assert requests[-1] == ("POST", "/api/create")
+        assert (("POST", "/api/blobs") in [(m, p[:10]) for m, p in requests]) == (server is not targets[0])
+    assert ("upload", SIZE, SIZE) in updates
+    assert "down: failed" in format_deploy_report(results)
+
+
+def test_failing_host_gets_no_model(source, targets):
+    targets[1].state.fail("/api/blobs", status=500, times=None)
+    hosts = {"ok": targets[0].url, "broken": targets[1].url}
+    results = asyncio.run(deploy(source.models_dir, "tuned:q4", hosts))
+    assert results["ok"]['error'] is None and "500" in results["broken"]['error']
+    assert targets[0].state.get_model("tuned:q4")
+    assert not targets[1].state.get_model("tuned:q4")
+    assert ("POST", "/api/create") not in targets[1].state.requests
@@ -0,0 +1,49 @@
+import os
+
+import pytest
+
+from OlaMoMa import fileio
+
+pytest.importorskip("PySide6")
+from OlaMoMa.app import MODELFILE_ALLOWANCE  # noqa: E402
+
+
+@pytest.fixture
+def server(server):
+    server.state.add_model("llama3.2:3b", size=300 * 1024)
+    server.state.add_model("qwen2.5:7b", size=200 * 1024)
+    return server
+
+
+def test_export_checks_free_space_first(tmp_path, manager, monkeypatch):
+    target = tmp_path / "out" / "llama.gguf"
+    with monkeypatch.context() as m:
+        m.setattr(fileio, "free_space", lambda path: 100 * 1024)
+        with pytest.raises(Exception, match="Not enough free space"):
+            manager.export_model("llama3.2:3b", str(target))
+    assert not target.exists()
+
+    manager.export_model("llama3.2:3b", str(target))
+    assert target.stat().st_size == 300 * 1024
+
+
+def test_batch_export_plan(tmp_path, manager, monkeypatch):
+    items = [("llama3.2:3b", str(tmp_path / "out" / "a.gguf")), ("qwen2.5:7b", str(tmp_path / "out" / "b.gguf"))]
+    plan = manager.plan_exports(items)
+    assert [size for _, _, size in plan] == [300 * 1024 + MODELFILE_ALLOWANCE, 200 * 1024 + MODELFILE_ALLOWANCE]
+
+    # 单个模型放得下，但两个加起来放不下
+    monkeypatch.setattr(fileio, "free_space", lambda path: 2 * MODELFILE_ALLOWANCE + 400 * 1024)
+    with pytest.raises(Exception, match="Not enough free space"):
+        manager.plan_exports(items)
+
+
+def test_failed_copy_removes_partial_file(tmp_path, monkeypatch):
+    src, dst = tmp_path / "src.gguf", tmp_path / "dst.gguf"
+    src.write_bytes(os.urandom(256 * 1024))
+    monkeypatch.setattr(fileio, "CHUNK_SIZE", 64 * 1024)
+    calls = []
+    with pytest.raises(Exception, match="cancelled"):
+        fileio.copy_file(str(src), str(dst), progress=lambda done, total: calls.append(done),
+                         cancelled=lambda: len(calls) >= 2)
+    assert not dst.exists()
@@ -0,0 +1,53 @@
+import os
+import time
+
+import pytest
+
+from OlaMoMa.api import OllamaClient
+
+pytest.importorskip("PySide6")
+
+
+@pytest.fixture
+def server(server):
+    server.state.add_model("llama3.2:3b", size=4096)
+    return server
+
+
+def test_cli_roundtrip(manager, tmp_path):
+    assert [m.full_name for m in manager.list_models()] == ["llama3.2:3b"]
+
+    export_path = str(tmp_path / "out" / "llama.gguf")
+    manager.export_model("llama3.2:3b", export_path)
+    assert os.path.getsize(export_path) == 4096
+
+    manager.import_model(export_path, "copy")
+    manager.update_model("copy:latest")
+    names = {m.full_name for m in manager.list_models()}
+    assert names == {"llama3.2:3b", "copy:latest"}
+
+    manager.delete_model("copy:latest")
+    assert [m.full_name for m in manager.list_models()] == ["llama3.2:3b"]
+
+
+def test_injected_failure_and_latency(server, manager):
+    server.state.fail("/api/tags", status=500, message="boom")
+    with pytest.raises(Exception, match="boom"):
+        manager.list_models()
+    assert manager.list_models()
+
+    server.state.set_latency(0.2, "/api/version")
+    start = time.perf_counter()
+    OllamaClient(server.url).version()
+    assert time.perf_counter() - start >= 0.2
+
+
+def test_streaming_pull_and_large_listing(server):
+    client = OllamaClient(server.url)
+    events = list(client.stream("POST", "/api/pull", {'model': "qwen2.5:7b"}))
+    completed = [e['completed'] for e in events if 'completed' in e]
+    assert completed == sorted(completed) and completed[-1] == events[1]['total']
+    assert events[-1]['status'] == "success"
+
+    server.state.populate(5000)
+    assert len(client.list_models()) == 5002
@@ -0,0 +1,89 @@
+import os
+
+import pytest
+
+from OlaMoMa import fileio
+from OlaMoMa.pagecache import resident_bytes
+
+
+@pytest.fixture
+def small_windows(monkeypatch):
+    monkeypatch.setattr(fileio, "CHUNK_SIZE", 64 * 1024)
+    monkeypatch.setattr(fileio, "WINDOW_SIZE", 256 * 1024)
+
+
+def write_file(path, size):
+    data = os.urandom(size)
+    path.write_bytes(data)
+    os.utime(path, (1_600_000_000, 1_600_000_000))
+    return data
+
+
+def test_copy_file(tmp_path, small_windows):
+    src, dst = tmp_path / "src.gguf", tmp_path / "dst.gguf"
+    data = write_file(src, 1024 * 1024 + 4321)
+    updates = []
+
+    assert fileio.copy_file(str(src), str(dst), progress=lambda done, total: updates.append(done)) == len(data)
+    assert dst.read_bytes() == data
+    assert os.path.getmtime(dst) == 1_600_000_000
+    assert updates[-1] == len(data)
+
+    with pytest.raises(Exception, match="cancelled"):
+        fileio.copy_file(str(src), str(dst), cancelled=lambda: True)
+
+
+@pytest.mark.skipif(not hasattr(os, "posix_fadvise") or resident_bytes(__file__) is None,
+                    reason="posix_fadvise and mincore are not available")
+def test_copy_leaves_page_cache_alone(tmp_path, small_windows):
+    cold, hot = tmp_path / "cold.gguf", tmp_path / "hot.gguf"
+    size = 2 * 1024 * 1024
+    write_file(cold, size)
+    write_file(hot, size)
+    with open(cold, 'rb+') as f:
+        os.fsync(f.fileno())
+    fileio.drop_cache(str(cold))
+    hot.read_bytes()
+    assert resident_bytes(str(cold)) < size // 2
+    assert fileio.mostly_resident(str(hot))
+
+    fileio.copy_file(str(cold), str(tmp_path / "cold-copy.gguf"))
+    fileio.copy_file(str(hot), str(tmp_path / "hot-copy.gguf"))
+
+    # 未缓存的源文件和目标文件都不会留在页缓存中，已缓存的源文件保持不变
+    assert resident_bytes(str(cold)) < size // 2
+    assert resident_bytes(str(tmp_path / "cold-copy.gguf")) < size // 2
+    assert resident_bytes(str(hot)) == size
+
+
+@pytest.mark.skipif(not hasattr(os, "posix_fadvise") or resident_bytes(__file__) is None,
+                    reason="posix_fadvise and mincore are not available")
+def test_digest_drops_cache_behind_reads(tmp_path, small_windows, monkeypatch):
+    from OlaMoMa import hashing
+    from OlaMoMa.hashing import file_digest
+
+    monkeypatch.setattr(hashing, "CHUNK_SIZE", 64 * 1024)
+
+    cold, hot = tmp_path / "cold.gguf", tmp_path / "hot.gguf"
+    size = 2 * 1024 * 1024
+    write_file(cold, size)
+    write_file(hot, size)
+    with open(cold, 'rb+') as f:
+        os.fsync(f.fileno())
+    fileio.drop_cache(str(cold))
+    hot.read_bytes()
+
+    with fileio.DropBehind(str(cold)) as cold_cache:
+        file_digest(str(cold), drop_behind=cold_cache)
+        # 读完的窗口在读取过程中就被丢弃，不必等到结束
+        assert resident_bytes(str(cold)) < size // 2
+    with fileio.DropBehind(str(hot)) as hot_cache:
+        file_digest(str(hot), drop_behind=hot_cache)
+    assert resident_bytes(str(hot)) == size
+
+    # 取消时 finish() 同样丢弃已经读过的部分；先完整读一遍，避免取消时还在进行的预读留下页
+    with pytest.raises(Exception, match="cancelled"):
+        with fileio.DropBehind(str(cold)) as cold_cache:
+            cold.read_bytes()
+            file_digest(str(cold), cancelled=lambda: True, drop_behind=cold_cache)
+    assert resident_bytes(str(cold)) < size // 2
@@ -0,0 +1,104 @@
+import os
+import struct
+
+import pytest
+
+from OlaMoMa import gguf
+from OlaMoMa.folderimport import find_gguf_files, plan_folder_import, run_folder_import, summarize
+
+
+def pack_string(text):
+    data = text.encode('utf-8')
+    return struct.pack("<Q", len(data)) + data
+
+
+def pack_value(value):
+    if isinstance(value, str):
+        return struct.pack("<I", 8) + pack_string(value)
+    if isinstance(value, list):
+        return struct.pack("<IIQ", 9, 8, len(value)) + b"".join(pack_string(item) for item in value)
+    return struct.pack("<II", 4, value)
+
+
+def write_gguf(path, metadata, payload=b""):
+    """写入只有元数据的GGUF文件，payload 代替张量数据"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(b"GGUF" + struct.pack("<IQQ", 3, 0, len(metadata)))
+        for key, value in metadata.items():
+            f.write(pack_string(key) + pack_value(value))
+        f.write(payload)
+    return str(path)
+
+
+def test_read_metadata(tmp_path):
+    tokens = [f"t{i}" for i in range(1000)]
+    path = write_gguf(tmp_path / "m.gguf", {
+        'general.architecture': "qwen2", 'general.basename': "Qwen2.5-Coder", 'general.size_label': "7B",
+        'general.finetune': "Instruct", 'general.file_type': 15, 'tokenizer.ggml.tokens': tokens,
+        'tokenizer.chat_template': "{{ messages }}"})
+
+    version, tensors, metadata = gguf.read_metadata(path)
+    assert (version, tensors) == (3, 0)
+    assert metadata['general.architecture'] == "qwen2"
+    assert metadata['tokenizer.ggml.tokens'] == {'type': 8, 'length': 1000}
+    assert metadata['tokenizer.chat_template'] == "{{ messages }}"
+    assert gguf.model_name(metadata, path) == "qwen2.5-coder:7b-instruct-q4_k_m"
+    assert gguf.model_name({}, str(tmp_path / "My Model-00001-of-00002.gguf")) == "my-model:latest"
+
+    (tmp_path / "bad.gguf").write_bytes(b"nope")
+    with pytest.raises(Exception, match="Not a GGUF file"):
+        gguf.read_metadata(str(tmp_path / "bad.gguf"))
+
+
+def make_folder(root):
+    write_gguf(root / "a" / "llama.gguf", {'general.basename': "Llama-3.2", 'general.size_label': "3B",
+                                            'general.file_type': 7}, b"weights-a")
+    write_gguf(root / "a" / "deep" / "phi.gguf", {'general.name': "Phi 3 Mini"}, b"weights-b")
+    # 与 llama.gguf 内容相同
+    write_gguf(root / "b" / "llama-copy.gguf", {'general.basename': "Llama-3.2", 'general.size_label': "3B",
+                                                 'general.file_type': 7}, b"weights-a")
+    write_gguf(root / "b" / "part-00002-of-00002.gguf", {'split.count': 2}, b"tail")
+    (root / "b" / "broken.gguf").write_bytes(b"GGUF")
+    (root / ".hidden").mkdir()
+    write_gguf(root / ".hidden" / "x.gguf", {}, b"hidden")
+
+
+def test_plan_and_run_folder_import(tmp_path, server):
+    root = tmp_path / "downloads"
+    make_folder(root)
+    assert len(find_gguf_files(str(root))) == 5
+
+    entries = plan_folder_import(str(root))
+    actions = {os.path.relpath(entry['path'], root): entry['action'] for entry in entries}
+    assert actions == {"a/llama.gguf": 'import', "a/deep/phi.gguf": 'import', "b/llama-copy.gguf": 'skip',
+                       "b/part-00002-of-00002.gguf": 'error', "b/broken.gguf": 'error'}
+
+    imported = []
+    run_folder_import(entries, lambda path, name, digest: imported.append((name, digest)), concurrency=2)
+    assert sorted(name for name, _ in imported) == ["llama-3.2:3b-q8_0", "phi-3-mini:latest"]
+    assert summarize(entries).splitlines()[0] == "2 failed, 2 imported, 1 skipped"
+
+    # 导入过的blob在下一次扫描时被跳过
+    server.state.write_blob(open(root / "a" / "llama.gguf", 'rb').read())
+    entries = plan_folder_import(str(root), existing_names=["llama-3.2:3b-q8_0"])
+    actions = {os.path.basename(entry['path']): entry['action'] for entry in entries}
+    assert (actions["llama.gguf"], actions["phi.gguf"]) == ('skip', 'import')
+
+
+def test_same_name_with_different_content_is_imported(tmp_path, server):
+    # 另一个量化版本得到相同的名称，但内容不同，不能按名称跳过
+    root = tmp_path / "downloads"
+    write_gguf(root / "phi.gguf", {'general.name': "Phi 3 Mini"}, b"requantized")
+    entries = plan_folder_import(str(root), existing_names=["phi-3-mini:latest"])
+    assert [(entry['action'], entry['name']) for entry in entries] == [('import', "phi-3-mini-2:latest")]
+
+
+def test_import_folder_end_to_end(tmp_path, manager):
+    root = tmp_path / "downloads"
+    make_folder(root)
+    entries = run_folder_import(plan_folder_import(str(root)),
+                                lambda path, name, digest: manager.import_model(path, name, digest=digest))
+    assert [entry['status'] for entry in entries].count('imported') == 2
+    names = {model.full_name for model in manager.list_models()}
+    assert names == {"llama-3.2:3b-q8_0", "phi-3-mini:latest"}
@@ -0,0 +1,90 @@
+import hashlib
+import os
+import time
+
+import pytest
+
+from OlaMoMa import cli, hashing
+from OlaMoMa.fake_ollama import FakeOllama
+from OlaMoMa.manifests import model_blobs
+from OlaMoMa.throttle import TokenBucket
+
+
+@pytest.fixture(params=["thread", "pool"])
+def engine(request, monkeypatch):
+    if request.param == "thread":
+        return hashing.HashEngine(workers=1)
+    # 去掉阈值，让小文件也经过进程池
+    monkeypatch.setattr(hashing, "POOL_THRESHOLD", 0)
+    return hashing.HashEngine(workers=2)
+
+
+def test_hash_files(tmp_path, engine):
+    paths = []
+    for index, size in enumerate([0, 1, 3 * 1024 * 1024 + 7]):
+        path = tmp_path / f"{index}.bin"
+        path.write_bytes(os.urandom(size))
+        paths.append(str(path))
+    updates = []
+
+    digests = engine.hash_files(paths, progress=lambda done, total: updates.append((done, total)))
+
+    for path in paths:
+        assert digests[path] == "sha256:" + hashlib.sha256(open(path, 'rb').read()).hexdigest()
+        assert digests[path] == hashing.file_digest(path)
+    total = sum(os.path.getsize(path) for path in paths)
+    assert updates[-1] == (total, total)
+
+
+def test_hash_tree_finds_corrupted_chunk(tmp_path, engine):
+    path = tmp_path / "model.gguf"
+    data = bytearray(os.urandom(5 * 1024 * 1024 + 100))
+    path.write_bytes(data)
+    chunk_size = 1024 * 1024
+
+    tree = engine.hash_tree(str(path), chunk_size=chunk_size)
+    assert len(tree['chunks']) == 6
+    assert tree['chunks'][5] == hashlib.sha256(data[5 * chunk_size:]).hexdigest()
+    assert engine.verify_tree(str(path), tree) == []
+
+    data[3 * chunk_size + 10] ^= 0xFF
+    path.write_bytes(data)
+    assert engine.verify_tree(str(path), tree) == [3]
+
+
+def test_limited_hash_reads_at_the_limit_and_can_be_cancelled(tmp_path, engine, monkeypatch):
+    rate = 32 * 1024 * 1024
+    monkeypatch.setattr(hashing, "bandwidth", TokenBucket(rate))
+    paths = []
+    for i in range(2):
+        paths.append(str(tmp_path / f"blob{i}"))
+        with open(paths[-1], 'wb') as f:
+            f.write(os.urandom(32 * 1024 * 1024))
+
+    start = time.monotonic()
+    engine.hash_files(paths)
+    # 每个工作进程最多提前读取一块，其余的读取受限速控制
+    assert time.monotonic() - start >= (64 * 1024 * 1024 - 2 * hashing.CHUNK_SIZE) / rate * 0.9
+
+    # 读到第一个文件中间时取消，不必等剩下的限速时间
+    updates = []
+    start = time.monotonic()
+    with pytest.raises(Exception, match="cancelled"):
+        engine.hash_files(paths, progress=lambda done, total: updates.append(done),
+                          cancelled=lambda: bool(updates) and updates[-1] >= hashing.CHUNK_SIZE)
+    assert time.monotonic() - start < 1.5
+    assert updates[-1] < 32 * 1024 * 1024
+
+
+def test_verify_model_blobs(tmp_path, capsys):
+    state = FakeOllama(str(tmp_path))
+    state.add_model("llama3.2:3b", size=64 * 1024)
+    blobs = model_blobs(str(tmp_path), "llama3.2:3b")
+    assert all(result['ok'] for result in hashing.verify_blobs(blobs))
+    assert cli.main(["verify", "--all", "--models-dir", str(tmp_path)]) == 0
+
+    with open(blobs[0]['path'], 'r+b') as f:
+        f.write(b"XXXX")
+    assert [result['ok'] for result in hashing.verify_blobs(blobs)][0] is False
+    assert cli.main(["verify", "llama3.2:3b", "--models-dir", str(tmp_path)]) == 1
+    assert "CORRUPT" in capsys.readouterr().out
@@ -0,0 +1,41 @@
+from OlaMoMa.api import normalize_host
+from OlaMoMa.hosts import LOCAL_HOST, HostRegistry, MultiHostLister
+from OlaMoMa.records import ModelRecord
+
+
+class StubManager:
+    def list_models(self):
+        return [ModelRecord.create('llama3.2:3b', 'a80c4f17acd5', 2 * 10 ** 9, 1700000000)]
+
+    async def list_models_async(self):
+        return self.list_models()
+
+
+def test_normalize_host():
+    assert normalize_host("gpu-box") == "http://gpu-box:11434"
+    assert normalize_host("0.0.0.0:8080") == "http://127.0.0.1:8080"
+    # 写了协议时与 Ollama 一样使用协议的默认端口，便于登记反向代理后面的服务器
+    assert normalize_host("https://example.com/ollama/") == "https://example.com:443/ollama"
+    assert normalize_host("http://example.com") == "http://example.com:80"
+    assert normalize_host("http://[::1]") == "http://[::1]:80"
+    assert normalize_host("[::1]") == "http://[::1]:11434"
+    assert normalize_host("http://[::]:9000") == "http://[::1]:9000"
+
+
+def test_registry_roundtrip(tmp_path):
+    registry = HostRegistry(str(tmp_path / "hosts.json"))
+    registry.add("box", "10.0.0.2")
+    assert HostRegistry(registry.path).names() == [LOCAL_HOST, "box"]
+
+
+def test_unreachable_host_keeps_other_results(tmp_path):
+    registry = HostRegistry(str(tmp_path / "hosts.json"))
+    registry.add("down", "127.0.0.1:9")
+    lister = MultiHostLister(registry, StubManager, timeout=1)
+
+    errors = lister.fetch_all()
+
+    assert list(errors) == ["down"]
+    models = lister.cached_models()
+    assert [m.host for m in models] == [LOCAL_HOST]
+    assert lister.cached_models("down") == []
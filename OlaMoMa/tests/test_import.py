@@ -0,0 +1,66 @@
+import os
+
+import pytest
+
+from OlaMoMa.hashing import file_digest
+from OlaMoMa.manifests import blob_path
+from OlaMoMa.session import get_session
+
+pytest.importorskip("PySide6")
+
+
+@pytest.fixture
+def gguf(tmp_path):
+    path = tmp_path / "src" / "tiny-model.gguf"
+    path.parent.mkdir()
+    path.write_bytes(b"GGUF" + os.urandom(64 * 1024))
+    (tmp_path / "src" / "tiny-model.modelfile").write_text(
+        'FROM ./tiny-model.gguf\nTEMPLATE """{{ .Prompt }}"""\nPARAMETER temperature 0.5\n', encoding='utf-8')
+    return str(path)
+
+
+def test_link_import_shares_the_source_file(manager, server, gguf):
+    assert manager.import_model(gguf, "tiny")
+
+    digest = file_digest(gguf)
+    blob = blob_path(server.state.models_dir, digest)
+    # reflink 得到独立的inode，硬链接与源文件共用inode；两种情况下都不应出现部分写入的临时文件
+    assert open(blob, 'rb').read() == open(gguf, 'rb').read()
+    assert not [name for name in os.listdir(os.path.dirname(blob)) if "-partial-" in name]
+    assert ("POST", f"/api/blobs/{digest}") not in server.state.requests
+    model = server.state.get_model("tiny")
+    assert model['layers'][0]['digest'] == digest
+    assert model['parameters'] == {'temperature': 0.5}
+
+    # 同一个文件再导入一次时直接使用已有的blob
+    assert manager.import_model(gguf, "tiny-copy")
+    assert server.state.get_model("tiny-copy")['layers'][0]['digest'] == digest
+
+
+def test_uploads_when_server_uses_another_models_dir(manager, server, gguf, tmp_path):
+    other = tmp_path / "other-models"
+    (other / "blobs").mkdir(parents=True)
+    # 模型目录在会话创建时确定
+    manager.session = get_session(models_dir=str(other))
+
+    stages = []
+    assert manager.import_model(gguf, "tiny", progress=lambda stage, done, total: stages.append((stage, done, total)))
+    assert os.listdir(other / "blobs") == []
+    assert stages[-1] == ("upload", os.path.getsize(gguf), os.path.getsize(gguf))
+    assert ("POST", f"/api/blobs/{file_digest(gguf)}") in server.state.requests
+
+
+def test_reimport_of_known_weights_skips_upload(manager, server, tmp_path, monkeypatch):
+    server.state.add_model("llama3.2:3b", size=256 * 1024)
+    export_path = str(tmp_path / "out" / "llama.gguf")
+    manager.export_model("llama3.2:3b", export_path)
+    # 模拟远程服务器：本机的模型目录与服务器无关，只能通过API判断blob是否存在
+    monkeypatch.setenv("OLLAMA_MODELS", str(tmp_path / "elsewhere"))
+
+    stages = []
+    assert manager.import_model(export_path, "llama-copy", progress=lambda stage, done, total: stages.append(stage))
+    digest = server.state.get_model("llama3.2:3b")['layers'][0]['digest']
+    assert server.state.get_model("llama-copy")['layers'][0]['digest'] == digest
+    assert ("HEAD", f"/api/blobs/{digest}") in server.state.requests
+    assert ("POST", f"/api/blobs/{digest}") not in server.state.requests
+    assert set(stages) == {"hash"}
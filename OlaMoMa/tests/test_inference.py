@@ -0,0 +1,21 @@
+from OlaMoMa.api import OllamaClient
+from OlaMoMa.fake_ollama import FakeOllama, FakeOllamaServer
+from OlaMoMa.inference import BenchmarkHistory, benchmark_model
+
+
+def test_benchmark_against_fake_server(tmp_path):
+    state = FakeOllama(str(tmp_path / "models"))
+    state.add_model("qwen2.5:7b-q4_K_M")
+    with FakeOllamaServer(state) as server:
+        result = benchmark_model(OllamaClient(server.url), "qwen2.5:7b-q4_K_M",
+                                 prompts=["one two three", "four five"], num_predict=20)
+
+    assert result['prompts'] == 2
+    assert result['load_s'] == 0.05  # 第一次请求需要加载模型
+    assert result['gen_tps'] == 100.0  # 模拟服务器每个token 10ms
+    assert result['prompt_tps'] == 5 / 0.06
+    assert 0 < result['ttft_s'] < result['total_s']
+
+    history = BenchmarkHistory(str(tmp_path / "history.sqlite"))
+    history.add(result)
+    assert history.rows()[0]['model'] == "qwen2.5:7b-q4_K_M"
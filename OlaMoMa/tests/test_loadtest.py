@@ -0,0 +1,46 @@
+import csv
+
+from OlaMoMa import cli
+from OlaMoMa.fake_ollama import FakeOllama, FakeOllamaServer
+from OlaMoMa.loadtest import percentile, run_load_test, write_csv
+
+
+def test_percentile_nearest_rank():
+    values = list(range(1, 101))
+    assert percentile(values, 0.50) == 50
+    assert percentile(values, 0.95) == 95
+    assert percentile(values, 0.99) == 99
+    assert percentile([3.0], 0.99) == 3.0
+    assert percentile([], 0.5) == 0.0
+
+
+def test_load_test_against_fake_server(tmp_path, capsys):
+    state = FakeOllama(str(tmp_path / "models"))
+    state.add_model("qwen2.5:7b")
+    state.set_latency(0.05, path="/api/generate")
+    with FakeOllamaServer(state) as server:
+        rows = run_load_test(server.url, "qwen2.5:7b", levels=[1, 4], requests=8, num_predict=4)
+        missing = run_load_test(server.url, "missing:latest", levels=[2], requests=2)
+
+        csv_path = tmp_path / "report.csv"
+        exit_code = cli.main(["loadtest", "qwen2.5:7b", "--host", server.url, "--concurrency", "2",
+                              "--requests", "4", "--csv", str(csv_path)])
+
+    assert [row['concurrency'] for row in rows] == [1, 4]
+    assert all(row['errors'] == 0 and row['p50_s'] >= 0.05 for row in rows)
+    assert rows[0]['p50_s'] <= rows[0]['p95_s'] <= rows[0]['p99_s']
+    # 4个并发请求同时执行，吞吐量明显高于串行
+    assert rows[1]['requests_per_s'] > rows[0]['requests_per_s'] * 2
+    assert rows[0]['tokens_per_s'] > 0
+
+    assert missing[0]['error_rate'] == 1.0
+    assert "not found" in missing[0]['first_error']
+
+    assert exit_code == 0
+    assert "p95" in capsys.readouterr().out
+    with open(csv_path, newline='', encoding='utf-8') as f:
+        report = list(csv.DictReader(f))
+    assert report[0]['concurrency'] == "2" and report[0]['errors'] == "0"
+
+    write_csv(rows, tmp_path / "rows.csv")
+    assert (tmp_path / "rows.csv").read_text(encoding='utf-8').startswith("concurrency,rate,requests")
@@ -0,0 +1,59 @@
+import time
+
+import pytest
+
+from OlaMoMa.api import OllamaClient, format_processor
+from OlaMoMa.fake_ollama import FakeOllama, FakeOllamaServer
+from OlaMoMa.monitor import AdaptiveInterval, duration_seconds, format_remaining, parse_keep_alive
+
+
+def test_keep_alive_parsing():
+    assert parse_keep_alive("300") == 300
+    assert parse_keep_alive("-1") == -1
+    assert parse_keep_alive(" 1h30m ") == "1h30m"
+    assert duration_seconds("1h30m") == 5400
+    assert duration_seconds("-1s") == -1
+    assert duration_seconds(0) == 0
+    with pytest.raises(Exception):
+        parse_keep_alive("soon")
+
+
+def test_formatting():
+    assert format_processor(100, 100) == "100% GPU"
+    assert format_processor(100, 0) == "100% CPU"
+    assert format_processor(100, 52) == "48%/52% CPU/GPU"
+    assert format_remaining(None) == "Forever"
+    assert format_remaining(45) == "45 seconds"
+    assert format_remaining(300) == "5 minutes"
+    assert format_remaining(7200) == "2 hours"
+
+
+def test_adaptive_interval():
+    interval = AdaptiveInterval(minimum=2, maximum=30)
+    assert interval.next(changed=True) == 2
+    assert [interval.next(changed=False) for _ in range(5)] == [4, 8, 16, 30, 30]
+    # 模型即将到期时提前刷新
+    assert interval.next(changed=False, until_expiry=5) == 6
+    assert interval.next(changed=False, until_expiry=-3) == 2
+    interval.reset()
+    assert interval.next(changed=False) == 4
+
+
+def test_preload_and_unload(tmp_path):
+    state = FakeOllama(str(tmp_path / "models"))
+    state.add_model("llama3.2:3b", size=2048)
+    state.add_model("qwen2.5:7b")
+    with FakeOllamaServer(state) as server:
+        client = OllamaClient(server.url)
+        assert client.loaded_models() == []
+
+        client.load_model("llama3.2:3b", "10m")
+        client.load_model("qwen2.5:7b", -1)
+        loaded = {model['full_name']: model for model in client.loaded_models()}
+        assert loaded["llama3.2:3b"]['processor'] == "100% GPU"
+        assert loaded["llama3.2:3b"]['size_bytes'] == 2048
+        assert abs(loaded["llama3.2:3b"]['expires_at'] - (time.time() + 600)) < 5
+        assert loaded["qwen2.5:7b"]['expires_at'] is None
+
+        client.unload_model("llama3.2:3b")
+        assert [model['full_name'] for model in client.loaded_models()] == ["qwen2.5:7b"]
@@ -0,0 +1,56 @@
+import os
+
+import pytest
+
+from OlaMoMa import cli, pagecache
+from OlaMoMa.fake_ollama import FakeOllama
+from OlaMoMa.manifests import MODEL_MEDIA_TYPE, iter_manifests, model_blobs
+
+
+def drop_cache(path):
+    if hasattr(os, "posix_fadvise"):
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+
+
+def test_manifest_resolution(tmp_path):
+    state = FakeOllama(str(tmp_path))
+    state.add_model("llama3.2:3b", size=4096)
+    state.add_model("user/custom")
+    state.add_model("hf.co/org/repo:Q4_K_M")
+
+    assert sorted(name for name, _ in iter_manifests(str(tmp_path))) == [
+        "hf.co/org/repo:Q4_K_M", "llama3.2:3b", "user/custom:latest"]
+    blobs = model_blobs(str(tmp_path), "llama3.2:3b")
+    assert blobs[0]['media_type'] == MODEL_MEDIA_TYPE and blobs[0]['size'] == 4096
+    assert all(os.path.exists(blob['path']) for blob in blobs)
+    with pytest.raises(Exception, match="Manifest not found"):
+        model_blobs(str(tmp_path), "missing")
+
+
+def test_warm_model(tmp_path, monkeypatch, capsys):
+    # 用较小的分段，让多个读取线程同时工作
+    monkeypatch.setattr(pagecache, "SEGMENT_SIZE", 1024 * 1024)
+    monkeypatch.setattr(pagecache, "CHUNK_SIZE", 256 * 1024)
+    state = FakeOllama(str(tmp_path))
+    state.add_model("llama3.2:3b", size=5 * 1024 * 1024 + 123)
+    for blob in model_blobs(str(tmp_path), "llama3.2:3b"):
+        drop_cache(blob['path'])
+
+    updates = []
+    result = pagecache.warm_model("llama3.2:3b", str(tmp_path), readers=3,
+                                  progress=lambda done, total: updates.append((done, total)))
+
+    model = result['blobs'][0]
+    assert result['bytes'] == sum(blob['size'] for blob in result['blobs'])
+    assert updates[-1] == (result['bytes'], result['bytes'])
+    if model['resident_after'] is not None:
+        assert model['resident_after'] == model['size']
+    assert "resident" in pagecache.format_report(result)
+
+    assert cli.main(["warm", "--all", "--check", "--models-dir", str(tmp_path)]) == 0
+    assert "llama3.2:3b:" in capsys.readouterr().out
@@ -0,0 +1,27 @@
+import os
+import zipfile
+
+from OlaMoMa import profiling
+
+
+def test_profile_operation_writes_artifacts(tmp_path, monkeypatch):
+    monkeypatch.setenv("OLAMOMA_HOME", str(tmp_path))
+    profiling.set_modes({"cpu", "mem"})
+    try:
+        with profiling.profile_operation("export") as base:
+            sum(range(1000))
+    finally:
+        profiling.set_modes(())
+
+    for suffix in (".prof", ".tracemalloc", "-memory.txt"):
+        assert (tmp_path / "diagnostics" / (os.path.basename(base) + suffix)).exists()
+
+    count = profiling.collect_diagnostics(str(tmp_path / "diag.zip"))
+    names = zipfile.ZipFile(tmp_path / "diag.zip").namelist()
+    assert count == 3 and "system.json" in names
+
+
+def test_parse_modes():
+    assert profiling.parse_modes("1") == {"cpu", "mem"}
+    assert profiling.parse_modes("mem") == {"mem"}
+    assert profiling.parse_modes("") == set()
@@ -0,0 +1,47 @@
+from datetime import datetime
+
+import pytest
+
+from OlaMoMa.api import model_from_tag
+from OlaMoMa.records import ModelRecord, format_modified, parse_modified, parse_size
+
+
+def test_create_splits_and_interns():
+    # 运行时拼接的字符串，驻留前与字面量不是同一个对象
+    a = ModelRecord.create("".join(["hf.co/user/model", ":Q4_K_M"]), "abc", 2.5e9, 1700000000.7, "".join("local"))
+    b = ModelRecord.create("hf.co/user/model:Q4_K_M", "def", 1, 0, "local")
+    assert (a.name, a.tag, a.size, a.modified_at) == ("hf.co/user/model", "Q4_K_M", 2500000000, 1700000000)
+    assert a.full_name is b.full_name and a.name is b.name and a.host is b.host
+    assert ModelRecord.create("untagged").tag == ""
+    assert not hasattr(a, "__dict__")
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("2.0 GB", 2 * 10 ** 9), ("274 MB", 274 * 10 ** 6), ("1.5KB", 1500), ("512 B", 512), ("12", 12), ("n/a", 0),
+])
+def test_parse_size(text, expected):
+    assert parse_size(text) == expected
+
+
+def test_parse_modified():
+    now = 1700000000
+    assert parse_modified("7 minutes ago", now) == now - 7 * 60
+    assert parse_modified("About an hour ago", now) == now - 3600
+    assert parse_modified("3 weeks ago", now) == now - 21 * 86400
+    assert parse_modified("Less than a second ago", now) == now
+    assert parse_modified("2024-05-01 12:30:00", now) == int(datetime(2024, 5, 1, 12, 30).timestamp())
+    assert parse_modified("someday", now) == 0
+    assert format_modified(parse_modified("2024-05-01 12:30:00")) == "2024-05-01 12:30:00"
+    assert format_modified(0) == ""
+
+
+def test_list_output_and_tags_give_the_same_records():
+    pytest.importorskip("PySide6")
+    from OlaMoMa.app import OllamaManager
+
+    output = ("NAME                ID              SIZE      MODIFIED\n"
+              "llama3.2:3b         a80c4f17acd5    2.0 GB    2024-05-01 12:30:00\n")
+    parsed = OllamaManager.parse_list_output(output)
+    tag = model_from_tag({'name': "llama3.2:3b", 'digest': "a80c4f17acd5" + "0" * 52, 'size': 2 * 10 ** 9,
+                          'modified_at': datetime(2024, 5, 1, 12, 30).astimezone().isoformat()})
+    assert parsed == [tag]
@@ -0,0 +1,149 @@
+import hashlib
+import json
+import os
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from OlaMoMa.registrycache import RegistryCache, RegistryCacheServer
+
+
+class FakeRegistry(ThreadingHTTPServer):
+    """只提供 manifest 和 blob 下载的上游仓库，记录每个请求"""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), FakeRegistryHandler)
+        self.blobs = {}
+        self.manifests = {}
+        self.requests = []
+        self.delay = 0
+        self.corrupt = False
+
+    def add_blob(self, data):
+        digest = "sha256:" + hashlib.sha256(data).hexdigest()
+        self.blobs[digest] = data
+        return digest
+
+    def add_model(self, name, tag, layers):
+        digests = [self.add_blob(data) for data in layers]
+        manifest = {'schemaVersion': 2, 'mediaType': "application/vnd.docker.distribution.manifest.v2+json",
+                    'layers': [{'digest': digest, 'size': len(data)} for digest, data in zip(digests, layers)]}
+        self.manifests[(name, tag)] = json.dumps(manifest).encode('utf-8')
+        return digests
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class FakeRegistryHandler(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        registry = self.server
+        registry.requests.append(self.path)
+        time.sleep(registry.delay)
+        _, _, rest = self.path.partition("/v2/")
+        name, kind, reference = rest.rsplit('/', 2)
+        data = registry.blobs.get(reference) if kind == "blobs" else registry.manifests.get((name, reference))
+        if data is None:
+            self.send_response(404)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        if registry.corrupt:
+            data = data[::-1]
+        self.send_response(200)
+        self.send_header('Content-Type', "application/vnd.docker.distribution.manifest.v2+json"
+                         if kind == "manifests" else "application/octet-stream")
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+@pytest.fixture
+def upstream():
+    registry = FakeRegistry()
+    threading.Thread(target=registry.serve_forever, daemon=True).start()
+    yield registry
+    registry.shutdown()
+    registry.server_close()
+
+
+def fetch(url, headers=None):
+    with urllib.request.urlopen(urllib.request.Request(url, headers=headers or {}), timeout=10) as response:
+        return response.status, response.read()
+
+
+def test_serves_from_cache_after_first_pull(upstream, tmp_path):
+    layers = [os.urandom(3 * 1024 * 1024), b"{{ .Prompt }}"]
+    digests = upstream.add_model("library/llama3.2", "3b", layers)
+    with RegistryCacheServer(RegistryCache(str(tmp_path), upstream.url), "127.0.0.1", 0) as server:
+        for _ in range(2):
+            status, manifest = fetch(f"{server.url}/v2/library/llama3.2/manifests/3b")
+            assert json.loads(manifest)['layers'][0]['digest'] == digests[0]
+            for digest, data in zip(digests, layers):
+                assert fetch(f"{server.url}/v2/library/llama3.2/blobs/{digest}")[1] == data
+        # Ollama 分段下载使用 Range
+        status, part = fetch(f"{server.url}/v2/library/llama3.2/blobs/{digests[0]}", {'Range': "bytes=10-19"})
+        assert (status, part) == (206, layers[0][10:20])
+        stats = server.cache.stats
+    assert len(upstream.requests) == 3
+    assert stats['upstream_bytes'] == sum(len(data) for data in layers)
+
+
+def test_concurrent_requests_download_once(upstream, tmp_path):
+    data = os.urandom(2 * 1024 * 1024)
+    digest = upstream.add_blob(data)
+    upstream.delay = 0.5
+    with RegistryCacheServer(RegistryCache(str(tmp_path), upstream.url), "127.0.0.1", 0) as server:
+        url = f"{server.url}/v2/library/qwen2.5/blobs/{digest}"
+        with ThreadPoolExecutor(8) as executor:
+            results = list(executor.map(lambda _: fetch(url)[1], range(8)))
+        stats = server.cache.stats
+    assert results == [data] * 8
+    assert len(upstream.requests) == 1
+    assert stats['misses'] == 1 and stats['coalesced'] + stats['hits'] == 7
+
+
+def test_quota_evicts_least_recently_used(upstream, tmp_path):
+    a, b, c = (upstream.add_blob(bytes([i]) * 1000) for i in range(3))
+    cache = RegistryCache(str(tmp_path), upstream.url, quota=2500)
+    cache.blob("library/m", a)
+    cache.blob("library/m", b)
+    cache.blob("library/m", a)
+    cache.blob("library/m", c)
+    assert not os.path.exists(cache.blob_path(b))
+    assert os.path.exists(cache.blob_path(a)) and os.path.exists(cache.blob_path(c))
+    assert cache.cached_bytes() == 2000 and cache.stats['evictions'] == 1
+    # 重启后按文件的修改时间恢复LRU顺序
+    assert list(RegistryCache(str(tmp_path), upstream.url)._sizes) == [a, c]
+
+
+def test_bad_upstream_data_is_not_cached(upstream, tmp_path):
+    digest = upstream.add_blob(b"weights")
+    upstream.corrupt = True
+    with RegistryCacheServer(RegistryCache(str(tmp_path), upstream.url), "127.0.0.1", 0) as server:
+        with pytest.raises(urllib.error.HTTPError) as error:
+            fetch(f"{server.url}/v2/library/m/blobs/{digest}")
+        assert error.value.code == 502
+        with pytest.raises(urllib.error.HTTPError) as error:
+            fetch(f"{server.url}/v2/library/m/blobs/{digest.replace('sha256:', 'sha256:..')}")
+        assert error.value.code == 400
+    assert os.listdir(tmp_path / "blobs") == []
+
+
+def test_stale_tag_is_served_when_upstream_is_down(upstream, tmp_path):
+    upstream.add_model("library/m", "latest", [b"x"])
+    cache = RegistryCache(str(tmp_path), upstream.url, manifest_ttl=0)
+    _, first = cache.manifest("library/m", "latest")
+    cache.upstream = "http://127.0.0.1:9"
+    assert cache.manifest("library/m", "latest")[1] == first
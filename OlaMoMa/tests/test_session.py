@@ -0,0 +1,123 @@
+import os
+import struct
+
+import pytest
+
+from OlaMoMa import session as session_module
+from OlaMoMa.connection import get_connection
+from OlaMoMa.fake_ollama import FakeOllama, FakeOllamaServer, write_cli_shim
+from OlaMoMa.session import Session, capabilities_for, get_session, parse_version
+
+pytest.importorskip("PySide6")
+from OlaMoMa.app import OllamaManager  # noqa: E402
+
+
+def start_server(tmp_path, monkeypatch, version):
+    state = FakeOllama(str(tmp_path / "models"), version=version)
+    server = FakeOllamaServer(state).start()
+    monkeypatch.setenv("OLLAMA_HOST", server.url)
+    monkeypatch.setenv("OLLAMA_MODELS", state.models_dir)
+    return server
+
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    server = start_server(tmp_path, monkeypatch, "0.6.8")
+    yield server
+    server.stop()
+
+
+def test_parse_version():
+    assert parse_version("0.6.8") == (0, 6, 8)
+    assert parse_version("v0.5.7-rc1") == (0, 5, 7)
+    assert parse_version("0.0.0") is None
+    assert parse_version("") is None
+    assert capabilities_for("0.1.30") == {'streaming', 'blobs'}
+    assert capabilities_for("0.5.5") == {'streaming', 'blobs', 'ps', 'create_files'}
+    # 开发版认为支持全部能力
+    assert capabilities_for("0.0.0") == set(session_module.CAPABILITIES)
+
+
+def test_session_is_resolved_once(server, monkeypatch):
+    lookups = []
+    real_find = session_module.find_ollama
+    monkeypatch.setattr(session_module, "find_ollama", lambda: lookups.append(1) or real_find())
+
+    managers = [OllamaManager() for _ in range(5)]
+    assert len({id(manager.session) for manager in managers}) == 1
+    assert len(lookups) == 1
+
+    for manager in managers:
+        manager.list_models()
+    assert [path for _, path in server.state.requests].count("/api/version") == 1
+    assert managers[0].session.version == "0.6.8"
+    assert managers[0].session.describe()['capabilities'] == ['blobs', 'create_files', 'ps', 'streaming']
+    # 列表直接来自 /api/tags，没有启动 ollama 子进程
+    assert ("GET", "/api/tags") in server.state.requests
+
+
+def test_detect_retries_after_failure(tmp_path):
+    session = Session("http://127.0.0.1:9", models_dir=str(tmp_path))
+    assert not session.detect()
+    assert not session.supports('ps')
+    assert session.version is None and not session._detected
+
+
+def test_detection_follows_server_restart(tmp_path):
+    state = FakeOllama(str(tmp_path / "old"), version="0.5.4")
+    server = FakeOllamaServer(state).start()
+    port = server.server_address[1]
+    session = Session(server.url, models_dir=state.models_dir)
+    connection = get_connection(server.url)
+    try:
+        assert session.detect() and not session.supports('create_files')
+        server.stop()
+        # 健康检查发现服务器离线后，旧的检测结果作废
+        assert not connection.check(force=True)
+        assert not session.supports('blobs') and not session.detected
+
+        # 在同一地址启动升级后的服务器
+        server = FakeOllamaServer(FakeOllama(str(tmp_path / "new"), version="0.6.8"), port=port).start()
+        assert connection.check(force=True)
+        assert session.supports('create_files') and session.version == "0.6.8"
+
+        # 没有观察到离线，只是健康检查读到了不同的版本
+        server.state.version = "0.1.30"
+        assert connection.check(force=True)
+        assert session.detect() and session.version == "0.1.30" and not session.supports('ps')
+    finally:
+        server.stop()
+
+
+def write_tiny_gguf(path):
+    with open(path, 'wb') as f:
+        f.write(b"GGUF" + struct.pack("<IQQ", 3, 0, 0) + os.urandom(4096))
+    return str(path)
+
+
+def test_old_server_imports_through_cli(tmp_path, monkeypatch):
+    server = start_server(tmp_path, monkeypatch, "0.5.4")
+    try:
+        manager = OllamaManager()
+        manager.ollama_path = write_cli_shim(str(tmp_path / "bin"))
+        commands = []
+        run_command = manager.run_command
+        monkeypatch.setattr(manager, "run_command", lambda cmd, **kwargs: commands.append(cmd[1]) or run_command(
+            cmd, **kwargs))
+        gguf = write_tiny_gguf(tmp_path / "tiny.gguf")
+        assert not manager.session.supports('create_files')
+        assert manager.import_model(gguf, "tiny")
+        # 服务器不支持按摘要创建时退回 ollama create
+        assert commands == ["create"]
+        assert server.state.get_model("tiny:latest")
+    finally:
+        server.stop()
+
+
+def test_update_reports_pull_progress(server):
+    server.state.add_model("llama3.2:3b", size=1024)
+    updates = []
+    assert OllamaManager().update_model("llama3.2:3b", progress=lambda *args: updates.append(args))
+    assert updates and updates[-1][0] == "success"
+    assert ("POST", "/api/pull") in server.state.requests
+    assert get_session().supports('streaming')
@@ -0,0 +1,76 @@
+import json
+
+import pytest
+
+from OlaMoMa import templates
+from OlaMoMa.modelfile import parse_modelfile
+
+
+@pytest.fixture
+def registry(tmp_path, monkeypatch):
+    monkeypatch.setenv("OLAMOMA_HOME", str(tmp_path))
+    templates.reload_registry()
+    yield templates.get_registry()
+    templates.reload_registry()
+
+
+def test_bundled_templates_are_valid_modelfiles(registry):
+    for name in registry.entries:
+        parsed = parse_modelfile(registry.render(name, "/models/My Model.gguf"))
+        assert parsed['from'] == "/models/My Model.gguf"
+        assert "{{ .Prompt }}" in parsed['template'] and "{{ .Response }}" in parsed['template']
+        assert parsed['parameters']['stop'] == registry.entries[name]['stop']
+        assert parsed['parameters']['temperature'] == 0.7
+        assert parsed['system']
+
+
+@pytest.mark.parametrize("metadata, filename, expected", [
+    ({}, "codellama-7b-instruct.Q4_K_M.gguf", "codellama"),
+    ({}, "code-llama-13b.gguf", "codellama"),
+    ({}, "Meta-Llama-3.1-8B-Instruct-Q8_0.gguf", "llama3"),
+    ({}, "llama-2-7b-chat.gguf", "llama"),
+    ({}, "Mistral-7B-Instruct-v0.3.gguf", "mistral"),
+    ({}, "DeepSeek-R1-Distill-Qwen-7B.gguf", "deepseek"),
+    ({}, "unknown.gguf", "default"),
+    ({'general.architecture': "qwen2"}, "model.gguf", "qwen"),
+    ({'general.architecture': "gemma3"}, "model.gguf", "gemma"),
+    ({'tokenizer.chat_template': "{% for m in messages %}<|im_start|>{{ m.role }}{% endfor %}"}, "model.gguf",
+     "chatml"),
+    ({'tokenizer.chat_template': "<|start_header_id|>{{ role }}<|end_header_id|>", 'general.architecture': "llama"},
+     "model.gguf", "llama3"),
+    # 蒸馏模型：架构是 qwen2，但对话格式是 DeepSeek 的
+    ({'tokenizer.chat_template': "<｜User｜>{{ content }}<｜Assistant｜>", 'general.architecture': "qwen2"},
+     "model.gguf", "deepseek"),
+    # 真实的 Qwen GGUF：chat_template 是 ChatML，由架构和文件名在共用这个标记的模板中选出 qwen
+    ({'tokenizer.chat_template': "{% for m in messages %}<|im_start|>{{ m.role }}{% endfor %}",
+      'general.architecture': "qwen2"}, "Qwen2.5-7B-Instruct-Q4_K_M.gguf", "qwen"),
+    ({'tokenizer.chat_template': "<|im_start|>", 'general.architecture': "qwen3"}, "model.gguf", "qwen"),
+    ({'tokenizer.chat_template': "<|im_start|>", 'general.architecture': "llama"}, "Yi-1.5-9B-Chat.gguf", "yi"),
+    ({'tokenizer.chat_template': "<|im_start|>", 'general.architecture': "llama"}, "hermes.gguf", "chatml"),
+    # 标记优先于文件名
+    ({'tokenizer.chat_template': "<<SYS>> [INST]"}, "mistral.gguf", "llama"),
+])
+def test_resolve(registry, metadata, filename, expected):
+    assert registry.resolve(metadata, filename) == expected
+
+
+def test_user_templates_override_and_extend(tmp_path, monkeypatch):
+    monkeypatch.setenv("OLAMOMA_HOME", str(tmp_path))
+    (tmp_path / templates.USER_FILENAME).write_text(json.dumps({
+        'defaults': {'parameters': {'temperature': 0.2}},
+        'templates': [
+            {'name': "granite", 'architectures': ["granite"], 'keywords': ["granite"],
+             'template': "<|user|>{{ .Prompt }}<|assistant|>{{ .Response }}", 'stop': ["<|user|>"]},
+            {'name': "default", 'system': "Be brief."},
+        ],
+    }), encoding='utf-8')
+    templates.reload_registry()
+    try:
+        registry = templates.get_registry()
+        assert registry.resolve({'general.architecture': "granite"}, "x.gguf") == "granite"
+        parsed = parse_modelfile(registry.render("default", "/x.gguf"))
+        assert parsed['system'] == "Be brief."
+        assert parsed['parameters']['temperature'] == 0.2
+        assert parsed['parameters']['top_k'] == 40
+    finally:
+        templates.reload_registry()
@@ -0,0 +1,66 @@
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+from OlaMoMa import fileio, throttle
+from OlaMoMa.throttle import TokenBucket
+
+
+def test_token_bucket_rate():
+    bucket = TokenBucket(rate=1000 * 1000)
+    start = time.monotonic()
+    for _ in range(5):
+        bucket.consume(100 * 1000)
+    # 桶开始时是空的，500KB 以 1MB/s 需要约0.5秒
+    assert 0.4 < time.monotonic() - start < 1.5
+
+    unlimited = TokenBucket()
+    start = time.monotonic()
+    unlimited.consume(10 ** 12)
+    assert time.monotonic() - start < 0.1
+
+
+def test_limit_can_be_lifted_while_waiting():
+    bucket = TokenBucket(rate=1000)
+    done = threading.Event()
+    thread = threading.Thread(target=lambda: (bucket.consume(10 ** 6), done.set()))
+    thread.start()
+    time.sleep(0.1)
+    assert not done.is_set()
+    bucket.set_rate(0)
+    assert done.wait(1)
+    thread.join()
+
+
+def test_copy_respects_bandwidth_limit(tmp_path, monkeypatch):
+    monkeypatch.setattr(fileio, "CHUNK_SIZE", 64 * 1024)
+    src = tmp_path / "src.gguf"
+    src.write_bytes(os.urandom(512 * 1024))
+    throttle.set_bandwidth_limit(1)
+    try:
+        start = time.monotonic()
+        fileio.copy_file(str(src), str(tmp_path / "dst.gguf"))
+        assert time.monotonic() - start > 0.4
+    finally:
+        throttle.set_bandwidth_limit(0)
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="per-thread priorities are Linux only")
+def test_lower_current_thread_priority():
+    result = {}
+
+    def worker():
+        thread_id = threading.get_native_id()
+        before = os.getpriority(os.PRIO_PROCESS, thread_id)
+        throttle.lower_current_thread_priority()
+        result['nice'] = os.getpriority(os.PRIO_PROCESS, thread_id) - before
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+    assert result['nice'] == min(throttle.NICE_INCREMENT, 19 - os.getpriority(os.PRIO_PROCESS, 0))
+    # 只影响调用的线程
+    assert os.getpriority(os.PRIO_PROCESS, threading.get_native_id()) == os.getpriority(os.PRIO_PROCESS, 0)
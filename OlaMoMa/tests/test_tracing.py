@@ -0,0 +1,62 @@
+import json
+import urllib.request
+
+import pytest
+
+from OlaMoMa import tracing
+from OlaMoMa.fake_ollama import FakeOllama, FakeOllamaServer
+from OlaMoMa.hosts import HostRegistry, MultiHostLister
+from OlaMoMa.tracing import Tracer, timed
+
+
+def test_span_is_logged_and_exported(tmp_path):
+    tracer = Tracer(log_path=str(tmp_path / "ops.jsonl"), textfile=str(tmp_path / "olamoma.prom"))
+
+    with tracer.span("export", queue_wait=0.25, model="llama3.2:3b") as span:
+        with timed("subprocess"):
+            pass
+        span.add_bytes(4096)
+    with pytest.raises(ValueError):
+        with tracer.span("delete"):
+            raise ValueError("boom")
+
+    records = [json.loads(line) for line in open(tmp_path / "ops.jsonl", encoding='utf-8')]
+    assert [(r['op'], r['result']) for r in records] == [("export", "ok"), ("delete", "error")]
+    assert records[0]['bytes'] == 4096 and records[0]['queue_wait_s'] == 0.25
+    assert records[0]['attrs'] == {'model': "llama3.2:3b"}
+    assert records[1]['error'] == "boom"
+
+    text = (tmp_path / "olamoma.prom").read_text()
+    assert 'olamoma_operation_duration_seconds_count{op="export",result="ok"} 1' in text
+    assert 'olamoma_operation_bytes_total{op="export",result="ok"} 4096' in text
+
+
+def test_metrics_endpoint(tmp_path):
+    tracer = Tracer(log_path=str(tmp_path / "ops.jsonl"))
+    with tracer.span("list"):
+        pass
+    server = tracer.start_http_server(0)
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+        body = urllib.request.urlopen(url, timeout=5).read().decode()
+    finally:
+        tracer.stop_http_server()
+    assert 'op="list",result="ok"' in body and body.endswith("# EOF\n")
+
+
+def test_async_list_is_traced(tmp_path, monkeypatch):
+    tracer = Tracer(log_path=str(tmp_path / "ops.jsonl"))
+    monkeypatch.setattr(tracing, "_tracer", tracer)
+    state = FakeOllama(str(tmp_path / "models"))
+    state.add_model("llama3.2:3b", size=2048)
+    state.latency["/api/tags"] = 0.2
+    registry = HostRegistry(str(tmp_path / "hosts.json"))
+    with FakeOllamaServer(state) as server:
+        registry.add("a", server.url)
+        registry.add("b", server.url)
+        assert MultiHostLister(registry, None).fetch_all(["a", "b"]) == {}
+
+    records = [json.loads(line) for line in open(tmp_path / "ops.jsonl", encoding='utf-8')]
+    assert [(r['op'], r['result'], r['attrs']) for r in records] == [("list", "ok", {'args': ["a", "b"]})]
+    # 两个主机的请求在 gather 创建的子任务中并发执行，HTTP时间都计入同一个 Span
+    assert records[0]['http_s'] >= 0.4 and records[0]['duration_s'] < 0.4
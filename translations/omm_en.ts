@@ -1,6 +1,237 @@
 <?xml version="1.0" encoding="utf-8"?>
 <!DOCTYPE TS>
 <TS version="2.1" language="en_US">
+<context>
+    <name>BenchmarkHistoryDialog</name>
+    <message>
+        <source>Time</source>
+        <translation>Time</translation>
+    </message>
+    <message>
+        <source>Host</source>
+        <translation>Host</translation>
+    </message>
+    <message>
+        <source>Model</source>
+        <translation>Model</translation>
+    </message>
+    <message>
+        <source>Load (s)</source>
+        <translation>Load (s)</translation>
+    </message>
+    <message>
+        <source>TTFT (s)</source>
+        <translation>TTFT (s)</translation>
+    </message>
+    <message>
+        <source>Prompt tokens/s</source>
+        <translation>Prompt tokens/s</translation>
+    </message>
+    <message>
+        <source>Generation tokens/s</source>
+        <translation>Generation tokens/s</translation>
+    </message>
+    <message>
+        <source>Total (s)</source>
+        <translation>Total (s)</translation>
+    </message>
+    <message>
+        <source>Benchmark History</source>
+        <translation>Benchmark History</translation>
+    </message>
+</context>
+<context>
+    <name>DeployDialog</name>
+    <message>
+        <source>Deploy %1</source>
+        <translation>Deploy %1</translation>
+    </message>
+    <message>
+        <source>Hosts:</source>
+        <translation>Hosts:</translation>
+    </message>
+    <message>
+        <source>Model name on the hosts:</source>
+        <translation>Model name on the hosts:</translation>
+    </message>
+</context>
+<context>
+    <name>JobsPanel</name>
+    <message>
+        <source>Jobs</source>
+        <translation>Jobs</translation>
+    </message>
+    <message>
+        <source>Bandwidth limit:</source>
+        <translation>Bandwidth limit:</translation>
+    </message>
+    <message>
+        <source>Unlimited</source>
+        <translation>Unlimited</translation>
+    </message>
+    <message>
+        <source>Total read rate of exports, imports and cache warming; applies immediately</source>
+        <translation>Total read rate of exports, imports and cache warming; applies immediately</translation>
+    </message>
+    <message>
+        <source>Low priority (nice/ionice)</source>
+        <translation>Low priority (nice/ionice)</translation>
+    </message>
+    <message>
+        <source>Applies to jobs started after the change</source>
+        <translation>Applies to jobs started after the change</translation>
+    </message>
+    <message>
+        <source>Operation</source>
+        <translation>Operation</translation>
+    </message>
+    <message>
+        <source>Details</source>
+        <translation>Details</translation>
+    </message>
+    <message>
+        <source>Status</source>
+        <translation>Status</translation>
+    </message>
+    <message>
+        <source>Progress</source>
+        <translation>Progress</translation>
+    </message>
+    <message>
+        <source>Duration (s)</source>
+        <translation>Duration (s)</translation>
+    </message>
+    <message>
+        <source>Running</source>
+        <translation>Running</translation>
+    </message>
+</context>
+<context>
+    <name>LoadTestDialog</name>
+    <message>
+        <source>Concurrency</source>
+        <translation>Concurrency</translation>
+    </message>
+    <message>
+        <source>Requests</source>
+        <translation>Requests</translation>
+    </message>
+    <message>
+        <source>Errors</source>
+        <translation>Errors</translation>
+    </message>
+    <message>
+        <source>Error rate</source>
+        <translation>Error rate</translation>
+    </message>
+    <message>
+        <source>p50 (s)</source>
+        <translation>p50 (s)</translation>
+    </message>
+    <message>
+        <source>p95 (s)</source>
+        <translation>p95 (s)</translation>
+    </message>
+    <message>
+        <source>p99 (s)</source>
+        <translation>p99 (s)</translation>
+    </message>
+    <message>
+        <source>Requests/s</source>
+        <translation>Requests/s</translation>
+    </message>
+    <message>
+        <source>Tokens/s</source>
+        <translation>Tokens/s</translation>
+    </message>
+    <message>
+        <source>Load Test: %1</source>
+        <translation>Load Test: %1</translation>
+    </message>
+</context>
+<context>
+    <name>LoadedModelsPanel</name>
+    <message>
+        <source>Loaded Models</source>
+        <translation>Loaded Models</translation>
+    </message>
+    <message>
+        <source>Host:</source>
+        <translation>Host:</translation>
+    </message>
+    <message>
+        <source>Model</source>
+        <translation>Model</translation>
+    </message>
+    <message>
+        <source>Size</source>
+        <translation>Size</translation>
+    </message>
+    <message>
+        <source>Processor</source>
+        <translation>Processor</translation>
+    </message>
+    <message>
+        <source>Until</source>
+        <translation>Until</translation>
+    </message>
+    <message>
+        <source>Preload...</source>
+        <translation>Preload...</translation>
+    </message>
+    <message>
+        <source>Unload</source>
+        <translation>Unload</translation>
+    </message>
+    <message>
+        <source>Refresh</source>
+        <translation>Refresh</translation>
+    </message>
+    <message>
+        <source>%1 model(s) loaded</source>
+        <translation>%1 model(s) loaded</translation>
+    </message>
+    <message>
+        <source>Warning</source>
+        <translation>Warning</translation>
+    </message>
+    <message>
+        <source>No models available on this host</source>
+        <translation>No models available on this host</translation>
+    </message>
+    <message>
+        <source>Preload Model</source>
+        <translation>Preload Model</translation>
+    </message>
+    <message>
+        <source>Model:</source>
+        <translation>Model:</translation>
+    </message>
+    <message>
+        <source>Keep alive (e.g. 5m, 1h, -1 for forever):</source>
+        <translation>Keep alive (e.g. 5m, 1h, -1 for forever):</translation>
+    </message>
+    <message>
+        <source>Please select a model first</source>
+        <translation>Please select a model first</translation>
+    </message>
+    <message>
+        <source>Another operation is still running</source>
+        <translation>Another operation is still running</translation>
+    </message>
+    <message>
+        <source>Loading %1...</source>
+        <translation>Loading %1...</translation>
+    </message>
+    <message>
+        <source>Unloading %1...</source>
+        <translation>Unloading %1...</translation>
+    </message>
+    <message>
+        <source>Error</source>
+        <translation>Error</translation>
+    </message>
+</context>
 <context>
     <name>MainWindow</name>
     <message>
@@ -31,10 +262,6 @@
         <source>Loading model list...</source>
         <translation>Loading model list...</translation>
     </message>
-    <message>
-        <source>Loaded %n model(s)</source>
-        <translation>Loaded %n model(s)</translation>
-    </message>
     <message>
         <source>Error</source>
         <translation>Error</translation>
@@ -120,12 +347,442 @@
         <translation>Language</translation>
     </message>
     <message>
-        <source>Language Switched</source>
-        <translation>Language Switched</translation>
+        <source>Ready - Press F5 to refresh, Ctrl+F to search</source>
+        <translation>Ready - Press F5 to refresh, Ctrl+F to search</translation>
     </message>
     <message>
-        <source>Language switched to %1. Changes will be applied immediately.</source>
-        <translation>Language switched to %1. Changes will be applied immediately.</translation>
+        <source>Sort by:</source>
+        <translation>Sort by:</translation>
+    </message>
+    <message>
+        <source>Name (A-Z)</source>
+        <translation>Name (A-Z)</translation>
+    </message>
+    <message>
+        <source>Name (Z-A)</source>
+        <translation>Name (Z-A)</translation>
+    </message>
+    <message>
+        <source>Size (Largest First)</source>
+        <translation>Size (Largest First)</translation>
+    </message>
+    <message>
+        <source>Size (Smallest First)</source>
+        <translation>Size (Smallest First)</translation>
+    </message>
+    <message>
+        <source>Date (Newest First)</source>
+        <translation>Date (Newest First)</translation>
+    </message>
+    <message>
+        <source>Date (Oldest First)</source>
+        <translation>Date (Oldest First)</translation>
+    </message>
+    <message>
+        <source>Search:</source>
+        <translation>Search:</translation>
+    </message>
+    <message>
+        <source>Enter model name to search...</source>
+        <translation>Enter model name to search...</translation>
+    </message>
+    <message>
+        <source>Clear</source>
+        <translation>Clear</translation>
+    </message>
+    <message>
+        <source>Host:</source>
+        <translation>Host:</translation>
+    </message>
+    <message>
+        <source>All Hosts</source>
+        <translation>All Hosts</translation>
+    </message>
+    <message>
+        <source>Tag</source>
+        <translation>Tag</translation>
+    </message>
+    <message>
+        <source>ID</source>
+        <translation>ID</translation>
+    </message>
+    <message>
+        <source>Size</source>
+        <translation>Size</translation>
+    </message>
+    <message>
+        <source>Modified Date</source>
+        <translation>Modified Date</translation>
+    </message>
+    <message>
+        <source>Host</source>
+        <translation>Host</translation>
+    </message>
+    <message>
+        <source>Import Folder</source>
+        <translation>Import Folder</translation>
+    </message>
+    <message>
+        <source>Delete Selected Model</source>
+        <translation>Delete Selected Model</translation>
+    </message>
+    <message>
+        <source>Update Selected Model</source>
+        <translation>Update Selected Model</translation>
+    </message>
+    <message>
+        <source>Hosts</source>
+        <translation>Hosts</translation>
+    </message>
+    <message>
+        <source>Add Host...</source>
+        <translation>Add Host...</translation>
+    </message>
+    <message>
+        <source>Remove Host...</source>
+        <translation>Remove Host...</translation>
+    </message>
+    <message>
+        <source>View</source>
+        <translation>View</translation>
+    </message>
+    <message>
+        <source>Diagnostics</source>
+        <translation>Diagnostics</translation>
+    </message>
+    <message>
+        <source>Enable Profiling</source>
+        <translation>Enable Profiling</translation>
+    </message>
+    <message>
+        <source>Benchmark History</source>
+        <translation>Benchmark History</translation>
+    </message>
+    <message>
+        <source>Collect Diagnostics...</source>
+        <translation>Collect Diagnostics...</translation>
+    </message>
+    <message numerus="yes">
+        <source>Loaded %n models</source>
+        <translation>
+            <numerusform>Loaded %n model</numerusform>
+            <numerusform>Loaded %n models</numerusform>
+        </translation>
+    </message>
+    <message>
+        <source>Some hosts failed: %1</source>
+        <translation>Some hosts failed: %1</translation>
+    </message>
+    <message>
+        <source>Ready - %n models loaded. Press F5 to refresh, Ctrl+F to search</source>
+        <translation>Ready - %n models loaded. Press F5 to refresh, Ctrl+F to search</translation>
+    </message>
+    <message>
+        <source>Error loading models</source>
+        <translation>Error loading models</translation>
+    </message>
+    <message>
+        <source>This operation is only available for models on the local host</source>
+        <translation>This operation is only available for models on the local host</translation>
+    </message>
+    <message>
+        <source>Select Export Directory</source>
+        <translation>Select Export Directory</translation>
+    </message>
+    <message>
+        <source>Exporting %1 models...</source>
+        <translation>Exporting %1 models...</translation>
+    </message>
+    <message>
+        <source>The file name contains special characters. Please enter a valid model name:</source>
+        <translation>The file name contains special characters. Please enter a valid model name:</translation>
+    </message>
+    <message>
+        <source>Model name cannot be empty</source>
+        <translation>Model name cannot be empty</translation>
+    </message>
+    <message>
+        <source>Model name can only contain letters, numbers, underscores, and hyphens</source>
+        <translation>Model name can only contain letters, numbers, underscores, and hyphens</translation>
+    </message>
+    <message>
+        <source>Select Folder to Import</source>
+        <translation>Select Folder to Import</translation>
+    </message>
+    <message>
+        <source>Importing models from %1...</source>
+        <translation>Importing models from %1...</translation>
+    </message>
+    <message>
+        <source>Importing models: %1</source>
+        <translation>Importing models: %1</translation>
+    </message>
+    <message>
+        <source>Confirm Deletion</source>
+        <translation>Confirm Deletion</translation>
+    </message>
+    <message>
+        <source>Are you sure you want to delete the model &quot;%1&quot;?</source>
+        <translation>Are you sure you want to delete the model "%1"?</translation>
+    </message>
+    <message>
+        <source>Deleting model %1...</source>
+        <translation>Deleting model %1...</translation>
+    </message>
+    <message>
+        <source>Model deletion cancelled</source>
+        <translation>Model deletion cancelled</translation>
+    </message>
+    <message>
+        <source>Confirm Update</source>
+        <translation>Confirm Update</translation>
+    </message>
+    <message>
+        <source>Are you sure you want to update the model &quot;%1&quot;? This may take a while.</source>
+        <translation>Are you sure you want to update the model "%1"? This may take a while.</translation>
+    </message>
+    <message>
+        <source>Updating model %1...</source>
+        <translation>Updating model %1...</translation>
+    </message>
+    <message>
+        <source>Model update cancelled</source>
+        <translation>Model update cancelled</translation>
+    </message>
+    <message>
+        <source>Profiling enabled - results are saved to %1</source>
+        <translation>Profiling enabled - results are saved to %1</translation>
+    </message>
+    <message>
+        <source>Profiling disabled</source>
+        <translation>Profiling disabled</translation>
+    </message>
+    <message>
+        <source>Save Diagnostics</source>
+        <translation>Save Diagnostics</translation>
+    </message>
+    <message>
+        <source>Zip Files (*.zip)</source>
+        <translation>Zip Files (*.zip)</translation>
+    </message>
+    <message>
+        <source>Failed to collect diagnostics: %1</source>
+        <translation>Failed to collect diagnostics: %1</translation>
+    </message>
+    <message>
+        <source>Saved %1 diagnostic files to %2</source>
+        <translation>Saved %1 diagnostic files to %2</translation>
+    </message>
+    <message>
+        <source>Add Host</source>
+        <translation>Add Host</translation>
+    </message>
+    <message>
+        <source>Host name:</source>
+        <translation>Host name:</translation>
+    </message>
+    <message>
+        <source>Host address (e.g. http://192.168.1.10:11434):</source>
+        <translation>Host address (e.g. http://192.168.1.10:11434):</translation>
+    </message>
+    <message>
+        <source>No remote hosts registered</source>
+        <translation>No remote hosts registered</translation>
+    </message>
+    <message>
+        <source>Remove Host</source>
+        <translation>Remove Host</translation>
+    </message>
+    <message>
+        <source>Please select models from a single host</source>
+        <translation>Please select models from a single host</translation>
+    </message>
+    <message>
+        <source>Benchmarking %1...</source>
+        <translation>Benchmarking %1...</translation>
+    </message>
+    <message>
+        <source>Load Test</source>
+        <translation>Load Test</translation>
+    </message>
+    <message>
+        <source>Concurrency levels (separated by spaces):</source>
+        <translation>Concurrency levels (separated by spaces):</translation>
+    </message>
+    <message>
+        <source>Invalid concurrency levels</source>
+        <translation>Invalid concurrency levels</translation>
+    </message>
+    <message>
+        <source>Requests per concurrency level:</source>
+        <translation>Requests per concurrency level:</translation>
+    </message>
+    <message>
+        <source>Load testing %1...</source>
+        <translation>Load testing %1...</translation>
+    </message>
+    <message>
+        <source>Load testing %1 at concurrency %2...</source>
+        <translation>Load testing %1 at concurrency %2...</translation>
+    </message>
+    <message>
+        <source>Load test finished</source>
+        <translation>Load test finished</translation>
+    </message>
+    <message>
+        <source>Load test failed: %1</source>
+        <translation>Load test failed: %1</translation>
+    </message>
+    <message>
+        <source>Load test failed</source>
+        <translation>Load test failed</translation>
+    </message>
+    <message>
+        <source>Benchmark finished</source>
+        <translation>Benchmark finished</translation>
+    </message>
+    <message>
+        <source>Benchmark failed: %1</source>
+        <translation>Benchmark failed: %1</translation>
+    </message>
+    <message>
+        <source>Benchmark failed</source>
+        <translation>Benchmark failed</translation>
+    </message>
+    <message>
+        <source>Model deleted successfully</source>
+        <translation>Model deleted successfully</translation>
+    </message>
+    <message>
+        <source>Delete failed: %1</source>
+        <translation>Delete failed: %1</translation>
+    </message>
+    <message>
+        <source>Model deletion failed</source>
+        <translation>Model deletion failed</translation>
+    </message>
+    <message>
+        <source>Model updated successfully</source>
+        <translation>Model updated successfully</translation>
+    </message>
+    <message>
+        <source>Update failed: %1</source>
+        <translation>Update failed: %1</translation>
+    </message>
+    <message>
+        <source>Model update failed</source>
+        <translation>Model update failed</translation>
+    </message>
+    <message>
+        <source>Benchmark Selected Models</source>
+        <translation>Benchmark Selected Models</translation>
+    </message>
+    <message>
+        <source>Warm Page Cache</source>
+        <translation>Warm Page Cache</translation>
+    </message>
+    <message>
+        <source>Verify Model Files</source>
+        <translation>Verify Model Files</translation>
+    </message>
+    <message>
+        <source>Deploy to Hosts...</source>
+        <translation>Deploy to Hosts...</translation>
+    </message>
+    <message>
+        <source>Preload Model...</source>
+        <translation>Preload Model...</translation>
+    </message>
+    <message>
+        <source>Unload Model</source>
+        <translation>Unload Model</translation>
+    </message>
+    <message>
+        <source>Load Test Model...</source>
+        <translation>Load Test Model...</translation>
+    </message>
+    <message>
+        <source>Warming %1...</source>
+        <translation>Warming %1...</translation>
+    </message>
+    <message>
+        <source>Warming %1: %2</source>
+        <translation>Warming %1: %2</translation>
+    </message>
+    <message>
+        <source>Page cache warmed</source>
+        <translation>Page cache warmed</translation>
+    </message>
+    <message>
+        <source>Page Cache</source>
+        <translation>Page Cache</translation>
+    </message>
+    <message>
+        <source>Failed to warm page cache: %1</source>
+        <translation>Failed to warm page cache: %1</translation>
+    </message>
+    <message>
+        <source>Failed to warm page cache</source>
+        <translation>Failed to warm page cache</translation>
+    </message>
+    <message>
+        <source>Verifying %1...</source>
+        <translation>Verifying %1...</translation>
+    </message>
+    <message>
+        <source>Verifying %1: %2</source>
+        <translation>Verifying %1: %2</translation>
+    </message>
+    <message>
+        <source>Model files verified</source>
+        <translation>Model files verified</translation>
+    </message>
+    <message>
+        <source>Model files failed verification: %1</source>
+        <translation>Model files failed verification: %1</translation>
+    </message>
+    <message>
+        <source>Model files failed verification</source>
+        <translation>Model files failed verification</translation>
+    </message>
+    <message>
+        <source>Deploying %1...</source>
+        <translation>Deploying %1...</translation>
+    </message>
+    <message>
+        <source>Deploying %1: %2</source>
+        <translation>Deploying %1: %2</translation>
+    </message>
+    <message>
+        <source>Model deployed</source>
+        <translation>Model deployed</translation>
+    </message>
+    <message>
+        <source>Deploy to Hosts</source>
+        <translation>Deploy to Hosts</translation>
+    </message>
+    <message>
+        <source>Deployment failed: %1</source>
+        <translation>Deployment failed: %1</translation>
+    </message>
+    <message>
+        <source>Deployment failed</source>
+        <translation>Deployment failed</translation>
+    </message>
+</context>
+<context>
+    <name>ResultsTableDialog</name>
+    <message>
+        <source>Save CSV</source>
+        <translation>Save CSV</translation>
+    </message>
+    <message>
+        <source>Close</source>
+        <translation>Close</translation>
+    </message>
+    <message>
+        <source>Error</source>
+        <translation>Error</translation>
     </message>
 </context>
-</TS>
\ No newline at end of file
+</TS>
@@ -1,6 +1,237 @@
 <?xml version="1.0" encoding="utf-8"?>
 <!DOCTYPE TS>
 <TS version="2.1" language="zh_CN">
+<context>
+    <name>BenchmarkHistoryDialog</name>
+    <message>
+        <source>Time</source>
+        <translation>时间</translation>
+    </message>
+    <message>
+        <source>Host</source>
+        <translation>主机</translation>
+    </message>
+    <message>
+        <source>Model</source>
+        <translation>模型</translation>
+    </message>
+    <message>
+        <source>Load (s)</source>
+        <translation>加载 (秒)</translation>
+    </message>
+    <message>
+        <source>TTFT (s)</source>
+        <translation>首字延迟 (秒)</translation>
+    </message>
+    <message>
+        <source>Prompt tokens/s</source>
+        <translation>提示词 tokens/秒</translation>
+    </message>
+    <message>
+        <source>Generation tokens/s</source>
+        <translation>生成 tokens/秒</translation>
+    </message>
+    <message>
+        <source>Total (s)</source>
+        <translation>总计 (秒)</translation>
+    </message>
+    <message>
+        <source>Benchmark History</source>
+        <translation>基准测试历史</translation>
+    </message>
+</context>
+<context>
+    <name>DeployDialog</name>
+    <message>
+        <source>Deploy %1</source>
+        <translation>部署%1</translation>
+    </message>
+    <message>
+        <source>Hosts:</source>
+        <translation>主机：</translation>
+    </message>
+    <message>
+        <source>Model name on the hosts:</source>
+        <translation>在主机上的模型名称：</translation>
+    </message>
+</context>
+<context>
+    <name>JobsPanel</name>
+    <message>
+        <source>Jobs</source>
+        <translation>任务</translation>
+    </message>
+    <message>
+        <source>Bandwidth limit:</source>
+        <translation>带宽限制：</translation>
+    </message>
+    <message>
+        <source>Unlimited</source>
+        <translation>不限制</translation>
+    </message>
+    <message>
+        <source>Total read rate of exports, imports and cache warming; applies immediately</source>
+        <translation>导出、导入和缓存预热的总读取速度；立即生效</translation>
+    </message>
+    <message>
+        <source>Low priority (nice/ionice)</source>
+        <translation>低优先级 (nice/ionice)</translation>
+    </message>
+    <message>
+        <source>Applies to jobs started after the change</source>
+        <translation>对更改之后开始的任务生效</translation>
+    </message>
+    <message>
+        <source>Operation</source>
+        <translation>操作</translation>
+    </message>
+    <message>
+        <source>Details</source>
+        <translation>详情</translation>
+    </message>
+    <message>
+        <source>Status</source>
+        <translation>状态</translation>
+    </message>
+    <message>
+        <source>Progress</source>
+        <translation>进度</translation>
+    </message>
+    <message>
+        <source>Duration (s)</source>
+        <translation>耗时 (秒)</translation>
+    </message>
+    <message>
+        <source>Running</source>
+        <translation>运行中</translation>
+    </message>
+</context>
+<context>
+    <name>LoadTestDialog</name>
+    <message>
+        <source>Concurrency</source>
+        <translation>并发数</translation>
+    </message>
+    <message>
+        <source>Requests</source>
+        <translation>请求数</translation>
+    </message>
+    <message>
+        <source>Errors</source>
+        <translation>错误数</translation>
+    </message>
+    <message>
+        <source>Error rate</source>
+        <translation>错误率</translation>
+    </message>
+    <message>
+        <source>p50 (s)</source>
+        <translation>p50 (秒)</translation>
+    </message>
+    <message>
+        <source>p95 (s)</source>
+        <translation>p95 (秒)</translation>
+    </message>
+    <message>
+        <source>p99 (s)</source>
+        <translation>p99 (秒)</translation>
+    </message>
+    <message>
+        <source>Requests/s</source>
+        <translation>请求/秒</translation>
+    </message>
+    <message>
+        <source>Tokens/s</source>
+        <translation>tokens/秒</translation>
+    </message>
+    <message>
+        <source>Load Test: %1</source>
+        <translation>负载测试：%1</translation>
+    </message>
+</context>
+<context>
+    <name>LoadedModelsPanel</name>
+    <message>
+        <source>Loaded Models</source>
+        <translation>已加载的模型</translation>
+    </message>
+    <message>
+        <source>Host:</source>
+        <translation>主机：</translation>
+    </message>
+    <message>
+        <source>Model</source>
+        <translation>模型</translation>
+    </message>
+    <message>
+        <source>Size</source>
+        <translation>大小</translation>
+    </message>
+    <message>
+        <source>Processor</source>
+        <translation>处理器</translation>
+    </message>
+    <message>
+        <source>Until</source>
+        <translation>保留到</translation>
+    </message>
+    <message>
+        <source>Preload...</source>
+        <translation>预加载...</translation>
+    </message>
+    <message>
+        <source>Unload</source>
+        <translation>卸载</translation>
+    </message>
+    <message>
+        <source>Refresh</source>
+        <translation>刷新</translation>
+    </message>
+    <message>
+        <source>%1 model(s) loaded</source>
+        <translation>已加载%1个模型</translation>
+    </message>
+    <message>
+        <source>Warning</source>
+        <translation>警告</translation>
+    </message>
+    <message>
+        <source>No models available on this host</source>
+        <translation>此主机上没有可用的模型</translation>
+    </message>
+    <message>
+        <source>Preload Model</source>
+        <translation>预加载模型</translation>
+    </message>
+    <message>
+        <source>Model:</source>
+        <translation>模型：</translation>
+    </message>
+    <message>
+        <source>Keep alive (e.g. 5m, 1h, -1 for forever):</source>
+        <translation>保留时间（例如 5m、1h，-1 表示一直保留）：</translation>
+    </message>
+    <message>
+        <source>Please select a model first</source>
+        <translation>请先选择一个模型</translation>
+    </message>
+    <message>
+        <source>Another operation is still running</source>
+        <translation>另一个操作仍在进行中</translation>
+    </message>
+    <message>
+        <source>Loading %1...</source>
+        <translation>正在加载%1...</translation>
+    </message>
+    <message>
+        <source>Unloading %1...</source>
+        <translation>正在卸载%1...</translation>
+    </message>
+    <message>
+        <source>Error</source>
+        <translation>错误</translation>
+    </message>
+</context>
 <context>
     <name>MainWindow</name>
     <message>
@@ -31,10 +262,6 @@
         <source>Loading model list...</source>
         <translation>正在加载模型列表...</translation>
     </message>
-    <message>
-        <source>Loaded %n model(s)</source>
-        <translation>已加载%n个模型</translation>
-    </message>
     <message>
         <source>Error</source>
         <translation>错误</translation>
@@ -120,12 +347,441 @@
         <translation>语言</translation>
     </message>
     <message>
-        <source>Language Switched</source>
-        <translation>语言已切换</translation>
+        <source>Ready - Press F5 to refresh, Ctrl+F to search</source>
+        <translation>就绪 - 按F5刷新，Ctrl+F搜索</translation>
     </message>
     <message>
-        <source>Language switched to %1. Changes will be applied immediately.</source>
-        <translation>语言已切换为%1。更改将立即生效。</translation>
+        <source>Sort by:</source>
+        <translation>排序：</translation>
+    </message>
+    <message>
+        <source>Name (A-Z)</source>
+        <translation>名称 (A-Z)</translation>
+    </message>
+    <message>
+        <source>Name (Z-A)</source>
+        <translation>名称 (Z-A)</translation>
+    </message>
+    <message>
+        <source>Size (Largest First)</source>
+        <translation>大小（从大到小）</translation>
+    </message>
+    <message>
+        <source>Size (Smallest First)</source>
+        <translation>大小（从小到大）</translation>
+    </message>
+    <message>
+        <source>Date (Newest First)</source>
+        <translation>日期（从新到旧）</translation>
+    </message>
+    <message>
+        <source>Date (Oldest First)</source>
+        <translation>日期（从旧到新）</translation>
+    </message>
+    <message>
+        <source>Search:</source>
+        <translation>搜索：</translation>
+    </message>
+    <message>
+        <source>Enter model name to search...</source>
+        <translation>输入模型名称进行搜索...</translation>
+    </message>
+    <message>
+        <source>Clear</source>
+        <translation>清除</translation>
+    </message>
+    <message>
+        <source>Host:</source>
+        <translation>主机：</translation>
+    </message>
+    <message>
+        <source>All Hosts</source>
+        <translation>所有主机</translation>
+    </message>
+    <message>
+        <source>Tag</source>
+        <translation>标签</translation>
+    </message>
+    <message>
+        <source>ID</source>
+        <translation>ID</translation>
+    </message>
+    <message>
+        <source>Size</source>
+        <translation>大小</translation>
+    </message>
+    <message>
+        <source>Modified Date</source>
+        <translation>修改日期</translation>
+    </message>
+    <message>
+        <source>Host</source>
+        <translation>主机</translation>
+    </message>
+    <message>
+        <source>Import Folder</source>
+        <translation>导入文件夹</translation>
+    </message>
+    <message>
+        <source>Delete Selected Model</source>
+        <translation>删除选中的模型</translation>
+    </message>
+    <message>
+        <source>Update Selected Model</source>
+        <translation>更新选中的模型</translation>
+    </message>
+    <message>
+        <source>Hosts</source>
+        <translation>主机</translation>
+    </message>
+    <message>
+        <source>Add Host...</source>
+        <translation>添加主机...</translation>
+    </message>
+    <message>
+        <source>Remove Host...</source>
+        <translation>移除主机...</translation>
+    </message>
+    <message>
+        <source>View</source>
+        <translation>视图</translation>
+    </message>
+    <message>
+        <source>Diagnostics</source>
+        <translation>诊断</translation>
+    </message>
+    <message>
+        <source>Enable Profiling</source>
+        <translation>启用性能分析</translation>
+    </message>
+    <message>
+        <source>Benchmark History</source>
+        <translation>基准测试历史</translation>
+    </message>
+    <message>
+        <source>Collect Diagnostics...</source>
+        <translation>收集诊断信息...</translation>
+    </message>
+    <message numerus="yes">
+        <source>Loaded %n models</source>
+        <translation>
+            <numerusform>已加载%n个模型</numerusform>
+        </translation>
+    </message>
+    <message>
+        <source>Some hosts failed: %1</source>
+        <translation>部分主机失败：%1</translation>
+    </message>
+    <message>
+        <source>Ready - %n models loaded. Press F5 to refresh, Ctrl+F to search</source>
+        <translation>就绪 - 已加载%n个模型。按F5刷新，Ctrl+F搜索</translation>
+    </message>
+    <message>
+        <source>Error loading models</source>
+        <translation>加载模型出错</translation>
+    </message>
+    <message>
+        <source>This operation is only available for models on the local host</source>
+        <translation>此操作仅适用于本机上的模型</translation>
+    </message>
+    <message>
+        <source>Select Export Directory</source>
+        <translation>选择导出目录</translation>
+    </message>
+    <message>
+        <source>Exporting %1 models...</source>
+        <translation>正在导出%1个模型...</translation>
+    </message>
+    <message>
+        <source>The file name contains special characters. Please enter a valid model name:</source>
+        <translation>文件名包含特殊字符，请输入有效的模型名称：</translation>
+    </message>
+    <message>
+        <source>Model name cannot be empty</source>
+        <translation>模型名称不能为空</translation>
+    </message>
+    <message>
+        <source>Model name can only contain letters, numbers, underscores, and hyphens</source>
+        <translation>模型名称只能包含字母、数字、下划线和连字符</translation>
+    </message>
+    <message>
+        <source>Select Folder to Import</source>
+        <translation>选择要导入的文件夹</translation>
+    </message>
+    <message>
+        <source>Importing models from %1...</source>
+        <translation>正在从%1导入模型...</translation>
+    </message>
+    <message>
+        <source>Importing models: %1</source>
+        <translation>正在导入模型：%1</translation>
+    </message>
+    <message>
+        <source>Confirm Deletion</source>
+        <translation>确认删除</translation>
+    </message>
+    <message>
+        <source>Are you sure you want to delete the model &quot;%1&quot;?</source>
+        <translation>确定要删除模型“%1”吗？</translation>
+    </message>
+    <message>
+        <source>Deleting model %1...</source>
+        <translation>正在删除模型%1...</translation>
+    </message>
+    <message>
+        <source>Model deletion cancelled</source>
+        <translation>模型删除已取消</translation>
+    </message>
+    <message>
+        <source>Confirm Update</source>
+        <translation>确认更新</translation>
+    </message>
+    <message>
+        <source>Are you sure you want to update the model &quot;%1&quot;? This may take a while.</source>
+        <translation>确定要更新模型“%1”吗？这可能需要一些时间。</translation>
+    </message>
+    <message>
+        <source>Updating model %1...</source>
+        <translation>正在更新模型%1...</translation>
+    </message>
+    <message>
+        <source>Model update cancelled</source>
+        <translation>模型更新已取消</translation>
+    </message>
+    <message>
+        <source>Profiling enabled - results are saved to %1</source>
+        <translation>已启用性能分析 - 结果保存到%1</translation>
+    </message>
+    <message>
+        <source>Profiling disabled</source>
+        <translation>已停用性能分析</translation>
+    </message>
+    <message>
+        <source>Save Diagnostics</source>
+        <translation>保存诊断信息</translation>
+    </message>
+    <message>
+        <source>Zip Files (*.zip)</source>
+        <translation>Zip文件 (*.zip)</translation>
+    </message>
+    <message>
+        <source>Failed to collect diagnostics: %1</source>
+        <translation>收集诊断信息失败：%1</translation>
+    </message>
+    <message>
+        <source>Saved %1 diagnostic files to %2</source>
+        <translation>已将%1个诊断文件保存到%2</translation>
+    </message>
+    <message>
+        <source>Add Host</source>
+        <translation>添加主机</translation>
+    </message>
+    <message>
+        <source>Host name:</source>
+        <translation>主机名称：</translation>
+    </message>
+    <message>
+        <source>Host address (e.g. http://192.168.1.10:11434):</source>
+        <translation>主机地址（例如 http://192.168.1.10:11434）：</translation>
+    </message>
+    <message>
+        <source>No remote hosts registered</source>
+        <translation>没有已登记的远程主机</translation>
+    </message>
+    <message>
+        <source>Remove Host</source>
+        <translation>移除主机</translation>
+    </message>
+    <message>
+        <source>Please select models from a single host</source>
+        <translation>请选择同一主机上的模型</translation>
+    </message>
+    <message>
+        <source>Benchmarking %1...</source>
+        <translation>正在对%1进行基准测试...</translation>
+    </message>
+    <message>
+        <source>Load Test</source>
+        <translation>负载测试</translation>
+    </message>
+    <message>
+        <source>Concurrency levels (separated by spaces):</source>
+        <translation>并发级别（用空格分隔）：</translation>
+    </message>
+    <message>
+        <source>Invalid concurrency levels</source>
+        <translation>无效的并发级别</translation>
+    </message>
+    <message>
+        <source>Requests per concurrency level:</source>
+        <translation>每个并发级别的请求数：</translation>
+    </message>
+    <message>
+        <source>Load testing %1...</source>
+        <translation>正在对%1进行负载测试...</translation>
+    </message>
+    <message>
+        <source>Load testing %1 at concurrency %2...</source>
+        <translation>正在以并发数%2对%1进行负载测试...</translation>
+    </message>
+    <message>
+        <source>Load test finished</source>
+        <translation>负载测试完成</translation>
+    </message>
+    <message>
+        <source>Load test failed: %1</source>
+        <translation>负载测试失败：%1</translation>
+    </message>
+    <message>
+        <source>Load test failed</source>
+        <translation>负载测试失败</translation>
+    </message>
+    <message>
+        <source>Benchmark finished</source>
+        <translation>基准测试完成</translation>
+    </message>
+    <message>
+        <source>Benchmark failed: %1</source>
+        <translation>基准测试失败：%1</translation>
+    </message>
+    <message>
+        <source>Benchmark failed</source>
+        <translation>基准测试失败</translation>
+    </message>
+    <message>
+        <source>Model deleted successfully</source>
+        <translation>模型删除成功</translation>
+    </message>
+    <message>
+        <source>Delete failed: %1</source>
+        <translation>删除失败：%1</translation>
+    </message>
+    <message>
+        <source>Model deletion failed</source>
+        <translation>模型删除失败</translation>
+    </message>
+    <message>
+        <source>Model updated successfully</source>
+        <translation>模型更新成功</translation>
+    </message>
+    <message>
+        <source>Update failed: %1</source>
+        <translation>更新失败：%1</translation>
+    </message>
+    <message>
+        <source>Model update failed</source>
+        <translation>模型更新失败</translation>
+    </message>
+    <message>
+        <source>Benchmark Selected Models</source>
+        <translation>对选中的模型进行基准测试</translation>
+    </message>
+    <message>
+        <source>Warm Page Cache</source>
+        <translation>预热页缓存</translation>
+    </message>
+    <message>
+        <source>Verify Model Files</source>
+        <translation>校验模型文件</translation>
+    </message>
+    <message>
+        <source>Deploy to Hosts...</source>
+        <translation>部署到主机...</translation>
+    </message>
+    <message>
+        <source>Preload Model...</source>
+        <translation>预加载模型...</translation>
+    </message>
+    <message>
+        <source>Unload Model</source>
+        <translation>卸载模型</translation>
+    </message>
+    <message>
+        <source>Load Test Model...</source>
+        <translation>负载测试模型...</translation>
+    </message>
+    <message>
+        <source>Warming %1...</source>
+        <translation>正在预热%1...</translation>
+    </message>
+    <message>
+        <source>Warming %1: %2</source>
+        <translation>正在预热%1：%2</translation>
+    </message>
+    <message>
+        <source>Page cache warmed</source>
+        <translation>页缓存已预热</translation>
+    </message>
+    <message>
+        <source>Page Cache</source>
+        <translation>页缓存</translation>
+    </message>
+    <message>
+        <source>Failed to warm page cache: %1</source>
+        <translation>预热页缓存失败：%1</translation>
+    </message>
+    <message>
+        <source>Failed to warm page cache</source>
+        <translation>预热页缓存失败</translation>
+    </message>
+    <message>
+        <source>Verifying %1...</source>
+        <translation>正在校验%1...</translation>
+    </message>
+    <message>
+        <source>Verifying %1: %2</source>
+        <translation>正在校验%1：%2</translation>
+    </message>
+    <message>
+        <source>Model files verified</source>
+        <translation>模型文件校验通过</translation>
+    </message>
+    <message>
+        <source>Model files failed verification: %1</source>
+        <translation>模型文件校验失败：%1</translation>
+    </message>
+    <message>
+        <source>Model files failed verification</source>
+        <translation>模型文件校验失败</translation>
+    </message>
+    <message>
+        <source>Deploying %1...</source>
+        <translation>正在部署%1...</translation>
+    </message>
+    <message>
+        <source>Deploying %1: %2</source>
+        <translation>正在部署%1：%2</translation>
+    </message>
+    <message>
+        <source>Model deployed</source>
+        <translation>模型已部署</translation>
+    </message>
+    <message>
+        <source>Deploy to Hosts</source>
+        <translation>部署到主机</translation>
+    </message>
+    <message>
+        <source>Deployment failed: %1</source>
+        <translation>部署失败：%1</translation>
+    </message>
+    <message>
+        <source>Deployment failed</source>
+        <translation>部署失败</translation>
+    </message>
+</context>
+<context>
+    <name>ResultsTableDialog</name>
+    <message>
+        <source>Save CSV</source>
+        <translation>保存CSV</translation>
+    </message>
+    <message>
+        <source>Close</source>
+        <translation>关闭</translation>
+    </message>
+    <message>
+        <source>Error</source>
+        <translation>错误</translation>
     </message>
 </context>
-</TS>
\ No newline at end of file
+</TS>